@@ -23,16 +23,19 @@ class AgroManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param http_session: the pooled HTTP transport to be shared with other managers (if not provided, a new one
+        will be created)
+    :type http_session: `pyowm.commons.http_client.HttpSession`
     :returns: an `AgroManager` instance
     :raises: `AssertionError` when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, http_session=None):
         assert isinstance(API_key, str), 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_AGRO_API)
+        self.http_client = HttpClient(API_key, config, ROOT_AGRO_API, session=http_session)
 
     def agro_api_version(self):
         return AGRO_API_VERSION
@@ -193,60 +196,13 @@ class AgroManager:
         :type max_valid_data_coverage: int
         :return: a list of `pyowm.agro10.imagery.MetaImage` subtypes instances
         """
-        assert polygon_id is not None
-        assert acquired_from is not None
-        assert acquired_to is not None
-        assert acquired_from <= acquired_to, 'Start timestamp of acquisition window must come before its end'
-        if min_resolution is not None:
-            assert min_resolution > 0, 'Minimum resolution must be positive'
-        if max_resolution is not None:
-            assert max_resolution > 0, 'Maximum resolution must be positive'
-        if min_resolution is not None and max_resolution is not None:
-            assert min_resolution <= max_resolution, 'Mininum resolution must be lower than maximum resolution'
-        if min_cloud_coverage is not None:
-            assert min_cloud_coverage >= 0, 'Minimum cloud coverage must be non negative'
-        if max_cloud_coverage is not None:
-            assert max_cloud_coverage >= 0, 'Maximum cloud coverage must be non negative'
-        if min_cloud_coverage is not None and max_cloud_coverage is not None:
-            assert min_cloud_coverage <= max_cloud_coverage, 'Minimum cloud coverage must be lower than maximum cloud coverage'
-        if min_valid_data_coverage is not None:
-            assert min_valid_data_coverage >= 0, 'Minimum valid data coverage must be non negative'
-        if max_valid_data_coverage is not None:
-            assert max_valid_data_coverage >= 0, 'Maximum valid data coverage must be non negative'
-        if min_valid_data_coverage is not None and max_valid_data_coverage is not None:
-            assert min_valid_data_coverage <= max_valid_data_coverage, 'Minimum valid data coverage must be lower than maximum valid data coverage'
-
-        # prepare params
-        params = dict(appid=self.API_key, polyid=polygon_id, start=acquired_from, end=acquired_to)
-        if min_resolution is not None:
-            params['resolution_min'] = min_resolution
-        if max_resolution is not None:
-            params['resolution_max'] = max_resolution
-        if acquired_by is not None:
-            params['type'] = acquired_by
-        if min_cloud_coverage is not None:
-            params['clouds_min'] = min_cloud_coverage
-        if max_cloud_coverage is not None:
-            params['clouds_max'] = max_cloud_coverage
-        if min_valid_data_coverage is not None:
-            params['coverage_min'] = min_valid_data_coverage
-        if max_valid_data_coverage is not None:
-            params['coverage_max'] = max_valid_data_coverage
-
+        params = self._satellite_imagery_search_params(
+            polygon_id, acquired_from, acquired_to, min_resolution, max_resolution, acquired_by, min_cloud_coverage,
+            max_cloud_coverage, min_valid_data_coverage, max_valid_data_coverage)
         # call API
         status, data = self.http_client.get_json(SATELLITE_IMAGERY_SEARCH_URI, params=params)
-
         result_set = SatelliteImagerySearchResultSet(polygon_id, data, timestamps.now(timeformat='unix'))
-
-        # further filter by img_type and/or preset (if specified)
-        if img_type is not None and preset is not None:
-            return result_set.with_img_type_and_preset(img_type, preset)
-        elif img_type is not None:
-            return result_set.with_img_type(img_type)
-        elif preset is not None:
-            return result_set.with_preset(preset)
-        else:
-            return result_set.all()
+        return self._filter_satellite_imagery(result_set, img_type, preset)
 
     def download_satellite_image(self, metaimage, x=None, y=None, zoom=None, palette=None):
         """
@@ -317,6 +273,67 @@ class AgroManager:
         return data
 
     # Utilities
+    def _satellite_imagery_search_params(self, polygon_id, acquired_from, acquired_to, min_resolution,
+                                         max_resolution, acquired_by, min_cloud_coverage, max_cloud_coverage,
+                                         min_valid_data_coverage, max_valid_data_coverage):
+        """
+        Helper method for search_satellite_imagery: checks the search filters and turns them into query params
+        """
+        assert polygon_id is not None
+        assert acquired_from is not None
+        assert acquired_to is not None
+        assert acquired_from <= acquired_to, 'Start timestamp of acquisition window must come before its end'
+        if min_resolution is not None:
+            assert min_resolution > 0, 'Minimum resolution must be positive'
+        if max_resolution is not None:
+            assert max_resolution > 0, 'Maximum resolution must be positive'
+        if min_resolution is not None and max_resolution is not None:
+            assert min_resolution <= max_resolution, 'Mininum resolution must be lower than maximum resolution'
+        if min_cloud_coverage is not None:
+            assert min_cloud_coverage >= 0, 'Minimum cloud coverage must be non negative'
+        if max_cloud_coverage is not None:
+            assert max_cloud_coverage >= 0, 'Maximum cloud coverage must be non negative'
+        if min_cloud_coverage is not None and max_cloud_coverage is not None:
+            assert min_cloud_coverage <= max_cloud_coverage, 'Minimum cloud coverage must be lower than maximum cloud coverage'
+        if min_valid_data_coverage is not None:
+            assert min_valid_data_coverage >= 0, 'Minimum valid data coverage must be non negative'
+        if max_valid_data_coverage is not None:
+            assert max_valid_data_coverage >= 0, 'Maximum valid data coverage must be non negative'
+        if min_valid_data_coverage is not None and max_valid_data_coverage is not None:
+            assert min_valid_data_coverage <= max_valid_data_coverage, 'Minimum valid data coverage must be lower than maximum valid data coverage'
+
+        # prepare params
+        params = dict(appid=self.API_key, polyid=polygon_id, start=acquired_from, end=acquired_to)
+        if min_resolution is not None:
+            params['resolution_min'] = min_resolution
+        if max_resolution is not None:
+            params['resolution_max'] = max_resolution
+        if acquired_by is not None:
+            params['type'] = acquired_by
+        if min_cloud_coverage is not None:
+            params['clouds_min'] = min_cloud_coverage
+        if max_cloud_coverage is not None:
+            params['clouds_max'] = max_cloud_coverage
+        if min_valid_data_coverage is not None:
+            params['coverage_min'] = min_valid_data_coverage
+        if max_valid_data_coverage is not None:
+            params['coverage_max'] = max_valid_data_coverage
+
+        return params
+
+    def _filter_satellite_imagery(self, result_set, img_type, preset):
+        """
+        Helper method for search_satellite_imagery: filters results by img_type and/or preset (if specified)
+        """
+        if img_type is not None and preset is not None:
+            return result_set.with_img_type_and_preset(img_type, preset)
+        elif img_type is not None:
+            return result_set.with_img_type(img_type)
+        elif preset is not None:
+            return result_set.with_preset(preset)
+        else:
+            return result_set.all()
+
     def _fill_url(self, url_template, x, y, zoom):
         return url_template.replace('{x}', str(x)).replace('{y}', str(y)).replace('{z}', str(zoom))
 
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pyowm.agroapi10.agro_manager import AgroManager
+from pyowm.agroapi10.enums import PresetEnum, PaletteEnum
+from pyowm.agroapi10.imagery import MetaTile, MetaGeoTiffImage, MetaPNGImage, SatelliteImage
+from pyowm.agroapi10.polygon import Polygon, GeoPolygon
+from pyowm.agroapi10.search import SatelliteImagerySearchResultSet
+from pyowm.agroapi10.soil import Soil
+from pyowm.agroapi10.uris import ROOT_AGRO_API, POLYGONS_URI, NAMED_POLYGON_URI, SOIL_URI, SATELLITE_IMAGERY_SEARCH_URI
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.commons.image import Image
+from pyowm.commons.tile import Tile
+from pyowm.utils import timestamps
+
+
+class AsyncAgroManager(AgroManager):
+
+    """
+    The asyncio counterpart of `pyowm.agroapi10.agro_manager.AgroManager`: it exposes the same methods, with the
+    same arguments and return values, as coroutines.
+
+    :param API_key: the OWM Agro API key
+    :type API_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param http_session: the pooled asyncio HTTP transport to be shared with other managers (if not provided, a new
+        one will be created)
+    :type http_session: `pyowm.commons.aio_http_client.AsyncHttpSession`
+    :returns: an `AsyncAgroManager` instance
+    :raises: `AssertionError` when no API Key is provided
+
+    """
+
+    def __init__(self, API_key, config, http_session=None):
+        assert isinstance(API_key, str), 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, ROOT_AGRO_API, session=http_session)
+
+    # POLYGON API subset methods
+
+    async def create_polygon(self, geopolygon, name=None):
+        """
+        See `AgroManager.create_polygon`
+        """
+        assert geopolygon is not None
+        assert isinstance(geopolygon, GeoPolygon)
+        data = dict()
+        data['geo_json'] = {
+            "type": "Feature",
+            "properties": {},
+            "geometry": geopolygon.to_dict()
+        }
+        if name is not None:
+            data['name'] = name
+        status, payload = await self.http_client.post(
+            POLYGONS_URI,
+            params={'appid': self.API_key},
+            data=data,
+            headers={'Content-Type': 'application/json'})
+        return Polygon.from_dict(payload)
+
+    async def get_polygons(self):
+        """
+        See `AgroManager.get_polygons`
+        """
+        status, data = await self.http_client.get_json(
+            POLYGONS_URI,
+            params={'appid': self.API_key},
+            headers={'Content-Type': 'application/json'})
+        return [Polygon.from_dict(item) for item in data]
+
+    async def get_polygon(self, polygon_id):
+        """
+        See `AgroManager.get_polygon`
+        """
+        status, data = await self.http_client.get_json(
+            NAMED_POLYGON_URI % str(polygon_id),
+            params={'appid': self.API_key},
+            headers={'Content-Type': 'application/json'})
+        return Polygon.from_dict(data)
+
+    async def update_polygon(self, polygon):
+        """
+        See `AgroManager.update_polygon`
+        """
+        assert polygon.id is not None
+        status, _ = await self.http_client.put(
+            NAMED_POLYGON_URI % str(polygon.id),
+            params={'appid': self.API_key},
+            data=dict(name=polygon.name),
+            headers={'Content-Type': 'application/json'})
+
+    async def delete_polygon(self, polygon):
+        """
+        See `AgroManager.delete_polygon`
+        """
+        assert polygon.id is not None
+        status, _ = await self.http_client.delete(
+            NAMED_POLYGON_URI % str(polygon.id),
+            params={'appid': self.API_key},
+            headers={'Content-Type': 'application/json'})
+
+    # SOIL API subset methods
+
+    async def soil_data(self, polygon):
+        """
+        See `AgroManager.soil_data`
+        """
+        assert polygon is not None
+        assert isinstance(polygon, Polygon)
+        polyd = polygon.id
+        status, data = await self.http_client.get_json(
+            SOIL_URI,
+            params={'appid': self.API_key,
+                    'polyid': polyd},
+            headers={'Content-Type': 'application/json'})
+        the_dict = dict()
+        the_dict['reference_time'] = data['dt']
+        the_dict['surface_temp'] = data['t0']
+        the_dict['ten_cm_temp'] = data['t10']
+        the_dict['moisture'] = data['moisture']
+        the_dict['polygon_id'] = polyd
+        return Soil.from_dict(the_dict)
+
+    # Satellite Imagery subset methods
+
+    async def search_satellite_imagery(self, polygon_id, acquired_from, acquired_to, img_type=None, preset=None,
+                                       min_resolution=None, max_resolution=None, acquired_by=None,
+                                       min_cloud_coverage=None, max_cloud_coverage=None, min_valid_data_coverage=None,
+                                       max_valid_data_coverage=None):
+        """
+        See `AgroManager.search_satellite_imagery`
+        """
+        params = self._satellite_imagery_search_params(
+            polygon_id, acquired_from, acquired_to, min_resolution, max_resolution, acquired_by, min_cloud_coverage,
+            max_cloud_coverage, min_valid_data_coverage, max_valid_data_coverage)
+        status, data = await self.http_client.get_json(SATELLITE_IMAGERY_SEARCH_URI, params=params)
+        result_set = SatelliteImagerySearchResultSet(polygon_id, data, timestamps.now(timeformat='unix'))
+        return self._filter_satellite_imagery(result_set, img_type, preset)
+
+    async def download_satellite_image(self, metaimage, x=None, y=None, zoom=None, palette=None):
+        """
+        See `AgroManager.download_satellite_image`
+        """
+        if palette is not None:
+            assert isinstance(palette, str)
+            params = dict(paletteid=palette)
+        else:
+            palette = PaletteEnum.GREEN
+            params = dict()
+        # polygon PNG
+        if isinstance(metaimage, MetaPNGImage):
+            status, data = await self.http_client.get_png(metaimage.url, params=params)
+            img = Image(data, metaimage.image_type)
+            return SatelliteImage(metaimage, img, downloaded_on=timestamps.now(timeformat='unix'), palette=palette)
+        # GeoTIF
+        elif isinstance(metaimage, MetaGeoTiffImage):
+            status, data = await self.http_client.get_geotiff(metaimage.url, params=params)
+            img = Image(data, metaimage.image_type)
+            return SatelliteImage(metaimage, img, downloaded_on=timestamps.now(timeformat='unix'), palette=palette)
+        # tile PNG
+        elif isinstance(metaimage, MetaTile):
+            assert x is not None
+            assert y is not None
+            assert zoom is not None
+            prepared_url = self._fill_url(metaimage.url, x, y, zoom)
+            status, data = await self.http_client.get_png(prepared_url, params=params)
+            img = Image(data, metaimage.image_type)
+            tile = Tile(x, y, zoom, None, img)
+            return SatelliteImage(metaimage, tile, downloaded_on=timestamps.now(timeformat='unix'), palette=palette)
+        else:
+            raise ValueError("Cannot download: unsupported MetaImage subtype")
+
+    async def stats_for_satellite_image(self, metaimage):
+        """
+        See `AgroManager.stats_for_satellite_image`
+        """
+        if metaimage.preset != PresetEnum.EVI and metaimage.preset != PresetEnum.NDVI:
+            raise ValueError("Unsupported image preset: should be EVI or NDVI")
+        if metaimage.stats_url is None:
+            raise ValueError("URL for image statistics is not defined")
+        status, data = await self.http_client.get_json(metaimage.stats_url, params={})
+        return data
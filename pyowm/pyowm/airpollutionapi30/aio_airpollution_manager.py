@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pyowm.airpollutionapi30 import airpollution_queries, coindex, no2index, ozone, so2index
+from pyowm.airpollutionapi30.uris import ROOT_POLLUTION_API_URL, CO_INDEX_URL, OZONE_URL, NO2_INDEX_URL, \
+    SO2_INDEX_URL
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.constants import AIRPOLLUTION_API_VERSION
+
+
+class AsyncAirPollutionManager:
+
+    """
+    The asyncio counterpart of `pyowm.airpollutionapi30.airpollution_manager.AirPollutionManager`: it exposes the
+    same methods, with the same arguments and return values, as coroutines.
+
+    :param API_key: the OWM AirPollution API key
+    :type API_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param http_session: the pooled asyncio HTTP transport to be shared with other managers (if not provided, a new
+        one will be created)
+    :type http_session: `pyowm.commons.aio_http_client.AsyncHttpSession`
+    :returns: an *AsyncAirPollutionManager* instance
+    :raises: *AssertionError* when no API Key is provided
+
+    """
+
+    def __init__(self, API_key, config, http_session=None):
+        assert API_key is not None, 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, ROOT_POLLUTION_API_URL, session=http_session)
+
+    def airpollution_api_version(self):
+        return AIRPOLLUTION_API_VERSION
+
+    async def coindex_around_coords(self, lat, lon, start=None, interval=None):
+        """
+        See `AirPollutionManager.coindex_around_coords`
+        """
+        params = airpollution_queries.index_params(lat, lon, start=start, interval=interval)
+        _, json_data = await self.http_client.get_json(airpollution_queries.index_uri(CO_INDEX_URL, params))
+        return airpollution_queries.index_from_dict(coindex.COIndex, json_data, interval)
+
+    async def ozone_around_coords(self, lat, lon, start=None, interval=None):
+        """
+        See `AirPollutionManager.ozone_around_coords`
+        """
+        params = airpollution_queries.index_params(lat, lon, start=start, interval=interval)
+        _, json_data = await self.http_client.get_json(airpollution_queries.index_uri(OZONE_URL, params))
+        return airpollution_queries.index_from_dict(ozone.Ozone, json_data, interval)
+
+    async def no2index_around_coords(self, lat, lon, start=None, interval=None):
+        """
+        See `AirPollutionManager.no2index_around_coords`
+        """
+        params = airpollution_queries.index_params(lat, lon, start=start, interval=interval)
+        _, json_data = await self.http_client.get_json(airpollution_queries.index_uri(NO2_INDEX_URL, params))
+        return airpollution_queries.index_from_dict(no2index.NO2Index, json_data, interval)
+
+    async def so2index_around_coords(self, lat, lon, start=None, interval=None):
+        """
+        See `AirPollutionManager.so2index_around_coords`
+        """
+        params = airpollution_queries.index_params(lat, lon, start=start, interval=interval)
+        _, json_data = await self.http_client.get_json(airpollution_queries.index_uri(SO2_INDEX_URL, params))
+        return airpollution_queries.index_from_dict(so2index.SO2Index, json_data, interval)
+
+    def __repr__(self):
+        return '<%s.%s>' % (__name__, self.__class__.__name__)
@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from pyowm.airpollutionapi30 import airpollution_queries
 from pyowm.airpollutionapi30.uris import CO_INDEX_URL, OZONE_URL, NO2_INDEX_URL, SO2_INDEX_URL
-from pyowm.utils import formatting
 
 
 class AirPollutionHttpClient:
@@ -24,19 +24,7 @@ class AirPollutionHttpClient:
         self._client = httpclient
 
     def _trim_to(self, date_object, interval):
-        if interval == 'minute':
-            return date_object.strftime('%Y-%m-%dT%H:%MZ')
-        elif interval == 'hour':
-            return date_object.strftime('%Y-%m-%dT%HZ')
-        elif interval == 'day':
-            return date_object.strftime('%Y-%m-%dZ')
-        elif interval == 'month':
-            return date_object.strftime('%Y-%mZ')
-        elif interval == 'year':
-            return date_object.strftime('%YZ')
-        else:
-            raise ValueError("The interval provided for the search "
-                             "window is invalid")
+        return airpollution_queries.trim_to(date_object, interval)
 
     def get_coi(self, params_dict):
         """
@@ -47,21 +35,7 @@ class AirPollutionHttpClient:
         :raises: *ValueError*, *APIRequestError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        start = params_dict['start']
-        interval = params_dict['interval']
-
-        # build request URL
-        if start is None:
-            timeref = 'current'
-        else:
-            if interval is None:
-                timeref = self._trim_to(formatting.to_date(start), 'year')
-            else:
-                timeref = self._trim_to(formatting.to_date(start), interval)
-
-        uri = '%s/%s,%s/%s.json' % (CO_INDEX_URL, lat, lon, timeref)
+        uri = airpollution_queries.index_uri(CO_INDEX_URL, params_dict)
         _, json_data = self._client.get_json(uri)
         return json_data
 
@@ -74,23 +48,7 @@ class AirPollutionHttpClient:
         :raises: *ValueError*, *APIRequestError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        start = params_dict['start']
-        interval = params_dict['interval']
-
-        # build request URL
-        if start is None:
-            timeref = 'current'
-        else:
-            if interval is None:
-                timeref = self._trim_to(
-                    formatting.to_date(start), 'year')
-            else:
-                timeref = self._trim_to(
-                    formatting.to_date(start), interval)
-
-        uri = '%s/%s,%s/%s.json' % (OZONE_URL, lat, lon, timeref)
+        uri = airpollution_queries.index_uri(OZONE_URL, params_dict)
         _, json_data = self._client.get_json(uri)
         return json_data
 
@@ -103,23 +61,7 @@ class AirPollutionHttpClient:
         :raises: *ValueError*, *APIRequestError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        start = params_dict['start']
-        interval = params_dict['interval']
-
-        # build request URL
-        if start is None:
-            timeref = 'current'
-        else:
-            if interval is None:
-                timeref = self._trim_to(
-                    formatting.to_date(start), 'year')
-            else:
-                timeref = self._trim_to(
-                    formatting.to_date(start), interval)
-
-        uri = '%s/%s,%s/%s.json' % (NO2_INDEX_URL, lat, lon, timeref)
+        uri = airpollution_queries.index_uri(NO2_INDEX_URL, params_dict)
         _, json_data = self._client.get_json(uri)
         return json_data
 
@@ -132,23 +74,7 @@ class AirPollutionHttpClient:
         :raises: *ValueError*, *APIRequestError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        start = params_dict['start']
-        interval = params_dict['interval']
-
-        # build request URL
-        if start is None:
-            timeref = 'current'
-        else:
-            if interval is None:
-                timeref = self._trim_to(
-                    formatting.to_date(start), 'year')
-            else:
-                timeref = self._trim_to(
-                    formatting.to_date(start), interval)
-
-        uri = '%s/%s,%s/%s.json' % (SO2_INDEX_URL, lat, lon, timeref)
+        uri = airpollution_queries.index_uri(SO2_INDEX_URL, params_dict)
         _, json_data = self._client.get_json(uri)
         return json_data
 
@@ -1,11 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from pyowm.airpollutionapi30 import airpollution_client, coindex, no2index, ozone, so2index
+from pyowm.airpollutionapi30 import airpollution_client, airpollution_queries, coindex, no2index, ozone, so2index
 from pyowm.airpollutionapi30.uris import ROOT_POLLUTION_API_URL
 from pyowm.commons.http_client import HttpClient
 from pyowm.constants import AIRPOLLUTION_API_VERSION
-from pyowm.utils import geo
 
 
 class AirPollutionManager:
@@ -17,18 +16,21 @@ class AirPollutionManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param http_session: the pooled HTTP transport to be shared with other managers (if not provided, a new one
+        will be created)
+    :type http_session: `pyowm.commons.http_client.HttpSession`
     :returns: an *AirPollutionManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, http_session=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
         self.ap_client = airpollution_client.AirPollutionHttpClient(
             API_key,
-            HttpClient(API_key, config, ROOT_POLLUTION_API_URL))
+            HttpClient(API_key, config, ROOT_POLLUTION_API_URL, session=http_session))
 
     def airpollution_api_version(self):
         return AIRPOLLUTION_API_VERSION
@@ -62,15 +64,8 @@ class AirPollutionManager:
             cannot be parsed, *APICallException* when OWM AirPollution API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat, 'start': start, 'interval': interval}
-        json_data = self.ap_client.get_coi(params)
-        coi = coindex.COIndex.from_dict(json_data)
-        if interval is None:
-            interval = 'year'
-        coi.interval = interval
-        return coi
+        json_data = self.ap_client.get_coi(airpollution_queries.index_params(lat, lon, start=start, interval=interval))
+        return airpollution_queries.index_from_dict(coindex.COIndex, json_data, interval)
 
     def ozone_around_coords(self, lat, lon, start=None, interval=None):
         """
@@ -100,15 +95,8 @@ class AirPollutionManager:
             cannot be parsed, *APICallException* when OWM AirPollution API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat, 'start': start, 'interval': interval}
-        json_data = self.ap_client.get_o3(params)
-        oz = ozone.Ozone.from_dict(json_data)
-        if interval is None:
-            interval = 'year'
-        oz.interval = interval
-        return oz
+        json_data = self.ap_client.get_o3(airpollution_queries.index_params(lat, lon, start=start, interval=interval))
+        return airpollution_queries.index_from_dict(ozone.Ozone, json_data, interval)
 
     def no2index_around_coords(self, lat, lon, start=None, interval=None):
         """
@@ -139,15 +127,8 @@ class AirPollutionManager:
             cannot be parsed, *APICallException* when OWM AirPollution API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat, 'start': start, 'interval': interval}
-        json_data = self.ap_client.get_no2(params)
-        no2 = no2index.NO2Index.from_dict(json_data)
-        if interval is None:
-            interval = 'year'
-        no2.interval = interval
-        return no2
+        json_data = self.ap_client.get_no2(airpollution_queries.index_params(lat, lon, start=start, interval=interval))
+        return airpollution_queries.index_from_dict(no2index.NO2Index, json_data, interval)
 
     def so2index_around_coords(self, lat, lon, start=None, interval=None):
         """
@@ -178,15 +159,8 @@ class AirPollutionManager:
             cannot be parsed, *APICallException* when OWM AirPollution API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat, 'start': start, 'interval': interval}
-        json_data = self.ap_client.get_so2(params)
-        so2 = so2index.SO2Index.from_dict(json_data)
-        if interval is None:
-            interval = 'year'
-        so2.interval = interval
-        return so2
+        json_data = self.ap_client.get_so2(airpollution_queries.index_params(lat, lon, start=start, interval=interval))
+        return airpollution_queries.index_from_dict(so2index.SO2Index, json_data, interval)
 
     def __repr__(self):
         return '<%s.%s>' % (__name__, self.__class__.__name__)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pyowm.utils import formatting, geo
+
+# The queries of the Air Pollution API methods, shared by `AirPollutionManager`, `AsyncAirPollutionManager` and
+# `AirPollutionHttpClient`: `index_params` checks the arguments of the manager methods and gives the parameters dict
+# that `index_uri` turns into the URI of the API call to be issued
+
+
+def index_params(lat, lon, start=None, interval=None):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    return {'lon': lon, 'lat': lat, 'start': start, 'interval': interval}
+
+
+def trim_to(date_object, interval):
+    if interval == 'minute':
+        return date_object.strftime('%Y-%m-%dT%H:%MZ')
+    elif interval == 'hour':
+        return date_object.strftime('%Y-%m-%dT%HZ')
+    elif interval == 'day':
+        return date_object.strftime('%Y-%m-%dZ')
+    elif interval == 'month':
+        return date_object.strftime('%Y-%mZ')
+    elif interval == 'year':
+        return date_object.strftime('%YZ')
+    else:
+        raise ValueError("The interval provided for the search "
+                         "window is invalid")
+
+
+def index_uri(index_url, params_dict):
+    start = params_dict['start']
+    interval = params_dict['interval']
+    if start is None:
+        timeref = 'current'
+    elif interval is None:
+        timeref = trim_to(formatting.to_date(start), 'year')
+    else:
+        timeref = trim_to(formatting.to_date(start), interval)
+    return '%s/%s,%s/%s.json' % (index_url, params_dict['lat'], params_dict['lon'], timeref)
+
+
+def index_from_dict(index_class, the_dict, interval):
+    """
+    Parses the pollution index out of the data dictionary of a `*_around_coords` API call
+
+    :param index_class: the class of the index (eg. *COIndex*)
+    :param interval: the `interval` argument of the call: the index interval defaults to `year`
+    :returns: an instance of `index_class`
+    """
+    index = index_class.from_dict(the_dict)
+    index.interval = 'year' if interval is None else interval
+    return index
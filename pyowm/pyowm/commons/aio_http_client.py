@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import time
+
+from pyowm.commons import exceptions
+from pyowm.commons.circuitbreaker import CircuitBreakers
+from pyowm.commons.enums import ImageTypeEnum
+from pyowm.commons.http_client import HttpClient, HttpRequestBuilder
+from pyowm.commons.jsondecoding import decoder_from_config
+from pyowm.commons.ratelimiter import RateLimiter, parse_retry_after
+from pyowm.commons.retry import RetryPolicy
+from pyowm.config import DEFAULT_CONFIG
+
+
+class AsyncHttpSession:
+
+    """
+    A pooled, keep-alive asyncio HTTP transport based on `aiohttp`, to be shared among all the `AsyncHttpClient`
+    instances created by a single `AsyncOWM` object. The underlying `aiohttp.ClientSession` is opened on first use,
+    so it is bound to the event loop that runs the first API call: the session must only be used from that loop.
+    Pooling, rate limiting, retry, circuit breaker and JSON decoder settings are read from the configuration dictionary as for
+    `pyowm.commons.http_client.HttpSession`
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :param rate_limiter: the rate limiter to be used, possibly shared with synchronous sessions (if not provided,
+        it is built based on the config)
+    :type rate_limiter: `pyowm.commons.ratelimiter.RateLimiter`
+    """
+
+    def __init__(self, config, rate_limiter=None):
+        assert isinstance(config, dict)
+        connection = dict(DEFAULT_CONFIG['connection'])
+        connection.update(config.get('connection', dict()))
+        self.pool_connections = connection['pool_connections']
+        assert isinstance(self.pool_connections, int) and self.pool_connections > 0
+        self.pool_maxsize = connection['pool_maxsize']
+        assert isinstance(self.pool_maxsize, int) and self.pool_maxsize > 0
+        self.keep_alive = connection['keep_alive']
+        assert isinstance(self.keep_alive, bool)
+        self.idle_timeout_secs = connection['idle_timeout_secs']
+        assert self.idle_timeout_secs is None or self.idle_timeout_secs > 0
+        if rate_limiter is None:
+            rate_limiter = RateLimiter.from_config(config)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = RetryPolicy.from_config(config)
+        self.circuit_breakers = CircuitBreakers.from_config(config)
+        self.decode_json = decoder_from_config(config)
+        self._session = None
+
+    def _open(self):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError('The asyncio API requires the aiohttp package: install it with "pip install pyowm[aio]"')
+        if self.keep_alive:
+            connector = aiohttp.TCPConnector(limit=self.pool_connections * self.pool_maxsize,
+                                             limit_per_host=self.pool_maxsize,
+                                             keepalive_timeout=self.idle_timeout_secs)
+        else:
+            connector = aiohttp.TCPConnector(limit=self.pool_connections * self.pool_maxsize,
+                                             limit_per_host=self.pool_maxsize,
+                                             force_close=True)
+        return aiohttp.ClientSession(connector=connector)
+
+    async def request(self, method, url, params=None, json=None, headers=None, proxies=None, timeout=None,
+                      verify=True):
+        """
+        Sends an HTTP request using a pooled connection and reads the whole response body. Arguments mirror the
+        ones of `requests.request`. GET requests are retried according to the retry policy, if any, as for
+        `pyowm.commons.http_client.HttpSession`
+
+        :param method: the HTTP method
+        :type method: str
+        :param url: the URL to be called
+        :type url: str
+        :returns: a tuple made of the response status code (int) and raw body (bytes)
+        :raises: `InvalidSSLCertificateError` when the server certificate is invalid, `ConnectionError` when the
+            server cannot be reached, `TimeoutError` when the call is timeouted, `RateLimitExceededError` if the
+            client-side rate limit does not allow the request
+        """
+        if self.retry_policy is None or method != 'GET':
+            status, _, body = await self._send(method, url, params, json, headers, proxies, timeout, verify)
+            return status, body
+        deadline = self.retry_policy.deadline()
+        attempt = 0
+        while True:
+            attempt_timeout = timeout
+            if timeout is not None:
+                attempt_timeout = max(0.001, min(timeout, deadline - time.monotonic()))
+            try:
+                status, response_headers, body = await self._send(method, url, params, json, headers, proxies,
+                                                                  attempt_timeout, verify)
+            except (exceptions.TimeoutError, exceptions.ConnectionError) as e:
+                reason = 'timeout' if isinstance(e, exceptions.TimeoutError) else 'connection_error'
+                delay = self.retry_policy.next_delay(attempt, deadline, reason)
+                if delay is None:
+                    raise
+            else:
+                if status not in self.retry_policy.status_codes:
+                    return status, body
+                delay = self.retry_policy.next_delay(attempt, deadline, 'status_%d' % status,
+                                                     parse_retry_after(response_headers.get('Retry-After')))
+                if delay is None:
+                    return status, body
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, method, url, params, json, headers, proxies, timeout, verify):
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        if self._session is None or self._session.closed:
+            self._session = self._open()
+        import aiohttp
+        proxy = None
+        if proxies:
+            proxy = proxies.get('https' if url.startswith('https') else 'http')
+        try:
+            async with self._session.request(method, url, params=params, json=json, headers=headers, proxy=proxy,
+                                             timeout=aiohttp.ClientTimeout(total=timeout),
+                                             ssl=None if verify else False) as resp:
+                if resp.status == 429 and self.rate_limiter is not None:
+                    self.rate_limiter.penalize(parse_retry_after(resp.headers.get('Retry-After')))
+                return resp.status, resp.headers, await resp.read()
+        except aiohttp.ClientSSLError as e:
+            raise exceptions.InvalidSSLCertificateError(str(e))
+        except asyncio.TimeoutError:
+            raise exceptions.TimeoutError('API call timeouted')
+        except aiohttp.ClientConnectionError as e:
+            raise exceptions.ConnectionError(str(e))
+
+    async def close(self):
+        """
+        Closes all the pooled connections. The session can still be used afterwards, new connections will be
+        opened on demand
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def __repr__(self):
+        return "<%s.%s - pool connections: %s, pool max size: %s, keep-alive: %s>" % \
+               (__name__, self.__class__.__name__, self.pool_connections, self.pool_maxsize, self.keep_alive)
+
+
+class AsyncHttpClient:
+
+    """
+    The asyncio counterpart of `pyowm.commons.http_client.HttpClient`: same interface, but all the API-calling
+    methods are coroutines
+
+    :param api_key: the OWM API key
+    :type api_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param root_uri: the root URI of the API endpoint
+    :type root_uri: str
+    :param admits_subdomains: if the root URI of the API endpoint admits subdomains based on the subcription type (default: True)
+    :type admits_subdomains: bool
+    :param session: the pooled transport to be used for HTTP calls (if not provided, a new one will be created
+        based on the config)
+    :type session: `AsyncHttpSession`
+    """
+
+    def __init__(self, api_key, config, root_uri, admits_subdomains=True, session=None):
+        assert isinstance(api_key, str)
+        self.api_key = api_key
+        assert isinstance(config, dict)
+        self.config = config
+        assert isinstance(root_uri, str)
+        self.root_uri = root_uri
+        assert isinstance(admits_subdomains, bool)
+        self.admits_subdomains = admits_subdomains
+        if session is None:
+            session = AsyncHttpSession(config)
+        assert isinstance(session, AsyncHttpSession)
+        self.session = session
+
+    def _builder(self, path, params, headers):
+        return HttpRequestBuilder(self.root_uri, self.api_key, self.config, has_subdomains=self.admits_subdomains)\
+            .with_path(path)\
+            .with_api_key()\
+            .with_language()\
+            .with_query_params(params if params is not None else dict())\
+            .with_headers(headers if headers is not None else dict())
+
+    async def _call(self, method, builder, data=None):
+        url, params, headers, proxies = builder.build()
+        # all the API calls go through the circuit breaker of the API root, if any
+        breaker = None
+        if self.session.circuit_breakers is not None:
+            breaker = self.session.circuit_breakers.get(self.root_uri)
+            breaker.before_call()
+        is_success = None
+        try:
+            try:
+                status_code, content = await self.session.request(
+                    method, url, params=params, json=data, headers=headers, proxies=proxies,
+                    timeout=self.config['connection']['timeout_secs'],
+                    verify=self.config['connection']['verify_ssl_certs'])
+            except (exceptions.TimeoutError, exceptions.ConnectionError):
+                is_success = False
+                raise
+            is_success = status_code < 500
+        finally:
+            if breaker is not None:
+                if is_success is None:
+                    breaker.release()
+                elif is_success:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+        HttpClient.check_status_code(status_code, content.decode('utf-8', errors='replace'))
+        return status_code, content
+
+    async def get_json(self, path, params=None, headers=None):
+        status_code, content = await self._call('GET', self._builder(path, params, headers))
+        try:
+            json_data = self.session.decode_json(content)
+        except:
+            raise exceptions.ParseAPIResponseError('Impossible to parse API response data')
+        # some OWM APIs embed the error status code in the response payload: let the rate limiter know
+        if isinstance(json_data, dict) and str(json_data.get('cod')) == '429':
+            if self.session.rate_limiter is not None:
+                self.session.rate_limiter.penalize()
+        return status_code, json_data
+
+    async def get_png(self, path, params=None, headers=None):
+        builder = self._builder(path, params, headers).with_header('Accept', ImageTypeEnum.PNG.mime_type)
+        return await self._call('GET', builder)
+
+    async def get_geotiff(self, path, params=None, headers=None):
+        builder = self._builder(path, params, headers).with_header('Accept', ImageTypeEnum.GEOTIFF.mime_type)
+        return await self._call('GET', builder)
+
+    async def post(self, path, params=None, data=None, headers=None):
+        status_code, content = await self._call('POST', self._builder(path, params, headers), data=data)
+        # this is a defense against OWM API responses containing an empty body!
+        try:
+            json_data = self.session.decode_json(content)
+        except:
+            json_data = {}
+        return status_code, json_data
+
+    async def put(self, path, params=None, data=None, headers=None):
+        status_code, content = await self._call('PUT', self._builder(path, params, headers), data=data)
+        # this is a defense against OWM API responses containing an empty body!
+        try:
+            json_data = self.session.decode_json(content)
+        except:
+            json_data = {}
+        return status_code, json_data
+
+    async def delete(self, path, params=None, data=None, headers=None):
+        status_code, content = await self._call('DELETE', self._builder(path, params, headers), data=data)
+        # this is a defense against OWM API responses containing an empty body!
+        try:
+            json_data = self.session.decode_json(content)
+        except:
+            json_data = None
+        return status_code, json_data
+
+    def __repr__(self):
+        return "<%s.%s - root: %s>" % (__name__, self.__class__.__name__, self.root_uri)
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.utils.cachedir import user_cache_dir
+
+
+class LRUCache:
+
+    """
+    A thread-safe, in-memory cache holding at most `max_size` items: when full, the least recently used item is
+    evicted
+
+    :param max_size: the maximum number of items in the cache
+    :type max_size: int
+    """
+
+    def __init__(self, max_size):
+        assert isinstance(max_size, int) and max_size > 0, 'Cache size must be a positive int'
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the item stored under the given key
+
+        :param key: the item key
+        :type key: str
+        :returns: a tuple made of the cached value and of its UNIX storage time, or ``None`` if the key is missing
+        """
+        with self._lock:
+            try:
+                self._items.move_to_end(key)
+                return self._items[key]
+            except KeyError:
+                return None
+
+    def set(self, key, value):
+        """
+        Stores the value under the given key, along with the current UNIX time
+
+        :param key: the item key
+        :type key: str
+        :param value: the value to be cached
+        :type value: str
+        """
+        with self._lock:
+            self._items[key] = (value, time.time())
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return "<%s.%s - size: %s, max size: %s>" % (__name__, self.__class__.__name__, len(self), self.max_size)
+
+
+class SQLiteCache:
+
+    """
+    A thread-safe cache persisted on disk by a SQLite database, that can be shared by many processes. It holds at
+    most `max_size` items: when full, the oldest stored items are evicted
+
+    :param path: path to the SQLite database file (it is created if missing, readable and writable by the user only)
+    :type path: str
+    :param max_size: the maximum number of items in the cache
+    :type max_size: int
+    """
+
+    def __init__(self, path, max_size):
+        assert isinstance(path, str), 'Path to SQLite database must be a string'
+        assert isinstance(max_size, int) and max_size > 0, 'Cache size must be a positive int'
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        if path != ':memory:' and not os.path.exists(path):
+            os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS responses '
+                           '(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)')
+
+    def get(self, key):
+        """
+        Returns the item stored under the given key
+
+        :param key: the item key
+        :type key: str
+        :returns: a tuple made of the cached value and of its UNIX storage time, or ``None`` if the key is missing
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT value, stored_at FROM responses WHERE key = ?', (key,)).fetchone()
+        return None if row is None else (row[0], row[1])
+
+    def set(self, key, value):
+        """
+        Stores the value under the given key, along with the current UNIX time
+
+        :param key: the item key
+        :type key: str
+        :param value: the value to be cached
+        :type value: str
+        """
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO responses (key, value, stored_at) VALUES (?, ?, ?)',
+                               (key, value, time.time()))
+            self._conn.execute('DELETE FROM responses WHERE key IN '
+                               '(SELECT key FROM responses ORDER BY stored_at DESC LIMIT -1 OFFSET ?)',
+                               (self.max_size,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def __repr__(self):
+        return "<%s.%s - path: %s, max size: %s>" % (__name__, self.__class__.__name__, self.path, self.max_size)
+
+
+class ResponseCache:
+
+    """
+    Caching policy for API responses, on top of a cache backend (eg. `LRUCache` or `SQLiteCache`).
+    Responses are cached for a time-to-live depending on the endpoint they come from, and are keyed on their URL and
+    query params - API key excluded. Endpoints with no time-to-live are not cached.
+    If `stale_while_revalidate_secs` is positive, expired responses keep being served for that many seconds while
+    they are refreshed in the background
+
+    :param backend: the cache backend
+    :type backend: `LRUCache` or `SQLiteCache` or any object with the same `get`/`set` interface
+    :param ttl_secs: time-to-live in seconds of the responses, by endpoint path (eg. `{'weather': 600}`). Paths are
+        matched by prefix, on whole path segments
+    :type ttl_secs: dict
+    :param stale_while_revalidate_secs: for how long expired responses can still be served (defaults to 0)
+    :type stale_while_revalidate_secs: int
+    """
+
+    EXCLUDED_PARAMS = ('appid',)
+
+    def __init__(self, backend, ttl_secs, stale_while_revalidate_secs=0):
+        assert backend is not None
+        self.backend = backend
+        assert isinstance(ttl_secs, dict)
+        self.ttl_secs = ttl_secs
+        assert stale_while_revalidate_secs >= 0
+        self.stale_while_revalidate_secs = stale_while_revalidate_secs
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds the response cache described by the `cache` section of the configuration dictionary: missing keys
+        are filled in with the values of `pyowm.config.DEFAULT_CONFIG`
+
+        :param config: the configuration dictionary
+        :type config: dict
+        :returns: a `ResponseCache` instance, or ``None`` if caching is disabled
+        """
+        cache_config = dict(DEFAULT_CONFIG['cache'])
+        cache_config.update(config.get('cache', dict()))
+        if not cache_config['enabled']:
+            return None
+        if cache_config['backend'] == 'lru':
+            backend = LRUCache(cache_config['max_size'])
+        elif cache_config['backend'] == 'sqlite':
+            path = cache_config['sqlite_path']
+            if path is None:
+                path = os.path.join(user_cache_dir(), 'responses.sqlite3')
+            backend = SQLiteCache(path, cache_config['max_size'])
+        else:
+            raise ValueError('Unsupported cache backend: {}'.format(cache_config['backend']))
+        return cls(backend, cache_config['ttl_secs'], cache_config['stale_while_revalidate_secs'])
+
+    def ttl_for(self, path):
+        """
+        Gives the time-to-live of the responses coming from the specified endpoint path
+
+        :param path: the endpoint path (eg. `forecast/daily`)
+        :type path: str
+        :returns: the time-to-live in seconds, or ``None`` if responses must not be cached
+        """
+        tokens = path.strip('/').split('/')
+        for i in range(len(tokens), 0, -1):
+            ttl = self.ttl_secs.get('/'.join(tokens[:i]))
+            if ttl is not None:
+                return ttl
+        return None
+
+    def key_for(self, url, params):
+        """
+        Gives the cache key for a request
+
+        :param url: the request URL
+        :type url: str
+        :param params: the request query params
+        :type params: dict
+        :returns: str
+        """
+        items = sorted((k, str(v)) for k, v in params.items() if k.lower() not in self.EXCLUDED_PARAMS)
+        return url + '?' + urlencode(items)
+
+    def lookup(self, key, ttl):
+        """
+        Looks up the cached response stored under the given key
+
+        :param key: the cache key
+        :type key: str
+        :param ttl: the time-to-live of the response
+        :type ttl: int
+        :returns: a tuple made of the cached response and of a bool telling if it is still fresh, or ``None`` if
+            there is no servable response
+        """
+        item = self.backend.get(key)
+        if item is None:
+            return None
+        value, stored_at = item
+        age = time.time() - stored_at
+        if age <= ttl:
+            return value, True
+        if age <= ttl + self.stale_while_revalidate_secs:
+            return value, False
+        return None
+
+    def store(self, key, value):
+        self.backend.set(key, value)
+
+    def begin_refresh(self, key):
+        """
+        Marks the response stored under the given key as being refreshed
+
+        :param key: the cache key
+        :type key: str
+        :returns: ``False`` if the response is already being refreshed, ``True`` otherwise
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def __repr__(self):
+        return "<%s.%s - backend: %s>" % (__name__, self.__class__.__name__, self.backend)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+
+from pyowm.commons import exceptions
+from pyowm.config import DEFAULT_CONFIG
+
+
+class CircuitBreaker:
+
+    """
+    A thread-safe circuit breaker protecting the calls towards an API. While *closed*, calls flow normally. After
+    `failure_threshold` consecutive failed calls the breaker *opens*: for `cooldown_secs` seconds calls fail fast
+    with a `CircuitBreakerOpenError`, without reaching the API. Then the breaker turns *half-open*: a limited number
+    of probe calls is let through, and the breaker closes again if they succeed or re-opens if they fail
+
+    :param name: the name of the protected API
+    :type name: str
+    :param failure_threshold: how many consecutive failed calls open the breaker
+    :type failure_threshold: int
+    :param cooldown_secs: for how long the breaker stays open
+    :type cooldown_secs: int or float
+    :param half_open_max_calls: how many probe calls can be in flight while the breaker is half-open (defaults to 1)
+    :type half_open_max_calls: int
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, failure_threshold, cooldown_secs, half_open_max_calls=1):
+        assert isinstance(name, str)
+        self.name = name
+        assert isinstance(failure_threshold, int) and failure_threshold > 0, 'Failure threshold must be a positive int'
+        self.failure_threshold = failure_threshold
+        assert cooldown_secs > 0, 'Cool-down must be positive'
+        self.cooldown_secs = cooldown_secs
+        assert isinstance(half_open_max_calls, int) and half_open_max_calls > 0
+        self.half_open_max_calls = half_open_max_calls
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Tells the breaker that a call is about to be made
+
+        :raises: `CircuitBreakerOpenError` if the call is not allowed
+        """
+        with self._lock:
+            if self._state == self.OPEN:
+                remaining = self._opened_at + self.cooldown_secs - time.monotonic()
+                if remaining > 0:
+                    raise exceptions.CircuitBreakerOpenError(
+                        'Too many failed calls to {}: calls suspended for {:.1f} seconds'.format(self.name, remaining))
+                self._state = self.HALF_OPEN
+                self._probes = 0
+            if self._state == self.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    raise exceptions.CircuitBreakerOpenError(
+                        'Too many failed calls to {}: calls suspended while probing'.format(self.name))
+                self._probes += 1
+
+    def record_success(self):
+        """
+        Tells the breaker that a call succeeded
+        """
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+            self._probes = 0
+
+    def record_failure(self):
+        """
+        Tells the breaker that a call failed
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+    def release(self):
+        """
+        Tells the breaker that a call ended without telling anything about the API health (eg. it was not made)
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    @property
+    def state(self):
+        """
+        Returns the current state of the breaker: `closed`, `open` or `half_open`
+
+        :returns: str
+        """
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() >= self._opened_at + self.cooldown_secs:
+                return self.HALF_OPEN
+            return self._state
+
+    def __repr__(self):
+        return "<%s.%s - name: %s, state: %s>" % (__name__, self.__class__.__name__, self.name, self.state)
+
+
+class CircuitBreakers:
+
+    """
+    Registry of the circuit breakers protecting the OWM APIs: one breaker per API root URI, created on demand
+
+    :param failure_threshold: how many consecutive failed calls open a breaker
+    :type failure_threshold: int
+    :param cooldown_secs: for how long an open breaker stays open
+    :type cooldown_secs: int or float
+    """
+
+    def __init__(self, failure_threshold, cooldown_secs):
+        self.failure_threshold = failure_threshold
+        self.cooldown_secs = cooldown_secs
+        self._breakers = dict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds the circuit breakers registry described by the `circuit_breaker` section of the configuration
+        dictionary: missing keys are filled in with the values of `pyowm.config.DEFAULT_CONFIG`
+
+        :param config: the configuration dictionary
+        :type config: dict
+        :returns: a `CircuitBreakers` instance, or ``None`` if circuit breakers are disabled
+        """
+        circuit_breaker = dict(DEFAULT_CONFIG['circuit_breaker'])
+        circuit_breaker.update(config.get('circuit_breaker', dict()))
+        if not circuit_breaker['enabled']:
+            return None
+        return cls(circuit_breaker['failure_threshold'], circuit_breaker['cooldown_secs'])
+
+    def get(self, root_uri):
+        """
+        Returns the circuit breaker protecting the API with the specified root URI
+
+        :param root_uri: the API root URI
+        :type root_uri: str
+        :returns: a `CircuitBreaker` instance
+        """
+        with self._lock:
+            breaker = self._breakers.get(root_uri)
+            if breaker is None:
+                breaker = CircuitBreaker(root_uri, self.failure_threshold, self.cooldown_secs)
+                self._breakers[root_uri] = breaker
+            return breaker
+
+    def states(self):
+        """
+        Returns the current state of all the circuit breakers
+
+        :returns: a dict mapping API root URIs to breaker states
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.state for breaker in breakers}
+
+    def __repr__(self):
+        return "<%s.%s - breakers: %s>" % (__name__, self.__class__.__name__, len(self._breakers))
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import mmap
+import struct
+
+
+class CityDB:
+
+    """
+    Read-only, memory-mapped binary database of the cities listed in the city ID files. The database file is opened
+    with `mmap`, so that it is never decompressed nor loaded as a whole: the OS pages it in on demand and several
+    processes share the same page cache copy of it. All lookups are binary searches.
+
+    The file is made of a header followed by these little-endian sections:
+
+      - *records*: one fixed-width record for each city, sorted by city ID: ID, latitude and longitude (in
+        millionths of degree), rank of the city line in the city ID files, index of the city name in the names
+        table and 2-chars country
+      - *names table*: the offsets of the distinct city names, followed by the UTF-8 encoded names
+      - *keys table*: the offsets of the distinct lowercase city names, followed by the UTF-8 encoded lowercase names
+        sorted and joined by newlines (so that substring searches can run on the whole table at once)
+      - *postings*: for each key, the offset of its postings, followed by the record numbers of the cities having
+        that lowercase name, sorted by rank
+
+    :param path: the path of the database file
+    :type path: str
+    :raises: *ValueError* if the file is not a city database
+    """
+
+    MAGIC = b'PYOWMCDB'
+    VERSION = 1
+    HEADER = struct.Struct('<8sI10I')
+    RECORD = struct.Struct('<IiiII2s')
+    OFFSET = struct.Struct('<I')
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < self.HEADER.size:
+            raise ValueError('Not a city database: {}'.format(path))
+        magic, version, self._n_records, self._n_names, self._n_keys, self._records_at, self._names_at, \
+            self._names_blob_at, self._keys_at, self._keys_blob_at, self._postings_at, self._postings_blob_at = \
+            self.HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError('Not a city database: {}'.format(path))
+
+    @classmethod
+    def build(cls, lines, path):
+        """
+        Writes the city database for the provided city ID file lines
+
+        :param lines: the lines of the city ID files, in the order of the files
+        :type lines: iterable of str
+        :param path: the path of the database file to be written
+        :type path: str
+        """
+        cities = list()
+        for rank, line in enumerate(l.strip() for l in lines):
+            if not line:
+                continue
+            name, city_id, lat, lon, country = line.rsplit(',', 4)
+            cities.append((int(city_id), int(round(float(lat) * 1e6)), int(round(float(lon) * 1e6)), rank, name,
+                           country))
+        cities.sort()
+
+        names = sorted(set(city[4] for city in cities))
+        name_indexes = {name: i for i, name in enumerate(names)}
+        postings = dict()
+        for record_number, city in enumerate(cities):
+            postings.setdefault(city[4].lower(), []).append(record_number)
+        keys = sorted(postings)
+
+        records = b''.join(cls.RECORD.pack(city_id, lat, lon, rank, name_indexes[name], country.encode('utf-8'))
+                           for city_id, lat, lon, rank, name, country in cities)
+        names_offsets, names_blob = cls._string_table(names, b'')
+        keys_offsets, keys_blob = cls._string_table(keys, b'\n')
+        postings_offsets, postings_blob = list(), list()
+        for key in keys:
+            postings_offsets.append(len(postings_blob))
+            postings_blob.extend(sorted(postings[key], key=lambda record_number: cities[record_number][3]))
+        postings_offsets.append(len(postings_blob))
+
+        sections = [records, cls._pack_ints(names_offsets), names_blob, cls._pack_ints(keys_offsets), keys_blob,
+                    cls._pack_ints(postings_offsets), cls._pack_ints(postings_blob)]
+        positions = list()
+        position = cls.HEADER.size
+        for section in sections:
+            positions.append(position)
+            position += len(section)
+        with open(path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(cities), len(names), len(keys), *positions))
+            for section in sections:
+                f.write(section)
+
+    @classmethod
+    def _string_table(cls, strings, separator):
+        offsets = list()
+        blob = bytearray()
+        for string in strings:
+            offsets.append(len(blob))
+            blob.extend(string.encode('utf-8'))
+            blob.extend(separator)
+        offsets.append(len(blob))
+        return offsets, bytes(blob)
+
+    @classmethod
+    def _pack_ints(cls, ints):
+        return struct.pack('<%dI' % len(ints), *ints)
+
+    # low-level readers
+
+    def _int_at(self, section_at, i):
+        return self.OFFSET.unpack_from(self._mm, section_at + self.OFFSET.size * i)[0]
+
+    def _name(self, i):
+        start = self._names_blob_at + self._int_at(self._names_at, i)
+        end = self._names_blob_at + self._int_at(self._names_at, i + 1)
+        return self._mm[start:end].decode('utf-8')
+
+    def _key(self, i):
+        start = self._keys_blob_at + self._int_at(self._keys_at, i)
+        end = self._keys_blob_at + self._int_at(self._keys_at, i + 1) - 1  # strip the newline
+        return self._mm[start:end]
+
+    def _record(self, record_number):
+        """
+        Returns the city stored in the provided record as a `(name, id, lat, lon, country, rank)` tuple
+        """
+        city_id, lat, lon, rank, name_index, country = \
+            self.RECORD.unpack_from(self._mm, self._records_at + self.RECORD.size * record_number)
+        return self._name(name_index), city_id, lat / 1e6, lon / 1e6, country.rstrip(b'\0').decode('utf-8'), rank
+
+    def _postings(self, key_index):
+        start = self._int_at(self._postings_at, key_index)
+        end = self._int_at(self._postings_at, key_index + 1)
+        return [self._int_at(self._postings_blob_at, i) for i in range(start, end)]
+
+    def _bisect_key(self, key):
+        lo, hi = 0, self._n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # lookups
+
+    def lookup(self, city_name, matching):
+        """
+        Returns the cities whose name matches the provided city name according to the provided matching style, in
+        the order of the city ID files
+
+        :param city_name: the city name
+        :type city_name: str
+        :param matching: the matching style: `exact`, `nocase`, `like` or `startswith`
+        :type matching: str
+        :returns: list of `[name, id, lat, lon, country]` lists
+        """
+        key = city_name.lower().encode('utf-8')
+        key_indexes = list()
+        if matching in ('exact', 'nocase', 'startswith'):
+            i = self._bisect_key(key)
+            while i < self._n_keys:
+                candidate = self._key(i)
+                if candidate == key or (matching == 'startswith' and candidate.startswith(key)):
+                    key_indexes.append(i)
+                    i += 1
+                else:
+                    break
+        elif matching == 'like':
+            start, end = self._keys_blob_at, self._postings_at
+            position = self._mm.find(key, start, end)
+            while position != -1:
+                i = self._key_index_at(position - start)
+                if not key_indexes or key_indexes[-1] != i:
+                    key_indexes.append(i)
+                position = self._mm.find(key, position + 1, end)
+        else:
+            raise ValueError('Unknown type of matching: {}'.format(matching))
+        records = sorted((self._record(n) for i in key_indexes for n in self._postings(i)), key=lambda r: r[5])
+        if matching == 'exact':
+            records = [r for r in records if r[0] == city_name]
+        return [list(r[:5]) for r in records]
+
+    def _key_index_at(self, blob_offset):
+        # the index of the key spanning the provided offset of the keys blob
+        lo, hi = 0, self._n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._int_at(self._keys_at, mid) <= blob_offset:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo - 1
+
+    def find(self, city_id):
+        """
+        Looks up the record of the city having the provided ID, with a binary search
+
+        :param city_id: the city ID
+        :type city_id: int
+        :returns: the record number (int), or ``None`` if no city has the provided ID
+        """
+        lo, hi = 0, self._n_records
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_id = self.OFFSET.unpack_from(self._mm, self._records_at + self.RECORD.size * mid)[0]
+            if mid_id < city_id:
+                lo = mid + 1
+            elif mid_id > city_id:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def city(self, record_number):
+        """
+        Returns the city stored in the provided record
+
+        :param record_number: the record number, between 0 and the number of cities
+        :type record_number: int
+        :returns: a `[name, id, lat, lon, country]` list
+        """
+        return list(self._record(record_number)[:5])
+
+    def coordinates(self):
+        """
+        Returns the coordinates of all the cities, in record order
+
+        :returns: a generator of `(lat, lon)` tuples
+        """
+        records = self._mm[self._records_at:self._records_at + self.RECORD.size * self._n_records]
+        for _, lat, lon, _, _, _ in self.RECORD.iter_unpack(records):
+            yield lat / 1e6, lon / 1e6
+
+    def close(self):
+        self._mm.close()
+
+    def __len__(self):
+        return self._n_records
+
+    def __repr__(self):
+        return "<%s.%s - path: %s, cities: %s>" % (__name__, self.__class__.__name__, self.path, self._n_records)
@@ -2,11 +2,286 @@
 # -*- coding: utf-8 -*-
 
 import bz2
-from pkg_resources import resource_filename
+import hashlib
+import os
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import chain
+from pyowm.commons.citydb import CityDB
+from pyowm.utils import geo, strings
+from pyowm.utils.cachedir import user_cache_dir
+from pyowm.utils.geoindex import GeoIndex
 from pyowm.weatherapi25.location import Location
 
 
 CITY_ID_FILES_PATH = 'cityids/%03d-%03d.txt.bz2'
+CITY_ID_FILES_RANGES = ((97, 102), (103, 108), (109, 114), (115, 122))  # first and last initials of each file
+FUZZY_MIN_SIMILARITY = 0.3
+
+
+def _resource_filename(filename):
+    # the path of a data file shipped within this package
+    try:
+        from importlib.resources import files
+    except ImportError:  # Python < 3.9
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    return str(files(__package__).joinpath(filename))
+
+
+_city_id_files_digests = dict()
+
+
+def city_id_files_digest(filepath_regex=CITY_ID_FILES_PATH):
+    """
+    Returns a digest of the contents of the city ID files, so that the city databases built out of them can be
+    told from the ones built out of other versions of the files. It is computed once per process
+
+    :param filepath_regex: Python format string that gives the path of the city ID files (defaults to the files
+        shipped with the library)
+    :type filepath_regex: str
+    :returns: a str of 16 hexadecimal digits
+    """
+    digest = _city_id_files_digests.get(filepath_regex)
+    if digest is None:
+        sha = hashlib.sha256()
+        for first, last in CITY_ID_FILES_RANGES:
+            with open(_resource_filename(filepath_regex % (first, last)), 'rb') as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b''):
+                    sha.update(chunk)
+        digest = sha.hexdigest()[:16]
+        _city_id_files_digests[filepath_regex] = digest
+    return digest
+
+
+def city_db_filename():
+    """
+    Returns the name of the binary city database file built out of the city ID files shipped with the library: it
+    changes along with the database format and with the contents of the files, so that upgrades of the library
+    shipping new city ID files lead to new databases
+
+    :returns: str
+    """
+    return 'cities-%d-%s.bin' % (CityDB.VERSION, city_id_files_digest())
+
+
+def _fuzzy_key(name):
+    return strings.fold(strings.transliterate(name))
+
+
+def _similarity(keys_trigrams, other_keys_trigrams):
+    shared = len(keys_trigrams & other_keys_trigrams)
+    return shared / float(len(keys_trigrams) + len(other_keys_trigrams) - shared)
+
+
+def fuzzy_similarity(city_name, toponym):
+    """
+    Returns how much the provided city name resembles the provided toponym, as the ratio of their shared trigrams:
+    names are transliterated to the Latin alphabet and folded (see `pyowm.utils.strings.fold`) before comparison
+
+    :param city_name: the city name
+    :type city_name: str
+    :param toponym: the toponym
+    :type toponym: str
+    :returns: a float between 0 (nothing in common) and 1 (same names)
+    """
+    return _similarity(strings.trigrams(_fuzzy_key(city_name)), strings.trigrams(_fuzzy_key(toponym)))
+
+
+class CityIndex:
+
+    """
+    In-memory index over the lines of a city ID file. Lines are kept in file order and toponyms are indexed by
+    their lowercase form in a hash map - for exact and case-insensitive lookups - and in a sorted array - for prefix
+    lookups. A newline-separated text of all the lowercase toponyms serves substring lookups, so that no lookup
+    ever needs to split the file lines again.
+    Lookups return the matching lines in file order, as the sequential scan of the file would do
+
+    :param lines: the lines of the city ID file
+    :type lines: iterable of str
+    """
+
+    def __init__(self, lines):
+        self._lines = [line.strip() for line in lines]
+        self._by_name = dict()
+        for i, line in enumerate(self._lines):
+            self._by_name.setdefault(line.rsplit(',', 4)[0].lower(), []).append(i)
+        self._names = sorted(self._by_name)
+        self._text = '\n'.join(self._names)
+        self._offsets = list()
+        offset = 0
+        for name in self._names:
+            self._offsets.append(offset)
+            offset += len(name) + 1
+
+    def lookup(self, city_name, matching):
+        """
+        Returns the lines whose toponym matches the provided city name according to the provided matching style
+
+        :param city_name: the city name
+        :type city_name: str
+        :param matching: the matching style: `exact`, `nocase`, `like` or `startswith`
+        :type matching: str
+        :returns: list of str
+        """
+        key = city_name.lower()
+        if matching in ('exact', 'nocase'):
+            positions = self._by_name.get(key, [])
+        elif matching == 'startswith':
+            positions = list()
+            for i in range(bisect_left(self._names, key), len(self._names)):
+                if not self._names[i].startswith(key):
+                    break
+                positions.extend(self._by_name[self._names[i]])
+        elif matching == 'like':
+            positions = list()
+            matched = set()
+            start = self._text.find(key)
+            while start != -1:
+                i = bisect_right(self._offsets, start) - 1
+                if i not in matched:
+                    matched.add(i)
+                    positions.extend(self._by_name[self._names[i]])
+                start = self._text.find(key, start + 1)
+        else:
+            raise ValueError('Unknown type of matching: {}'.format(matching))
+        lines = [self._lines[i] for i in sorted(positions)]
+        if matching == 'exact':
+            lines = [line for line in lines if line.rsplit(',', 4)[0] == city_name]
+        return lines
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __repr__(self):
+        return "<%s.%s - lines: %s, toponyms: %s>" % (__name__, self.__class__.__name__, len(self._lines),
+                                                      len(self._names))
+
+
+class CompletionIndex:
+
+    """
+    Index serving the completion of city name prefixes. City names are folded (see `pyowm.utils.strings.fold`)
+    and grouped by length into sorted arrays: a prefix is looked up by bisecting the arrays of increasing length, so
+    that completions come out already ranked - shorter names first, then in alphabetical order, then in the order of
+    the cities - and the lookup stops as soon as enough completions are found
+
+    :param names: the city names
+    :type names: iterable of str
+    """
+
+    def __init__(self, names):
+        by_length = dict()
+        for position, name in enumerate(names):
+            key = strings.fold(name)
+            by_length.setdefault(len(key), dict()).setdefault(key, []).append(position)
+        self._keys = dict()
+        self._positions = dict()
+        for length, positions_by_key in by_length.items():
+            self._keys[length] = sorted(positions_by_key)
+            self._positions[length] = [positions_by_key[key] for key in self._keys[length]]
+        self._lengths = sorted(by_length)
+
+    def complete(self, prefix, limit, accept=None):
+        """
+        Returns the positions of the city names starting with the provided prefix, ranked
+
+        :param prefix: the prefix
+        :type prefix: str
+        :param limit: the maximum number of positions to be returned
+        :type limit: int
+        :param accept: a function telling whether the city at a given position can be returned (optional)
+        :type accept: callable
+        :returns: list of int
+        """
+        key = strings.fold(prefix)
+        result = list()
+        for length in self._lengths[bisect_left(self._lengths, len(key)):]:
+            keys = self._keys[length]
+            for i in range(bisect_left(keys, key), len(keys)):
+                if not keys[i].startswith(key):
+                    break
+                for position in self._positions[length][i]:
+                    if accept is None or accept(position):
+                        result.append(position)
+                        if len(result) == limit:
+                            return result
+        return result
+
+    def __repr__(self):
+        return "<%s.%s - names: %s>" % (__name__, self.__class__.__name__,
+                                        sum(len(keys) for keys in self._keys.values()))
+
+
+class FuzzyIndex:
+
+    """
+    Trigram inverted index serving typo-tolerant lookups of city names. City names are transliterated to the Latin
+    alphabet and folded (see `pyowm.utils.strings.fold`), then each distinct name is indexed under its trigrams: the
+    candidate matches of a lookup are the names sharing at least a trigram with the looked up name, and they are
+    ranked by similarity (see `fuzzy_similarity`)
+
+    :param names: the city names
+    :type names: iterable of str
+    """
+
+    def __init__(self, names):
+        positions_by_key = dict()
+        for position, name in enumerate(names):
+            positions_by_key.setdefault(_fuzzy_key(name), []).append(position)
+        self._keys = list(positions_by_key)
+        self._positions = [positions_by_key[key] for key in self._keys]
+        self._sizes = array('H')
+        self._postings = dict()
+        for key_id, key in enumerate(self._keys):
+            key_trigrams = strings.trigrams(key)
+            self._sizes.append(len(key_trigrams))
+            for trigram in key_trigrams:
+                self._postings.setdefault(trigram, array('i')).append(key_id)
+
+    def lookup(self, city_name, min_similarity=FUZZY_MIN_SIMILARITY):
+        """
+        Returns the positions of the city names resembling the provided one, ranked by decreasing similarity - and
+        then by increasing length difference
+
+        :param city_name: the city name
+        :type city_name: str
+        :param min_similarity: the minimum similarity of the returned names (defaults to `FUZZY_MIN_SIMILARITY`)
+        :type min_similarity: float
+        :returns: list of int
+        """
+        key = _fuzzy_key(city_name)
+        key_trigrams = strings.trigrams(key)
+        size = len(key_trigrams)
+        shared_trigrams = Counter(chain.from_iterable(self._postings.get(t, ()) for t in key_trigrams))
+        least_shared = min_similarity * size  # similarity can't exceed shared / size
+        ranked = list()
+        for key_id, shared in shared_trigrams.items():
+            if shared < least_shared:
+                continue
+            similarity = shared / float(size + self._sizes[key_id] - shared)
+            if similarity >= min_similarity:
+                ranked.append((-similarity, abs(len(self._keys[key_id]) - len(key)), key_id))
+        ranked.sort()
+        return [position for _, _, key_id in ranked for position in self._positions[key_id]]
+
+    def __repr__(self):
+        return "<%s.%s - names: %s, trigrams: %s>" % (__name__, self.__class__.__name__, len(self._keys),
+                                                      len(self._postings))
+
+
+# process-wide city ID file indexes, city databases, city tables, spatial indexes, completion indexes and fuzzy
+# indexes, built or opened on first use and keyed by file path
+_city_indexes = dict()
+_city_dbs = dict()
+_city_tables = dict()
+_geo_indexes = dict()
+_completion_indexes = dict()
+_fuzzy_indexes = dict()
+_id_indexes = dict()
+_city_indexes_lock = threading.Lock()
 
 
 class CityIDRegistry:
@@ -15,10 +290,11 @@ class CityIDRegistry:
         'exact': lambda city_name, toponym: city_name == toponym,
         'nocase': lambda city_name, toponym: city_name.lower() == toponym.lower(),
         'like': lambda city_name, toponym: city_name.lower() in toponym.lower(),
-        'startswith': lambda city_name, toponym: toponym.lower().startswith(city_name.lower())
+        'startswith': lambda city_name, toponym: toponym.lower().startswith(city_name.lower()),
+        'fuzzy': lambda city_name, toponym: fuzzy_similarity(city_name, toponym) >= FUZZY_MIN_SIMILARITY
     }
 
-    def __init__(self, filepath_regex):
+    def __init__(self, filepath_regex, use_index=False, db_path=None):
         """
         Initialise a registry that can be used to lookup info about cities.
 
@@ -26,18 +302,37 @@ class CityIDRegistry:
                that store the city IDs information.
                Eg: ``folder1/folder2/%02d-%02d.txt``
         :type filepath_regex: str
+        :param use_index: whether lookups are served by in-memory indexes of the
+               city ID files, which are decompressed and indexed once per process
+               upon first use, instead of by scanning the files at each lookup.
+               Defaults to ``False``
+        :type use_index: bool
+        :param db_path: path of a binary city database: when provided, lookups
+               are served by the memory-mapped database instead of by the
+               city ID files. If the database is missing, it is built from
+               the city ID files upon first use. Defaults to ``None``
+        :type db_path: str
         :returns: a *CityIDRegistry* instance
 
         """
         self._filepath_regex = filepath_regex
+        self._use_index = use_index
+        self._db_path = db_path
 
     @classmethod
-    def get_instance(cls):
+    def get_instance(cls, use_index=False, use_db=False):
         """
         Factory method returning the default city ID registry
+        :param use_index: whether lookups are served by in-memory indexes
+        :type use_index: bool
+        :param use_db: whether lookups are served by the memory-mapped city
+               database, which is built from the city ID files into the user
+               cache directory upon first use (see `pyowm.utils.cachedir`)
+        :type use_db: bool
         :return: a `CityIDRegistry` instance
         """
-        return CityIDRegistry(CITY_ID_FILES_PATH)
+        db_path = os.path.join(user_cache_dir(), city_db_filename()) if use_db else None
+        return CityIDRegistry(CITY_ID_FILES_PATH, use_index=use_index, db_path=db_path)
 
     def ids_for(self, city_name, country=None, matching='nocase'):
         """
@@ -57,7 +352,10 @@ class CityIDRegistry:
         `like` - matches cities whose name contains, as a substring, the string
         fed to the function, case-insensitive,
         `startswith` - matches cities whose names start with the string fed
-        to the function, case-insensitive.
+        to the function, case-insensitive,
+        `fuzzy` - matches cities whose names resemble the string fed to the
+        function, tolerating typos, accents and Cyrillic spelling: matches are
+        ranked by decreasing similarity.
         :raises ValueError if the value for `matching` is unknown
         :return: list of tuples
         """
@@ -71,6 +369,69 @@ class CityIDRegistry:
         splits = self._filter_matching_lines(city_name, country, matching)
         return [(int(item[1]), item[0], item[4]) for item in splits]
 
+    def ids_for_many(self, city_names, country=None, matching='nocase'):
+        """
+        Batch version of `ids_for`: returns a dict mapping each one of the
+        provided city names to the list of tuples that `ids_for` would
+        return for it.
+        City names are grouped by the city ID file they are to be looked up
+        into, so that each file is read and scanned at most once - whatever
+        the number of city names. Names that can't be looked up (eg. empty
+        names or names not starting with a letter) are mapped to empty lists.
+        :param city_names: the city names
+        :type city_names: iterable of str
+        :param country: two character str representing the country where to
+        search for the cities. Defaults to `None`, which means: search in all
+        countries.
+        :param matching: str. Default is `nocase`. Possible values are the
+        same as for `ids_for`
+        :raises ValueError if the value for `matching` is unknown
+        :return: dict
+        """
+        if matching not in self.MATCHINGS:
+            raise ValueError("Unknown type of matching: "
+                             "allowed values are %s" % ", ".join(self.MATCHINGS))
+        if country is not None and len(country) != 2:
+            raise ValueError("Country must be a 2-char string")
+        result = {city_name: [] for city_name in city_names}
+
+        # indexed lookups are fast enough on their own
+        if self._is_indexed() or matching == 'fuzzy':
+            for city_name in result:
+                try:
+                    result[city_name] = self.ids_for(city_name, country=country, matching=matching)
+                except ValueError:
+                    pass
+            return result
+
+        # group city names by the file to be scanned
+        city_names_by_file = dict()
+        for city_name in result:
+            if not city_name:
+                continue
+            try:
+                if matching == 'like':
+                    filenames = [self._assess_subfile_from(c) for c in ['a', 'g', 'm', 's']]
+                else:
+                    filenames = [self._assess_subfile_from(city_name)]
+            except ValueError:
+                continue
+            for filename in filenames:
+                city_names_by_file.setdefault(filename, []).append(city_name)
+
+        for filename, names in city_names_by_file.items():
+            matches = self._batch_matcher(names, matching)
+            for line in self._get_lines(filename):
+                line = line.strip()
+                if not line:
+                    continue
+                tokens = self._split_line(line)
+                if country is not None and tokens[4] != country:
+                    continue
+                for city_name in matches(tokens[0]):
+                    result[city_name].append((int(tokens[1]), tokens[0], tokens[4]))
+        return result
+
     def locations_for(self, city_name, country=None, matching='nocase'):
         """
         Returns a list of Location objects corresponding to
@@ -89,7 +450,10 @@ class CityIDRegistry:
         `like` - matches cities whose name contains, as a substring, the string
         fed to the function, case-insensitive,
         `startswith` - matches cities whose names start with the string fed
-        to the function, case-insensitive.
+        to the function, case-insensitive,
+        `fuzzy` - matches cities whose names resemble the string fed to the
+        function, tolerating typos, accents and Cyrillic spelling: matches are
+        ranked by decreasing similarity.
         :raises ValueError if the value for `matching` is unknown
         :return: list of `weatherapi25.location.Location` objects
         """
@@ -101,8 +465,7 @@ class CityIDRegistry:
         if country is not None and len(country) != 2:
             raise ValueError("Country must be a 2-char string")
         splits = self._filter_matching_lines(city_name, country, matching)
-        return [Location(item[0], float(item[3]), float(item[2]),
-                         int(item[1]), item[4]) for item in splits]
+        return [self._location_from(item) for item in splits]
 
     def geopoints_for(self, city_name, country=None, matching='nocase'):
         """
@@ -122,15 +485,191 @@ class CityIDRegistry:
         `like` - matches cities whose name contains, as a substring, the string
         fed to the function, case-insensitive,
         `startswith` - matches cities whose names start with the string fed
-        to the function, case-insensitive.
+        to the function, case-insensitive,
+        `fuzzy` - matches cities whose names resemble the string fed to the
+        function, tolerating typos, accents and Cyrillic spelling: matches are
+        ranked by decreasing similarity.
         :raises ValueError if the value for `matching` is unknown
         :return: list of `pyowm.utils.geo.Point` objects
         """
         locations = self.locations_for(city_name, country, matching=matching)
         return [loc.to_geopoint() for loc in locations]
 
+    def nearest(self, lat, lon, k=1, max_km=None):
+        """
+        Returns the cities that are closest to the provided geographic
+        coordinates, sorted by great-circle distance.
+        The lookup is served by a spatial index of all the cities, built
+        once per process upon first use.
+        :param lat: the latitude
+        :type lat: int or float
+        :param lon: the longitude
+        :type lon: int or float
+        :param k: how many cities must be returned. Defaults to 1
+        :type k: int
+        :param max_km: the maximum distance of the returned cities in
+        kilometers. Defaults to `None`, which means: no limit
+        :type max_km: int or float
+        :raises ValueError if coordinates are out of bounds
+        :return: list of at most `k` `weatherapi25.location.Location` objects
+        """
+        geo.assert_is_lat(lat)
+        geo.assert_is_lon(lon)
+        assert isinstance(k, int) and k > 0, "'k' must be a positive int"
+        assert max_km is None or max_km > 0, 'Max distance must be greater than zero'
+        index, city_at = self._get_geo_index()
+        return [self._location_from(city_at(position)) for _, position in index.nearest(lat, lon, k, max_km)]
+
+    def within_radius(self, point, km):
+        """
+        Returns the cities whose great-circle distance from the provided
+        geopoint is not greater than the provided radius, sorted by distance.
+        The lookup is served by a spatial index of all the cities, built
+        once per process upon first use.
+        :param point: the centre of the circle
+        :type point: `pyowm.utils.geo.Point`
+        :param km: the radius of the circle in kilometers
+        :type km: int or float
+        :return: list of `weatherapi25.location.Location` objects
+        """
+        assert isinstance(point, geo.Point), "'point' must be a pyowm.utils.geo.Point"
+        assert km > 0, 'Radius must be greater than zero'
+        index, city_at = self._get_geo_index()
+        return [self._location_from(city_at(position))
+                for _, position in index.within_radius(point.lat, point.lon, km)]
+
+    def complete(self, prefix, country=None, limit=10):
+        """
+        Returns the cities whose name starts with the provided prefix, in a
+        case- and accent-insensitive way (eg. `zur` completes to `Zürich`).
+        Completions are ranked: shorter names come first.
+        The lookup is served by an index of all the city names, built once
+        per process upon first use.
+        :param prefix: the prefix of the city name
+        :type prefix: str
+        :param country: two character str representing the country where to
+        search for the city. Defaults to `None`, which means: search in all
+        countries.
+        :param limit: the maximum number of completions. Defaults to 10
+        :type limit: int
+        :raises ValueError if the country is not a 2-char string
+        :return: list of `weatherapi25.location.Location` objects
+        """
+        assert isinstance(limit, int) and limit > 0, "'limit' must be a positive int"
+        if not prefix:
+            return []
+        if country is not None and len(country) != 2:
+            raise ValueError("Country must be a 2-char string")
+        count, city_at = self._get_cities()
+        accept = None if country is None else lambda position: city_at(position)[4] == country
+        return [self._location_from(city_at(position))
+                for position in self._get_completion_index().complete(prefix, limit, accept=accept)]
+
+    def location_for_id(self, id):
+        """
+        Returns the Location object of the city having the provided ID.
+        The lookup is a binary search on an array of the city IDs.
+        :param id: the city ID
+        :type id: int
+        :raises ValueError if the ID is negative
+        :return: a `weatherapi25.location.Location` object, or `None` if no
+        city has the provided ID
+        """
+        return self.locations_for_ids([id])[id]
+
+    def locations_for_ids(self, ids):
+        """
+        Returns the Location objects of the cities having the provided IDs.
+        Each lookup is a binary search on an array of the city IDs.
+        :param ids: the city IDs
+        :type ids: iterable of int
+        :raises ValueError if an ID is negative
+        :return: a dict mapping each ID to a `weatherapi25.location.Location`
+        object, or to `None` if no city has that ID
+        """
+        ids = list(ids)
+        for id in ids:
+            assert type(id) is int, "'id' must be an int"
+            if id < 0:
+                raise ValueError("'id' value must be greater than 0")
+        cities = self._cities_for_ids(ids)
+        return {id: None if cities.get(id) is None else self._location_from(cities[id]) for id in ids}
+
     # helper functions
 
+    def _cities_for_ids(self, ids):
+        """
+        Returns a dict mapping the provided city IDs to the split tokens of
+        the corresponding cities, if any
+        :param ids: list of int
+        :return: dict
+        """
+        result = dict()
+        if self._db_path is not None:
+            db = self._get_db()
+            for id in ids:
+                record_number = db.find(id)
+                if record_number is not None:
+                    result[id] = db.city(record_number)
+            return result
+        sorted_ids, positions = self._get_id_index()
+        count, city_at = self._get_cities()
+        for id in ids:
+            i = bisect_left(sorted_ids, id)
+            if i < len(sorted_ids) and sorted_ids[i] == id:
+                result[id] = city_at(positions[i])
+        return result
+
+    @staticmethod
+    def _split_line(line):
+        tokens = line.split(",")
+        # sometimes city names have one or more inner commas
+        if len(tokens) > 5:
+            tokens = [','.join(tokens[:-4]), *tokens[-4:]]
+        return tokens
+
+    def _is_indexed(self):
+        # whether lookups are served by indexes rather than by file scans
+        return self._db_path is not None or self._use_index
+
+    @staticmethod
+    def _batch_matcher(city_names, matching):
+        """
+        Returns a function telling which ones of the provided city names
+        match a given toponym according to the provided matching style, in
+        a time that does not depend on the number of city names
+        :param city_names: list of str
+        :param matching: str
+        :return: function
+        """
+        names_by_key = dict()
+        for city_name in city_names:
+            key = city_name if matching == 'exact' else city_name.lower()
+            names_by_key.setdefault(key, []).append(city_name)
+
+        if matching == 'exact':
+            return lambda toponym: names_by_key.get(toponym, ())
+        if matching == 'nocase':
+            return lambda toponym: names_by_key.get(toponym.lower(), ())
+        if matching == 'startswith':
+            def matches(toponym):
+                toponym = toponym.lower()
+                return [name for i in range(1, len(toponym) + 1) for name in names_by_key.get(toponym[:i], ())]
+            return matches
+
+        # like: look up all the substrings of the toponym having the length of a city name
+        lengths = sorted(set(len(key) for key in names_by_key))
+
+        def matches(toponym):
+            toponym = toponym.lower()
+            keys = set(toponym[i:i + length] for length in lengths for i in range(len(toponym) - length + 1))
+            return [name for key in keys for name in names_by_key.get(key, ())]
+        return matches
+
+    @staticmethod
+    def _location_from(tokens):
+        return Location(tokens[0], float(tokens[3]), float(tokens[2]), int(tokens[1]), tokens[4])
+
     def _filter_matching_lines(self, city_name, country, matching):
         """
         Returns an iterable whose items are the lists of split tokens of every
@@ -143,9 +682,25 @@ class CityIDRegistry:
         """
         result = list()
 
+        # fuzzy matchings are served by an index of all the city names
+        if matching == 'fuzzy':
+            count, city_at = self._get_cities()
+            cities = map(city_at, self._get_fuzzy_index().lookup(city_name))
+            return [tokens for tokens in cities if country is None or tokens[4] == country]
+
         # find the right file to scan and extract its lines. Upon "like"
         # matchings, just read all files
-        if matching == 'like':
+        if self._db_path is not None:
+            if matching != 'like':
+                self._assess_subfile_from(city_name)  # only validates the city name
+            lines = self._get_db().lookup(city_name, matching)
+        elif self._use_index:
+            if matching == 'like':
+                filenames = [self._assess_subfile_from(c) for c in ['a', 'g', 'm', 's']]
+            else:
+                filenames = [self._assess_subfile_from(city_name)]
+            lines = [l for filename in filenames for l in self._get_index(filename).lookup(city_name, matching)]
+        elif matching == 'like':
             lines = [l.strip() for l in self._get_all_lines()]
         else:
             filename = self._assess_subfile_from(city_name)
@@ -153,11 +708,10 @@ class CityIDRegistry:
 
         # look for toponyms matching the specified city_name and according to
         # the specified matching style
+        if self._db_path is not None:
+            return [tokens for tokens in lines if country is None or tokens[4] == country]
         for line in lines:
-            tokens = line.split(",")
-            # sometimes city names have one or more inner commas
-            if len(tokens) > 5:
-                tokens = [','.join(tokens[:-4]), *tokens[-4:]]
+            tokens = self._split_line(line)
             # check country
             if country is not None:
                 if tokens[4] != country:
@@ -194,13 +748,111 @@ class CityIDRegistry:
             raise ValueError('Error: city name must start with a letter')
 
     def _get_lines(self, filename):
-        res_name = resource_filename(__name__, filename)
+        res_name = _resource_filename(filename)
         with bz2.open(res_name, mode='rb') as fh:
             lines = fh.readlines()
             if type(lines[0]) is bytes:
                 lines = map(lambda l: l.decode("utf-8"), lines)
             return lines
 
+    def _get_index(self, filename):
+        index = _city_indexes.get(filename)
+        if index is None:
+            with _city_indexes_lock:
+                index = _city_indexes.get(filename)
+                if index is None:
+                    index = CityIndex(self._get_lines(filename))
+                    _city_indexes[filename] = index
+        return index
+
+    def _get_db(self):
+        db = _city_dbs.get(self._db_path)
+        if db is None:
+            with _city_indexes_lock:
+                db = _city_dbs.get(self._db_path)
+                if db is None:
+                    if not os.path.isfile(self._db_path):
+                        self._build_db()
+                    db = CityDB(self._db_path)
+                    _city_dbs[self._db_path] = db
+        return db
+
+    def _build_db(self):
+        # the database is built aside, in a new file readable by the user only, and then moved in place: so other
+        # processes never see it half-built
+        fd, building_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(self._db_path)))
+        os.close(fd)
+        try:
+            CityDB.build(self._get_all_lines(), building_path)
+            os.replace(building_path, self._db_path)
+        finally:
+            if os.path.exists(building_path):
+                os.remove(building_path)
+
+    def _get_cities(self):
+        # the number of cities, along with the function returning the split tokens of the city at a given position.
+        # Cities are read from the city database if any, or from all the city ID files
+        key = self._db_path if self._db_path is not None else self._filepath_regex
+        cities = _city_tables.get(key)
+        if cities is None:
+            if self._db_path is not None:
+                db = self._get_db()
+                cities = (len(db), db.city)
+            else:
+                lines = [l.strip() for l in self._get_all_lines() if l.strip()]
+                cities = (len(lines), lambda position: CityIDRegistry._split_line(lines[position]))
+            # concurrent builders may race: the first built table wins
+            with _city_indexes_lock:
+                cities = _city_tables.setdefault(key, cities)
+        return cities
+
+    def _get_geo_index(self):
+        # the spatial index of all the cities, along with the function returning the split tokens of the city at
+        # a given index position
+        key = self._db_path if self._db_path is not None else self._filepath_regex
+        geo_index = _geo_indexes.get(key)
+        if geo_index is None:
+            count, city_at = self._get_cities()
+            if self._db_path is not None:
+                coordinates = self._get_db().coordinates()
+            else:
+                coordinates = ((float(t[2]), float(t[3])) for t in map(city_at, range(count)))
+            with _city_indexes_lock:
+                geo_index = _geo_indexes.setdefault(key, (GeoIndex(coordinates), city_at))
+        return geo_index
+
+    def _get_completion_index(self):
+        key = self._db_path if self._db_path is not None else self._filepath_regex
+        index = _completion_indexes.get(key)
+        if index is None:
+            count, city_at = self._get_cities()
+            index = CompletionIndex(city_at(position)[0] for position in range(count))
+            with _city_indexes_lock:
+                index = _completion_indexes.setdefault(key, index)
+        return index
+
+    def _get_fuzzy_index(self):
+        key = self._db_path if self._db_path is not None else self._filepath_regex
+        index = _fuzzy_indexes.get(key)
+        if index is None:
+            count, city_at = self._get_cities()
+            index = FuzzyIndex(city_at(position)[0] for position in range(count))
+            with _city_indexes_lock:
+                index = _fuzzy_indexes.setdefault(key, index)
+        return index
+
+    def _get_id_index(self):
+        # the sorted array of all the city IDs, along with the array of the corresponding city positions
+        key = self._filepath_regex
+        id_index = _id_indexes.get(key)
+        if id_index is None:
+            count, city_at = self._get_cities()
+            pairs = sorted((int(city_at(position)[1]), position) for position in range(count))
+            id_index = (array('q', (id for id, _ in pairs)), array('l', (position for _, position in pairs)))
+            with _city_indexes_lock:
+                id_index = _id_indexes.setdefault(key, id_index)
+        return id_index
+
     def _get_all_lines(self):
         all_lines = list()
         for city_name in ['a', 'g', 'm', 's']:  # all available city ID files
@@ -223,5 +875,5 @@ class CityIDRegistry:
         return None
 
     def __repr__(self):
-        return "<%s.%s - filepath_regex=%s>" % (__name__, \
-          self.__class__.__name__, self._filepath_regex)
+        return "<%s.%s - filepath_regex=%s, use_index=%s, db_path=%s>" % (__name__, \
+          self.__class__.__name__, self._filepath_regex, self._use_index, self._db_path)
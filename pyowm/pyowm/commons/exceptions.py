@@ -45,6 +45,38 @@ class TimeoutError(APIRequestError):
     pass
 
 
+class TooManyRequestsError(APIRequestError):
+    """
+    Error class that represents 429 errors - i.e when the API calls quota of the subscription
+    has been exceeded.
+    """
+    pass
+
+
+class RateLimitExceededError(APIRequestError):
+    """
+    Error class that represents the situation when an API call is not made because it would
+    exceed the client-side rate limit.
+    """
+    pass
+
+
+class ConnectionError(APIRequestError):
+    """
+    Error class that represents failures in connecting to the OWM API servers, in example when
+    DNS resolution fails or the connection is refused or reset.
+    """
+    pass
+
+
+class CircuitBreakerOpenError(APIRequestError):
+    """
+    Error class that represents the situation when an API call is not made because too many
+    calls to the same API failed recently.
+    """
+    pass
+
+
 class InvalidSSLCertificateError(APIRequestError):
     """
     Error class that represents failure in verifying the SSL certificate provided
@@ -53,6 +85,17 @@ class InvalidSSLCertificateError(APIRequestError):
     pass
 
 
+class BulkAPIRequestError(PyOWMError):
+    """
+    Error class that represents the failure of some of the API calls issued by a bulk
+    request. The `failures` attribute lists the failed calls as tuples made of the call
+    arguments and the raised exception.
+    """
+    def __init__(self, failures):
+        self.failures = failures
+        super().__init__('%d API calls of the bulk request failed' % len(failures))
+
+
 class APIResponseError(PyOWMError):
     """
     Generic base class for exceptions representing HTTP error status codes in OWM Weather API
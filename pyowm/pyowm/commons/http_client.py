@@ -2,16 +2,27 @@
 # -*- coding: utf-8 -*-
 
 import json
+import threading
+import time
+from urllib.parse import urlencode
 import requests
+from requests.adapters import HTTPAdapter
 
 from pyowm.commons import exceptions
+from pyowm.commons.circuitbreaker import CircuitBreakers
 from pyowm.commons.enums import ImageTypeEnum
+from pyowm.commons.jsondecoding import decoder_from_config
+from pyowm.commons.ratelimiter import RateLimiter, parse_retry_after
+from pyowm.commons.retry import RetryPolicy
+from pyowm.commons.singleflight import SingleFlight
+from pyowm.config import DEFAULT_CONFIG
 
 
 class HttpRequestBuilder:
 
     URL_TEMPLATE_WITH_SUBDOMAINS = '{}://{}.{}/{}'
     URL_TEMPLATE_WITHOUT_SUBDOMAINS = '{}://{}/{}'
+    HEADER_VALUE_TYPES = (str, int, float, bool, list, tuple, dict, type(None))  # the JSON serializable ones
 
     """
     A stateful HTTP URL, params and headers builder with a fluent interface
@@ -65,9 +76,7 @@ class HttpRequestBuilder:
 
     def with_header(self, key, value):
         assert isinstance(key, str)
-        try:
-            json.dumps(value)
-        except TypeError:
+        if not isinstance(value, self.HEADER_VALUE_TYPES):
             raise ValueError('Header value is not JSON serializable')
         self.headers.update({key: value})
         return self
@@ -97,6 +106,173 @@ class HttpRequestBuilder:
         return "<%s.%s>" % (__name__, self.__class__.__name__)
 
 
+class HttpSession:
+
+    """
+    A pooled, keep-alive HTTP transport that can be shared among threads and among all the `HttpClient` instances
+    created by a single `OWM` object, so that connections to the OWM API hosts are reused across calls. It also
+    holds the state shared by those clients: the responses cache, the in-flight calls registry, the rate limiter,
+    the retry policy, the circuit breakers and the JSON decoder, each one built from its section of the
+    configuration dictionary (missing keys are filled in with the values of `pyowm.config.DEFAULT_CONFIG`)
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :param rate_limiter: the rate limiter to be used (if not provided, it is built based on the config)
+    :type rate_limiter: `pyowm.commons.ratelimiter.RateLimiter`
+    """
+
+    def __init__(self, config, rate_limiter=None):
+        assert isinstance(config, dict)
+        connection = dict(DEFAULT_CONFIG['connection'])
+        connection.update(config.get('connection', dict()))
+        self.pool_connections = connection['pool_connections']
+        assert isinstance(self.pool_connections, int) and self.pool_connections > 0
+        self.pool_maxsize = connection['pool_maxsize']
+        assert isinstance(self.pool_maxsize, int) and self.pool_maxsize > 0
+        self.keep_alive = connection['keep_alive']
+        assert isinstance(self.keep_alive, bool)
+        self.idle_timeout_secs = connection['idle_timeout_secs']
+        assert self.idle_timeout_secs is None or self.idle_timeout_secs > 0
+        self._lock = threading.Lock()
+        self._last_used = None
+        self._session = self._new_session()
+        self._users = {self._session: 0}  # number of requests in progress, by session
+        self.cache = None
+        if config.get('cache', dict()).get('enabled', DEFAULT_CONFIG['cache']['enabled']):
+            from pyowm.commons.cache import ResponseCache  # imported here as it loads sqlite3
+            self.cache = ResponseCache.from_config(config)
+        self.single_flight = SingleFlight()
+        if rate_limiter is None:
+            rate_limiter = RateLimiter.from_config(config)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = RetryPolicy.from_config(config)
+        self.circuit_breakers = CircuitBreakers.from_config(config)
+        self.decode_json = decoder_from_config(config)
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def _replace_session(self):
+        # must be called holding the lock: requests in progress keep on using the old session, which is closed
+        # as soon as the last of them is over
+        old_session = self._session
+        self._session = self._new_session()
+        self._users[self._session] = 0
+        if self._users[old_session] == 0:
+            del self._users[old_session]
+            old_session.close()
+
+    def _acquire_session(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._last_used is not None and self.idle_timeout_secs is not None \
+                    and now - self._last_used > self.idle_timeout_secs:
+                # pooled connections are likely to have been dropped server-side: start over with fresh ones
+                self._replace_session()
+            self._last_used = now
+            self._users[self._session] += 1
+            return self._session
+
+    def _release_session(self, session):
+        with self._lock:
+            self._users[session] -= 1
+            if self._users[session] == 0 and session is not self._session:
+                del self._users[session]
+                session.close()
+
+    def request(self, method, url, **kwargs):
+        """
+        Sends an HTTP request using a pooled connection. Keyword arguments are the same as `requests.request`.
+        GET requests are retried according to the retry policy, if any: the timeout of each attempt is shortened so
+        that the retry policy deadline is not exceeded
+
+        :param method: the HTTP method
+        :type method: str
+        :param url: the URL to be called
+        :type url: str
+        :returns: a `requests.Response` instance
+        :raises: `RateLimitExceededError` if the client-side rate limit does not allow the request, any
+            `requests.exceptions.RequestException` raised by the last attempt
+        """
+        if self.retry_policy is None or method != 'GET':
+            return self._send(method, url, **kwargs)
+        deadline = self.retry_policy.deadline()
+        timeout = kwargs.get('timeout')
+        attempt = 0
+        while True:
+            if isinstance(timeout, (int, float)):
+                kwargs['timeout'] = max(0.001, min(timeout, deadline - time.monotonic()))
+            try:
+                resp = self._send(method, url, **kwargs)
+            except requests.exceptions.SSLError:
+                raise
+            except requests.exceptions.RequestException as e:
+                if isinstance(e, requests.exceptions.ConnectTimeout):
+                    reason = 'connect_timeout'
+                elif isinstance(e, requests.exceptions.ReadTimeout):
+                    reason = 'read_timeout'
+                elif isinstance(e, requests.exceptions.ConnectionError):
+                    reason = 'connection_error'
+                else:
+                    raise
+                delay = self.retry_policy.next_delay(attempt, deadline, reason)
+                if delay is None:
+                    raise
+            else:
+                if resp.status_code not in self.retry_policy.status_codes:
+                    return resp
+                delay = self.retry_policy.next_delay(attempt, deadline, 'status_%d' % resp.status_code,
+                                                     parse_retry_after(resp.headers.get('Retry-After')))
+                if delay is None:
+                    return resp
+                resp.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(self, method, url, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        session = self._acquire_session()
+        try:
+            resp = session.request(method, url, **kwargs)
+        finally:
+            self._release_session(session)
+        if resp.status_code == 429 and self.rate_limiter is not None:
+            self.rate_limiter.penalize(parse_retry_after(resp.headers.get('Retry-After')))
+        return resp
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def close(self):
+        """
+        Closes all the pooled connections, once the requests in progress are over. The session can still be used
+        afterwards, new connections will be opened on demand
+        """
+        with self._lock:
+            self._replace_session()
+            self._last_used = None
+
+    def __repr__(self):
+        return "<%s.%s - pool connections: %s, pool max size: %s, keep-alive: %s>" % \
+               (__name__, self.__class__.__name__, self.pool_connections, self.pool_maxsize, self.keep_alive)
+
+
 class HttpClient:
 
     """
@@ -110,9 +286,12 @@ class HttpClient:
     :type root_uri: str
     :param admits_subdomains: if the root URI of the API endpoint admits subdomains based on the subcription type (default: True)
     :type admits_subdomains: bool
+    :param session: the pooled transport to be used for HTTP calls (if not provided, a new one will be created
+        based on the config)
+    :type session: `HttpSession`
     """
 
-    def __init__(self, api_key, config, root_uri, admits_subdomains=True):
+    def __init__(self, api_key, config, root_uri, admits_subdomains=True, session=None):
         assert isinstance(api_key, str)
         self.api_key = api_key
         assert isinstance(config, dict)
@@ -121,6 +300,10 @@ class HttpClient:
         self.root_uri = root_uri
         assert isinstance(admits_subdomains, bool)
         self.admits_subdomains = admits_subdomains
+        if session is None:
+            session = HttpSession(config)
+        assert isinstance(session, HttpSession)
+        self.session = session
 
     def get_json(self, path, params=None, headers=None):
         builder = HttpRequestBuilder(self.root_uri, self.api_key, self.config, has_subdomains=self.admits_subdomains)\
@@ -130,22 +313,63 @@ class HttpClient:
             .with_query_params(params if params is not None else dict())\
             .with_headers(headers if headers is not None else dict())
         url, params, headers, proxies = builder.build()
+        cache = self.session.cache
+        ttl = cache.ttl_for(path) if cache is not None else None
+        if ttl is None:
+            resp = self._coalesced_get_json_response(url, params, headers, proxies)
+            json_data = self._parse_json(resp.content)
+            self._is_quota_exceeded(json_data)
+            return resp.status_code, json_data
+
+        # cached API responses are served as long as they are fresh - or stale within the configured time window,
+        # in which case they are refreshed in the background
+        key = cache.key_for(url, params)
+        cached = cache.lookup(key, ttl)
+        if cached is not None:
+            text, is_fresh = cached
+            if not is_fresh and cache.begin_refresh(key):
+                threading.Thread(target=self._refresh_cached_json, args=(key, url, params, headers, proxies),
+                                 daemon=True).start()
+            return 200, self._parse_json(text)
+        resp = self._coalesced_get_json_response(url, params, headers, proxies)
+        json_data = self._parse_json(resp.content)
+        if not self._is_quota_exceeded(json_data):
+            cache.store(key, resp.text)
+        return resp.status_code, json_data
+
+    def _coalesced_get_json_response(self, url, params, headers, proxies):
+        # concurrent identical API calls are coalesced into a single one, whose response is shared by all callers
+        key = '{}?{}#{}'.format(url, urlencode(sorted((k, str(v)) for k, v in params.items())),
+                                json.dumps(headers, sort_keys=True))
+        return self.session.single_flight.do(
+            key, lambda: self._request('get', url, params=params, headers=headers, proxies=proxies))
+
+    def _parse_json(self, document):
+        # response bodies are decoded straight from bytes, with no intermediate text decoding
         try:
-            resp = requests.get(url, params=params, headers=headers, proxies=proxies,
-                                timeout=self.config['connection']['timeout_secs'],
-                                verify=self.config['connection']['verify_ssl_certs'])
-        except requests.exceptions.SSLError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.ConnectionError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.Timeout:
-            raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
-        try:
-            return resp.status_code, resp.json()
+            return self.session.decode_json(document)
         except:
             raise exceptions.ParseAPIResponseError('Impossible to parse API response data')
 
+    def _is_quota_exceeded(self, json_data):
+        # some OWM APIs embed the error status code in the response payload: let the rate limiter know
+        if isinstance(json_data, dict) and str(json_data.get('cod')) == '429':
+            if self.session.rate_limiter is not None:
+                self.session.rate_limiter.penalize()
+            return True
+        return False
+
+    def _refresh_cached_json(self, key, url, params, headers, proxies):
+        cache = self.session.cache
+        try:
+            resp = self._coalesced_get_json_response(url, params, headers, proxies)
+            if not self._is_quota_exceeded(self._parse_json(resp.content)):
+                cache.store(key, resp.text)
+        except Exception:
+            pass  # the stale response will be served until a refresh succeeds or it expires for good
+        finally:
+            cache.end_refresh(key)
+
     def get_png(self, path, params=None, headers=None):
         builder = HttpRequestBuilder(self.root_uri, self.api_key, self.config, has_subdomains=self.admits_subdomains)\
             .with_path(path)\
@@ -155,17 +379,7 @@ class HttpClient:
             .with_headers(headers if headers is not None else dict())\
             .with_header('Accept', ImageTypeEnum.PNG.mime_type)
         url, params, headers, proxies = builder.build()
-        try:
-            resp = requests.get(url, stream=True, params=params, headers=headers, proxies=proxies,
-                                timeout=self.config['connection']['timeout_secs'],
-                                verify=self.config['connection']['verify_ssl_certs'])
-        except requests.exceptions.SSLError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.ConnectionError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.Timeout:
-            raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        resp = self._request('get', url, stream=True, params=params, headers=headers, proxies=proxies)
         try:
             return resp.status_code, resp.content
         except:
@@ -181,17 +395,7 @@ class HttpClient:
             .with_headers(headers if headers is not None else dict())\
             .with_header('Accept', ImageTypeEnum.GEOTIFF.mime_type)
         url, params, headers, proxies = builder.build()
-        try:
-            resp = requests.get(url, stream=True, params=params, headers=headers, proxies=proxies,
-                                timeout=self.config['connection']['timeout_secs'],
-                                verify=self.config['connection']['verify_ssl_certs'])
-        except requests.exceptions.SSLError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.ConnectionError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.Timeout:
-            raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        resp = self._request('get', url, stream=True, params=params, headers=headers, proxies=proxies)
         try:
             return resp.status_code, resp.content
         except:
@@ -206,20 +410,10 @@ class HttpClient:
             .with_query_params(params if params is not None else dict())\
             .with_headers(headers if headers is not None else dict())
         url, params, headers, proxies = builder.build()
-        try:
-            resp = requests.post(url, params=params, json=data, headers=headers, proxies=proxies,
-                                 timeout=self.config['connection']['timeout_secs'],
-                                 verify=self.config['connection']['verify_ssl_certs'])
-        except requests.exceptions.SSLError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.ConnectionError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.Timeout:
-            raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        resp = self._request('post', url, params=params, json=data, headers=headers, proxies=proxies)
         # this is a defense against OWM API responses containing an empty body!
         try:
-            json_data = resp.json()
+            json_data = self.session.decode_json(resp.content)
         except:
             json_data = {}
         return resp.status_code, json_data
@@ -232,20 +426,10 @@ class HttpClient:
             .with_query_params(params if params is not None else dict())\
             .with_headers(headers if headers is not None else dict())
         url, params, headers, proxies = builder.build()
-        try:
-            resp = requests.put(url, params=params, json=data, headers=headers, proxies=proxies,
-                                timeout=self.config['connection']['timeout_secs'],
-                                verify=self.config['connection']['verify_ssl_certs'])
-        except requests.exceptions.SSLError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.ConnectionError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.Timeout:
-            raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        resp = self._request('put', url, params=params, json=data, headers=headers, proxies=proxies)
         # this is a defense against OWM API responses containing an empty body!
         try:
-            json_data = resp.json()
+            json_data = self.session.decode_json(resp.content)
         except:
             json_data = {}
         return resp.status_code, json_data
@@ -258,24 +442,45 @@ class HttpClient:
             .with_query_params(params if params is not None else dict())\
             .with_headers(headers if headers is not None else dict())
         url, params, headers, proxies = builder.build()
-        try:
-            resp = requests.delete(url, params=params, json=data, headers=headers, proxies=proxies,
-                                   timeout=self.config['connection']['timeout_secs'],
-                                   verify=self.config['connection']['verify_ssl_certs'])
-        except requests.exceptions.SSLError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.ConnectionError as e:
-            raise exceptions.InvalidSSLCertificateError(str(e))
-        except requests.exceptions.Timeout:
-            raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        resp = self._request('delete', url, params=params, json=data, headers=headers, proxies=proxies)
         # this is a defense against OWM API responses containing an empty body!
         try:
-            json_data = resp.json()
+            json_data = self.session.decode_json(resp.content)
         except:
             json_data = None
         return resp.status_code, json_data
 
+    def _request(self, method, url, **kwargs):
+        # all the API calls go through the circuit breaker of the API root, if any
+        breaker = None
+        if self.session.circuit_breakers is not None:
+            breaker = self.session.circuit_breakers.get(self.root_uri)
+            breaker.before_call()
+        is_success = None
+        try:
+            try:
+                resp = getattr(self.session, method)(url, timeout=self.config['connection']['timeout_secs'],
+                                                     verify=self.config['connection']['verify_ssl_certs'], **kwargs)
+            except requests.exceptions.SSLError as e:
+                raise exceptions.InvalidSSLCertificateError(str(e))
+            except requests.exceptions.Timeout:
+                is_success = False
+                raise exceptions.TimeoutError('API call timeouted')
+            except requests.exceptions.ConnectionError as e:
+                is_success = False
+                raise exceptions.ConnectionError(str(e))
+            is_success = resp.status_code < 500
+        finally:
+            if breaker is not None:
+                if is_success is None:
+                    breaker.release()
+                elif is_success:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+        HttpClient.check_status_code(resp.status_code, resp.text)
+        return resp
+
     @classmethod
     def check_status_code(cls, status_code, payload):
         if status_code < 400:
@@ -286,6 +491,8 @@ class HttpClient:
             raise exceptions.UnauthorizedError('Invalid API Key provided')
         elif status_code == 404:
             raise exceptions.NotFoundError('Unable to find the resource')
+        elif status_code == 429:
+            raise exceptions.TooManyRequestsError('API calls quota exceeded')
         elif status_code == 502:
             raise exceptions.BadGatewayError('Unable to contact the upstream server')
         else:
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import importlib
+import json
+
+from pyowm.config import DEFAULT_CONFIG
+
+
+DECODERS = ('orjson', 'ujson', 'json')  # by decreasing speed
+
+
+def _json_loads(document):
+    # the standard library parses bytes after sniffing their encoding, which is slower than decoding them as UTF-8
+    if isinstance(document, (bytes, bytearray)):
+        document = document.decode('utf-8')
+    return json.loads(document)
+
+
+def decoder_for(name='auto'):
+    """
+    Gives the function decoding JSON documents with the specified library. All the decoders parse `bytes` (UTF-8
+    encoded JSON, as found in HTTP response bodies) as well as `str` documents, and raise a `ValueError` subclass
+    when a document cannot be parsed
+
+    :param name: the name of the decoding library: `orjson`, `ujson` and `json` (the standard library module), or
+        `auto` for the fastest of them which is installed (defaults to `auto`)
+    :type name: str
+    :returns: a one-argument function
+    :raises: *ValueError* if the library is not supported, *ImportError* if it is not installed
+    """
+    if name == 'auto':
+        for candidate in DECODERS[:-1]:
+            try:
+                return importlib.import_module(candidate).loads
+            except ImportError:
+                pass
+        name = 'json'
+    if name == 'json':
+        return _json_loads
+    if name not in DECODERS:
+        raise ValueError('Unsupported JSON decoder: {}'.format(name))
+    try:
+        return importlib.import_module(name).loads
+    except ImportError:
+        raise ImportError('The {} JSON decoder is not installed: install it with "pip install {}"'.format(name, name))
+
+
+def decoder_from_config(config):
+    """
+    Gives the function decoding JSON documents with the library named by the `json_decoder` key of the configuration
+    dictionary: if the key is missing, the value of `pyowm.config.DEFAULT_CONFIG` is used
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :returns: a one-argument function
+    :raises: *ValueError* if the library is not supported, *ImportError* if it is not installed
+    """
+    return decoder_for(config.get('json_decoder', DEFAULT_CONFIG['json_decoder']))
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from pyowm.commons import exceptions
+from pyowm.config import DEFAULT_CONFIG
+
+
+def parse_retry_after(value):
+    """
+    Parses the value of a `Retry-After` HTTP header, either expressed in seconds or as an HTTP date
+
+    :param value: the header value
+    :type value: str or ``None``
+    :returns: the number of seconds to wait (float), or ``None`` if the value is missing or cannot be parsed
+    """
+    if value is None:
+        return None
+    try:
+        return max(0., float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0., parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class RateLimiter:
+
+    """
+    A thread-safe and asyncio-safe token bucket limiting the rate of API calls. The bucket holds at most
+    `burst_size` tokens and is refilled at `calls_per_minute` tokens per minute: each API call takes one token.
+    When the bucket is empty, the `block` policy makes callers wait for the next token, while the `fail` policy makes
+    them fail fast with a `RateLimitExceededError`.
+    When the API reports that the quota is exceeded, the bucket is emptied and no tokens are handed out until the
+    server-suggested retry time
+
+    :param calls_per_minute: the allowed number of API calls per minute
+    :type calls_per_minute: int or float
+    :param burst_size: the maximum number of API calls that can be made in a burst
+    :type burst_size: int
+    :param policy: what to do when the bucket is empty: `block` or `fail` (defaults to `block`)
+    :type policy: str
+    """
+
+    POLICIES = ('block', 'fail')
+
+    def __init__(self, calls_per_minute, burst_size, policy='block'):
+        assert calls_per_minute > 0, 'Calls per minute must be positive'
+        self.calls_per_minute = calls_per_minute
+        assert isinstance(burst_size, int) and burst_size > 0, 'Burst size must be a positive int'
+        self.burst_size = burst_size
+        if policy not in self.POLICIES:
+            raise ValueError('Unsupported rate limiting policy: {}'.format(policy))
+        self.policy = policy
+        self._rate = calls_per_minute / 60.
+        self._tokens = float(burst_size)
+        self._updated_at = time.monotonic()
+        self._blocked_until = self._updated_at
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds the rate limiter described by the `rate_limit` section of the configuration dictionary, for the
+        configured subscription type: missing keys are filled in with the values of `pyowm.config.DEFAULT_CONFIG`
+
+        :param config: the configuration dictionary
+        :type config: dict
+        :returns: a `RateLimiter` instance, or ``None`` if rate limiting is disabled
+        """
+        rate_limit = dict(DEFAULT_CONFIG['rate_limit'])
+        rate_limit.update(config.get('rate_limit', dict()))
+        if not rate_limit['enabled']:
+            return None
+        subscription_type = config.get('subscription_type', DEFAULT_CONFIG['subscription_type'])
+        try:
+            calls_per_minute = rate_limit['calls_per_minute'][subscription_type.name]
+        except KeyError:
+            raise ValueError('No rate limit set for subscription type: {}'.format(subscription_type.name))
+        return cls(calls_per_minute, rate_limit['burst_size'], rate_limit['policy'])
+
+    def _refill(self, now):
+        # no tokens are accrued while the bucket is blocked
+        start = max(self._updated_at, self._blocked_until)
+        if now > start:
+            self._tokens = min(float(self.burst_size), self._tokens + (now - start) * self._rate)
+        self._updated_at = now
+
+    def _reserve(self):
+        # takes a token - possibly in advance - and returns how long the caller must wait before using it
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0., self._blocked_until - now)
+            if self._tokens < 1.:
+                wait += (1. - self._tokens) / self._rate
+            if wait > 0. and self.policy == 'fail':
+                raise exceptions.RateLimitExceededError(
+                    'Client-side rate limit exceeded: next API call allowed in {:.2f} seconds'.format(wait))
+            self._tokens -= 1.
+            return wait
+
+    def acquire(self):
+        """
+        Takes a token from the bucket, waiting for it if the bucket is empty and the policy is `block`
+
+        :raises: `RateLimitExceededError` if the bucket is empty and the policy is `fail`
+        """
+        wait = self._reserve()
+        if wait > 0.:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """
+        Same as `acquire`, but waits without blocking the event loop
+
+        :raises: `RateLimitExceededError` if the bucket is empty and the policy is `fail`
+        """
+        import asyncio  # imported here, so that sync-only users never load it
+        wait = self._reserve()
+        if wait > 0.:
+            await asyncio.sleep(wait)
+
+    def penalize(self, retry_after=None):
+        """
+        Reports that the API rejected a call because the quota was exceeded: the bucket is emptied and no tokens
+        will be handed out for `retry_after` seconds
+
+        :param retry_after: the server-suggested seconds to wait before the next call (if not provided, the time
+            needed to refill one token)
+        :type retry_after: int or float
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.)
+            if retry_after is None:
+                retry_after = 1. / self._rate
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def state(self):
+        """
+        Returns a snapshot of the bucket state
+
+        :returns: a dict with keys `tokens` (available tokens, negative when calls are queued), `burst_size`,
+            `calls_per_minute`, `policy` and `blocked_for` (seconds before the next call is allowed)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return dict(tokens=self._tokens, burst_size=self.burst_size, calls_per_minute=self.calls_per_minute,
+                        policy=self.policy, blocked_for=max(0., self._blocked_until - now))
+
+    def __repr__(self):
+        return "<%s.%s - calls per minute: %s, burst size: %s, policy: %s>" % \
+               (__name__, self.__class__.__name__, self.calls_per_minute, self.burst_size, self.policy)
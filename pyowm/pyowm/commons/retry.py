@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import random
+import threading
+import time
+
+from pyowm.config import DEFAULT_CONFIG
+
+
+class RetryPolicy:
+
+    """
+    Policy for retrying idempotent API calls that failed because of transient conditions: timeouts, connection
+    errors and some HTTP error status codes (eg. 502 or 429). Retries are delayed by a capped exponential backoff
+    with full jitter - or by the server-suggested retry time, if longer - and all the attempts of a call must fit
+    into a total deadline. The policy also counts the retries it allows, by reason
+
+    :param max_retries: the maximum number of retries of a call
+    :type max_retries: int
+    :param backoff_base_secs: the backoff of the first retry
+    :type backoff_base_secs: int or float
+    :param backoff_max_secs: the maximum backoff of a retry
+    :type backoff_max_secs: int or float
+    :param deadline_secs: the maximum time that all the attempts of a call can take
+    :type deadline_secs: int or float
+    :param status_codes: the HTTP status codes of the responses to be retried
+    :type status_codes: list of int
+    """
+
+    def __init__(self, max_retries, backoff_base_secs, backoff_max_secs, deadline_secs, status_codes):
+        assert isinstance(max_retries, int) and max_retries >= 0, 'Max retries must be a non negative int'
+        self.max_retries = max_retries
+        assert backoff_base_secs > 0, 'Backoff base must be positive'
+        self.backoff_base_secs = backoff_base_secs
+        assert backoff_max_secs >= backoff_base_secs, 'Backoff max must not be less than backoff base'
+        self.backoff_max_secs = backoff_max_secs
+        assert deadline_secs > 0, 'Deadline must be positive'
+        self.deadline_secs = deadline_secs
+        self.status_codes = frozenset(status_codes)
+        self._retries = dict()
+        self._exhausted = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds the retry policy described by the `retry` section of the configuration dictionary: missing keys are
+        filled in with the values of `pyowm.config.DEFAULT_CONFIG`
+
+        :param config: the configuration dictionary
+        :type config: dict
+        :returns: a `RetryPolicy` instance, or ``None`` if retries are disabled
+        """
+        retry = dict(DEFAULT_CONFIG['retry'])
+        retry.update(config.get('retry', dict()))
+        if retry['max_retries'] == 0:
+            return None
+        return cls(retry['max_retries'], retry['backoff_base_secs'], retry['backoff_max_secs'],
+                   retry['deadline_secs'], retry['status_codes'])
+
+    def deadline(self):
+        """
+        Returns the deadline of a call starting now, on the `time.monotonic()` clock
+
+        :returns: float
+        """
+        return time.monotonic() + self.deadline_secs
+
+    def next_delay(self, attempt, deadline, reason, retry_after=None):
+        """
+        Tells whether a failed call must be retried and after how long. Allowed retries are counted
+
+        :param attempt: the number of retries of the call made so far
+        :type attempt: int
+        :param deadline: the deadline of the call, as given by `deadline()`
+        :type deadline: float
+        :param reason: why the call failed (eg. `timeout` or `status_502`)
+        :type reason: str
+        :param retry_after: the server-suggested seconds to wait before retrying, if any
+        :type retry_after: int or float
+        :returns: the seconds to wait before retrying, or ``None`` if the call must not be retried
+        """
+        delay = random.uniform(0., min(self.backoff_max_secs, self.backoff_base_secs * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        with self._lock:
+            if attempt >= self.max_retries or time.monotonic() + delay >= deadline:
+                self._exhausted += 1
+                return None
+            self._retries[reason] = self._retries.get(reason, 0) + 1
+        return delay
+
+    def metrics(self):
+        """
+        Returns the retries counters
+
+        :returns: a dict with keys `retries` (total number of retries), `retries_by_reason` (dict of retries
+            counters, by failure reason) and `exhausted` (number of failed calls that were not retried any further)
+        """
+        with self._lock:
+            return dict(retries=sum(self._retries.values()), retries_by_reason=dict(self._retries),
+                        exhausted=self._exhausted)
+
+    def __repr__(self):
+        return "<%s.%s - max retries: %s, deadline: %s secs>" % \
+               (__name__, self.__class__.__name__, self.max_retries, self.deadline_secs)
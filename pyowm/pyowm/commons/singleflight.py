@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+
+
+class _Call:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+
+    """
+    Coalesces concurrent executions of the same call: while a call identified by a key is in flight, other threads
+    asking for a call with the same key wait for it to complete and get its result - or its exception - instead of
+    executing it again
+    """
+
+    def __init__(self):
+        self._calls = dict()
+        self._lock = threading.Lock()
+
+    def do(self, key, function):
+        """
+        Executes the function, unless a call with the same key is already in flight: in that case, waits for that
+        call to complete
+
+        :param key: the call key
+        :type key: str
+        :param function: the argument-less function to be executed
+        :type function: callable
+        :returns: the result of the function
+        :raises: whatever exception is raised by the function
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        """
+        Returns the number of calls currently in flight
+
+        :returns: int
+        """
+        with self._lock:
+            return len(self._calls)
+
+    def __repr__(self):
+        return "<%s.%s - in flight: %s>" % (__name__, self.__class__.__name__, self.in_flight())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sqlite3
+import tempfile
+import threading
+from pyowm.commons.cityidregistry import CityIDRegistry, CITY_ID_FILES_PATH, city_id_files_digest
+from pyowm.utils.cachedir import user_cache_dir
+
+
+class SQLiteCityIDRegistry(CityIDRegistry):
+
+    """
+    City ID registry whose lookups are served by a SQLite database, which holds the contents of the city ID files
+    along with indexes on the lowercase city names, countries and IDs, and a FTS5 trigram index for `like` lookups.
+    The database is built from the city ID files the first time it is needed and then reused, also by other
+    processes: it is rebuilt only if it is missing, was built with a different layout or from city ID files with
+    different contents.
+    It is a drop-in replacement for `CityIDRegistry`: lookups give the same results in the same order
+
+    :param path: path to the SQLite database file (it is built if missing). Defaults to a file in the user cache
+        directory (see `pyowm.utils.cachedir`)
+    :type path: str
+    :param filepath_regex: Python format string that gives the path of the city ID files the database is built from
+        (defaults to the files shipped with the library)
+    :type filepath_regex: str
+    :returns: a *SQLiteCityIDRegistry* instance
+    """
+
+    SCHEMA_VERSION = 1
+    MAX_QUERY_PARAMS = 500
+
+    def __init__(self, path=None, filepath_regex=CITY_ID_FILES_PATH):
+        if path is None:
+            path = os.path.join(user_cache_dir(), 'cities-%d-%s.sqlite3' % (self.SCHEMA_VERSION,
+                                                                          city_id_files_digest(filepath_regex)))
+        assert isinstance(path, str), 'Path to SQLite database must be a string'
+        super().__init__(filepath_regex)
+        self.path = path
+        self._conn = None
+        self._has_fts = False
+        self._lock = threading.Lock()
+
+    # helper functions
+
+    def _connection(self):
+        # opens the database upon first use, building it if needed. Must be called holding the lock
+        if self._conn is None:
+            conn = self._open()
+            if conn is None:
+                self._build()
+                conn = self._open()
+            self._has_fts = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'cities_fts'").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def _open(self):
+        # the database connection, or None if the database is missing, was built with a different layout or from
+        # city ID files with different contents
+        if not os.path.isfile(self.path):
+            return None
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            if conn.execute('PRAGMA user_version').fetchone()[0] == self.SCHEMA_VERSION and \
+                    conn.execute("SELECT value FROM meta WHERE key = 'digest'").fetchone() == \
+                    (city_id_files_digest(self._filepath_regex),):
+                return conn
+        except sqlite3.DatabaseError:
+            pass
+        conn.close()
+        return None
+
+    def _build(self):
+        # the database is built aside, in a new file readable by the user only, and then moved in place: so other
+        # processes never see it half-built
+        fd, building_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(self.path)))
+        os.close(fd)
+        try:
+            self._fill(building_path)
+            os.replace(building_path, self.path)
+        finally:
+            if os.path.exists(building_path):
+                os.remove(building_path)
+
+    def _fill(self, building_path):
+        conn = sqlite3.connect(building_path)
+        try:
+            conn.execute('CREATE TABLE cities (rank INTEGER PRIMARY KEY, id INTEGER NOT NULL, name TEXT NOT NULL, '
+                         'name_lower TEXT NOT NULL, lat REAL NOT NULL, lon REAL NOT NULL, country TEXT NOT NULL)')
+            rows = list()
+            for rank, line in enumerate(l.strip() for l in self._get_all_lines()):
+                if not line:
+                    continue
+                name, city_id, lat, lon, country = self._split_line(line)
+                rows.append((rank, int(city_id), name, name.lower(), float(lat), float(lon), country))
+            conn.executemany('INSERT INTO cities VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            conn.execute('CREATE INDEX cities_name_lower ON cities (name_lower)')
+            conn.execute('CREATE INDEX cities_country ON cities (country)')
+            conn.execute('CREATE INDEX cities_id ON cities (id)')
+            try:
+                conn.execute("CREATE VIRTUAL TABLE cities_fts USING fts5(name_lower, content='cities', "
+                             "content_rowid='rank', tokenize='trigram')")
+                conn.execute("INSERT INTO cities_fts (cities_fts) VALUES ('rebuild')")
+            except sqlite3.OperationalError:  # FTS5 or its trigram tokenizer are not available: 'like' lookups scan
+                pass
+            conn.execute('CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            conn.execute("INSERT INTO meta VALUES ('digest', ?)", (city_id_files_digest(self._filepath_regex),))
+            conn.execute('PRAGMA user_version = %d' % self.SCHEMA_VERSION)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _query(self, city_name, country, matching):
+        key = city_name.lower()
+        if matching == 'exact':
+            where, params = 'name_lower = ? AND name = ?', [key, city_name]
+        elif matching == 'nocase':
+            where, params = 'name_lower = ?', [key]
+        elif matching == 'startswith':
+            where, params = 'name_lower >= ? AND name_lower < ?', [key, key[:-1] + chr(ord(key[-1]) + 1)]
+        elif self._has_fts and len(key) >= 3:  # the trigram tokenizer needs at least 3 characters
+            where = 'rank IN (SELECT rowid FROM cities_fts WHERE cities_fts MATCH ?) AND instr(name_lower, ?) > 0'
+            params = ['"%s"' % key.replace('"', '""'), key]
+        else:
+            where, params = 'instr(name_lower, ?) > 0', [key]
+        if country is not None:
+            where += ' AND country = ?'
+            params.append(country)
+        return 'SELECT name, id, lat, lon, country FROM cities WHERE %s ORDER BY rank' % where, params
+
+    def _filter_matching_lines(self, city_name, country, matching):
+        if matching == 'fuzzy':
+            return super()._filter_matching_lines(city_name, country, matching)
+        if matching != 'like':
+            self._assess_subfile_from(city_name)  # only validates the city name
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(*self._query(city_name, country, matching)).fetchall()
+        return [list(row) for row in rows]
+
+    def _cities_for_ids(self, ids):
+        result = dict()
+        distinct_ids = list(set(ids))
+        with self._lock:
+            conn = self._connection()
+            for i in range(0, len(distinct_ids), self.MAX_QUERY_PARAMS):
+                chunk = distinct_ids[i:i + self.MAX_QUERY_PARAMS]
+                rows = conn.execute('SELECT name, id, lat, lon, country FROM cities WHERE id IN (%s)'
+                                    % ', '.join('?' * len(chunk)), chunk).fetchall()
+                result.update((row[1], list(row)) for row in rows)
+        return result
+
+    def _is_indexed(self):
+        return True
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __repr__(self):
+        return "<%s.%s - path=%s>" % (__name__, self.__class__.__name__, self.path)
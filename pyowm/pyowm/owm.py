@@ -2,16 +2,12 @@
 # -*- coding: utf-8 -*-
 
 from pyowm import constants
-from pyowm.agroapi10 import agro_manager
-from pyowm.airpollutionapi30 import airpollution_manager
-from pyowm.alertapi30 import alert_manager
-from pyowm.stationsapi30 import stations_manager
-from pyowm.tiles import tile_manager
 from pyowm.utils import strings
-from pyowm.uvindexapi30 import uvindex_manager
 from pyowm.utils import config as cfg
-from pyowm.commons import cityidregistry
-from pyowm.weatherapi25 import weather_manager
+from pyowm.commons import http_client
+
+# The API packages are imported upon first request of their managers, so that importing the library only loads what
+# is actually used
 
 
 class OWM:
@@ -23,6 +19,9 @@ class OWM:
     :type api_key: str
     :param config: the configuration dictionary (if not provided, a default one will be used)
     :type config: dict
+
+    All the managers given by an `OWM` instance share the same pooled HTTP transport (`http_session`).
+    The API packages are imported upon first request of their managers
     """
     def __init__(self, api_key, config=None):
         assert api_key is not None, 'API Key must be set'
@@ -32,6 +31,8 @@ class OWM:
         else:
             assert isinstance(config, dict)
             self.config = config
+        self.http_session = http_client.HttpSession(self.config)
+        self._aio = None
 
     @property
     def configuration(self):
@@ -63,13 +64,26 @@ class OWM:
         """
         return constants.LANGUAGES
 
+    @property
+    def aio(self):
+        """
+        Returns the entry point to the asyncio API, providing coroutine-based counterparts of the managers
+
+        :returns: an `AsyncOWM` instance
+
+        """
+        if self._aio is None:
+            self._aio = AsyncOWM(self.api_key, self.config, rate_limiter=self.http_session.rate_limiter)
+        return self._aio
+
     def agro_manager(self):
         """
         Gives a `pyowm.agro10.agro_manager.AgroManager` instance that can be used to read/write data from the
         Agricultural API.
         :return: a `pyowm.agro10.agro_manager.AgroManager` instance
         """
-        return agro_manager.AgroManager(self.api_key, self.config)
+        from pyowm.agroapi10 import agro_manager
+        return agro_manager.AgroManager(self.api_key, self.config, http_session=self.http_session)
 
     def airpollution_manager(self):
         """
@@ -77,22 +91,48 @@ class OWM:
         pollution data.
         :return: a `pyowm.airpollutionapi30.airpollution_manager.AirPollutionManager` instance
         """
-        return airpollution_manager.AirPollutionManager(self.api_key, self.config)
+        from pyowm.airpollutionapi30 import airpollution_manager
+        return airpollution_manager.AirPollutionManager(self.api_key, self.config,
+                                                        http_session=self.http_session)
 
     def alert_manager(self):
         """
         Gives an *AlertManager* instance that can be used to read/write weather triggers and alerts data.
         :return: an *AlertManager* instance
         """
-        return alert_manager.AlertManager(self.api_key, self.config)
+        from pyowm.alertapi30 import alert_manager
+        return alert_manager.AlertManager(self.api_key, self.config, http_session=self.http_session)
 
-    def city_id_registry(self):
+    def city_id_registry(self, backend='files', sqlite_path=None):
         """
         Gives the *CityIDRegistry* singleton instance that can be used to lookup for city IDs.
+        Lookups can be served by different backends, all giving the same results:
 
+          - `files`: the city ID files are decompressed and scanned at each lookup (slow, no memory overhead)
+          - `index`: the city ID files are decompressed and indexed in memory once per process, upon first use
+          - `mmap`: a binary city database, built from the city ID files into the user cache directory upon first
+            use, is memory-mapped: nothing is decompressed and the database pages are shared among processes
+          - `sqlite`: a SQLite database, built from the city ID files upon first use and then reused by all processes
+
+        :param backend: the lookup backend: `files` (default), `index`, `mmap` or `sqlite`
+        :type backend: str
+        :param sqlite_path: path to the SQLite database file, for the `sqlite` backend (defaults to a file in the
+            user cache directory)
+        :type sqlite_path: str
         :returns: a *CityIDRegistry* instance
+        :raises: *ValueError* if the backend is unknown
         """
-        return cityidregistry.CityIDRegistry.get_instance()
+        from pyowm.commons import cityidregistry
+        if backend == 'files':
+            return cityidregistry.CityIDRegistry.get_instance()
+        if backend == 'index':
+            return cityidregistry.CityIDRegistry.get_instance(use_index=True)
+        if backend == 'mmap':
+            return cityidregistry.CityIDRegistry.get_instance(use_db=True)
+        if backend == 'sqlite':
+            from pyowm.commons import sqlite_cityidregistry
+            return sqlite_cityidregistry.SQLiteCityIDRegistry(sqlite_path)
+        raise ValueError('Unknown city ID registry backend: {}'.format(backend))
 
     def stations_manager(self):
         """
@@ -100,7 +140,8 @@ class OWM:
         meteostations data.
         :returns: a *StationsManager* instance
         """
-        return stations_manager.StationsManager(self.api_key, self.config)
+        from pyowm.stationsapi30 import stations_manager
+        return stations_manager.StationsManager(self.api_key, self.config, http_session=self.http_session)
 
     def tile_manager(self, layer_name):
         """
@@ -108,14 +149,16 @@ class OWM:
         :param layer_name: the layer name for the tiles (values can be looked up on `pyowm.tiles.enums.MapLayerEnum`)
         :return: a `pyowm.tiles.tile_manager.TileManager` instance
         """
-        return tile_manager.TileManager(self.api_key, layer_name, self.config)
+        from pyowm.tiles import tile_manager
+        return tile_manager.TileManager(self.api_key, layer_name, self.config, http_session=self.http_session)
 
     def uvindex_manager(self):
         """
         Gives a `pyowm.uvindexapi30.uvindex_manager.UVIndexManager` instance that can be used to fetch UV data.
         :return: a `pyowm.uvindexapi30.uvindex_manager.UVIndexManager` instance
         """
-        return uvindex_manager.UVIndexManager(self.api_key, self.config)
+        from pyowm.uvindexapi30 import uvindex_manager
+        return uvindex_manager.UVIndexManager(self.api_key, self.config, http_session=self.http_session)
 
     def weather_manager(self):
         """
@@ -123,7 +166,8 @@ class OWM:
         pollution data.
         :return: a `pyowm.weatherapi25.weather_manager.WeatherManager` instance
         """
-        return weather_manager.WeatherManager(self.api_key, self.config)
+        from pyowm.weatherapi25 import weather_manager
+        return weather_manager.WeatherManager(self.api_key, self.config, http_session=self.http_session)
 
     def __repr__(self):
         return "<%s.%s - API key=%s, subscription type=%s, PyOWM version=%s>" % \
@@ -131,3 +175,93 @@ class OWM:
                      self.__class__.__name__,
                      strings.obfuscate_API_key(self.api_key) if self.api_key is not None else 'None',
                      self.config['subscription_type'].name, self.version)
+
+
+class AsyncOWM:
+
+    """
+    Entry point class providing ad-hoc asyncio API clients for the OWM web APIs: all the API-calling methods of the
+    managers are coroutines, and return the same objects as their synchronous counterparts.
+    All the managers given by an `AsyncOWM` instance share the same pooled asyncio HTTP transport (`http_session`),
+    which is bound to the event loop running the first API call and must be closed with `close()` (or by using
+    the `AsyncOWM` instance as an async context manager). The `aiohttp` package is required.
+
+    :param api_key: the OWM API key
+    :type api_key: str
+    :param config: the configuration dictionary (if not provided, a default one will be used)
+    :type config: dict
+    :param rate_limiter: the client-side rate limiter, possibly shared with an `OWM` instance using the same API key
+        (if not provided, it is built based on the config)
+    :type rate_limiter: `pyowm.commons.ratelimiter.RateLimiter`
+    """
+    def __init__(self, api_key, config=None, rate_limiter=None):
+        assert api_key is not None, 'API Key must be set'
+        self.api_key = api_key
+        if config is None:
+            self.config = cfg.get_default_config()
+        else:
+            assert isinstance(config, dict)
+            self.config = config
+        from pyowm.commons import aio_http_client
+        self.http_session = aio_http_client.AsyncHttpSession(self.config, rate_limiter=rate_limiter)
+
+    def agro_manager(self):
+        """
+        Gives a `pyowm.agroapi10.aio_agro_manager.AsyncAgroManager` instance
+        :return: a `pyowm.agroapi10.aio_agro_manager.AsyncAgroManager` instance
+        """
+        from pyowm.agroapi10 import aio_agro_manager
+        return aio_agro_manager.AsyncAgroManager(self.api_key, self.config, http_session=self.http_session)
+
+    def airpollution_manager(self):
+        """
+        Gives a `pyowm.airpollutionapi30.aio_airpollution_manager.AsyncAirPollutionManager` instance
+        :return: a `pyowm.airpollutionapi30.aio_airpollution_manager.AsyncAirPollutionManager` instance
+        """
+        from pyowm.airpollutionapi30 import aio_airpollution_manager
+        return aio_airpollution_manager.AsyncAirPollutionManager(self.api_key, self.config,
+                                                                 http_session=self.http_session)
+
+    def tile_manager(self, layer_name):
+        """
+        Gives a `pyowm.tiles.aio_tile_manager.AsyncTileManager` instance
+        :param layer_name: the layer name for the tiles (values can be looked up on `pyowm.tiles.enums.MapLayerEnum`)
+        :return: a `pyowm.tiles.aio_tile_manager.AsyncTileManager` instance
+        """
+        from pyowm.tiles import aio_tile_manager
+        return aio_tile_manager.AsyncTileManager(self.api_key, layer_name, self.config, http_session=self.http_session)
+
+    def uvindex_manager(self):
+        """
+        Gives a `pyowm.uvindexapi30.aio_uvindex_manager.AsyncUVIndexManager` instance
+        :return: a `pyowm.uvindexapi30.aio_uvindex_manager.AsyncUVIndexManager` instance
+        """
+        from pyowm.uvindexapi30 import aio_uvindex_manager
+        return aio_uvindex_manager.AsyncUVIndexManager(self.api_key, self.config, http_session=self.http_session)
+
+    def weather_manager(self):
+        """
+        Gives a `pyowm.weatherapi25.aio_weather_manager.AsyncWeatherManager` instance
+        :return: a `pyowm.weatherapi25.aio_weather_manager.AsyncWeatherManager` instance
+        """
+        from pyowm.weatherapi25 import aio_weather_manager
+        return aio_weather_manager.AsyncWeatherManager(self.api_key, self.config, http_session=self.http_session)
+
+    async def close(self):
+        """
+        Closes the pooled connections of the shared asyncio HTTP transport
+        """
+        await self.http_session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def __repr__(self):
+        return "<%s.%s - API key=%s, subscription type=%s>" % \
+                    (__name__,
+                     self.__class__.__name__,
+                     strings.obfuscate_API_key(self.api_key) if self.api_key is not None else 'None',
+                     self.config['subscription_type'].name)
@@ -19,16 +19,19 @@ class StationsManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param http_session: the pooled HTTP transport to be shared with other managers (if not provided, a new one
+        will be created)
+    :type http_session: `pyowm.commons.http_client.HttpSession`
     :returns: a *StationsManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, http_session=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_STATIONS_API_URL)
+        self.http_client = HttpClient(API_key, config, ROOT_STATIONS_API_URL, session=http_session)
 
     def stations_api_version(self):
         return STATIONS_API_VERSION
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.commons.enums import ImageTypeEnum
+from pyowm.commons.image import Image
+from pyowm.commons.tile import Tile
+from pyowm.tiles.uris import ROOT_TILE_URL, NAMED_MAP_LAYER_URL
+
+
+class AsyncTileManager:
+
+    """
+    The asyncio counterpart of `pyowm.tiles.tile_manager.TileManager`: it exposes the same methods, with the same
+    arguments and return values, as coroutines.
+
+    :param API_key: the OWM Weather API key
+    :type API_key: str
+    :param map_layer: the layer for which you want tiles fetched. Allowed map layers are specified by
+        the `pyowm.tiles.enum.MapLayerEnum` enumerator class.
+    :type map_layer: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param http_session: the pooled asyncio HTTP transport to be shared with other managers (if not provided, a new
+        one will be created)
+    :type http_session: `pyowm.commons.aio_http_client.AsyncHttpSession`
+    :returns: an *AsyncTileManager* instance
+    :raises: *AssertionError* when no API Key or no map layer is provided, or map layer name is not a string
+
+    """
+
+    def __init__(self, API_key, map_layer, config, http_session=None):
+        assert API_key is not None, 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert map_layer is not None, 'You must provide a valid map layer name'
+        assert isinstance(map_layer, str), 'Map layer name must be a string'
+        self.map_layer = map_layer
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, ROOT_TILE_URL, admits_subdomains=False,
+                                           session=http_session)
+
+    async def get_tile(self, x, y, zoom):
+        """
+        See `TileManager.get_tile`
+        """
+        status, data = await self.http_client.get_png(
+            NAMED_MAP_LAYER_URL % self.map_layer + '/%s/%s/%s.png' % (zoom, x, y),
+            params={'appid': self.API_key})
+        img = Image(data, ImageTypeEnum.PNG)
+        return Tile(x, y, zoom, self.map_layer, img)
+
+    def __repr__(self):
+        return "<%s.%s - layer_name=%s>" % (__name__, self.__class__.__name__, self.map_layer)
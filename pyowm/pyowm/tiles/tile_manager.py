@@ -20,19 +20,23 @@ class TileManager:
     :type map_layer: str
     :param config: the configuration dictionary
     :type config: dict
+    :param http_session: the pooled HTTP transport to be shared with other managers (if not provided, a new one
+        will be created)
+    :type http_session: `pyowm.commons.http_client.HttpSession`
     :returns: a *TileManager* instance
     :raises: *AssertionError* when no API Key or no map layer is provided, or map layer name is not a string
 
     """
 
-    def __init__(self, API_key, map_layer, config):
+    def __init__(self, API_key, map_layer, config, http_session=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert map_layer is not None, 'You must provide a valid map layer name'
         assert isinstance(map_layer, str), 'Map layer name must be a string'
         self.map_layer = map_layer
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_TILE_URL, admits_subdomains=False)
+        self.http_client = HttpClient(API_key, config, ROOT_TILE_URL, admits_subdomains=False,
+                                      session=http_session)
 
     def get_tile(self, x, y, zoom):
         """
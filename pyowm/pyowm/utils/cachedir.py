@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+
+def user_cache_dir():
+    """
+    Gives the per-user directory where the library caches the files it builds (eg. the city database), creating it
+    if needed with permissions for the user only. The directory is `%LOCALAPPDATA%\\pyowm\\Cache` on Windows,
+    `~/Library/Caches/pyowm` on macOS and `$XDG_CACHE_HOME/pyowm` (defaulting to `~/.cache/pyowm`) elsewhere
+
+    :returns: the path of the directory (str)
+    """
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+        path = os.path.join(base, 'pyowm', 'Cache')
+    elif sys.platform == 'darwin':
+        path = os.path.expanduser(os.path.join('~', 'Library', 'Caches', 'pyowm'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+        path = os.path.join(base, 'pyowm')
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def fan_out(function, items, max_workers, cancel_event=None):
+    """
+    Applies the function to each item concurrently on a pool of `max_workers` threads, and yields the outcomes as
+    soon as they are available - thus in no particular order. Items are consumed lazily from the iterable, so that
+    at most twice as many calls as workers are pending at any time.
+    Failed calls do not stop the others: their exceptions are yielded as outcomes.
+    Pending calls are cancelled when the generator is closed or when the cancellation event is set: calls already
+    running are left to complete, but their outcomes are discarded
+
+    :param function: the one-argument function to be applied
+    :type function: callable
+    :param items: the items the function is to be applied to
+    :type items: iterable
+    :param max_workers: the maximum number of concurrent calls
+    :type max_workers: int
+    :param cancel_event: an event that stops the fan-out when set (optional)
+    :type cancel_event: `threading.Event`
+    :returns: a generator of `(item, result)` tuples, where `result` is either the value returned by the function
+        or the exception it raised
+    :raises: *AssertionError* when `max_workers` is not a positive int, *TypeError* when `items` is not iterable
+        (both upon call, before the generator is started)
+    """
+    assert isinstance(max_workers, int) and max_workers > 0, "'max_workers' must be a positive int"
+    return _fan_out(function, iter(items), max_workers, cancel_event)
+
+
+def _fan_out(function, items, max_workers, cancel_event):
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = dict()
+
+    def submit(n):
+        for item in itertools.islice(items, n):
+            pending[executor.submit(function, item)] = item
+
+    try:
+        submit(2 * max_workers)
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            done, _ = wait(pending, timeout=0.1 if cancel_event is not None else None,
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                yield item, result
+            submit(len(done))
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -41,6 +41,28 @@ def assert_is_lon(val):
         raise ValueError("Longitude value must be between -180 and 180")
 
 
+def great_circle_distance(lat1, lon1, lat2, lon2):
+    """
+    Returns the great-circle distance between two geographic points, computed with the haversine formula on a
+    sphere having radius = Earth's radius
+
+    :param lat1: the latitude of the first point
+    :type lat1: int or float
+    :param lon1: the longitude of the first point
+    :type lon1: int or float
+    :param lat2: the latitude of the second point
+    :type lat2: int or float
+    :param lon2: the longitude of the second point
+    :type lon2: int or float
+    :returns: the distance in kilometers (float)
+
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((phi2 - phi1) / 2.) ** 2 + \
+        math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2.) ** 2
+    return 2. * EARTH_RADIUS_KM * math.asin(min(1., math.sqrt(a)))
+
+
 # classes
 
 class Geometry:
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from array import array
+from pyowm.utils import geo
+
+
+class GeoIndex:
+    """
+    Spatial index of geographic points. Points are bucketed into a grid of cells spanning `cell_deg` degrees of
+    latitude and longitude: radius queries only look at the points in the cells overlapping the bounding box of the
+    circle, and nearest neighbours queries run radius queries on growing circles until enough points are found.
+    Points are identified by their position in the iterable the index is built from
+
+    :param coordinates: the `(lat, lon)` coordinates of the points
+    :type coordinates: iterable of tuples
+    :param cell_deg: the size of the grid cells in degrees (defaults to 1)
+    :type cell_deg: int or float
+    """
+
+    def __init__(self, coordinates, cell_deg=1.):
+        assert cell_deg > 0., 'Cell size must be greater than zero'
+        self.cell_deg = float(cell_deg)
+        self._rows = int(math.ceil(180. / self.cell_deg))
+        self._columns = int(math.ceil(360. / self.cell_deg))
+        self._lats = array('d')
+        self._lons = array('d')
+        self._cells = dict()
+        for position, (lat, lon) in enumerate(coordinates):
+            self._lats.append(lat)
+            self._lons.append(lon)
+            self._cells.setdefault((self._row(lat), self._column(lon)), array('l')).append(position)
+
+    def _row(self, lat):
+        return min(self._rows - 1, max(0, int((lat + 90.) // self.cell_deg)))
+
+    def _column(self, lon):
+        return int((lon + 180.) // self.cell_deg) % self._columns
+
+    def _candidates(self, lat, lon, km):
+        # positions of the points in the cells overlapping the bounding box of the circle
+        rad_distance = km / geo.EARTH_RADIUS_KM
+        min_lat = lat - math.degrees(rad_distance)
+        max_lat = lat + math.degrees(rad_distance)
+        if min_lat <= -90. or max_lat >= 90. or math.sin(rad_distance) >= math.cos(math.radians(lat)):
+            columns = range(self._columns)  # a pole is in the bounding box
+        else:
+            delta_lon = math.degrees(math.asin(math.sin(rad_distance) / math.cos(math.radians(lat))))
+            first = int((lon - delta_lon + 180.) // self.cell_deg)
+            last = int((lon + delta_lon + 180.) // self.cell_deg)
+            if last - first + 1 >= self._columns:
+                columns = range(self._columns)
+            else:
+                columns = [column % self._columns for column in range(first, last + 1)]
+        for row in range(self._row(min_lat), self._row(max_lat) + 1):
+            for column in columns:
+                cell = self._cells.get((row, column))
+                if cell is not None:
+                    yield from cell
+
+    def within_radius(self, lat, lon, km):
+        """
+        Returns the points whose great-circle distance from the provided coordinates is not greater than `km`
+
+        :param lat: the latitude of the centre
+        :type lat: int or float
+        :param lon: the longitude of the centre
+        :type lon: int or float
+        :param km: the radius in kilometers
+        :type km: int or float
+        :returns: a list of `(distance, position)` tuples, sorted by distance
+        """
+        result = list()
+        for position in self._candidates(lat, lon, km):
+            distance = geo.great_circle_distance(lat, lon, self._lats[position], self._lons[position])
+            if distance <= km:
+                result.append((distance, position))
+        result.sort()
+        return result
+
+    def nearest(self, lat, lon, k=1, max_km=None):
+        """
+        Returns the `k` points that are closest to the provided coordinates
+
+        :param lat: the latitude of the centre
+        :type lat: int or float
+        :param lon: the longitude of the centre
+        :type lon: int or float
+        :param k: how many points must be returned (defaults to 1)
+        :type k: int
+        :param max_km: the maximum distance of the returned points in kilometers (defaults to ``None``, that is: no
+            limit)
+        :type max_km: int or float
+        :returns: a list of at most `k` `(distance, position)` tuples, sorted by distance
+        """
+        limit = math.pi * geo.EARTH_RADIUS_KM  # no point on the sphere is farther than this
+        if max_km is not None:
+            limit = min(limit, max_km)
+        km = min(limit, self.cell_deg * math.pi / 180. * geo.EARTH_RADIUS_KM)
+        while True:
+            result = self.within_radius(lat, lon, km)
+            if len(result) >= k or km >= limit:
+                return result[:k]
+            km = min(limit, 2. * km)
+
+    def __len__(self):
+        return len(self._lats)
+
+    def __repr__(self):
+        return "<%s.%s - points: %s, cell size: %s deg>" % (__name__, self.__class__.__name__, len(self._lats),
+                                                           self.cell_deg)
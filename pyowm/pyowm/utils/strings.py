@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import importlib
+import unicodedata
 
 
 def obfuscate_API_key(API_key):
@@ -43,3 +44,58 @@ def class_from_dotted_path(dotted_path):
     modpath, class_name = '.'.join(tokens[:-1]), tokens[-1]
     klass = getattr(importlib.import_module(modpath), class_name)
     return klass
+
+
+def fold(text):
+    """
+    Returns a case- and accent-insensitive form of the supplied text, suitable for comparisons: the text is
+    decomposed, stripped of its combining marks (eg. accents) and case-folded.
+    Eg: "Zürich" --> "zurich"
+
+    :param text: the text to be folded
+    :type text: str
+    :return: str
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+# romanization of the Russian, Ukrainian and Belarusian Cyrillic letters, after the BGN/PCGN systems
+CYRILLIC_TO_LATIN = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'ґ': 'g', 'д': 'd', 'е': 'e', 'ё': 'e', 'є': 'ye', 'ж': 'zh', 'з': 'z',
+    'и': 'i', 'і': 'i', 'ї': 'yi', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r',
+    'с': 's', 'т': 't', 'у': 'u', 'ў': 'w', 'ф': 'f', 'х': 'kh', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'shch',
+    'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya'}
+
+
+def transliterate(text):
+    """
+    Returns the supplied text with its Cyrillic letters romanized, while other characters are left untouched.
+    Eg: "Москва" --> "Moskva"
+
+    :param text: the text to be transliterated
+    :type text: str
+    :return: str
+    """
+    result = list()
+    for c in text:
+        latin = CYRILLIC_TO_LATIN.get(c.lower())
+        if latin is None:
+            result.append(c)
+        else:
+            result.append(latin.capitalize() if c.isupper() else latin)
+    return ''.join(result)
+
+
+def trigrams(text):
+    """
+    Returns the set of the trigrams of the supplied text, padded with two leading blanks and a trailing one so that
+    also the first and last characters contribute to three and two trigrams respectively.
+    Eg: "rome" --> {"  r", " ro", "rom", "ome", "me "}
+
+    :param text: the text
+    :type text: str
+    :return: set of str
+    """
+    padded = '  ' + text + ' '
+    return set(padded[i:i + 3] for i in range(len(padded) - 2))
@@ -8,7 +8,8 @@ def status_is(weather, status, weather_code_registry):
     """
     Checks if the weather status code of a *Weather* object corresponds to the
     detailed status indicated. The lookup is performed against the provided 
-    *WeatherCodeRegistry* object.
+    *WeatherCodeRegistry* object, and its outcome is cached by the *Weather*
+    object.
 
     :param weather: the *Weather* object whose status code is to be checked
     :type weather: *Weather*
@@ -19,9 +20,7 @@ def status_is(weather, status, weather_code_registry):
     :returns: ``True`` if the check is positive, ``False`` otherwise
 
     """
-    weather_status = weather_code_registry. \
-        status_for(weather.weather_code).lower()
-    return weather_status == status
+    return weather.classified_status(weather_code_registry) == status
 
 
 def any_status_is(weather_list, status, weather_code_registry):
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.constants import UVINDEX_API_VERSION
+from pyowm.uvindexapi30 import uvindex, uvindex_queries
+from pyowm.uvindexapi30.uris import ROOT_UV_API_URL
+
+
+class AsyncUVIndexManager:
+
+    """
+    The asyncio counterpart of `pyowm.uvindexapi30.uvindex_manager.UVIndexManager`: it exposes the same methods,
+    with the same arguments and return values, as coroutines.
+
+    :param API_key: the OWM UV Index API key
+    :type API_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param http_session: the pooled asyncio HTTP transport to be shared with other managers (if not provided, a new
+        one will be created)
+    :type http_session: `pyowm.commons.aio_http_client.AsyncHttpSession`
+    :returns: an *AsyncUVIndexManager* instance
+    :raises: *AssertionError* when no API Key is provided
+
+    """
+
+    def __init__(self, API_key, config, http_session=None):
+        assert API_key is not None, 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, ROOT_UV_API_URL, session=http_session)
+
+    def uvindex_api_version(self):
+        return UVINDEX_API_VERSION
+
+    async def uvindex_around_coords(self, lat, lon):
+        """
+        See `UVIndexManager.uvindex_around_coords`
+        """
+        uri, params = uvindex_queries.get_uvi(uvindex_queries.coords_params(lat, lon))
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return uvindex.UVIndex.from_dict(json_data)
+
+    async def uvindex_forecast_around_coords(self, lat, lon):
+        """
+        See `UVIndexManager.uvindex_forecast_around_coords`
+        """
+        uri, params = uvindex_queries.get_uvi_forecast(uvindex_queries.coords_params(lat, lon))
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return uvindex_queries.uvindex_list_from_list(json_data)
+
+    async def uvindex_history_around_coords(self, lat, lon, start, end=None):
+        """
+        See `UVIndexManager.uvindex_history_around_coords`
+        """
+        uri, params = uvindex_queries.get_uvi_history(uvindex_queries.history_params(lat, lon, start, end=end))
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return uvindex_queries.uvindex_list_from_list(json_data)
+
+    def __repr__(self):
+        return '<%s.%s>' % (__name__, self.__class__.__name__)
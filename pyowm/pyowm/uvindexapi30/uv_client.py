@@ -1,8 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from pyowm.uvindexapi30.uris import UV_INDEX_URL, UV_INDEX_FORECAST_URL, \
-    UV_INDEX_HISTORY_URL
+from pyowm.uvindexapi30 import uvindex_queries
 
 
 class UltraVioletHttpClient:
@@ -47,12 +46,8 @@ class UltraVioletHttpClient:
         :raises: *ValueError*, *APIRequestError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        params = dict(lat=lat, lon=lon)
-
-        # build request URL
-        _, json_data = self._client.get_json(UV_INDEX_URL, params=params)
+        uri, params = uvindex_queries.get_uvi(params_dict)
+        _, json_data = self._client.get_json(uri, params=params)
         return json_data
 
     def get_uvi_forecast(self, params_dict):
@@ -64,12 +59,8 @@ class UltraVioletHttpClient:
         :raises: *ValueError*, *APIRequestError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        params = dict(lat=lat, lon=lon)
-
-        # build request URL
-        _, json_data = self._client.get_json(UV_INDEX_FORECAST_URL, params=params)
+        uri, params = uvindex_queries.get_uvi_forecast(params_dict)
+        _, json_data = self._client.get_json(uri, params=params)
         return json_data
 
     def get_uvi_history(self, params_dict):
@@ -81,14 +72,8 @@ class UltraVioletHttpClient:
         :raises: *ValueError*, *APIRequestError*
 
         """
-        lat = str(params_dict['lat'])
-        lon = str(params_dict['lon'])
-        start = str(params_dict['start'])
-        end = str(params_dict['end'])
-        params = dict(lat=lat, lon=lon, start=start, end=end)
-
-        # build request URL
-        _, json_data = self._client.get_json(UV_INDEX_HISTORY_URL, params=params)
+        uri, params = uvindex_queries.get_uvi_history(params_dict)
+        _, json_data = self._client.get_json(uri, params=params)
         return json_data
 
     def __repr__(self):
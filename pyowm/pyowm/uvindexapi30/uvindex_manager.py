@@ -3,8 +3,7 @@
 
 from pyowm.commons.http_client import HttpClient
 from pyowm.constants import UVINDEX_API_VERSION
-from pyowm.utils import formatting, geo, timestamps
-from pyowm.uvindexapi30 import uv_client, uvindex
+from pyowm.uvindexapi30 import uv_client, uvindex, uvindex_queries
 from pyowm.uvindexapi30.uris import ROOT_UV_API_URL
 
 
@@ -17,17 +16,20 @@ class UVIndexManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param http_session: the pooled HTTP transport to be shared with other managers (if not provided, a new one
+        will be created)
+    :type http_session: `pyowm.commons.http_client.HttpSession`
     :returns: a *UVIndexManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, http_session=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
         self.uv_client = uv_client.UltraVioletHttpClient(
-            API_key, HttpClient(API_key, config, ROOT_UV_API_URL))
+            API_key, HttpClient(API_key, config, ROOT_UV_API_URL, session=http_session))
 
     def uvindex_api_version(self):
         return UVINDEX_API_VERSION
@@ -48,10 +50,7 @@ class UVIndexManager:
             cannot be parsed, *APICallException* when OWM UV Index API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        json_data = self.uv_client.get_uvi(params)
+        json_data = self.uv_client.get_uvi(uvindex_queries.coords_params(lat, lon))
         return uvindex.UVIndex.from_dict(json_data)
 
     def uvindex_forecast_around_coords(self, lat, lon):
@@ -68,12 +67,8 @@ class UVIndexManager:
             cannot be parsed, *APICallException* when OWM UV Index API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        json_data = self.uv_client.get_uvi_forecast(params)
-        uvindex_list = [uvindex.UVIndex.from_dict(item) for item in json_data]
-        return uvindex_list
+        json_data = self.uv_client.get_uvi_forecast(uvindex_queries.coords_params(lat, lon))
+        return uvindex_queries.uvindex_list_from_list(json_data)
 
     def uvindex_history_around_coords(self, lat, lon, start, end=None):
         """
@@ -97,18 +92,8 @@ class UVIndexManager:
             cannot be parsed, *APICallException* when OWM UV Index API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        assert start is not None
-        start = formatting.timeformat(start, 'unix')
-        if end is None:
-            end = timestamps.now(timeformat='unix')
-        else:
-            end = formatting.timeformat(end, 'unix')
-        params = {'lon': lon, 'lat': lat, 'start': start, 'end': end}
-        json_data = self.uv_client.get_uvi_history(params)
-        uvindex_list = [uvindex.UVIndex.from_dict(item) for item in json_data]
-        return uvindex_list
+        json_data = self.uv_client.get_uvi_history(uvindex_queries.history_params(lat, lon, start, end=end))
+        return uvindex_queries.uvindex_list_from_list(json_data)
 
     def __repr__(self):
         return '<%s.%s>' % (__name__, self.__class__.__name__)
\ No newline at end of file
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pyowm.utils import formatting, geo, timestamps
+from pyowm.uvindexapi30 import uvindex
+from pyowm.uvindexapi30.uris import UV_INDEX_URL, UV_INDEX_FORECAST_URL, UV_INDEX_HISTORY_URL
+
+# The queries of the UV Index API methods, shared by `UVIndexManager`, `AsyncUVIndexManager` and
+# `UltraVioletHttpClient`: the `*_params` functions check the arguments of the manager methods and give the
+# parameters dict that the `get_uvi*` functions turn into the `(uri, params)` of the API call to be issued
+
+
+def coords_params(lat, lon):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    return {'lon': lon, 'lat': lat}
+
+
+def history_params(lat, lon, start, end=None):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    assert start is not None
+    start = formatting.timeformat(start, 'unix')
+    if end is None:
+        end = timestamps.now(timeformat='unix')
+    else:
+        end = formatting.timeformat(end, 'unix')
+    return {'lon': lon, 'lat': lat, 'start': start, 'end': end}
+
+
+def get_uvi(params_dict):
+    return UV_INDEX_URL, dict(lat=str(params_dict['lat']), lon=str(params_dict['lon']))
+
+
+def get_uvi_forecast(params_dict):
+    return UV_INDEX_FORECAST_URL, dict(lat=str(params_dict['lat']), lon=str(params_dict['lon']))
+
+
+def get_uvi_history(params_dict):
+    return UV_INDEX_HISTORY_URL, dict(lat=str(params_dict['lat']), lon=str(params_dict['lon']),
+                                      start=str(params_dict['start']), end=str(params_dict['end']))
+
+
+def uvindex_list_from_list(the_list):
+    """
+    Parses the UV indexes out of the data list of a `uvindex_forecast_*` or `uvindex_history_*` API call
+
+    :returns: a list of *UVIndex* instances
+    """
+    return [uvindex.UVIndex.from_dict(item) for item in the_list]
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from typing import Union
+
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.constants import WEATHER_API_VERSION
+from pyowm.weatherapi25 import historian, observation, one_call, weather_queries
+from pyowm.weatherapi25.uris import ROOT_WEATHER_API
+
+
+class AsyncWeatherManager:
+    """
+    The asyncio counterpart of `pyowm.weatherapi25.weather_manager.WeatherManager`: it exposes the same methods,
+    with the same arguments and return values, as coroutines.
+
+    :param API_key: the OWM Weather API key
+    :type API_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param http_session: the pooled asyncio HTTP transport to be shared with other managers (if not provided, a new
+        one will be created)
+    :type http_session: `pyowm.commons.aio_http_client.AsyncHttpSession`
+    :returns: an *AsyncWeatherManager* instance
+    :raises: *AssertionError* when no API Key is provided
+
+    """
+
+    def __init__(self, API_key, config, http_session=None):
+        assert isinstance(API_key, str), 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, ROOT_WEATHER_API, session=http_session)
+
+    def weather_api_version(self):
+        return WEATHER_API_VERSION
+
+    async def weather_at_place(self, name):
+        """
+        See `WeatherManager.weather_at_place`
+        """
+        uri, params = weather_queries.weather_at_place(name)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return observation.Observation.from_dict(json_data)
+
+    async def weather_at_coords(self, lat, lon):
+        """
+        See `WeatherManager.weather_at_coords`
+        """
+        uri, params = weather_queries.weather_at_coords(lat, lon)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return observation.Observation.from_dict(json_data)
+
+    async def weather_at_zip_code(self, zipcode, country):
+        """
+        See `WeatherManager.weather_at_zip_code`
+        """
+        uri, params = weather_queries.weather_at_zip_code(zipcode, country)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return observation.Observation.from_dict(json_data)
+
+    async def weather_at_id(self, id):
+        """
+        See `WeatherManager.weather_at_id`
+        """
+        uri, params = weather_queries.weather_at_id(id)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return observation.Observation.from_dict(json_data)
+
+    async def weather_at_ids(self, ids_list):
+        """
+        See `WeatherManager.weather_at_ids`
+        """
+        uri, params = weather_queries.weather_at_ids(ids_list)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return observation.Observation.from_dict_of_lists(json_data)
+
+    async def weather_at_places(self, pattern, searchtype, limit=None):
+        """
+        See `WeatherManager.weather_at_places`
+        """
+        uri, params = weather_queries.weather_at_places(pattern, searchtype, limit=limit)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return observation.Observation.from_dict_of_lists(json_data)
+
+    async def weather_at_places_in_bbox(self, lon_left, lat_bottom, lon_right, lat_top,
+                                        zoom=10, cluster=False):
+        """
+        See `WeatherManager.weather_at_places_in_bbox`
+        """
+        uri, params = weather_queries.weather_at_places_in_bbox(lon_left, lat_bottom, lon_right, lat_top,
+                                                                zoom=zoom, cluster=cluster)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return observation.Observation.from_dict_of_lists(json_data)
+
+    async def weather_around_coords(self, lat, lon, limit=None):
+        """
+        See `WeatherManager.weather_around_coords`
+        """
+        uri, params = weather_queries.weather_around_coords(lat, lon, limit=limit)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return observation.Observation.from_dict_of_lists(json_data)
+
+    async def forecast_at_place(self, name, interval, limit=None):
+        """
+        See `WeatherManager.forecast_at_place`
+        """
+        uri, params = weather_queries.forecast_at_place(name, interval, limit=limit)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return weather_queries.forecaster_from_dict(json_data, interval)
+
+    async def forecast_at_coords(self, lat, lon, interval, limit=None):
+        """
+        See `WeatherManager.forecast_at_coords`
+        """
+        uri, params = weather_queries.forecast_at_coords(lat, lon, interval, limit=limit)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return weather_queries.forecaster_from_dict(json_data, interval)
+
+    async def forecast_at_id(self, id, interval, limit=None):
+        """
+        See `WeatherManager.forecast_at_id`
+        """
+        uri, params = weather_queries.forecast_at_id(id, interval, limit=limit)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return weather_queries.forecaster_from_dict(json_data, interval)
+
+    async def station_tick_history(self, station_ID, limit=None):
+        """
+        See `WeatherManager.station_tick_history`
+        """
+        return await self._retrieve_station_history(station_ID, limit, "tick")
+
+    async def station_hour_history(self, station_ID, limit=None):
+        """
+        See `WeatherManager.station_hour_history`
+        """
+        return await self._retrieve_station_history(station_ID, limit, "hour")
+
+    async def station_day_history(self, station_ID, limit=None):
+        """
+        See `WeatherManager.station_day_history`
+        """
+        return await self._retrieve_station_history(station_ID, limit, "day")
+
+    async def _retrieve_station_history(self, station_ID, limit, interval):
+        """
+        Helper method for station_X_history functions.
+        """
+        uri, params = weather_queries.station_history(station_ID, limit, interval)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        sh = weather_queries.station_history_from_dict(json_data, station_ID, interval)
+        if sh is not None:
+            return historian.Historian(sh)
+        else:
+            return None
+
+    async def one_call(self, lat: Union[int, float], lon: Union[int, float], **kwargs) -> one_call.OneCall:
+        """
+        See `WeatherManager.one_call`
+        """
+        uri, params = weather_queries.one_call(lat, lon, **kwargs)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return one_call.OneCall.from_dict(json_data, lazy=kwargs.get('lazy', False))
+
+    async def one_call_history(self, lat: Union[int, float], lon: Union[int, float], dt: int = None):
+        """
+        See `WeatherManager.one_call_history`
+        """
+        uri, params = weather_queries.one_call_history(lat, lon, dt=dt)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return one_call.OneCall.from_dict(json_data)
+
+    def __repr__(self):
+        return '<%s.%s>' % (__name__, self.__class__.__name__)
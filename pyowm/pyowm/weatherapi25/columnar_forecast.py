@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from array import array
+from itertools import chain, compress
+
+
+class WeatherList(list):
+    """
+    A list of *Weather* objects counting the changes made to it, so that the column-oriented views built out of it
+    can tell when they are stale
+
+    :param weathers: the *Weather* objects
+    :type weathers: iterable
+    :returns: a *WeatherList* instance
+
+    """
+
+    changes = 0  # a class attribute, so that it is there when the items of unpickled lists are restored
+
+    def __setitem__(self, index, value):
+        self.changes += 1
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self.changes += 1
+        super().__delitem__(index)
+
+    def __iadd__(self, other):
+        self.changes += 1
+        return super().__iadd__(other)
+
+    def __imul__(self, n):
+        self.changes += 1
+        return super().__imul__(n)
+
+    def append(self, weather):
+        self.changes += 1
+        super().append(weather)
+
+    def extend(self, weathers):
+        self.changes += 1
+        super().extend(weathers)
+
+    def insert(self, index, weather):
+        self.changes += 1
+        super().insert(index, weather)
+
+    def pop(self, index=-1):
+        self.changes += 1
+        return super().pop(index)
+
+    def remove(self, weather):
+        self.changes += 1
+        super().remove(weather)
+
+    def clear(self):
+        self.changes += 1
+        super().clear()
+
+    def sort(self, *, key=None, reverse=False):
+        self.changes += 1
+        super().sort(key=key, reverse=reverse)
+
+    def reverse(self):
+        self.changes += 1
+        super().reverse()
+
+
+class ColumnarForecast:
+    """
+    Column-oriented view of a list of *Weather* objects, for fast bulk analytics: each weather value is stored in a
+    contiguous `array.array` column, with one item per *Weather* object in the order of the list, so that reductions
+    and filters run in C instead of looping over the objects. Columns support the buffer protocol, hence can be
+    wrapped by NumPy without copies (eg. `numpy.frombuffer(columns.humidity)`).
+
+    The reference times, humidity, clouds and weather codes columns are built upon instantiation, while the columns
+    of the values of the temperature, rain, snow, wind and pressure dicts are built upon first access and then
+    cached. Values of these dicts are stored as they are in the *Weather* objects (that is: temperatures are in
+    Kelvin and wind speeds in meters per second), and missing or ``None`` values are stored as NaN.
+
+    The view is a snapshot: it does not reflect later changes to the list nor to the *Weather* objects. Use
+    `is_view_of` to tell if it is still up to date with a list.
+
+    :param weathers: the list of *Weather* objects
+    :type weathers: list
+    :returns: a *ColumnarForecast* instance
+
+    """
+
+    def __init__(self, weathers):
+        self.weathers = weathers
+        self.changes = getattr(weathers, 'changes', None)
+        self.reference_times = array('q', (w.ref_time for w in weathers))
+        self.humidity = array('d', (self._float(w.humidity) for w in weathers))
+        self.clouds = array('d', (self._float(w.clouds) for w in weathers))
+        self.weather_codes = array('l', (w.weather_code or 0 for w in weathers))
+        self._columns = dict()
+
+    def is_view_of(self, weathers):
+        """
+        Tells if this view was built out of the provided sequence of *Weather* objects and is still up to date with
+        it. Changes are tracked for *WeatherList* instances only: other sequences are deemed to be read-only
+
+        :param weathers: the sequence of *Weather* objects
+        :type weathers: `WeatherList` or any sequence
+        :returns: bool
+        """
+        return self.weathers is weathers and self.changes == getattr(weathers, 'changes', None)
+
+    @staticmethod
+    def _float(value):
+        return math.nan if value is None else float(value)
+
+    @staticmethod
+    def _value(the_dict, key):
+        return None if the_dict is None else the_dict.get(key)
+
+    def _column(self, field, key):
+        column = self._columns.get((field, key))
+        if column is None:
+            column = array('d', (self._float(self._value(getattr(w, field), key)) for w in self.weathers))
+            self._columns[(field, key)] = column
+        return column
+
+    def temperature(self, key='temp'):
+        """
+        Returns the column of the values of the specified key of the temperature dicts, in Kelvin
+
+        :param key: the temperature key (eg. `temp`, `temp_max`, `feels_like`, `day`). Defaults to `temp`
+        :type key: str
+        :returns: an `array.array` of floats
+        """
+        return self._column('temp', key)
+
+    def rain(self, key='all'):
+        """
+        Returns the column of the values of the specified key of the rain dicts
+
+        :param key: the rain key (eg. `all`, `1h`, `3h`). Defaults to `all`
+        :type key: str
+        :returns: an `array.array` of floats
+        """
+        return self._column('rain', key)
+
+    def snow(self, key='all'):
+        """
+        Returns the column of the values of the specified key of the snow dicts
+
+        :param key: the snow key (eg. `all`, `1h`, `3h`). Defaults to `all`
+        :type key: str
+        :returns: an `array.array` of floats
+        """
+        return self._column('snow', key)
+
+    def wind(self, key='speed'):
+        """
+        Returns the column of the values of the specified key of the wind dicts, in meters per second for speeds
+
+        :param key: the wind key (eg. `speed`, `deg`, `gust`). Defaults to `speed`
+        :type key: str
+        :returns: an `array.array` of floats
+        """
+        return self._column('wnd', key)
+
+    def pressure(self, key='press'):
+        """
+        Returns the column of the values of the specified key of the pressure dicts
+
+        :param key: the pressure key (eg. `press`, `sea_level`). Defaults to `press`
+        :type key: str
+        :returns: an `array.array` of floats
+        """
+        return self._column('pressure', key)
+
+    # reductions and filters
+
+    def argmax(self, column, above=-math.inf):
+        """
+        Returns the position of the first greatest value of a column which is greater than a threshold. NaNs are
+        skipped
+
+        :param column: the column
+        :type column: `array.array`
+        :param above: the threshold (defaults to minus infinity)
+        :type above: float
+        :returns: an int, or ``None`` if no value is greater than the threshold
+        """
+        greatest = max(chain((above,), column))  # NaNs are never greater than the threshold, so they are skipped
+        return column.index(greatest) if greatest > above else None
+
+    def argmin(self, column, below=math.inf):
+        """
+        Returns the position of the first smallest value of a column which is smaller than a threshold. NaNs are
+        skipped
+
+        :param column: the column
+        :type column: `array.array`
+        :param below: the threshold (defaults to infinity)
+        :type below: float
+        :returns: an int, or ``None`` if no value is smaller than the threshold
+        """
+        smallest = min(chain((below,), column))
+        return column.index(smallest) if smallest < below else None
+
+    def any_code_in(self, codes):
+        """
+        Tells if any of the weather codes is in the provided set
+
+        :param codes: the weather codes
+        :type codes: set
+        :returns: bool
+        """
+        return not codes.isdisjoint(self.weather_codes)
+
+    def filter_by_codes(self, codes):
+        """
+        Returns the *Weather* objects whose weather code is in the provided set, in the order of the list
+
+        :param codes: the weather codes
+        :type codes: set
+        :returns: a list of *Weather* objects
+        """
+        return list(compress(self.weathers, map(codes.__contains__, self.weather_codes)))
+
+    def __len__(self):
+        return len(self.reference_times)
+
+    def __repr__(self):
+        return "<%s.%s - items: %s, cached columns: %s>" % (__name__, self.__class__.__name__, len(self),
+                                                            len(self._columns))
@@ -2,18 +2,23 @@
 # -*- coding: utf-8 -*-
 
 import time
+from bisect import bisect_left
+from operator import attrgetter
 
 from pyowm.commons import  exceptions
 from pyowm.utils import timestamps, formatting
 from pyowm.weatherapi25 import location
 from pyowm.weatherapi25 import weather
+from pyowm.weatherapi25.columnar_forecast import ColumnarForecast, WeatherList
 
 
 class Forecast:
     """
     A class encapsulating weather forecast data for a certain location and
     relative to a specific time interval (forecast for every three hours or
-    for every day)
+    for every day).
+    The *Weather* objects are kept sorted by reference time, so that the
+    ones closest to given times are looked up with binary searches
 
     :param interval: the time granularity of the forecast. May be: *'3h'* for
         three hours forecast or *'daily'* for daily ones
@@ -23,8 +28,9 @@ class Forecast:
     :type reception_time: int
     :param location: the *Location* object relative to the forecast
     :type location: Location
-    :param weathers: the list of *Weather* objects composing the forecast
-    :type weathers: list
+    :param weathers: the *Weather* objects composing the forecast, in any
+        order
+    :type weathers: iterable
     :returns:  a *Forecast* instance
     :raises: *ValueError* when negative values are provided
 
@@ -36,8 +42,23 @@ class Forecast:
             raise ValueError("'reception_time' must be greater than 0")
         self.rec_time = reception_time
         self.location = location
+        self._columns = None
         self.weathers = weathers
 
+    @property
+    def weathers(self):
+        """
+        The list of *Weather* objects composing the forecast, sorted by
+        reference time. Lists assigned to this attribute are sorted as well
+
+        :returns: a *WeatherList* instance
+        """
+        return self._weathers
+
+    @weathers.setter
+    def weathers(self, weathers):
+        self._weathers = WeatherList(sorted(weathers, key=attrgetter('ref_time')))
+
     def get(self, index):
         """
         Lookups up into the *Weather* items list for the item at the specified
@@ -73,6 +94,85 @@ class Forecast:
         actualized_weathers = filter(lambda x: x.reference_time(timeformat='unix') >= current_time, self.weathers)
         self.weathers = list(actualized_weathers)
 
+    def to_columns(self):
+        """
+        Returns a column-oriented view of the *Weather* objects of this forecast, for fast bulk analytics. The view
+        is cached, and rebuilt when the list of *Weather* objects is replaced or changed in place (the list is
+        sorted again then, in case items were added)
+
+        :returns: a *ColumnarForecast* instance
+        """
+        columns = self._columns
+        weathers = self._weathers
+        if columns is None or not columns.is_view_of(weathers):
+            weathers.sort(key=attrgetter('ref_time'))
+            columns = ColumnarForecast(weathers)
+            self._columns = columns
+        return columns
+
+    def is_in_coverage(self, timeobject):
+        """
+        Tells if the specified time is within the time range (coverage) going
+        from the most ancient to the most recent *Weather* item in the forecast
+
+        :param timeobject: may be a UNIX time, a ``datetime.datetime`` object
+            or an ISO8601-formatted string in the format
+            ``YYYY-MM-DD HH:MM:SS+00``
+        :type timeobject: long/int, ``datetime.datetime`` or str)
+        :returns: ``True`` if the time is in the coverage, ``False`` otherwise
+            (and when the forecast is empty)
+        """
+        times = self.to_columns().reference_times
+        return bool(times) and times[0] <= formatting.to_UNIXtime(timeobject) <= times[-1]
+
+    def _closest_position(self, times, unixtime):
+        # position of the item closest in time to the provided UNIX time: on a tie the most ancient item wins, as
+        # with a scan of the sorted list
+        if not times or not times[0] <= unixtime <= times[-1]:
+            raise exceptions.NotFoundError('Error: the specified time is not included in the weather coverage range')
+        i = bisect_left(times, unixtime)
+        if times[i] != unixtime and unixtime - times[i - 1] <= times[i] - unixtime:
+            i = bisect_left(times, times[i - 1])
+        return i
+
+    def get_weather_at(self, timeobject):
+        """
+        Gives the *Weather* item in the forecast that is closest in time to
+        the time value conveyed by the parameter
+
+        :param timeobject: may be a UNIX time, a ``datetime.datetime`` object
+            or an ISO8601-formatted string in the format
+            ``YYYY-MM-DD HH:MM:SS+00``
+        :type timeobject: long/int, ``datetime.datetime`` or str)
+        :returns: a *Weather* object, or ``None`` if the forecast is empty
+        :raises: *NotFoundError* when the time is not in the forecast coverage
+        """
+        columns = self.to_columns()
+        if not columns:
+            return None
+        return columns.weathers[self._closest_position(columns.reference_times, formatting.to_UNIXtime(timeobject))]
+
+    def get_weathers_at(self, timeobjects):
+        """
+        Gives the *Weather* items in the forecast that are closest in time to
+        each of the time values conveyed by the parameter: this is faster than
+        many calls to `get_weather_at`
+
+        :param timeobjects: the times, each one may be a UNIX time, a
+            ``datetime.datetime`` object or an ISO8601-formatted string in the
+            format ``YYYY-MM-DD HH:MM:SS+00``
+        :type timeobjects: iterable
+        :returns: a list of *Weather* objects, in the order of the times (an
+            empty list if the forecast is empty)
+        :raises: *NotFoundError* when any of the times is not in the forecast
+            coverage
+        """
+        columns = self.to_columns()
+        if not columns:
+            return []
+        weathers, times = columns.weathers, columns.reference_times
+        return [weathers[self._closest_position(times, formatting.to_UNIXtime(t))] for t in timeobjects]
+
     @classmethod
     def from_dict(cls, the_dict):
         """
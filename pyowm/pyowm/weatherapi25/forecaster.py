@@ -3,6 +3,7 @@
 
 from pyowm.utils import formatting, weather
 from pyowm.weatherapi25 import weathercoderegistry
+from pyowm.weatherapi25.columnar_forecast import ColumnarForecast
 
 
 class Forecaster:
@@ -12,6 +13,10 @@ class Forecaster:
     data. The class encapsulates a *Forecast* instance and provides
     abstractions on the top of it in order to let programmers exploit weather
     forecast data in a human-friendly fashion.
+    Searches and filters run on a column-oriented view of the forecast
+    (see `ColumnarForecast`), built at each call so that they see in-place
+    changes to the *Weather* items, and lookups by time are binary searches on
+    the sorted reference times of the forecast
 
     :param forecast: a *Forecast* instance
     :type forecast: *Forecast*
@@ -37,8 +42,7 @@ class Forecaster:
         :raises: *ValueError* when invalid time format values are provided
 
         """
-        start_coverage = min([item.reference_time() \
-                              for item in self.forecast])
+        start_coverage = min(self._columns().reference_times)
         return formatting.timeformat(start_coverage, timeformat)
 
     def when_ends(self, timeformat='unix'):
@@ -55,8 +59,7 @@ class Forecaster:
         :raises: *ValueError* when invalid time format values are provided
 
         """
-        end_coverage = max([item.reference_time()
-                            for item in self.forecast])
+        end_coverage = max(self._columns().reference_times)
         return formatting.timeformat(end_coverage, timeformat)
 
     def will_have_rain(self):
@@ -67,7 +70,7 @@ class Forecaster:
         :returns: boolean
 
         """        
-        return weather.any_status_is(self.forecast.weathers, "rain", self._wc_registry)
+        return self._columns().any_code_in(self._wc_registry.codes_for("rain"))
 
     def will_have_clear(self):
         """
@@ -77,7 +80,7 @@ class Forecaster:
         :returns: boolean
 
         """
-        return weather.any_status_is(self.forecast.weathers, "sun", self._wc_registry)
+        return self._columns().any_code_in(self._wc_registry.codes_for("sun"))
 
     def will_have_fog(self):
         """
@@ -87,7 +90,7 @@ class Forecaster:
         :returns: boolean
 
         """
-        return weather.any_status_is(self.forecast.weathers, "fog", self._wc_registry)
+        return self._columns().any_code_in(self._wc_registry.codes_for("fog"))
 
     def will_have_clouds(self):
         """
@@ -97,7 +100,7 @@ class Forecaster:
         :returns: boolean
 
         """
-        return weather.any_status_is(self.forecast.weathers, "clouds", self._wc_registry)
+        return self._columns().any_code_in(self._wc_registry.codes_for("clouds"))
 
     def will_have_snow(self):
         """
@@ -107,7 +110,7 @@ class Forecaster:
         :returns: boolean
 
         """
-        return weather.any_status_is(self.forecast.weathers, "snow", self._wc_registry)
+        return self._columns().any_code_in(self._wc_registry.codes_for("snow"))
 
     def will_have_storm(self):
         """
@@ -117,7 +120,7 @@ class Forecaster:
         :returns: boolean
 
         """
-        return weather.any_status_is(self.forecast.weathers, "storm", self._wc_registry)
+        return self._columns().any_code_in(self._wc_registry.codes_for("storm"))
 
     def will_have_tornado(self):
         """
@@ -127,7 +130,7 @@ class Forecaster:
         :returns: boolean
 
         """
-        return weather.any_status_is(self.forecast.weathers, "tornado", self._wc_registry)
+        return self._columns().any_code_in(self._wc_registry.codes_for("tornado"))
 
     def will_have_hurricane(self):
         """
@@ -137,7 +140,7 @@ class Forecaster:
         :returns: boolean
 
         """
-        return weather.any_status_is(self.forecast.weathers, "hurricane", self._wc_registry)
+        return self._columns().any_code_in(self._wc_registry.codes_for("hurricane"))
 
     def when_rain(self):
         """
@@ -146,7 +149,7 @@ class Forecaster:
 
         :returns: a list of *Weather* objects
         """
-        return weather.filter_by_status(self.forecast.weathers, "rain", self._wc_registry)
+        return self._columns().filter_by_codes(self._wc_registry.codes_for("rain"))
 
     def when_clear(self):
         """
@@ -155,7 +158,7 @@ class Forecaster:
 
         :returns: a list of *Weather* objects
         """
-        return weather.filter_by_status(self.forecast.weathers, "sun", self._wc_registry)
+        return self._columns().filter_by_codes(self._wc_registry.codes_for("sun"))
 
 
     def when_fog(self):
@@ -165,7 +168,7 @@ class Forecaster:
 
         :returns: a list of *Weather* objects
         """
-        return weather.filter_by_status(self.forecast.weathers, "fog", self._wc_registry)
+        return self._columns().filter_by_codes(self._wc_registry.codes_for("fog"))
 
     def when_clouds(self):
         """
@@ -174,7 +177,7 @@ class Forecaster:
 
         :returns: a list of *Weather* objects
         """
-        return weather.filter_by_status(self.forecast.weathers, "clouds", self._wc_registry)
+        return self._columns().filter_by_codes(self._wc_registry.codes_for("clouds"))
 
     def when_snow(self):
         """
@@ -183,7 +186,7 @@ class Forecaster:
 
         :returns: a list of *Weather* objects
         """
-        return weather.filter_by_status(self.forecast.weathers, "snow", self._wc_registry)
+        return self._columns().filter_by_codes(self._wc_registry.codes_for("snow"))
 
     def when_storm(self):
         """
@@ -192,7 +195,7 @@ class Forecaster:
 
         :returns: a list of *Weather* objects
         """
-        return weather.filter_by_status(self.forecast.weathers, "storm", self._wc_registry)
+        return self._columns().filter_by_codes(self._wc_registry.codes_for("storm"))
 
     def when_tornado(self):
         """
@@ -201,7 +204,7 @@ class Forecaster:
 
         :returns: a list of *Weather* objects
         """
-        return weather.filter_by_status(self.forecast.weathers, "tornado", self._wc_registry)
+        return self._columns().filter_by_codes(self._wc_registry.codes_for("tornado"))
 
     def when_hurricane(self):
         """
@@ -210,7 +213,7 @@ class Forecaster:
 
         :returns: a list of *Weather* objects
         """
-        return weather.filter_by_status(self.forecast.weathers, "hurricane", self._wc_registry)
+        return self._columns().filter_by_codes(self._wc_registry.codes_for("hurricane"))
 
     def _will_be(self, timeobject, weather_condition):
         """
@@ -227,10 +230,7 @@ class Forecaster:
         :returns: boolean
 
         """
-        time_value = formatting.to_UNIXtime(timeobject)
-        closest_weather = weather.find_closest_weather(
-                                        self.forecast.weathers,
-                                        time_value)
+        closest_weather = self.forecast.get_weather_at(timeobject)
         return weather.status_is(closest_weather, weather_condition, self._wc_registry)
 
     def will_be_rainy_at(self, timeobject):
@@ -363,11 +363,26 @@ class Forecaster:
             ``YYYY-MM-DD HH:MM:SS+00``
         :type timeobject: long/int, ``datetime.datetime`` or str)
         :returns: a *Weather* object
+        :raises: *NotFoundError* when the time is not in the forecast coverage
 
         """
-        return weather. \
-            find_closest_weather(self.forecast.weathers,
-                                 formatting.to_UNIXtime(timeobject))
+        return self.forecast.get_weather_at(timeobject)
+
+    def get_weathers_at(self, timeobjects):
+        """
+        Gives the *Weather* items in the forecast that are closest in time to
+        each of the time values conveyed by the parameter
+
+        :param timeobjects: the times, each one may be a UNIX time, a
+            ``datetime.datetime`` object or an ISO8601-formatted string in the
+            format ``YYYY-MM-DD HH:MM:SS+00``
+        :type timeobjects: iterable
+        :returns: a list of *Weather* objects, in the order of the times
+        :raises: *NotFoundError* when any of the times is not in the forecast
+            coverage
+
+        """
+        return self.forecast.get_weathers_at(timeobjects)
 
     def most_hot(self):
         """
@@ -378,15 +393,8 @@ class Forecaster:
         :returns: a *Weather* object or ``None`` if no item in the forecast is
             eligible
         """
-        maxtemp = -270.0  # No one would survive that...
-        hottest = None
-        for weather in self.forecast.weathers:
-            d = weather.temperature()
-            if 'temp_max' in d:
-                if d['temp_max'] > maxtemp:
-                    maxtemp = d['temp_max']
-                    hottest = weather
-        return hottest
+        columns = self._columns()
+        return self._weather_at(columns, columns.argmax(columns.temperature('temp_max'), above=-270.0))
 
     def most_cold(self):
         """
@@ -397,15 +405,8 @@ class Forecaster:
         :returns: a *Weather* object or ``None`` if no item in the forecast is
             eligible
         """
-        mintemp = 1000.0  # No one would survive that...
-        coldest = None
-        for weather in self.forecast.weathers:
-            d = weather.temperature()
-            if 'temp_min' in d:
-                if d['temp_min'] < mintemp:
-                    mintemp = d['temp_min']
-                    coldest = weather
-        return coldest
+        columns = self._columns()
+        return self._weather_at(columns, columns.argmin(columns.temperature('temp_min'), below=1000.0))
 
     def most_humid(self):
         """
@@ -415,14 +416,8 @@ class Forecaster:
         :returns: a *Weather* object or ``None`` if no item in the forecast is
             eligible
         """
-        max_humidity = 0
-        most_humid = None
-        for weather in self.forecast.weathers:
-            h = weather.humidity
-            if h > max_humidity:
-                max_humidity = h
-                most_humid = weather
-        return most_humid
+        columns = self._columns()
+        return self._weather_at(columns, columns.argmax(columns.humidity, above=0.))
 
     def most_rainy(self):
         """
@@ -433,15 +428,8 @@ class Forecaster:
         :returns: a *Weather* object or ``None`` if no item in the forecast is
             eligible
         """
-        max_rain = 0
-        most_rainy = None
-        for weather in self.forecast.weathers:
-            d = weather.rain
-            if 'all' in d:
-                if d['all'] > max_rain:
-                    max_rain = d['all']
-                    most_rainy = weather
-        return most_rainy
+        columns = self._columns()
+        return self._weather_at(columns, columns.argmax(columns.rain('all'), above=0.))
 
     def most_snowy(self):
         """
@@ -452,15 +440,8 @@ class Forecaster:
         :returns: a *Weather* object or ``None`` if no item in the forecast is
             eligible
         """
-        max_snow = 0
-        most_snowy = None
-        for weather in self.forecast.weathers:
-            d = weather.snow
-            if 'all' in d:
-                if d['all'] > max_snow:
-                    max_snow = d['all']
-                    most_snowy = weather
-        return most_snowy
+        columns = self._columns()
+        return self._weather_at(columns, columns.argmax(columns.snow('all'), above=0.))
 
     def most_windy(self):
         """
@@ -471,15 +452,17 @@ class Forecaster:
         :returns: a *Weather* object or ``None`` if no item in the forecast is
             eligible
         """
-        max_wind_speed = 0
-        most_windy = None
-        for weather in self.forecast.weathers:
-            d = weather.wind()
-            if 'speed' in d:
-                if d['speed'] > max_wind_speed:
-                    max_wind_speed = d['speed']
-                    most_windy = weather
-        return most_windy
+        columns = self._columns()
+        return self._weather_at(columns, columns.argmax(columns.wind('speed'), above=0.))
+
+    def _columns(self):
+        # unlike the view cached by the forecast, a new view is not stale when the *Weather* items were changed in
+        # place (eg. their weather codes or temperature dicts)
+        return ColumnarForecast(self.forecast.weathers)
+
+    @staticmethod
+    def _weather_at(columns, position):
+        return None if position is None else columns.weathers[position]
 
     def __repr__(self):
         return "<%s.%s>" % (__name__, self.__class__.__name__)
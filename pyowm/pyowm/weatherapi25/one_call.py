@@ -1,10 +1,67 @@
+from collections.abc import Sequence
 from typing import Union, Optional
 
 from pyowm.commons import exceptions
 from pyowm.utils import geo
+from pyowm.weatherapi25.columnar_forecast import ColumnarForecast, WeatherList
 from pyowm.weatherapi25.weather import Weather
 
 
+class LazyWeatherSequence(Sequence):
+
+    """
+    Read-only sequence of *Weather* objects that are parsed out of the provided data dictionaries only when they
+    are accessed: each of them is parsed once and then memoized
+
+    :param items: the data dictionaries of the *Weather* objects
+    :type items: list
+    :returns: a *LazyWeatherSequence* instance
+    """
+
+    def __init__(self, items: list) -> None:
+        assert isinstance(items, list), "'items' must be a list"
+        self._items = items
+        self._weathers = [None] * len(items)
+
+    def _weather_at(self, index: int) -> Weather:
+        weather = self._weathers[index]
+        if weather is None:
+            try:
+                weather = Weather.from_dict(self._items[index])
+            except KeyError:
+                raise exceptions.ParseAPIResponseError(f"{__name__}: impossible to read weather info from input data")
+            self._weathers[index] = weather
+        return weather
+
+    def parsed_count(self) -> int:
+        """
+        Tells how many *Weather* objects have been parsed so far
+
+        :returns: int
+        """
+        return len(self._weathers) - self._weathers.count(None)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._weather_at(i) for i in range(*index.indices(len(self._weathers)))]
+        if index < 0:
+            index += len(self._weathers)
+        if not 0 <= index < len(self._weathers):
+            raise IndexError('Weather index out of range')
+        return self._weather_at(index)
+
+    def __iter__(self):
+        for index in range(len(self._weathers)):
+            yield self._weather_at(index)
+
+    def __len__(self) -> int:
+        return len(self._weathers)
+
+    def __repr__(self):
+        return "<%s.%s - items=%s, parsed=%s>" % (__name__, self.__class__.__name__, len(self),
+                                                  self.parsed_count())
+
+
 class OneCall:
 
     def __init__(self,
@@ -27,10 +84,42 @@ class OneCall:
         if current is None:
             raise ValueError("'current' must be set")
         self.current = current
+        self._columns = dict()
         self.forecast_minutely = forecast_minutely
         self.forecast_hourly = forecast_hourly
         self.forecast_daily = forecast_daily
 
+    @staticmethod
+    def _tracked(weathers):
+        # lists are tracked for changes, so that the cached columnar views can tell when they are stale
+        if isinstance(weathers, list) and not isinstance(weathers, WeatherList):
+            return WeatherList(weathers)
+        return weathers
+
+    @property
+    def forecast_minutely(self):
+        return self._forecast_minutely
+
+    @forecast_minutely.setter
+    def forecast_minutely(self, weathers):
+        self._forecast_minutely = self._tracked(weathers)
+
+    @property
+    def forecast_hourly(self):
+        return self._forecast_hourly
+
+    @forecast_hourly.setter
+    def forecast_hourly(self, weathers):
+        self._forecast_hourly = self._tracked(weathers)
+
+    @property
+    def forecast_daily(self):
+        return self._forecast_daily
+
+    @forecast_daily.setter
+    def forecast_daily(self, weathers):
+        self._forecast_daily = self._tracked(weathers)
+
     def __repr__(self):
         return "<%s.%s - lat=%s, lon=%s, retrieval_time=%s>" % (
             __name__, self.__class__.__name__, self.lat, self.lon,
@@ -47,15 +136,46 @@ class OneCall:
             return None
         return geo.Point(self.lon, self.lat)
 
+    def to_columns(self, interval: str = 'hourly') -> Optional[ColumnarForecast]:
+        """
+        Returns a column-oriented view of the *Weather* objects of one of the forecasts, for fast bulk analytics.
+        The view is cached, and rebuilt when the forecast is replaced or changed in place
+
+        :param interval: the forecast: `minutely`, `hourly` (default) or `daily`
+        :type interval: str
+        :returns: a ``pyowm.weatherapi25.columnar_forecast.ColumnarForecast`` instance, or ``None`` if the forecast
+            is not available
+        :raises: *ValueError* if the interval is unknown
+        """
+        if interval == 'minutely':
+            weathers = self.forecast_minutely
+        elif interval == 'hourly':
+            weathers = self.forecast_hourly
+        elif interval == 'daily':
+            weathers = self.forecast_daily
+        else:
+            raise ValueError('Unknown forecast interval: {}'.format(interval))
+        if weathers is None:
+            return None
+        columns = self._columns.get(interval)
+        if columns is None or not columns.is_view_of(weathers):
+            columns = ColumnarForecast(weathers)
+            self._columns[interval] = columns
+        return columns
 
     @classmethod
-    def from_dict(cls, the_dict: dict):
+    def from_dict(cls, the_dict: dict, lazy: bool = False):
         """
         Parses a *OneCall* instance out of a data dictionary. Only certain properties of the data dictionary
         are used: if these properties are not found or cannot be parsed, an exception is issued.
+        In lazy mode only the current weather is parsed upfront, while the minutely, hourly and daily forecasts are
+        *LazyWeatherSequence* views parsing each of their *Weather* objects upon first access: parsing errors of
+        forecast items are then issued upon access too
 
         :param the_dict: the input dictionary
         :type the_dict: `dict`
+        :param lazy: whether to parse the forecasts lazily or not (defaults to ``False``)
+        :type lazy: bool
         :returns: a *OneCall* instance or ``None`` if no data is available
         :raises: *ParseAPIResponseError* if it is impossible to find or parse the
             data needed to build the result, *APIResponseError* if the input dict embeds an HTTP status error
@@ -77,17 +197,18 @@ class OneCall:
             else:
                 raise exceptions.APIResponseError("OWM API: error - response payload", the_dict['cod'])
 
+        parse = LazyWeatherSequence if lazy else lambda items: [Weather.from_dict(item) for item in items]
         try:
             current = Weather.from_dict(the_dict["current"])
             minutely = None
             if "minutely" in the_dict:
-                minutely = [Weather.from_dict(item) for item in the_dict["minutely"]]
+                minutely = parse(the_dict["minutely"])
             hourly = None
             if "hourly" in the_dict:
-                hourly = [Weather.from_dict(item) for item in the_dict["hourly"]]
+                hourly = parse(the_dict["hourly"])
             daily = None
             if "daily" in the_dict:
-                daily = [Weather.from_dict(item) for item in the_dict["daily"]]
+                daily = parse(the_dict["daily"])
 
         except KeyError:
             raise exceptions.ParseAPIResponseError(f"{__name__}: impossible to read weather info from input data")
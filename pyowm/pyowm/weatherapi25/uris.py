@@ -5,6 +5,7 @@
 ROOT_WEATHER_API = 'openweathermap.org/data/2.5'
 OBSERVATION_URI = 'weather'
 GROUP_OBSERVATIONS_URI = 'group'
+GROUP_OBSERVATIONS_MAX_IDS = 20
 STATION_URI = 'station'
 FIND_OBSERVATIONS_URI = 'find'
 FIND_STATION_URI = 'station/find'
@@ -6,6 +6,12 @@ import json
 from pyowm.commons import exceptions
 from pyowm.utils import formatting, measurables
 from pyowm.weatherapi25.uris import ICONS_BASE_URI
+from pyowm.weatherapi25.weathercoderegistry import WeatherCodeRegistry
+
+
+_NUMBER = (int, float)
+_FEELS_LIKE_KEYS = {label: 'feels_like_' + label for label in ('day', 'night', 'eve', 'morn')}  # shared by all dicts
+_NO_DATA = dict()  # stands for missing nested dicts: never modified
 
 
 class Weather:
@@ -59,8 +65,16 @@ class Weather:
     :returns:  a *Weather* instance
     :raises: *ValueError* when negative values are provided for non-negative quantities
 
+    Instances have no `__dict__`: all the values are stored in slots, and the `rain`, `snow`, `wnd`, `pressure`
+    and `temp` slots hold the nested dicts as they are
+
     """
 
+    __slots__ = ('ref_time', 'sset_time', 'srise_time', 'clouds', 'rain', 'snow', 'wnd', 'humidity', 'pressure',
+                 'temp', 'status', 'detailed_status', 'weather_code', 'weather_icon_name', 'visibility_distance',
+                 'dewpoint', 'humidex', 'heat_index', 'utc_offset', 'uvi', 'precipitation_probability',
+                 '_classified_by', '_classified_code', '_classified_status')
+
     def __init__(self, reference_time, sunset_time, sunrise_time, clouds, rain,
                  snow, wind, humidity, pressure, temperature, status,
                  detailed_status, weather_code, weather_icon_name,
@@ -124,7 +138,7 @@ class Weather:
             raise ValueError("'precipitation_probability' must be between " \
                              "0.0 and 1.0")
         self.precipitation_probability = precipitation_probability
-        
+
     def reference_time(self, timeformat='unix'):
         """Returns the GMT time telling when the weather was measured
 
@@ -181,23 +195,24 @@ class Weather:
         :returns: a dict containing wind info
 
         """
+        wnd = self.wnd
         if unit == 'meters_sec':
-            return self.wnd
+            return wnd
         elif unit == 'miles_hour':
-            wind_dict = {k: self.wnd[k]
-                         for k in self.wnd if self.wnd[k] is not None}
+            wind_dict = {k: wnd[k]
+                         for k in wnd if wnd[k] is not None}
             return measurables.metric_wind_dict_to_imperial(wind_dict)
         elif unit == 'km_hour':
-            wind_dict = {k: self.wnd[k]
-                         for k in self.wnd if self.wnd[k] is not None}
+            wind_dict = {k: wnd[k]
+                         for k in wnd if wnd[k] is not None}
             return measurables.metric_wind_dict_to_km_h(wind_dict)
         elif unit == 'knots':
-            wind_dict = {k: self.wnd[k]
-                         for k in self.wnd if self.wnd[k] is not None}
+            wind_dict = {k: wnd[k]
+                         for k in wnd if wnd[k] is not None}
             return measurables.metric_wind_dict_to_knots(wind_dict)
         elif unit == 'beaufort':
-            wind_dict = {k: self.wnd[k]
-                         for k in self.wnd if self.wnd[k] is not None}
+            wind_dict = {k: wnd[k]
+                         for k in wnd if wnd[k] is not None}
             return measurables.metric_wind_dict_to_beaufort(wind_dict)
         else:
             raise ValueError("Invalid value for target wind conversion unit")
@@ -225,6 +240,26 @@ class Weather:
         return dict(list(converted.items()) +
                     list(not_to_be_converted.items()))
 
+    def classified_status(self, weather_code_registry=None):
+        """Returns the lowercase weather status that a weather code registry
+        relates to the weather code. The status is cached until the weather
+        code changes or a different registry is used.
+
+        :param weather_code_registry: the *WeatherCodeRegistry* object (defaults
+            to the default registry)
+        :type weather_code_registry: *WeatherCodeRegistry*
+        :returns: a str (eg. "rain") or ``None`` if the weather code is not mapped
+
+        """
+        if weather_code_registry is None:
+            weather_code_registry = WeatherCodeRegistry.get_instance()
+        if getattr(self, '_classified_by', None) is not weather_code_registry or \
+                self._classified_code != self.weather_code:
+            self._classified_status = weather_code_registry.status_for(self.weather_code, lowercase=True)
+            self._classified_code = self.weather_code
+            self._classified_by = weather_code_registry
+        return self._classified_status
+
     def weather_icon_url(self, size=""):
         """Returns weather-related icon URL as a string.
 
@@ -237,6 +272,15 @@ class Weather:
         size = ("@" if size != "" else "") + size
         return ICONS_BASE_URI % (self.weather_icon_name, size)
 
+    def __getstate__(self):
+        # the cached status is not pickled, as it refers to a registry
+        return {slot: getattr(self, slot) for slot in self.__slots__
+                if hasattr(self, slot) and not slot.startswith('_classified_')}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
     def __repr__(self):
         return "<%s.%s - reference_time=%s, status=%s, detailed_status=%s>" % (
             __name__, self.__class__.__name__, self.reference_time('iso'), self.status.lower(),
@@ -257,206 +301,159 @@ class Weather:
         """
         if the_dict is None:
             raise exceptions.ParseAPIResponseError('Data is None')
+        has_last, has_main = 'last' in the_dict, 'main' in the_dict
+        last = the_dict['last'] if has_last else None
+        main = the_dict['main'] if has_main else None
+
         # -- times
-        reference_time = 0
         if 'dt' in the_dict:
             reference_time = the_dict['dt']
         elif 'dt' in the_dict['last']:
-            reference_time = the_dict['last']['dt']
-
+            reference_time = last['dt']
+        else:
+            reference_time = 0
+        sys_info = the_dict['sys'] if 'sys' in the_dict else _NO_DATA
         if 'sunset' in the_dict:
             sunset_time = the_dict['sunset']
-        elif 'sys' in the_dict and 'sunset' in the_dict['sys']:
-            sunset_time = the_dict['sys']['sunset']
         else:
-            sunset_time = None
-
+            sunset_time = sys_info['sunset'] if 'sunset' in sys_info else None
         if 'sunrise' in the_dict:
             sunrise_time = the_dict['sunrise']
-        elif 'sys' in the_dict and 'sunrise' in the_dict['sys']:
-            sunrise_time = the_dict['sys']['sunrise']
         else:
-            sunrise_time = None
+            sunrise_time = sys_info['sunrise'] if 'sunrise' in sys_info else None
 
         # -- calc
-        dewpoint = None
-        humidex = None
-        heat_index = None
         if 'calc' in the_dict:
-            if 'dewpoint' in the_dict['calc']:
-                dewpoint = the_dict['calc']['dewpoint']
-
-            if 'humidex' in the_dict['calc']:
-                humidex = the_dict['calc']['humidex']
-
-            if 'heatindex' in the_dict['calc']:
-                heat_index = the_dict['calc']['heatindex']
-
-        elif 'last' in the_dict:
-            if 'calc' in the_dict['last']:
-                if 'dewpoint' in the_dict['last']['calc']:
-                    dewpoint = the_dict['last']['calc']['dewpoint']
-
-                if 'humidex' in the_dict['last']['calc']:
-                    humidex = the_dict['last']['calc']['humidex']
-
-                if 'heatindex' in the_dict['last']['calc']:
-                    heat_index = the_dict['last']['calc']['heatindex']
-
-        if 'dew_point' in the_dict and dewpoint is None:
-            dewpoint = the_dict.get('dew_point', None)
+            calc = the_dict['calc']
+        elif has_last and 'calc' in last:
+            calc = last['calc']
+        else:
+            calc = _NO_DATA
+        dewpoint = calc['dewpoint'] if 'dewpoint' in calc else None
+        humidex = calc['humidex'] if 'humidex' in calc else None
+        heat_index = calc['heatindex'] if 'heatindex' in calc else None
+        if dewpoint is None and 'dew_point' in the_dict:
+            dewpoint = the_dict['dew_point']
 
         # -- visibility
         visibility_distance = None
         if 'visibility' in the_dict:
-            if isinstance(the_dict['visibility'], int):
-                visibility_distance = the_dict['visibility']
-            elif 'distance' in the_dict['visibility']:
-                visibility_distance = the_dict['visibility']['distance']
-        elif 'last' in the_dict and 'visibility' in the_dict['last']:
-            if isinstance(the_dict['last']['visibility'], int) or isinstance(the_dict['last']['visibility'], float):
-                visibility_distance = the_dict['last']['visibility']
-            elif 'distance' in the_dict['last']['visibility']:
-                visibility_distance = the_dict['last']['visibility']['distance']
+            visibility = the_dict['visibility']
+            if isinstance(visibility, int):
+                visibility_distance = visibility
+            elif 'distance' in visibility:
+                visibility_distance = visibility['distance']
+        elif has_last and 'visibility' in last:
+            visibility = last['visibility']
+            if isinstance(visibility, _NUMBER):
+                visibility_distance = visibility
+            elif 'distance' in visibility:
+                visibility_distance = visibility['distance']
 
         # -- clouds
         clouds = 0
         if 'clouds' in the_dict:
-            if isinstance(the_dict['clouds'], int) or isinstance(the_dict['clouds'], float):
-                clouds = the_dict['clouds']
-            elif 'all' in the_dict['clouds']:
-                clouds = the_dict['clouds']['all']
-
-        # -- precipitation workaround
-        if 'precipitation' in the_dict and 'rain' not in the_dict:
-            the_dict['rain'] = the_dict['precipitation']
-
-        # -- rain
-        rain = dict()
-        if 'rain' in the_dict:
-            if isinstance(the_dict['rain'], int) or isinstance(the_dict['rain'], float):
-                rain = {'all': the_dict['rain']}
-            else:
-                if the_dict['rain'] is not None:
-                    rain = the_dict['rain'].copy()
+            clouds = the_dict['clouds']
+            if not isinstance(clouds, _NUMBER):
+                clouds = clouds['all'] if 'all' in clouds else 0
+
+        # -- rain, which is named precipitation in minutely forecasts
+        rain = the_dict['rain'] if 'rain' in the_dict else the_dict.get('precipitation')
+        if rain is None:
+            rain = dict()
+        elif isinstance(rain, _NUMBER):
+            rain = {'all': rain}
+        else:
+            rain = rain.copy()
 
         # -- wind
-        wind = dict()
-        if 'wind' in the_dict and the_dict['wind'] is not None:
-            wind = the_dict['wind'].copy()
-        elif 'last' in the_dict:
-            if 'wind' in the_dict['last'] and the_dict['last']['wind'] is not None:
-                wind = the_dict['last']['wind'].copy()
+        wind = the_dict['wind'] if 'wind' in the_dict else None
+        if wind is not None:
+            wind = wind.copy()
+        elif has_last:
+            wind = last['wind'].copy() if 'wind' in last and last['wind'] is not None else dict()
         else:
+            wind = dict()
             if 'speed' in the_dict:
                 wind['speed'] = the_dict['speed']
             elif 'wind_speed' in the_dict:
-                wind['speed'] = the_dict.get('wind_speed', 0)
-
+                wind['speed'] = the_dict['wind_speed']
             if 'deg' in the_dict:
                 wind['deg'] = the_dict['deg']
             elif 'wind_deg' in the_dict:
-                wind['deg'] = the_dict.get('wind_deg', 0)
-
+                wind['deg'] = the_dict['wind_deg']
             if 'wind_gust' in the_dict:
-                wind['gust'] = the_dict.get('wind_gust', 0)
+                wind['gust'] = the_dict['wind_gust']
 
         # -- humidity
         if 'humidity' in the_dict:
             humidity = the_dict['humidity']
-        elif 'main' in the_dict and 'humidity' in the_dict['main']:
-            humidity = the_dict['main']['humidity']
-        elif 'last' in the_dict and 'main' in the_dict['last'] and 'humidity' in the_dict['last']['main']:
-            humidity = the_dict['last']['main']['humidity']
+        elif has_main and 'humidity' in main:
+            humidity = main['humidity']
+        elif has_last and 'main' in last and 'humidity' in last['main']:
+            humidity = last['main']['humidity']
         else:
             humidity = 0
 
         # -- snow
-        snow = dict()
-        if 'snow' in the_dict:
-            if isinstance(the_dict['snow'], int) or isinstance(the_dict['snow'], float):
-                snow = {'all': the_dict['snow']}
-            else:
-                if the_dict['snow'] is not None:
-                    snow = the_dict['snow'].copy()
+        snow = the_dict['snow'] if 'snow' in the_dict else None
+        if snow is None:
+            snow = dict()
+        elif isinstance(snow, _NUMBER):
+            snow = {'all': snow}
+        else:
+            snow = snow.copy()
 
         # -- pressure
-        atm_press = None
         if 'pressure' in the_dict:
             atm_press = the_dict['pressure']
-        elif 'main' in the_dict and 'pressure' in the_dict['main']:
-            atm_press = the_dict['main']['pressure']
-        elif 'last' in the_dict:
-            if 'main' in the_dict['last']:
-                atm_press = the_dict['last']['main']['pressure']
-
-        sea_level_press = None
-        if 'main' in the_dict and 'sea_level' in the_dict['main']:
-            sea_level_press = the_dict['main']['sea_level']
-
+        elif has_main and 'pressure' in main:
+            atm_press = main['pressure']
+        elif has_last and 'main' in last:
+            atm_press = last['main']['pressure']
+        else:
+            atm_press = None
+        sea_level_press = main['sea_level'] if has_main and 'sea_level' in main else None
         pressure = {'press': atm_press, 'sea_level': sea_level_press}
 
         # -- temperature
-        temperature = dict()
-        if 'temp' in the_dict:
-            if isinstance(the_dict['temp'], int) or isinstance(the_dict['temp'], float):
-                temperature = {
-                    'temp': the_dict.get('temp', None)
-                }
-            elif the_dict['temp'] is not None:
-                temperature = the_dict['temp'].copy()
-        elif 'main' in the_dict and 'temp' in the_dict['main']:
-            temp_dic = the_dict['main']
-
-            temperature = {'temp': temp_dic['temp'],
-                           'temp_kf': temp_dic.get('temp_kf', None),
-                           'temp_max': temp_dic.get('temp_max', None),
-                           'temp_min': temp_dic.get('temp_min', None),
-                           'feels_like': temp_dic.get('feels_like', None)
-                           }
-        elif 'last' in the_dict:
-            if 'main' in the_dict['last']:
-                temperature = dict(temp=the_dict['last']['main']['temp'])
-
-        # add feels_like to temperature if present
+        temperature = the_dict['temp'] if 'temp' in the_dict else None
+        if temperature is not None:
+            temperature = {'temp': temperature} if isinstance(temperature, _NUMBER) else temperature.copy()
+        elif 'temp' in the_dict:
+            temperature = dict()
+        elif has_main and 'temp' in main:
+            temperature = {'temp': main['temp'], 'temp_kf': main.get('temp_kf'), 'temp_max': main.get('temp_max'),
+                           'temp_min': main.get('temp_min'), 'feels_like': main.get('feels_like')}
+        elif has_last and 'main' in last:
+            temperature = {'temp': last['main']['temp']}
+        else:
+            temperature = dict()
         if 'feels_like' in the_dict:
             feels_like = the_dict['feels_like']
-            if isinstance(feels_like, int) or isinstance(feels_like, float):
-                temperature['feels_like'] = the_dict.get('feels_like', None)
+            if isinstance(feels_like, _NUMBER):
+                temperature['feels_like'] = feels_like
             elif isinstance(feels_like, dict):
                 for label, temp in feels_like.items():
-                    temperature[f'feels_like_{label}'] = temp
+                    temperature[_FEELS_LIKE_KEYS.get(label) or f'feels_like_{label}'] = temp
 
         # -- weather status info
         if 'weather' in the_dict:
-            status = the_dict['weather'][0]['main']
-            detailed_status = the_dict['weather'][0]['description']
-            weather_code = the_dict['weather'][0]['id']
-            weather_icon_name = the_dict['weather'][0]['icon']
+            status_info = the_dict['weather'][0]
+            status = status_info['main']
+            detailed_status = status_info['description']
+            weather_code = status_info['id']
+            weather_icon_name = status_info['icon']
         else:
-            status = ''
-            detailed_status = ''
+            status = detailed_status = weather_icon_name = ''
             weather_code = 0
-            weather_icon_name = ''
-
-        # -- timezone
-        if 'timezone' in the_dict:
-            utc_offset = the_dict['timezone']
-        else:
-            utc_offset = None
-
-        # -- UV index
-        uvi = the_dict.get('uvi', None)
-
-        # -- Precipitation probability
-        precipitation_probability = the_dict.get('pop', None)
 
         return Weather(reference_time, sunset_time, sunrise_time, clouds,
                        rain, snow, wind, humidity, pressure, temperature,
                        status, detailed_status, weather_code, weather_icon_name,
                        visibility_distance, dewpoint, humidex, heat_index,
-                       utc_offset=utc_offset, uvi=uvi,
-                       precipitation_probability=precipitation_probability)
+                       utc_offset=the_dict.get('timezone'), uvi=the_dict.get('uvi'),
+                       precipitation_probability=the_dict.get('pop'))
 
     @classmethod
     def from_dict_of_lists(cls, the_dict):
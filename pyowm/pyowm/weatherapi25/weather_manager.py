@@ -1,15 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-from datetime import datetime, timedelta, timezone
 from typing import Union
 
+from pyowm.commons import exceptions
 from pyowm.commons.http_client import HttpClient
 from pyowm.constants import WEATHER_API_VERSION
-from pyowm.utils import geo
-from pyowm.weatherapi25 import forecaster, historian, observation, forecast, stationhistory, one_call
-from pyowm.weatherapi25.uris import ROOT_WEATHER_API, OBSERVATION_URI, GROUP_OBSERVATIONS_URI, FIND_OBSERVATIONS_URI, \
-    BBOX_CITY_URI, THREE_HOURS_FORECAST_URI, DAILY_FORECAST_URI, STATION_WEATHER_HISTORY_URI, ONE_CALL_URI, \
-    ONE_CALL_HISTORICAL_URI
+from pyowm.utils.concurrency import fan_out
+from pyowm.weatherapi25 import historian, observation, one_call, weather_queries
+from pyowm.weatherapi25.uris import ROOT_WEATHER_API, GROUP_OBSERVATIONS_MAX_IDS
 
 
 class WeatherManager:
@@ -20,16 +18,19 @@ class WeatherManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param http_session: the pooled HTTP transport to be shared with other managers (if not provided, a new one
+        will be created)
+    :type http_session: `pyowm.commons.http_client.HttpSession`
     :returns: a *WeatherManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, http_session=None):
         assert isinstance(API_key, str), 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_WEATHER_API)
+        self.http_client = HttpClient(API_key, config, ROOT_WEATHER_API, session=http_session)
 
     def weather_api_version(self):
         return WEATHER_API_VERSION
@@ -48,9 +49,8 @@ class WeatherManager:
             reached
         """
 
-        assert isinstance(name, str), "Value must be a string"
-        params = {'q': name}
-        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=params)
+        uri, params = weather_queries.weather_at_place(name)
+        _, json_data = self.http_client.get_json(uri, params=params)
         return observation.Observation.from_dict(json_data)
 
     def weather_at_coords(self, lat, lon):
@@ -68,10 +68,8 @@ class WeatherManager:
             cannot be parsed or *APICallException* when OWM Weather API can not be
             reached
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=params)
+        uri, params = weather_queries.weather_at_coords(lat, lon)
+        _, json_data = self.http_client.get_json(uri, params=params)
         return observation.Observation.from_dict(json_data)
 
     def weather_at_zip_code(self, zipcode, country):
@@ -89,11 +87,8 @@ class WeatherManager:
             cannot be parsed or *APICallException* when OWM Weather API can not be
             reached
         """
-        assert isinstance(zipcode, str), "Value must be a string"
-        assert isinstance(country, str), "Value must be a string"
-        zip_param = zipcode + ',' + country
-        params = {'zip': zip_param}
-        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=params)
+        uri, params = weather_queries.weather_at_zip_code(zipcode, country)
+        _, json_data = self.http_client.get_json(uri, params=params)
         return observation.Observation.from_dict(json_data)
 
     def weather_at_id(self, id):
@@ -109,11 +104,8 @@ class WeatherManager:
             cannot be parsed or *APICallException* when OWM Weather API can not be
             reached
         """
-        assert type(id) is int, "'id' must be an int"
-        if id < 0:
-            raise ValueError("'id' value must be greater than 0")
-        params = {'id': id}
-        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=params)
+        uri, params = weather_queries.weather_at_id(id)
+        _, json_data = self.http_client.get_json(uri, params=params)
         return observation.Observation.from_dict(json_data)
 
     def weather_at_ids(self, ids_list):
@@ -129,16 +121,57 @@ class WeatherManager:
             cannot be parsed or *APICallException* when OWM Weather API can not be
             reached
         """
-        assert type(ids_list) is list, "'ids_list' must be a list of integers"
-        for id in ids_list:
-            assert type(id) is int, "'ids_list' must be a list of integers"
-            if id < 0:
-                raise ValueError("id values in 'ids_list' must be greater "
-                                 "than 0")
-        params = {'id': ','.join(list(map(str, ids_list)))}
-        _, json_data = self.http_client.get_json(GROUP_OBSERVATIONS_URI, params=params)
+        uri, params = weather_queries.weather_at_ids(ids_list)
+        _, json_data = self.http_client.get_json(uri, params=params)
         return observation.Observation.from_dict_of_lists(json_data)
 
+    def bulk_weather_at_ids(self, ids, chunk_size=GROUP_OBSERVATIONS_MAX_IDS, concurrency=4, on_failure=None):
+        """
+        Queries the OWM Weather API for the currently observed weathers at an arbitrary number of city IDs.
+        IDs are split into chunks that are queried concurrently, and the observations of each chunk are streamed as
+        soon as the chunk is retrieved - thus in no particular order.
+        A failed chunk does not stop the others: it is reported to the `on_failure` callback, if provided. Otherwise,
+        once all the chunks are done a *BulkAPIRequestError* listing the failed chunks is raised. Chunks for which
+        no weather data is found fail with a *NotFoundError*.
+
+        :param ids: the city IDs
+        :type ids: iterable of int
+        :param chunk_size: how many IDs are queried with each API call (defaults to the maximum allowed by the API)
+        :type chunk_size: int
+        :param concurrency: the maximum number of concurrent API calls (defaults to 4)
+        :type concurrency: int
+        :param on_failure: a function called with the IDs of each failed chunk and the raised exception (optional)
+        :type on_failure: callable
+        :returns: a generator of *Observation* instances
+        :raises: *AssertionError* or *ValueError* when wrong parameters are provided (before any API call is
+            issued), *BulkAPIRequestError* when some chunks failed and no `on_failure` callback is provided
+        """
+        assert isinstance(chunk_size, int), "'chunk_size' must be an int"
+        if not 0 < chunk_size <= GROUP_OBSERVATIONS_MAX_IDS:
+            raise ValueError("'chunk_size' must be between 1 and %d" % GROUP_OBSERVATIONS_MAX_IDS)
+        ids = list(ids)
+        for id in ids:
+            assert type(id) is int, "'ids' must be integers"
+            if id < 0:
+                raise ValueError("id values in 'ids' must be greater than 0")
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        return self._stream_bulk_observations(fan_out(self.weather_at_ids, chunks, concurrency), on_failure)
+
+    def _stream_bulk_observations(self, outcomes, on_failure):
+        failures = []
+        for chunk, result in outcomes:
+            if result is None:
+                result = exceptions.NotFoundError('No weather data found for city IDs: %s' % chunk)
+            if isinstance(result, Exception):
+                if on_failure is not None:
+                    on_failure(chunk, result)
+                else:
+                    failures.append((chunk, result))
+            else:
+                yield from result
+        if failures:
+            raise exceptions.BulkAPIRequestError(failures)
+
     def weather_at_places(self, pattern, searchtype, limit=None):
         """
         Queries the OWM Weather API for the currently observed weather in all the
@@ -162,19 +195,8 @@ class WeatherManager:
             reached, *ValueError* when bad value is supplied for the search
             type or the maximum number of items retrieved
         """
-        assert isinstance(pattern, str), "'pattern' must be a str"
-        assert isinstance(searchtype, str), "'searchtype' must be a str"
-        if searchtype != "accurate" and searchtype != "like":
-            raise ValueError("'searchtype' value must be 'accurate' or 'like'")
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-        params = {'q': pattern, 'type': searchtype}
-        if limit is not None:
-            # fix for OWM 2.5 API bug!
-            params['cnt'] = limit - 1
-        _, json_data = self.http_client.get_json(FIND_OBSERVATIONS_URI, params=params)
+        uri, params = weather_queries.weather_at_places(pattern, searchtype, limit=limit)
+        _, json_data = self.http_client.get_json(uri, params=params)
         return observation.Observation.from_dict_of_lists(json_data)
 
     def weather_at_places_in_bbox(self, lon_left, lat_bottom, lon_right, lat_top,
@@ -206,21 +228,9 @@ class WeatherManager:
             reached, *ValueError* when coordinates values are out of bounds or
             negative values are provided for limit
         """
-        geo.assert_is_lon(lon_left)
-        geo.assert_is_lon(lon_right)
-        geo.assert_is_lat(lat_bottom)
-        geo.assert_is_lat(lat_top)
-        assert type(zoom) is int, "'zoom' must be an int"
-        if zoom <= 0:
-            raise ValueError("'zoom' must greater than zero")
-        assert type(cluster) is bool, "'cluster' must be a bool"
-        params = {'bbox': ','.join([str(lon_left),
-                                    str(lat_bottom),
-                                    str(lon_right),
-                                    str(lat_top),
-                                    str(zoom)]),
-                  'cluster': 'yes' if cluster else 'no'}
-        _, json_data = self.http_client.get_json(BBOX_CITY_URI, params=params)
+        uri, params = weather_queries.weather_at_places_in_bbox(lon_left, lat_bottom, lon_right, lat_top,
+                                                                zoom=zoom, cluster=cluster)
+        _, json_data = self.http_client.get_json(uri, params=params)
         return observation.Observation.from_dict_of_lists(json_data)
 
     def weather_around_coords(self, lat, lon, limit=None):
@@ -242,15 +252,8 @@ class WeatherManager:
             reached, *ValueError* when coordinates values are out of bounds or
             negative values are provided for limit
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-            params['cnt'] = limit
-        _, json_data = self.http_client.get_json(FIND_OBSERVATIONS_URI, params=params)
+        uri, params = weather_queries.weather_around_coords(lat, lon, limit=limit)
+        _, json_data = self.http_client.get_json(uri, params=params)
         return observation.Observation.from_dict_of_lists(json_data)
 
     def forecast_at_place(self, name, interval, limit=None):
@@ -273,28 +276,9 @@ class WeatherManager:
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        assert isinstance(name, str), "Value must be a string"
-        assert isinstance(interval, str), "Interval must be a string"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-        params = {'q': name}
-        if limit is not None:
-            params['cnt'] = limit
-        if interval == '3h':
-            uri = THREE_HOURS_FORECAST_URI
-        elif interval == 'daily':
-            uri = DAILY_FORECAST_URI
-        else:
-            raise ValueError("Unsupported time interval for forecast")
+        uri, params = weather_queries.forecast_at_place(name, interval, limit=limit)
         _, json_data = self.http_client.get_json(uri, params=params)
-        fc = forecast.Forecast.from_dict(json_data)
-        if fc is not None:
-            fc.interval = interval
-            return forecaster.Forecaster(fc)
-        else:
-            return None
+        return weather_queries.forecaster_from_dict(json_data, interval)
 
     def forecast_at_coords(self, lat, lon, interval, limit=None):
         """
@@ -318,29 +302,9 @@ class WeatherManager:
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        assert isinstance(interval, str), "Interval must be a string"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-        params = {'lon': lon, 'lat': lat}
-        if limit is not None:
-            params['cnt'] = limit
-        if interval == '3h':
-            uri = THREE_HOURS_FORECAST_URI
-        elif interval == 'daily':
-            uri = DAILY_FORECAST_URI
-        else:
-            raise ValueError("Unsupported time interval for forecast")
+        uri, params = weather_queries.forecast_at_coords(lat, lon, interval, limit=limit)
         _, json_data = self.http_client.get_json(uri, params=params)
-        fc = forecast.Forecast.from_dict(json_data)
-        if fc is not None:
-            fc.interval = interval
-            return forecaster.Forecaster(fc)
-        else:
-            return None
+        return weather_queries.forecaster_from_dict(json_data, interval)
 
     def forecast_at_id(self, id, interval, limit=None):
         """
@@ -362,30 +326,36 @@ class WeatherManager:
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        assert type(id) is int, "'id' must be an int"
-        if id < 0:
-            raise ValueError("'id' value must be greater than 0")
-        assert isinstance(interval, str), "Interval must be a string"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-        params = {'id': id}
-        if limit is not None:
-            params['cnt'] = limit
-        if interval == '3h':
-            uri = THREE_HOURS_FORECAST_URI
-        elif interval == 'daily':
-            uri = DAILY_FORECAST_URI
-        else:
-            raise ValueError("Unsupported time interval for forecast")
+        uri, params = weather_queries.forecast_at_id(id, interval, limit=limit)
         _, json_data = self.http_client.get_json(uri, params=params)
-        fc = forecast.Forecast.from_dict(json_data)
-        if fc is not None:
-            fc.interval = interval
-            return forecaster.Forecaster(fc)
-        else:
-            return None
+        return weather_queries.forecaster_from_dict(json_data, interval)
+
+    def bulk_forecast_at_ids(self, ids, interval, limit=None, concurrency=4, cancel_event=None):
+        """
+        Queries the OWM Weather API for weather forecasts for many city IDs, with the given time granularity.
+        Forecasts are retrieved concurrently and streamed as soon as they are available - thus in no particular
+        order. A failed API call does not stop the others: the raised exception is streamed in place of the forecast.
+        Pending API calls are cancelled when the returned generator is closed or when `cancel_event` is set.
+
+        :param ids: the city IDs
+        :type ids: iterable of int
+        :param interval: the granularity of the forecast, among `3h` and 'daily'
+        :type interval: str among `3h` and 'daily'
+        :param limit: the maximum number of *Weather* items to be retrieved for each forecast
+            (default is ``None``, which stands for any number of items)
+        :type limit: int or ``None``
+        :param concurrency: the maximum number of concurrent API calls (defaults to 4)
+        :type concurrency: int
+        :param cancel_event: an event that stops the retrieval when set (optional)
+        :type cancel_event: `threading.Event`
+        :returns: a generator of `(id, result)` tuples, where `result` is a *Forecaster* instance, ``None`` if
+            forecast data is not available for the city ID, or the exception raised by the API call
+        :raises: *AssertionError* or *ValueError* when wrong `interval`, `limit` or `concurrency` values are provided
+            (before any API call is issued)
+        """
+        weather_queries.forecast_uri(interval, limit=limit)  # checks the arguments shared by all the API calls
+        return fan_out(lambda id: self.forecast_at_id(id, interval, limit=limit), ids, concurrency,
+                       cancel_event=cancel_event)
 
     def station_tick_history(self, station_ID, limit=None):
         """
@@ -408,11 +378,6 @@ class WeatherManager:
             reached, *ValueError* if the limit value is negative
 
         """
-        assert isinstance(station_ID, int), "'station_ID' must be int"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
         station_history = self._retrieve_station_history(station_ID, limit, "tick")
         if station_history is not None:
             return historian.Historian(station_history)
@@ -441,11 +406,6 @@ class WeatherManager:
             reached, *ValueError* if the limit value is negative
 
         """
-        assert isinstance(station_ID, int), "'station_ID' must be int"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
         station_history = self._retrieve_station_history(station_ID, limit, "hour")
         if station_history is not None:
             return historian.Historian(station_history)
@@ -474,11 +434,6 @@ class WeatherManager:
             reached, *ValueError* if the limit value is negative
 
         """
-        assert isinstance(station_ID, int), "'station_ID' must be int"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
         station_history = self._retrieve_station_history(station_ID, limit, "day")
         if station_history is not None:
             return historian.Historian(station_history)
@@ -489,15 +444,9 @@ class WeatherManager:
         """
         Helper method for station_X_history functions.
         """
-        params = {'id': station_ID, 'type': interval}
-        if limit is not None:
-            params['cnt'] = limit
-        _, json_data = self.http_client.get_json(STATION_WEATHER_HISTORY_URI, params=params)
-        sh = stationhistory.StationHistory.from_dict(json_data)
-        if sh is not None:
-            sh.station_id = station_ID
-            sh.interval = interval
-        return sh
+        uri, params = weather_queries.station_history(station_ID, limit, interval)
+        _, json_data = self.http_client.get_json(uri, params=params)
+        return weather_queries.station_history_from_dict(json_data, station_ID, interval)
 
     def one_call(self, lat: Union[int, float], lon: Union[int, float], **kwargs) -> one_call.OneCall:
         """
@@ -514,21 +463,38 @@ class WeatherManager:
         :type lat: int/float
         :param lon: location's longitude, must be between -180.0 and 180.0
         :type lon: int/float
+        :param kwargs: `exclude` (the comma-separated parts of the data to be left out), `units` and `lazy` (whether
+            to parse the forecasts lazily, see `OneCall.from_dict`)
         :returns: a *OneCall* instance or ``None`` if the data is not
             available for the specified location
         :raises: *ParseResponseException* when OWM Weather API responses' data
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        for key , value in kwargs.items():
-            if key == 'exclude': params['exclude'] = value
-            if key == 'units': params['units'] = value
+        uri, params = weather_queries.one_call(lat, lon, **kwargs)
+        _, json_data = self.http_client.get_json(uri, params=params)
+        return one_call.OneCall.from_dict(json_data, lazy=kwargs.get('lazy', False))
 
-        _, json_data = self.http_client.get_json(ONE_CALL_URI, params=params)
-        return one_call.OneCall.from_dict(json_data)
+    def bulk_one_call(self, coords, concurrency=4, cancel_event=None, **kwargs):
+        """
+        Queries the OWM Weather API with one call for current weather information and forecast for many geographic
+        coordinates. Data is retrieved concurrently and streamed as soon as it is available - thus in no particular
+        order. A failed API call does not stop the others: the raised exception is streamed in place of the data.
+        Pending API calls are cancelled when the returned generator is closed or when `cancel_event` is set.
+        Keyword arguments are the same as for `one_call`
+
+        :param coords: the `(lat, lon)` geographic coordinates
+        :type coords: iterable of tuples
+        :param concurrency: the maximum number of concurrent API calls (defaults to 4)
+        :type concurrency: int
+        :param cancel_event: an event that stops the retrieval when set (optional)
+        :type cancel_event: `threading.Event`
+        :returns: a generator of `((lat, lon), result)` tuples, where `result` is a *OneCall* instance or the
+            exception raised by the API call
+        :raises: *AssertionError* when a wrong `concurrency` value is provided (before any API call is issued)
+        """
+        return fan_out(lambda latlon: self.one_call(latlon[0], latlon[1], **kwargs), coords, concurrency,
+                       cancel_event=cancel_event)
 
     def one_call_history(self, lat: Union[int, float], lon: Union[int, float], dt: int = None):
         """
@@ -550,19 +516,8 @@ class WeatherManager:
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        if dt is None:
-            dt = int((datetime.now(timezone.utc) - timedelta(days=5)).timestamp())
-        else:
-            if not isinstance(dt, int):
-                raise ValueError("dt must be of type int")
-            if dt < 0:
-                raise ValueError("dt must be positive")
-
-        params = {'lon': lon, 'lat': lat, 'dt': dt}
-
-        _, json_data = self.http_client.get_json(ONE_CALL_HISTORICAL_URI, params=params)
+        uri, params = weather_queries.one_call_history(lat, lon, dt=dt)
+        _, json_data = self.http_client.get_json(uri, params=params)
         return one_call.OneCall.from_dict(json_data)
 
     def __repr__(self):
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from datetime import datetime, timedelta, timezone
+
+from pyowm.utils import geo
+from pyowm.weatherapi25 import forecaster, forecast, stationhistory
+from pyowm.weatherapi25.uris import OBSERVATION_URI, GROUP_OBSERVATIONS_URI, FIND_OBSERVATIONS_URI, BBOX_CITY_URI, \
+    THREE_HOURS_FORECAST_URI, DAILY_FORECAST_URI, STATION_WEATHER_HISTORY_URI, ONE_CALL_URI, ONE_CALL_HISTORICAL_URI
+
+# The queries of the Weather API methods, shared by `WeatherManager` and `AsyncWeatherManager`: each function checks
+# the arguments of the namesake manager method and gives the `(uri, params)` of the API call to be issued
+
+
+def _assert_is_limit(limit):
+    if limit is not None:
+        assert isinstance(limit, int), "'limit' must be an int or None"
+        if limit < 1:
+            raise ValueError("'limit' must be None or greater than zero")
+
+
+def _assert_is_id(id):
+    assert type(id) is int, "'id' must be an int"
+    if id < 0:
+        raise ValueError("'id' value must be greater than 0")
+
+
+def weather_at_place(name):
+    assert isinstance(name, str), "Value must be a string"
+    return OBSERVATION_URI, {'q': name}
+
+
+def weather_at_coords(lat, lon):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    return OBSERVATION_URI, {'lon': lon, 'lat': lat}
+
+
+def weather_at_zip_code(zipcode, country):
+    assert isinstance(zipcode, str), "Value must be a string"
+    assert isinstance(country, str), "Value must be a string"
+    return OBSERVATION_URI, {'zip': zipcode + ',' + country}
+
+
+def weather_at_id(id):
+    _assert_is_id(id)
+    return OBSERVATION_URI, {'id': id}
+
+
+def weather_at_ids(ids_list):
+    assert type(ids_list) is list, "'ids_list' must be a list of integers"
+    for id in ids_list:
+        assert type(id) is int, "'ids_list' must be a list of integers"
+        if id < 0:
+            raise ValueError("id values in 'ids_list' must be greater "
+                             "than 0")
+    return GROUP_OBSERVATIONS_URI, {'id': ','.join(list(map(str, ids_list)))}
+
+
+def weather_at_places(pattern, searchtype, limit=None):
+    assert isinstance(pattern, str), "'pattern' must be a str"
+    assert isinstance(searchtype, str), "'searchtype' must be a str"
+    if searchtype != "accurate" and searchtype != "like":
+        raise ValueError("'searchtype' value must be 'accurate' or 'like'")
+    _assert_is_limit(limit)
+    params = {'q': pattern, 'type': searchtype}
+    if limit is not None:
+        # fix for OWM 2.5 API bug!
+        params['cnt'] = limit - 1
+    return FIND_OBSERVATIONS_URI, params
+
+
+def weather_at_places_in_bbox(lon_left, lat_bottom, lon_right, lat_top, zoom=10, cluster=False):
+    geo.assert_is_lon(lon_left)
+    geo.assert_is_lon(lon_right)
+    geo.assert_is_lat(lat_bottom)
+    geo.assert_is_lat(lat_top)
+    assert type(zoom) is int, "'zoom' must be an int"
+    if zoom <= 0:
+        raise ValueError("'zoom' must greater than zero")
+    assert type(cluster) is bool, "'cluster' must be a bool"
+    params = {'bbox': ','.join([str(lon_left),
+                                str(lat_bottom),
+                                str(lon_right),
+                                str(lat_top),
+                                str(zoom)]),
+              'cluster': 'yes' if cluster else 'no'}
+    return BBOX_CITY_URI, params
+
+
+def weather_around_coords(lat, lon, limit=None):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    _assert_is_limit(limit)
+    params = {'lon': lon, 'lat': lat}
+    if limit is not None:
+        params['cnt'] = limit
+    return FIND_OBSERVATIONS_URI, params
+
+
+def forecast_uri(interval, limit=None):
+    assert isinstance(interval, str), "Interval must be a string"
+    _assert_is_limit(limit)
+    if interval == '3h':
+        return THREE_HOURS_FORECAST_URI
+    elif interval == 'daily':
+        return DAILY_FORECAST_URI
+    else:
+        raise ValueError("Unsupported time interval for forecast")
+
+
+def _forecast(params, interval, limit):
+    uri = forecast_uri(interval, limit=limit)
+    if limit is not None:
+        params['cnt'] = limit
+    return uri, params
+
+
+def forecast_at_place(name, interval, limit=None):
+    assert isinstance(name, str), "Value must be a string"
+    return _forecast({'q': name}, interval, limit)
+
+
+def forecast_at_coords(lat, lon, interval, limit=None):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    return _forecast({'lon': lon, 'lat': lat}, interval, limit)
+
+
+def forecast_at_id(id, interval, limit=None):
+    _assert_is_id(id)
+    return _forecast({'id': id}, interval, limit)
+
+
+def forecaster_from_dict(the_dict, interval):
+    """
+    Parses the forecast out of the data dictionary of a `forecast_at_*` API call
+
+    :returns: a *Forecaster* instance or ``None`` if no forecast data is available
+    """
+    fc = forecast.Forecast.from_dict(the_dict)
+    if fc is not None:
+        fc.interval = interval
+        return forecaster.Forecaster(fc)
+    else:
+        return None
+
+
+def station_history(station_ID, limit, interval):
+    assert isinstance(station_ID, int), "'station_ID' must be int"
+    _assert_is_limit(limit)
+    params = {'id': station_ID, 'type': interval}
+    if limit is not None:
+        params['cnt'] = limit
+    return STATION_WEATHER_HISTORY_URI, params
+
+
+def station_history_from_dict(the_dict, station_ID, interval):
+    """
+    Parses the station history out of the data dictionary of a `station_*_history` API call
+
+    :returns: a *StationHistory* instance or ``None`` if no data is available
+    """
+    sh = stationhistory.StationHistory.from_dict(the_dict)
+    if sh is not None:
+        sh.station_id = station_ID
+        sh.interval = interval
+    return sh
+
+
+def one_call(lat, lon, **kwargs):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    params = {'lon': lon, 'lat': lat}
+    for key, value in kwargs.items():
+        if key == 'exclude':
+            params['exclude'] = value
+        if key == 'units':
+            params['units'] = value
+    return ONE_CALL_URI, params
+
+
+def one_call_history(lat, lon, dt=None):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    if dt is None:
+        dt = int((datetime.now(timezone.utc) - timedelta(days=5)).timestamp())
+    else:
+        if not isinstance(dt, int):
+            raise ValueError("dt must be of type int")
+        if dt < 0:
+            raise ValueError("dt must be positive")
+    return ONE_CALL_HISTORICAL_URI, {'lon': lon, 'lat': lat, 'dt': dt}
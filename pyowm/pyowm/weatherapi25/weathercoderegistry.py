@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from array import array
+from itertools import chain
+
 
 WEATHER_CODES_INTERVALS = {
     "rain": [{
@@ -61,11 +64,18 @@ WEATHER_CODES_INTERVALS = {
     }]
 }
 
+_default_instance = None
+
 
 class WeatherCodeRegistry:
 
     """
     A registry class for looking up weather statuses from weather codes.
+    The code ranges are compiled upon instantiation into a lookup table indexed
+    by weather code, so that lookups take constant time: codes greater than
+    `MAX_TABLE_CODE` are looked up by scanning the ranges. When ranges of
+    different statuses overlap, the status coming first in the dict wins.
+    The registry must not be modified after instantiation.
 
     :param code_ranges_dict: a dict containing the mapping between weather
         statuses (eg: "sun","clouds",etc) and weather code ranges
@@ -74,33 +84,104 @@ class WeatherCodeRegistry:
 
     """
 
+    MAX_TABLE_CODE = 9999
+
     def __init__(self, code_ranges_dict):
         assert isinstance(code_ranges_dict, dict)
         self._code_ranges_dict = code_ranges_dict
+        self._codes_by_status = dict()
+        table_size = 1 + max([min(_range['end'], self.MAX_TABLE_CODE)
+                              for ranges in code_ranges_dict.values() for _range in ranges] or [-1])
+        table = [None] * table_size
+        for status, ranges in code_ranges_dict.items():
+            for _range in ranges:
+                for code in range(max(_range['start'], 0), min(_range['end'], self.MAX_TABLE_CODE) + 1):
+                    if table[code] is None:
+                        table[code] = status
+        self._table = tuple(table)
+        self._lowercase_table = tuple(None if status is None else status.lower() for status in table)
+
+    def _scan(self, code):
+        is_in = lambda start, end, n: True if start <= n <= end else False
+        for status in self._code_ranges_dict:
+            for _range in self._code_ranges_dict[status]:
+                if is_in(_range['start'],_range['end'],code):
+                    return status
+        return None
 
-    def status_for(self, code):
+    def status_for(self, code, lowercase=False):
         """
         Returns the weather status related to the specified weather status
         code, if any is stored, ``None`` otherwise.
 
         :param code: the weather status code whose status is to be looked up
         :type code: int
+        :param lowercase: whether the status must be lowercased (defaults to ``False``)
+        :type lowercase: bool
         :returns: the weather status str or ``None`` if the code is not mapped
         """
-        is_in = lambda start, end, n: True if start <= n <= end else False
-        for status in self._code_ranges_dict:
-            for _range in self._code_ranges_dict[status]:
-                if is_in(_range['start'],_range['end'],code):
-                    return status
-        return None
+        table = self._lowercase_table if lowercase else self._table
+        if type(code) is int and 0 <= code < len(table):
+            return table[code]
+        status = self._scan(code)
+        return status.lower() if lowercase and status is not None else status
+
+    def classify(self, codes, lowercase=False):
+        """
+        Returns the weather statuses related to many weather status codes at
+        once: this is way faster than calling `status_for` for each code.
+
+        :param codes: the weather status codes
+        :type codes: iterable of int (eg. an `array.array`)
+        :param lowercase: whether the statuses must be lowercased (defaults to ``False``)
+        :type lowercase: bool
+        :returns: a list with the weather status str of each code, or ``None``
+            for codes that are not mapped
+        """
+        table = self._lowercase_table if lowercase else self._table
+        if not isinstance(codes, (array, list, tuple)):
+            codes = list(codes)
+        try:
+            if not codes or (min(codes) >= 0 and max(codes) < len(table)):
+                return list(map(table.__getitem__, codes))
+        except TypeError:  # not all the codes are int
+            pass
+        return [self.status_for(code, lowercase=lowercase) for code in codes]
+
+    def codes_for(self, status):
+        """
+        Returns the weather status codes related to the specified weather status, that is: the codes whose status
+        is the specified one once lowercased
+
+        :param status: the weather status (eg. "rain")
+        :type status: str
+        :returns: a frozenset of int
+        """
+        codes = self._codes_by_status.get(status)
+        if codes is None:
+            codes = set(code for code, code_status in enumerate(self._lowercase_table) if code_status == status)
+            for code_status, ranges in self._code_ranges_dict.items():  # codes out of the table
+                if code_status.lower() != status:
+                    continue
+                for _range in ranges:
+                    out_of_table = chain(range(_range['start'], min(_range['end'], -1) + 1),
+                                         range(max(_range['start'], self.MAX_TABLE_CODE + 1), _range['end'] + 1))
+                    codes.update(code for code in out_of_table if self.status_for(code, lowercase=True) == status)
+            codes = frozenset(codes)
+            self._codes_by_status[status] = codes
+        return codes
 
     @classmethod
     def get_instance(cls):
         """
-        Factory method returning the default weather code registry
+        Factory method returning the default weather code registry, which is
+        shared by all its callers
         :return: a `WeatherCodeRegistry` instance
         """
-        return WeatherCodeRegistry(WEATHER_CODES_INTERVALS)
+        global _default_instance
+        if _default_instance is None:
+            _default_instance = WeatherCodeRegistry(WEATHER_CODES_INTERVALS)
+        return _default_instance
 
     def __repr__(self):
         return "<%s.%s>" % (__name__, self.__class__.__name__)
\ No newline at end of file
@@ -21,6 +21,10 @@ setup(
         'PySocks>=1.7.1,<2',
         'requests[socks]'
     ],
+    extras_require={
+        'aio': ['aiohttp>=3.6,<4'],
+        'fastjson': ['orjson>=3,<4']
+    },
     python_requires='>=3.7',
     classifiers=[
       "License :: OSI Approved :: MIT License",
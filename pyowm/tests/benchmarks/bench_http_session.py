@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Latency of sequential `WeatherManager.weather_at_place` calls against a local stub server, with a pooled keep-alive
+transport versus a new connection per call.
+
+Run from the project root with: `python -m tests.benchmarks.bench_http_session [number_of_calls]`
+"""
+
+import copy
+import statistics
+import sys
+import time
+
+from pyowm.commons.http_client import HttpClient, HttpSession
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.weatherapi25.weather_manager import WeatherManager
+from tests.benchmarks.stub_server import StubServer
+from tests.unit.weatherapi25.json_test_responses import OBSERVATION_JSON
+
+
+def _config(keep_alive):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['connection']['use_ssl'] = False
+    config['connection']['keep_alive'] = keep_alive
+    return config
+
+
+def run(root_uri, keep_alive, calls):
+    config = _config(keep_alive)
+    session = HttpSession(config)
+    mgr = WeatherManager('fakeapikey', config, http_session=session)
+    mgr.http_client = HttpClient('fakeapikey', config, root_uri, admits_subdomains=False, session=session)
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        mgr.weather_at_place('London,uk')
+        latencies.append(time.perf_counter() - start)
+    session.close()
+    return latencies
+
+
+def report(label, latencies):
+    cut_points = statistics.quantiles(latencies, n=100)
+    print('{:<12} p50: {:7.3f} ms  p99: {:7.3f} ms  total: {:7.3f} s'.format(
+        label, cut_points[49] * 1000, cut_points[98] * 1000, sum(latencies)))
+
+
+def main(calls=1000):
+    with StubServer(OBSERVATION_JSON) as server:
+        report('pooled', run(server.root_uri, True, calls))
+        report('not pooled', run(server.root_uri, False, calls))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
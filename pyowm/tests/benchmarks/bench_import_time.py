@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cold-start cost of the library: wall time of importing it, of building an `OWM` instance and of getting the
+managers, each measured in a fresh interpreter - which is what a restarting worker pays.
+
+Run from the project root with: `python -m tests.benchmarks.bench_import_time [number_of_runs]`
+"""
+
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = [
+    ('import', "import pyowm"),
+    ('OWM()', "import pyowm; pyowm.OWM('fakeapikey')"),
+    ('weather', "import pyowm; pyowm.OWM('fakeapikey').weather_manager()"),
+    ('registry', "import pyowm; pyowm.OWM('fakeapikey').city_id_registry()"),
+    ('all', "import pyowm; owm = pyowm.OWM('fakeapikey'); [getattr(owm, m)() for m in ('agro_manager', "
+            "'airpollution_manager', 'alert_manager', 'stations_manager', 'uvindex_manager', 'weather_manager')]"),
+]
+
+TIMED = """
+import sys, time
+start = time.perf_counter()
+{}
+elapsed = time.perf_counter() - start
+print(elapsed, len([m for m in sys.modules if m.startswith('pyowm')]), len(sys.modules))
+"""
+
+
+def run(code, runs):
+    timings = []
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, '-c', TIMED.format(code)], universal_newlines=True)
+        elapsed, pyowm_modules, all_modules = out.split()
+        timings.append(float(elapsed))
+    return timings, int(pyowm_modules), int(all_modules)
+
+
+def report(label, timings, pyowm_modules, all_modules):
+    print('{:<10} median: {:7.1f} ms  min: {:7.1f} ms  pyowm modules: {:3d}  all modules: {:4d}'.format(
+        label, statistics.median(timings) * 1000, min(timings) * 1000, pyowm_modules, all_modules))
+
+
+def main(runs=10):
+    for label, code in SCENARIOS:
+        report(label, *run(code, runs))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Decoding time of API response bodies with each of the installed JSON decoders (see `pyowm.commons.jsondecoding`),
+versus the former decoding, which turned the body into text first and then parsed it with the standard library.
+Documents are the JSON test responses and a full-size OneCall response (48 hourly, 8 daily and 60 minutely entries,
+tens of KB) built out of the OneCall test response.
+
+Run from the project root with: `python -m tests.benchmarks.bench_json_decoding [number_of_runs]`
+"""
+
+import json
+import sys
+import timeit
+
+from pyowm.commons.jsondecoding import DECODERS, decoder_for
+from tests.unit.weatherapi25 import json_test_responses
+
+
+def full_one_call():
+    data = json.loads(json_test_responses.ONE_CALL_JSON)
+    data['hourly'] = (data['hourly'] * 48)[:48]
+    data['daily'] = (data['daily'] * 8)[:8]
+    data['minutely'] = [{'dt': data['current']['dt'] + 60 * i, 'precipitation': 0.1 * i} for i in range(60)]
+    return json.dumps(data)
+
+
+def documents():
+    fixtures = [getattr(json_test_responses, name) for name in sorted(dir(json_test_responses))
+                if name.endswith('_JSON')]
+    fixtures = [fixture for fixture in fixtures if fixture.lstrip().startswith(('{', '['))]
+    return [('test responses ({})'.format(len(fixtures)), [f.encode('utf-8') for f in fixtures]),
+            ('full OneCall response', [full_one_call().encode('utf-8')])]
+
+
+def installed_decoders():
+    decoders = [('text + json', lambda body: json.loads(body.decode('utf-8')))]
+    for name in DECODERS:
+        try:
+            decoders.append((name, decoder_for(name)))
+        except ImportError:
+            print('{} is not installed'.format(name))
+    return decoders
+
+
+def main(runs=2000):
+    decoders = installed_decoders()
+    for title, bodies in documents():
+        size = sum(len(body) for body in bodies)
+        print('{}: {} bytes, {} runs'.format(title, size, runs))
+        baseline = None
+        for name, decode in decoders:
+            assert all(decode(body) == json.loads(body) for body in bodies)
+            secs = min(timeit.repeat(lambda: [decode(body) for body in bodies], number=runs, repeat=3)) / runs
+            baseline = baseline or secs
+            print('  {:<12} {:8.1f} us ({:.2f}x)'.format(name, secs * 1e6, baseline / secs))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Memory footprint of `Weather` objects built out of the entries of a OneCall response: the slots-based layout versus
+the former layout, which held the values in a per-instance `__dict__` (reproduced here by storing the same values
+into instances of a plain class). Both layouts hold the same nested rain, snow, wind, pressure and temperature dicts.
+
+Run from the project root with: `python -m tests.benchmarks.bench_weather_memory [number_of_copies]`
+"""
+
+import json
+import sys
+import tracemalloc
+
+from pyowm.weatherapi25.weather import Weather
+from tests.unit.weatherapi25.json_test_responses import ONE_CALL_JSON
+
+NESTED = {'rain': 'rain', 'snow': 'snow', 'wind': 'wnd', 'pressure': 'pressure', 'temperature': 'temp'}
+RENAMED = {'reference_time': 'ref_time', 'sunset_time': 'sset_time', 'sunrise_time': 'srise_time'}
+
+
+class DictBasedWeather:
+
+    def __init__(self, attributes):
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+
+def entries():
+    data = json.loads(ONE_CALL_JSON)
+    return [data['current']] + data.get('hourly', []) + data.get('daily', []) + data.get('minutely', [])
+
+
+def dict_based(weather):
+    attributes = dict()
+    for key, value in weather.to_dict().items():
+        if key in NESTED:
+            attributes[NESTED[key]] = None if value is None else dict(value)
+        else:
+            attributes[RENAMED.get(key, key)] = value
+    return DictBasedWeather(attributes)
+
+
+def measure(build, items):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(item) for item in items]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(objects)) / len(objects)
+
+
+def main(copies=1000):
+    items = entries() * copies
+    weathers = [Weather.from_dict(item) for item in entries()] * copies
+    slots = measure(Weather.from_dict, items)
+    dicts = measure(dict_based, weathers)
+    print('objects: {}'.format(len(items)))
+    print('{:<12} {:8.1f} bytes per object'.format('__dict__', dicts))
+    print('{:<12} {:8.1f} bytes per object ({:.0%} of __dict__)'.format('__slots__', slots, slots / dicts))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Throughput of `Weather.from_dict` - in weather items parsed per second - for each of the payload shapes it is fed
+with: current weather, 3 hours and daily forecasts, the current, hourly, daily and minutely items of a full-size
+OneCall response, weather history and weather station data, versus the former parser (reproduced here), which
+probed each key of the data dictionary again in each branch. Items are the JSON test responses, decoded once
+before timing.
+
+Run from the project root with: `python -m tests.benchmarks.bench_weather_parsing [number_of_runs]`
+"""
+
+import json
+import sys
+import timeit
+
+from pyowm.weatherapi25.weather import Weather
+from tests.benchmarks.bench_json_decoding import full_one_call
+from tests.unit.weatherapi25 import json_test_responses
+
+
+STATION_JSON = '{"station": {"name": "KPPQ", "type": 1, "status": 50, "id": 1000, ' \
+               '"coord": {"lon": -90.47, "lat": 39.38}}, "last": {"main": {"temp": 276.15, "pressure": 1031}, ' \
+               '"wind": {"speed": 3.1, "deg": 140}, "visibility": {"distance": 11265, "prefix": 0}, ' \
+               '"calc": {"dewpoint": 273.15, "humidex": 57.8, "heatindex": 1.2}, ' \
+               '"clouds": [{"distance": 427, "condition": "SCT"}], "dt": 1417977300}, ' \
+               '"params": ["temp", "pressure", "wind", "visibility"], "timezone": 1234567}'
+
+
+def former_from_dict(the_dict):
+    # -- times
+    reference_time = 0
+    if 'dt' in the_dict:
+        reference_time = the_dict['dt']
+    elif 'dt' in the_dict['last']:
+        reference_time = the_dict['last']['dt']
+
+    if 'sunset' in the_dict:
+        sunset_time = the_dict['sunset']
+    elif 'sys' in the_dict and 'sunset' in the_dict['sys']:
+        sunset_time = the_dict['sys']['sunset']
+    else:
+        sunset_time = None
+
+    if 'sunrise' in the_dict:
+        sunrise_time = the_dict['sunrise']
+    elif 'sys' in the_dict and 'sunrise' in the_dict['sys']:
+        sunrise_time = the_dict['sys']['sunrise']
+    else:
+        sunrise_time = None
+
+    # -- calc
+    dewpoint = None
+    humidex = None
+    heat_index = None
+    if 'calc' in the_dict:
+        if 'dewpoint' in the_dict['calc']:
+            dewpoint = the_dict['calc']['dewpoint']
+
+        if 'humidex' in the_dict['calc']:
+            humidex = the_dict['calc']['humidex']
+
+        if 'heatindex' in the_dict['calc']:
+            heat_index = the_dict['calc']['heatindex']
+
+    elif 'last' in the_dict:
+        if 'calc' in the_dict['last']:
+            if 'dewpoint' in the_dict['last']['calc']:
+                dewpoint = the_dict['last']['calc']['dewpoint']
+
+            if 'humidex' in the_dict['last']['calc']:
+                humidex = the_dict['last']['calc']['humidex']
+
+            if 'heatindex' in the_dict['last']['calc']:
+                heat_index = the_dict['last']['calc']['heatindex']
+
+    if 'dew_point' in the_dict and dewpoint is None:
+        dewpoint = the_dict.get('dew_point', None)
+
+    # -- visibility
+    visibility_distance = None
+    if 'visibility' in the_dict:
+        if isinstance(the_dict['visibility'], int):
+            visibility_distance = the_dict['visibility']
+        elif 'distance' in the_dict['visibility']:
+            visibility_distance = the_dict['visibility']['distance']
+    elif 'last' in the_dict and 'visibility' in the_dict['last']:
+        if isinstance(the_dict['last']['visibility'], int) or isinstance(the_dict['last']['visibility'], float):
+            visibility_distance = the_dict['last']['visibility']
+        elif 'distance' in the_dict['last']['visibility']:
+            visibility_distance = the_dict['last']['visibility']['distance']
+
+    # -- clouds
+    clouds = 0
+    if 'clouds' in the_dict:
+        if isinstance(the_dict['clouds'], int) or isinstance(the_dict['clouds'], float):
+            clouds = the_dict['clouds']
+        elif 'all' in the_dict['clouds']:
+            clouds = the_dict['clouds']['all']
+
+    # -- precipitation workaround
+    if 'precipitation' in the_dict and 'rain' not in the_dict:
+        the_dict['rain'] = the_dict['precipitation']
+
+    # -- rain
+    rain = dict()
+    if 'rain' in the_dict:
+        if isinstance(the_dict['rain'], int) or isinstance(the_dict['rain'], float):
+            rain = {'all': the_dict['rain']}
+        else:
+            if the_dict['rain'] is not None:
+                rain = the_dict['rain'].copy()
+
+    # -- wind
+    wind = dict()
+    if 'wind' in the_dict and the_dict['wind'] is not None:
+        wind = the_dict['wind'].copy()
+    elif 'last' in the_dict:
+        if 'wind' in the_dict['last'] and the_dict['last']['wind'] is not None:
+            wind = the_dict['last']['wind'].copy()
+    else:
+        if 'speed' in the_dict:
+            wind['speed'] = the_dict['speed']
+        elif 'wind_speed' in the_dict:
+            wind['speed'] = the_dict.get('wind_speed', 0)
+
+        if 'deg' in the_dict:
+            wind['deg'] = the_dict['deg']
+        elif 'wind_deg' in the_dict:
+            wind['deg'] = the_dict.get('wind_deg', 0)
+
+        if 'wind_gust' in the_dict:
+            wind['gust'] = the_dict.get('wind_gust', 0)
+
+    # -- humidity
+    if 'humidity' in the_dict:
+        humidity = the_dict['humidity']
+    elif 'main' in the_dict and 'humidity' in the_dict['main']:
+        humidity = the_dict['main']['humidity']
+    elif 'last' in the_dict and 'main' in the_dict['last'] and 'humidity' in the_dict['last']['main']:
+        humidity = the_dict['last']['main']['humidity']
+    else:
+        humidity = 0
+
+    # -- snow
+    snow = dict()
+    if 'snow' in the_dict:
+        if isinstance(the_dict['snow'], int) or isinstance(the_dict['snow'], float):
+            snow = {'all': the_dict['snow']}
+        else:
+            if the_dict['snow'] is not None:
+                snow = the_dict['snow'].copy()
+
+    # -- pressure
+    atm_press = None
+    if 'pressure' in the_dict:
+        atm_press = the_dict['pressure']
+    elif 'main' in the_dict and 'pressure' in the_dict['main']:
+        atm_press = the_dict['main']['pressure']
+    elif 'last' in the_dict:
+        if 'main' in the_dict['last']:
+            atm_press = the_dict['last']['main']['pressure']
+
+    sea_level_press = None
+    if 'main' in the_dict and 'sea_level' in the_dict['main']:
+        sea_level_press = the_dict['main']['sea_level']
+
+    pressure = {'press': atm_press, 'sea_level': sea_level_press}
+
+    # -- temperature
+    temperature = dict()
+    if 'temp' in the_dict:
+        if isinstance(the_dict['temp'], int) or isinstance(the_dict['temp'], float):
+            temperature = {
+                'temp': the_dict.get('temp', None)
+            }
+        elif the_dict['temp'] is not None:
+            temperature = the_dict['temp'].copy()
+    elif 'main' in the_dict and 'temp' in the_dict['main']:
+        temp_dic = the_dict['main']
+
+        temperature = {'temp': temp_dic['temp'],
+                       'temp_kf': temp_dic.get('temp_kf', None),
+                       'temp_max': temp_dic.get('temp_max', None),
+                       'temp_min': temp_dic.get('temp_min', None),
+                       'feels_like': temp_dic.get('feels_like', None)
+                       }
+    elif 'last' in the_dict:
+        if 'main' in the_dict['last']:
+            temperature = dict(temp=the_dict['last']['main']['temp'])
+
+    # add feels_like to temperature if present
+    if 'feels_like' in the_dict:
+        feels_like = the_dict['feels_like']
+        if isinstance(feels_like, int) or isinstance(feels_like, float):
+            temperature['feels_like'] = the_dict.get('feels_like', None)
+        elif isinstance(feels_like, dict):
+            for label, temp in feels_like.items():
+                temperature[f'feels_like_{label}'] = temp
+
+    # -- weather status info
+    if 'weather' in the_dict:
+        status = the_dict['weather'][0]['main']
+        detailed_status = the_dict['weather'][0]['description']
+        weather_code = the_dict['weather'][0]['id']
+        weather_icon_name = the_dict['weather'][0]['icon']
+    else:
+        status = ''
+        detailed_status = ''
+        weather_code = 0
+        weather_icon_name = ''
+
+    # -- timezone
+    if 'timezone' in the_dict:
+        utc_offset = the_dict['timezone']
+    else:
+        utc_offset = None
+
+    # -- UV index
+    uvi = the_dict.get('uvi', None)
+
+    # -- Precipitation probability
+    precipitation_probability = the_dict.get('pop', None)
+
+    return Weather(reference_time, sunset_time, sunrise_time, clouds,
+                   rain, snow, wind, humidity, pressure, temperature,
+                   status, detailed_status, weather_code, weather_icon_name,
+                   visibility_distance, dewpoint, humidex, heat_index,
+                   utc_offset=utc_offset, uvi=uvi,
+                   precipitation_probability=precipitation_probability)
+
+
+def shapes():
+    one_call = json.loads(full_one_call())
+    return [('current weather', [json.loads(json_test_responses.OBSERVATION_JSON)]),
+            ('3h forecast', json.loads(json_test_responses.THREE_HOURS_FORECAST_JSON)['list']),
+            ('daily forecast', json.loads(json_test_responses.DAILY_FORECAST_JSON)['list']),
+            ('OneCall current', [one_call['current']]),
+            ('OneCall hourly', one_call['hourly']),
+            ('OneCall daily', one_call['daily']),
+            ('OneCall minutely', one_call['minutely']),
+            ('weather history', json.loads(json_test_responses.CITY_WEATHER_HISTORY_JSON)['list']),
+            ('weather station', [json.loads(STATION_JSON)])]
+
+
+def main(runs=2000):
+    print('{} runs'.format(runs))
+    for title, items in shapes():
+        former_items = [dict(item) for item in items]  # the former parser adds the 'rain' key to minutely items
+        assert all(Weather.from_dict(item).to_dict() == former_from_dict(former_item).to_dict()
+                   for item, former_item in zip(items, former_items))
+        timings = list()
+        for parse, parsed in ((former_from_dict, former_items), (Weather.from_dict, items)):
+            secs = min(timeit.repeat(lambda: [parse(item) for item in parsed], number=runs, repeat=5))
+            timings.append(secs / (runs * len(items)))
+        print('  {:<18} {:10,.0f} items/s ({:5.2f} us/item), former parser {:10,.0f} items/s ({:.2f}x)'.format(
+            title, 1 / timings[1], timings[1] * 1e6, 1 / timings[0], timings[0] / timings[1]))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A tiny local HTTP/1.1 server replying with canned OWM API responses, to be used by benchmarks
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubServer:
+
+    """
+    Serves the same JSON payload on any GET path, honouring keep-alive. Usable as a context manager.
+
+    :param payload: the JSON text to be returned
+    :type payload: str
+    """
+
+    def __init__(self, payload):
+        body = payload.encode('utf-8')
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if self.close_connection:
+                    self.send_header('Connection', 'close')
+                # headers and body go out in one segment, or delayed ACKs would dominate keep-alive timings
+                self._headers_buffer.append(b'\r\n' + body)
+                self.flush_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def root_uri(self):
+        """
+        The root URI to be given to an `HttpClient` (without schema and without subdomains)
+        """
+        host, port = self.server.server_address
+        return '{}:{}/data/2.5'.format(host, port)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
@@ -35,6 +35,94 @@ class TesDefaultConfig(unittest.TestCase):
         self.assertTrue('timeout_secs' in connection)
         self.assertEqual(5, connection['timeout_secs'])
 
+        self.assertTrue('pool_connections' in connection)
+        self.assertEqual(10, connection['pool_connections'])
+
+        self.assertTrue('pool_maxsize' in connection)
+        self.assertEqual(10, connection['pool_maxsize'])
+
+        self.assertTrue('keep_alive' in connection)
+        self.assertTrue(connection['keep_alive'])
+
+        self.assertTrue('idle_timeout_secs' in connection)
+        self.assertEqual(60, connection['idle_timeout_secs'])
+
+        # cache is a sub-dict, check its keys
+        self.assertTrue('cache' in DEFAULT_CONFIG)
+        cache = DEFAULT_CONFIG['cache']
+        self.assertIsInstance(cache, dict)
+
+        self.assertTrue('enabled' in cache)
+        self.assertFalse(cache['enabled'])
+
+        self.assertTrue('backend' in cache)
+        self.assertEqual('lru', cache['backend'])
+
+        self.assertTrue('max_size' in cache)
+        self.assertEqual(1000, cache['max_size'])
+
+        self.assertTrue('sqlite_path' in cache)
+        self.assertIsNone(cache['sqlite_path'])
+
+        self.assertTrue('stale_while_revalidate_secs' in cache)
+        self.assertEqual(0, cache['stale_while_revalidate_secs'])
+
+        self.assertTrue('ttl_secs' in cache)
+        self.assertEqual(600, cache['ttl_secs']['weather'])
+        self.assertEqual(3600, cache['ttl_secs']['forecast'])
+
+        # rate_limit is a sub-dict, check its keys
+        self.assertTrue('rate_limit' in DEFAULT_CONFIG)
+        rate_limit = DEFAULT_CONFIG['rate_limit']
+        self.assertIsInstance(rate_limit, dict)
+
+        self.assertTrue('enabled' in rate_limit)
+        self.assertFalse(rate_limit['enabled'])
+
+        self.assertTrue('policy' in rate_limit)
+        self.assertEqual('block', rate_limit['policy'])
+
+        self.assertTrue('burst_size' in rate_limit)
+        self.assertEqual(10, rate_limit['burst_size'])
+
+        self.assertTrue('calls_per_minute' in rate_limit)
+        for subscription_type in SubscriptionTypeEnum.items():
+            self.assertTrue(subscription_type.name in rate_limit['calls_per_minute'])
+
+        # retry is a sub-dict, check its keys
+        self.assertTrue('retry' in DEFAULT_CONFIG)
+        retry = DEFAULT_CONFIG['retry']
+        self.assertIsInstance(retry, dict)
+
+        self.assertTrue('max_retries' in retry)
+        self.assertEqual(0, retry['max_retries'])
+
+        self.assertTrue('backoff_base_secs' in retry)
+        self.assertEqual(0.5, retry['backoff_base_secs'])
+
+        self.assertTrue('backoff_max_secs' in retry)
+        self.assertEqual(8, retry['backoff_max_secs'])
+
+        self.assertTrue('deadline_secs' in retry)
+        self.assertEqual(30, retry['deadline_secs'])
+
+        self.assertTrue('status_codes' in retry)
+        self.assertEqual([429, 500, 502, 503, 504], retry['status_codes'])
+
+        # circuit_breaker is a sub-dict, check its keys
+        self.assertTrue('circuit_breaker' in DEFAULT_CONFIG)
+        circuit_breaker = DEFAULT_CONFIG['circuit_breaker']
+        self.assertIsInstance(circuit_breaker, dict)
+
+        self.assertTrue('enabled' in circuit_breaker)
+        self.assertFalse(circuit_breaker['enabled'])
+
+        self.assertTrue('failure_threshold' in circuit_breaker)
+        self.assertEqual(5, circuit_breaker['failure_threshold'])
+
+        self.assertTrue('cooldown_secs' in circuit_breaker)
+        self.assertEqual(30, circuit_breaker['cooldown_secs'])
+
         # proxies is a sub-dict, check its keys
         self.assertTrue('proxies' in DEFAULT_CONFIG)
         proxies = DEFAULT_CONFIG['proxies']
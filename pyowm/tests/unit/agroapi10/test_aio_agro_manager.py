@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.commons.enums import ImageTypeEnum
+from pyowm.commons.tile import Tile
+from pyowm.agroapi10.aio_agro_manager import AsyncAgroManager
+from pyowm.agroapi10.polygon import Polygon, GeoPolygon
+from pyowm.agroapi10.soil import Soil
+from pyowm.agroapi10.imagery import SatelliteImage, MetaTile
+from pyowm.agroapi10.enums import PresetEnum, SatelliteEnum
+from tests.unit.agroapi10.test_agro_manager import MockHttpClientPolygons, MockHttpClientOnePolygon, \
+    MockHttpClientSoil, MockHttpClientReturningImage, MockHttpClientStats, MockHttpClientImagerySearch
+
+
+class MockAsyncHttpClient(AsyncHttpClient):
+
+    """
+    Turns the mocked synchronous HTTP clients of the `AgroManager` tests into asynchronous ones
+    """
+
+    def __init__(self, sync_client):
+        super().__init__('APIKey', DEFAULT_CONFIG, 'fake-root.com')
+        self.sync_client = sync_client
+
+    async def get_json(self, path, params=None, headers=None):
+        return self.sync_client.get_json(path, params=params, headers=headers)
+
+    async def get_png(self, path, params=None, headers=None):
+        return self.sync_client.get_png(path, params=params, headers=headers)
+
+    async def get_geotiff(self, path, params=None, headers=None):
+        return self.sync_client.get_geotiff(path, params=params, headers=headers)
+
+    async def post(self, path, params=None, data=None, headers=None):
+        return self.sync_client.post(path, params=params, data=data, headers=headers)
+
+    async def put(self, path, params=None, data=None, headers=None):
+        return self.sync_client.put(path, params=params, data=data, headers=headers)
+
+    async def delete(self, path, params=None, data=None, headers=None):
+        return self.sync_client.delete(path, params=params, data=data, headers=headers)
+
+
+class TestAsyncAgroManager(unittest.TestCase):
+
+    geopolygon = GeoPolygon([[
+        [-121.1958, 37.6683],
+        [-121.1779, 37.6687],
+        [-121.1773, 37.6792],
+        [-121.1958, 37.6792],
+        [-121.1958, 37.6683]]])
+
+    polygon = Polygon('test-id', 'test-name', geopolygon, area=789.4, user_id='a-user')
+
+    def factory(self, _kls):
+        sm = AsyncAgroManager('APIKey', DEFAULT_CONFIG)
+        sm.http_client = MockAsyncHttpClient(_kls('APIKey', DEFAULT_CONFIG, 'fake-root.com'))
+        return sm
+
+    def test_instantiation_with_wrong_params(self):
+        with self.assertRaises(AssertionError):
+            AsyncAgroManager(None, dict())
+        with self.assertRaises(AssertionError):
+            AsyncAgroManager('apikey', None)
+
+    def test_polygons_crud(self):
+        result = asyncio.run(self.factory(MockHttpClientPolygons).get_polygons())
+        self.assertTrue(all(isinstance(p, Polygon) for p in result))
+        instance = self.factory(MockHttpClientOnePolygon)
+        self.assertIsInstance(asyncio.run(instance.get_polygon('5abb9fb82c8897000bde3e87')), Polygon)
+        self.assertIsInstance(asyncio.run(instance.create_polygon(self.geopolygon, 'name')), Polygon)
+        self.assertIsNone(asyncio.run(instance.update_polygon(self.polygon)))
+        self.assertIsNone(asyncio.run(instance.delete_polygon(self.polygon)))
+
+    def test_soil_data(self):
+        result = asyncio.run(self.factory(MockHttpClientSoil).soil_data(self.polygon))
+        self.assertIsInstance(result, Soil)
+        self.assertEqual(self.polygon.id, result.polygon_id)
+
+    def test_download_satellite_image_with_tile_png(self):
+        instance = self.factory(MockHttpClientReturningImage)
+        metaimg = MetaTile('http://a.com', PresetEnum.FALSE_COLOR,
+                           SatelliteEnum.SENTINEL_2.name, 1378459200, 98.2, 0.3, 11.7, 7.89, 'a1b2c3d4')
+        result = asyncio.run(instance.download_satellite_image(metaimg, x=1, y=2, zoom=4))
+        self.assertIsInstance(result, SatelliteImage)
+        self.assertIsInstance(result.data, Tile)
+        with self.assertRaises(AssertionError):
+            asyncio.run(instance.download_satellite_image(metaimg, x=1))
+        with self.assertRaises(ValueError):
+            asyncio.run(instance.download_satellite_image('not-a-metaimage'))
+
+    def test_stats_for_satellite_image(self):
+        instance = self.factory(MockHttpClientStats)
+        metaimg = MetaTile('http://a.com', PresetEnum.EVI,
+                           SatelliteEnum.SENTINEL_2.name, 1378459200, 98.2, 0.3, 11.7, 7.89, 'a1b2c3d4',
+                           stats_url='http://stats.com')
+        self.assertIsInstance(asyncio.run(instance.stats_for_satellite_image(metaimg)), dict)
+
+    def test_search_satellite_imagery(self):
+        instance = self.factory(MockHttpClientImagerySearch)
+        results = asyncio.run(instance.search_satellite_imagery('test_pol', 1480699083, 1480782083))
+        self.assertEqual(12, len(results))
+        results = asyncio.run(instance.search_satellite_imagery(
+            'test_pol', 1480699083, 1480782083, ImageTypeEnum.PNG, PresetEnum.EVI, 10, 20,
+            SatelliteEnum.SENTINEL_2.symbol, 0, 10, 90, 100))
+        self.assertEqual(2, len(results))
+        with self.assertRaises(AssertionError):
+            asyncio.run(instance.search_satellite_imagery('test_pol', 1480782083, 1480699083))
+
+    def test_repr(self):
+        print(AsyncAgroManager('APIKey', DEFAULT_CONFIG))
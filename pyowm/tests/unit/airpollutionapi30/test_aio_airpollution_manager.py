@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import unittest
+from pyowm.airpollutionapi30 import coindex, so2index, ozone, no2index
+from pyowm.airpollutionapi30.aio_airpollution_manager import AsyncAirPollutionManager
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.constants import AIRPOLLUTION_API_VERSION
+from tests.unit.airpollutionapi30.test_ozone import OZONE_JSON
+from tests.unit.airpollutionapi30.test_coindex import COINDEX_JSON
+from tests.unit.airpollutionapi30.test_no2index import NO2INDEX_JSON
+from tests.unit.airpollutionapi30.test_so2index import SO2INDEX_JSON
+
+
+class MockAsyncHttpClient(AsyncHttpClient):
+
+    def __init__(self, payload):
+        super().__init__('fakeapikey', DEFAULT_CONFIG, 'anyurl.com')
+        self.payload = payload
+        self.paths = []
+
+    async def get_json(self, path, params=None, headers=None):
+        self.paths.append(path)
+        return 200, json.loads(self.payload)
+
+
+class TestAsyncAirPollutionManager(unittest.TestCase):
+
+    def _instance_returning(self, payload):
+        instance = AsyncAirPollutionManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client = MockAsyncHttpClient(payload)
+        return instance
+
+    def test_instantiation_with_wrong_params(self):
+        self.assertRaises(AssertionError, AsyncAirPollutionManager, None, dict())
+        self.assertRaises(AssertionError, AsyncAirPollutionManager, 'apikey', None)
+
+    def test_get_airpollution_api_version(self):
+        result = AsyncAirPollutionManager('fakeapikey', DEFAULT_CONFIG).airpollution_api_version()
+        self.assertEqual(AIRPOLLUTION_API_VERSION, result)
+
+    def test_coindex_around_coords(self):
+        instance = self._instance_returning(COINDEX_JSON)
+        result = asyncio.run(instance.coindex_around_coords(45, 9))
+        self.assertIsInstance(result, coindex.COIndex)
+        self.assertEqual('year', result.interval)
+        self.assertEqual('co/45,9/current.json', instance.http_client.paths[0])
+        result = asyncio.run(instance.coindex_around_coords(45, 9, start=1500000000, interval='day'))
+        self.assertEqual('day', result.interval)
+        self.assertEqual('co/45,9/2017-07-14Z.json', instance.http_client.paths[1])
+        with self.assertRaises(ValueError):
+            asyncio.run(instance.coindex_around_coords(200, 9))
+
+    def test_ozone_around_coords(self):
+        result = asyncio.run(self._instance_returning(OZONE_JSON).ozone_around_coords(45, 9, interval='day'))
+        self.assertIsInstance(result, ozone.Ozone)
+
+    def test_no2index_around_coords(self):
+        result = asyncio.run(self._instance_returning(NO2INDEX_JSON).no2index_around_coords(45, 9))
+        self.assertIsInstance(result, no2index.NO2Index)
+
+    def test_so2index_around_coords(self):
+        result = asyncio.run(self._instance_returning(SO2INDEX_JSON).so2index_around_coords(45, 9))
+        self.assertIsInstance(result, so2index.SO2Index)
+
+    def test_repr(self):
+        print(AsyncAirPollutionManager('fakeapikey', DEFAULT_CONFIG))
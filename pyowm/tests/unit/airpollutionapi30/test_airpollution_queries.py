@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+from pyowm.airpollutionapi30 import airpollution_queries, coindex
+from tests.unit.airpollutionapi30.test_coindex import COINDEX_JSON
+
+
+class TestAirPollutionQueries(unittest.TestCase):
+
+    def test_index_params(self):
+        self.assertEqual({'lon': 9, 'lat': 45, 'start': None, 'interval': None},
+                         airpollution_queries.index_params(45, 9))
+        self.assertRaises(ValueError, airpollution_queries.index_params, 200, 9)
+        self.assertRaises(ValueError, airpollution_queries.index_params, 45, 200)
+
+    def test_index_uri(self):
+        self.assertEqual('co/45,9/current.json',
+                         airpollution_queries.index_uri('co', airpollution_queries.index_params(45, 9)))
+        params = airpollution_queries.index_params(45, 9, start=1500000000)
+        self.assertEqual('o3/45,9/2017Z.json', airpollution_queries.index_uri('o3', params))
+        params = airpollution_queries.index_params(45, 9, start=1500000000, interval='hour')
+        self.assertEqual('so2/45,9/2017-07-14T02Z.json', airpollution_queries.index_uri('so2', params))
+        params = airpollution_queries.index_params(45, 9, start=1500000000, interval='decade')
+        self.assertRaises(ValueError, airpollution_queries.index_uri, 'no2', params)
+
+    def test_index_from_dict(self):
+        result = airpollution_queries.index_from_dict(coindex.COIndex, json.loads(COINDEX_JSON), None)
+        self.assertIsInstance(result, coindex.COIndex)
+        self.assertEqual('year', result.interval)
+        result = airpollution_queries.index_from_dict(coindex.COIndex, json.loads(COINDEX_JSON), 'day')
+        self.assertEqual('day', result.interval)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import unittest
+import pyowm.commons.exceptions
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.commons.aio_http_client import AsyncHttpClient, AsyncHttpSession
+from pyowm.commons.circuitbreaker import CircuitBreakers
+from pyowm.commons.ratelimiter import RateLimiter
+
+
+class MockAsyncHttpSession(AsyncHttpSession):
+
+    def __init__(self, status, payload):
+        super().__init__(DEFAULT_CONFIG)
+        self.status = status
+        self.payload = payload
+        self.calls = []
+
+    async def request(self, method, url, params=None, json=None, headers=None, proxies=None, timeout=None,
+                      verify=True):
+        self.calls.append(dict(method=method, url=url, params=params, json=json, headers=headers))
+        return self.status, self.payload
+
+
+class TestAsyncHttpClient(unittest.TestCase):
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, AsyncHttpClient, None, DEFAULT_CONFIG, 'test.com', True)
+        self.assertRaises(AssertionError, AsyncHttpClient, 'apikey', None, 'test.com', True)
+        self.assertRaises(AssertionError, AsyncHttpClient, 'apikey', DEFAULT_CONFIG, None, True)
+        self.assertRaises(AssertionError, AsyncHttpClient, 'apikey', DEFAULT_CONFIG, 'test.com', None)
+        self.assertRaises(AssertionError, AsyncHttpClient, 'apikey', DEFAULT_CONFIG, 'test.com', True, 'session')
+        session = AsyncHttpSession(DEFAULT_CONFIG)
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'test.com', session=session)
+        self.assertIs(session, instance.session)
+
+    def test_get_json(self):
+        expected_data = '{"name": "james bond", "designation": "007"}'
+        session = MockAsyncHttpSession(200, expected_data.encode('utf-8'))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        status, data = asyncio.run(instance.get_json('resource', params=dict(a=1)))
+        self.assertEqual(200, status)
+        self.assertEqual(json.loads(expected_data), data)
+        call = session.calls[0]
+        self.assertEqual('GET', call['method'])
+        self.assertEqual('https://api.anyurl.com/resource', call['url'])
+        self.assertEqual(1, call['params']['a'])
+        self.assertEqual('apikey', call['params']['APPID'])
+
+    def test_get_json_parse_error(self):
+        session = MockAsyncHttpSession(200, b'not json')
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        with self.assertRaises(pyowm.commons.exceptions.ParseAPIResponseError):
+            asyncio.run(instance.get_json('resource'))
+
+    def test_get_json_with_quota_exceeded_payload_feeds_rate_limiter(self):
+        session = MockAsyncHttpSession(200, b'{"cod": 429, "message": "quota exceeded"}')
+        session.rate_limiter = RateLimiter(60, 10)
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        asyncio.run(instance.get_json('resource'))
+        self.assertGreater(session.rate_limiter.state()['blocked_for'], 0)
+
+    def test_circuit_breaker(self):
+        session = MockAsyncHttpSession(503, b'unavailable')
+        session.circuit_breakers = CircuitBreakers(2, 30)
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        for _ in range(2):
+            with self.assertRaises(pyowm.commons.exceptions.APIRequestError):
+                asyncio.run(instance.get_json('resource'))
+        with self.assertRaises(pyowm.commons.exceptions.CircuitBreakerOpenError):
+            asyncio.run(instance.get_json('resource'))
+        self.assertEqual(2, len(session.calls))
+
+    def test_get_json_error_status(self):
+        session = MockAsyncHttpSession(404, b'{"message": "city not found"}')
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        with self.assertRaises(pyowm.commons.exceptions.NotFoundError):
+            asyncio.run(instance.get_json('resource'))
+
+    def test_get_png_and_geotiff(self):
+        expected_data = b'\x89PNG\r\n\x1a\n'
+        session = MockAsyncHttpSession(200, expected_data)
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        status, data = asyncio.run(instance.get_png('resource'))
+        self.assertEqual(expected_data, data)
+        self.assertEqual('image/png', session.calls[0]['headers']['Accept'])
+        status, data = asyncio.run(instance.get_geotiff('resource'))
+        self.assertEqual(expected_data, data)
+        self.assertEqual('image/tiff', session.calls[1]['headers']['Accept'])
+
+    def test_post_put_delete(self):
+        expected_data = '{"key": "value"}'
+        session = MockAsyncHttpSession(201, expected_data.encode('utf-8'))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        status, data = asyncio.run(instance.post('resource', data=dict(key='value')))
+        self.assertEqual(json.loads(expected_data), data)
+        self.assertEqual(dict(key='value'), session.calls[0]['json'])
+        status, data = asyncio.run(instance.put('resource', data=dict(key=7)))
+        self.assertEqual(json.loads(expected_data), data)
+        self.assertEqual('PUT', session.calls[1]['method'])
+
+        # in case an empty payload is returned
+        session.status, session.payload = 204, b''
+        status, data = asyncio.run(instance.delete('resource'))
+        self.assertIsNone(data)
+        status, data = asyncio.run(instance.post('resource'))
+        self.assertEqual({}, data)
+
+    def test_repr(self):
+        print(AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com'))
+
+
+class TestAsyncHttpSession(unittest.TestCase):
+
+    def test_instantiation(self):
+        with self.assertRaises(AssertionError):
+            AsyncHttpSession(None)
+        instance = AsyncHttpSession(dict())
+        self.assertEqual(DEFAULT_CONFIG['connection']['pool_maxsize'], instance.pool_maxsize)
+        self.assertIsNone(instance._session)
+
+    def test_instantiation_with_rate_limiter(self):
+        self.assertIsNone(AsyncHttpSession(DEFAULT_CONFIG).rate_limiter)
+        self.assertIsInstance(AsyncHttpSession({'rate_limit': {'enabled': True}}).rate_limiter, RateLimiter)
+        rate_limiter = RateLimiter(60, 1)
+        self.assertIs(rate_limiter, AsyncHttpSession(DEFAULT_CONFIG, rate_limiter=rate_limiter).rate_limiter)
+
+    def test_get_requests_are_retried(self):
+        instance = AsyncHttpSession({'retry': {'max_retries': 3, 'backoff_base_secs': 0.001,
+                                               'backoff_max_secs': 0.01}})
+        outcomes = [pyowm.commons.exceptions.TimeoutError('timeout'), (502, dict(), b'bad gateway'),
+                    (200, dict(), b'{}')]
+        calls = []
+
+        async def monkey_patched_send(method, url, params, json, headers, proxies, timeout, verify):
+            calls.append(method)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        instance._send = monkey_patched_send
+        self.assertEqual((200, b'{}'), asyncio.run(instance.request('GET', 'http://anyurl.com', timeout=5)))
+        self.assertEqual(dict(timeout=1, status_502=1), instance.retry_policy.metrics()['retries_by_reason'])
+        outcomes.append((502, dict(), b'bad gateway'))
+        self.assertEqual((502, b'bad gateway'), asyncio.run(instance.request('POST', 'http://anyurl.com')))
+        self.assertEqual(4, len(calls))
+
+    def test_close_when_never_opened(self):
+        instance = AsyncHttpSession(DEFAULT_CONFIG)
+        asyncio.run(instance.close())
+        self.assertIsNone(instance._session)
+
+    def test_repr(self):
+        print(AsyncHttpSession(DEFAULT_CONFIG))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import stat
+import tempfile
+import time
+import unittest
+from unittest import mock
+from pyowm.commons.cache import LRUCache, SQLiteCache, ResponseCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, LRUCache, 0)
+        self.assertRaises(AssertionError, LRUCache, '10')
+
+    def test_get_and_set(self):
+        instance = LRUCache(10)
+        self.assertIsNone(instance.get('key'))
+        instance.set('key', 'value')
+        value, stored_at = instance.get('key')
+        self.assertEqual('value', value)
+        self.assertAlmostEqual(time.time(), stored_at, delta=5)
+        self.assertEqual(1, len(instance))
+        instance.clear()
+        self.assertEqual(0, len(instance))
+
+    def test_least_recently_used_items_are_evicted(self):
+        instance = LRUCache(2)
+        instance.set('a', '1')
+        instance.set('b', '2')
+        instance.get('a')
+        instance.set('c', '3')
+        self.assertEqual(2, len(instance))
+        self.assertIsNone(instance.get('b'))
+        self.assertEqual('1', instance.get('a')[0])
+        self.assertEqual('3', instance.get('c')[0])
+
+    def test_repr(self):
+        print(LRUCache(10))
+
+
+class TestSQLiteCache(unittest.TestCase):
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, SQLiteCache, None, 10)
+        self.assertRaises(AssertionError, SQLiteCache, ':memory:', 0)
+
+    def test_get_and_set(self):
+        instance = SQLiteCache(':memory:', 10)
+        self.assertIsNone(instance.get('key'))
+        instance.set('key', 'value')
+        instance.set('key', 'new value')
+        value, stored_at = instance.get('key')
+        self.assertEqual('new value', value)
+        self.assertAlmostEqual(time.time(), stored_at, delta=5)
+        self.assertEqual(1, len(instance))
+        instance.clear()
+        self.assertEqual(0, len(instance))
+
+    def test_oldest_items_are_evicted(self):
+        instance = SQLiteCache(':memory:', 2)
+        instance.set('a', '1')
+        instance.set('b', '2')
+        instance.set('c', '3')
+        self.assertEqual(2, len(instance))
+        self.assertIsNone(instance.get('a'))
+
+    def test_items_are_persisted(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'cache.sqlite3')
+            instance = SQLiteCache(path, 10)
+            instance.set('key', 'value')
+            instance.close()
+            instance = SQLiteCache(path, 10)
+            self.assertEqual('value', instance.get('key')[0])
+            instance.close()
+
+    @unittest.skipIf(os.name == 'nt', 'POSIX permissions only')
+    def test_database_file_is_private(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'cache.sqlite3')
+            SQLiteCache(path, 10).close()
+            self.assertEqual(0o600, stat.S_IMODE(os.stat(path).st_mode))
+
+    def test_repr(self):
+        print(SQLiteCache(':memory:', 10))
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_from_config(self):
+        self.assertIsNone(ResponseCache.from_config(dict()))
+        instance = ResponseCache.from_config({'cache': {'enabled': True}})
+        self.assertIsInstance(instance.backend, LRUCache)
+        self.assertEqual(0, instance.stale_while_revalidate_secs)
+        instance = ResponseCache.from_config({'cache': {'enabled': True, 'backend': 'sqlite',
+                                                        'sqlite_path': ':memory:'}})
+        self.assertIsInstance(instance.backend, SQLiteCache)
+        with tempfile.TemporaryDirectory() as folder:
+            with mock.patch('pyowm.commons.cache.user_cache_dir', return_value=folder):
+                instance = ResponseCache.from_config({'cache': {'enabled': True, 'backend': 'sqlite'}})
+            self.assertEqual(os.path.join(folder, 'responses.sqlite3'), instance.backend.path)
+            instance.backend.close()
+        self.assertRaises(ValueError, ResponseCache.from_config, {'cache': {'enabled': True, 'backend': 'redis'}})
+
+    def test_ttl_for(self):
+        instance = ResponseCache(LRUCache(10), {'weather': 600, 'forecast': 3600, 'forecast/daily': 7200, 'co': 60})
+        self.assertEqual(600, instance.ttl_for('weather'))
+        self.assertEqual(3600, instance.ttl_for('forecast'))
+        self.assertEqual(7200, instance.ttl_for('forecast/daily'))
+        self.assertEqual(60, instance.ttl_for('co/45,9/current.json'))
+        self.assertIsNone(instance.ttl_for('coords'))
+        self.assertIsNone(instance.ttl_for('polygons/abc'))
+
+    def test_key_for(self):
+        instance = ResponseCache(LRUCache(10), dict())
+        url = 'https://api.openweathermap.org/data/2.5/weather'
+        key_1 = instance.key_for(url, dict(q='London', APPID='key1', lang='en'))
+        key_2 = instance.key_for(url, dict(lang='en', appid='key2', q='London'))
+        self.assertEqual(key_1, key_2)
+        self.assertNotIn('key1', key_1)
+        self.assertNotEqual(key_1, instance.key_for(url, dict(q='London', lang='it')))
+
+    def test_lookup(self):
+        backend = LRUCache(10)
+        instance = ResponseCache(backend, dict(), stale_while_revalidate_secs=60)
+        self.assertIsNone(instance.lookup('key', 600))
+        instance.store('key', '{}')
+        self.assertEqual(('{}', True), instance.lookup('key', 600))
+        backend._items['key'] = ('{}', time.time() - 630)
+        self.assertEqual(('{}', False), instance.lookup('key', 600))
+        backend._items['key'] = ('{}', time.time() - 661)
+        self.assertIsNone(instance.lookup('key', 600))
+
+    def test_refreshes_are_not_duplicated(self):
+        instance = ResponseCache(LRUCache(10), dict())
+        self.assertTrue(instance.begin_refresh('key'))
+        self.assertFalse(instance.begin_refresh('key'))
+        instance.end_refresh('key')
+        self.assertTrue(instance.begin_refresh('key'))
+
+    def test_repr(self):
+        print(ResponseCache(LRUCache(10), dict()))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from pyowm.commons.circuitbreaker import CircuitBreaker, CircuitBreakers
+from pyowm.commons.exceptions import CircuitBreakerOpenError
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def _open(self, instance):
+        for _ in range(instance.failure_threshold):
+            instance.before_call()
+            instance.record_failure()
+
+    def _expire_cooldown(self, instance):
+        instance._opened_at -= instance.cooldown_secs
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, CircuitBreaker, None, 5, 30)
+        self.assertRaises(AssertionError, CircuitBreaker, 'api', 0, 30)
+        self.assertRaises(AssertionError, CircuitBreaker, 'api', 5, 0)
+        self.assertRaises(AssertionError, CircuitBreaker, 'api', 5, 30, 0)
+        self.assertEqual(CircuitBreaker.CLOSED, CircuitBreaker('api', 5, 30).state)
+
+    def test_opens_after_consecutive_failures(self):
+        instance = CircuitBreaker('api', 3, 30)
+        for _ in range(2):
+            instance.before_call()
+            instance.record_failure()
+        instance.before_call()
+        instance.record_success()
+        self.assertEqual(CircuitBreaker.CLOSED, instance.state)
+        self._open(instance)
+        self.assertEqual(CircuitBreaker.OPEN, instance.state)
+        self.assertRaises(CircuitBreakerOpenError, instance.before_call)
+
+    def test_half_open_probe_success_closes(self):
+        instance = CircuitBreaker('api', 2, 30)
+        self._open(instance)
+        self._expire_cooldown(instance)
+        self.assertEqual(CircuitBreaker.HALF_OPEN, instance.state)
+        instance.before_call()
+        # only one probe at a time
+        self.assertRaises(CircuitBreakerOpenError, instance.before_call)
+        instance.record_success()
+        self.assertEqual(CircuitBreaker.CLOSED, instance.state)
+        instance.before_call()
+
+    def test_half_open_probe_failure_reopens(self):
+        instance = CircuitBreaker('api', 2, 30)
+        self._open(instance)
+        self._expire_cooldown(instance)
+        instance.before_call()
+        instance.record_failure()
+        self.assertEqual(CircuitBreaker.OPEN, instance.state)
+        self.assertRaises(CircuitBreakerOpenError, instance.before_call)
+
+    def test_release_frees_probe(self):
+        instance = CircuitBreaker('api', 2, 30)
+        self._open(instance)
+        self._expire_cooldown(instance)
+        instance.before_call()
+        instance.release()
+        instance.before_call()
+        self.assertEqual(CircuitBreaker.HALF_OPEN, instance.state)
+
+    def test_repr(self):
+        print(CircuitBreaker('api', 5, 30))
+
+
+class TestCircuitBreakers(unittest.TestCase):
+
+    def test_from_config(self):
+        self.assertIsNone(CircuitBreakers.from_config(dict()))
+        instance = CircuitBreakers.from_config({'circuit_breaker': {'enabled': True, 'failure_threshold': 3}})
+        self.assertEqual(3, instance.failure_threshold)
+        self.assertEqual(30, instance.cooldown_secs)
+
+    def test_get(self):
+        instance = CircuitBreakers(3, 30)
+        breaker = instance.get('openweathermap.org/data/2.5')
+        self.assertIs(breaker, instance.get('openweathermap.org/data/2.5'))
+        self.assertIsNot(breaker, instance.get('agromonitoring.com/agro/1.0'))
+        self.assertEqual(3, breaker.failure_threshold)
+
+    def test_states(self):
+        instance = CircuitBreakers(1, 30)
+        instance.get('weather')
+        agro = instance.get('agro')
+        agro.before_call()
+        agro.record_failure()
+        self.assertEqual(dict(weather='closed', agro='open'), instance.states())
+
+    def test_repr(self):
+        print(CircuitBreakers(3, 30))
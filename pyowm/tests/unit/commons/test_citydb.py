@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+from pyowm.commons.citydb import CityDB
+
+
+class TestCityDB(unittest.TestCase):
+
+    _test_lines = ['Abasolo,3533505,24.066669,-98.366669,MX\n',
+                   'Abasolo,4019867,25.950001,-100.400002,MX\n',
+                   'Abbans-Dessus,6452202,47.116669,5.88333,FR\n',
+                   'Abbans-Dessus,3038800,47.120548,5.88188,FR\n',
+                   'Abbeville,3038789,50.099998,1.83333,FR\n',
+                   'abbeville,4178992,31.992121,-83.306824,US\n',
+                   'Bologna,2829449,30.57184,-83.250488,IT\n',
+                   'Thale, Stadt,6550950,51.7528,11.058,DE\n',
+                   'Moskva,524901,55.75222,37.615559,RU\n',
+                   'Москва,9999999,55.75222,37.615559,\n',
+                   '\n']
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.bin')
+        os.close(fd)
+        CityDB.build(self._test_lines, self.path)
+        self.instance = CityDB(self.path)
+
+    def tearDown(self):
+        self.instance.close()
+        os.remove(self.path)
+
+    def test_build(self):
+        self.assertEqual(10, len(self.instance))
+
+    def test_opening_fails_with_wrong_files(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'PYOWMXXX' + b'\0' * 100)
+        self.assertRaises(ValueError, CityDB, self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'PYOWM')
+        self.assertRaises(ValueError, CityDB, self.path)
+
+    def test_lookup_exact(self):
+        self.assertEqual([['Abbeville', 3038789, 50.099998, 1.83333, 'FR']],
+                         self.instance.lookup('Abbeville', 'exact'))
+        self.assertEqual([], self.instance.lookup('bologna', 'exact'))
+
+    def test_lookup_nocase(self):
+        self.assertEqual([['Abbeville', 3038789, 50.099998, 1.83333, 'FR'],
+                          ['abbeville', 4178992, 31.992121, -83.306824, 'US']],
+                         self.instance.lookup('ABBEVILLE', 'nocase'))
+        self.assertEqual([['Thale, Stadt', 6550950, 51.7528, 11.058, 'DE']],
+                         self.instance.lookup('thale, stadt', 'nocase'))
+        self.assertEqual([['Москва', 9999999, 55.75222, 37.615559, '']], self.instance.lookup('москва', 'nocase'))
+        self.assertEqual([], self.instance.lookup('abb', 'nocase'))
+
+    def test_lookup_startswith(self):
+        result = self.instance.lookup('abb', 'startswith')
+        # results are in the order of the lines, not of the IDs
+        self.assertEqual([6452202, 3038800, 3038789, 4178992], [r[1] for r in result])
+        self.assertEqual([], self.instance.lookup('ville', 'startswith'))
+        self.assertEqual([], self.instance.lookup('zzz', 'startswith'))
+
+    def test_lookup_like(self):
+        self.assertEqual([3533505, 4019867], [r[1] for r in self.instance.lookup('SOLO', 'like')])
+        self.assertEqual([6452202, 3038800], [r[1] for r in self.instance.lookup('dessus', 'like')])
+        self.assertEqual([524901], [r[1] for r in self.instance.lookup('moskva', 'like')])
+        self.assertEqual([9999999], [r[1] for r in self.instance.lookup('оскв', 'like')])
+        self.assertEqual([], self.instance.lookup('xyz', 'like'))
+
+    def test_lookup_fails_with_unknown_matching(self):
+        self.assertRaises(ValueError, self.instance.lookup, 'abb', 'xyz')
+
+    def test_find(self):
+        self.assertEqual(['Moskva', 524901, 55.75222, 37.615559, 'RU'], self.instance.city(self.instance.find(524901)))
+        self.assertEqual(['Москва', 9999999, 55.75222, 37.615559, ''], self.instance.city(self.instance.find(9999999)))
+        self.assertEqual(0, self.instance.find(524901))
+        self.assertIsNone(self.instance.find(1))
+        self.assertIsNone(self.instance.find(10000000))
+
+    def test_repr(self):
+        print(self.instance)
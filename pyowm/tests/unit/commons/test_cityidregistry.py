@@ -1,10 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+import tempfile
 import unittest
 from io import StringIO
 from itertools import chain
-from pyowm.commons.cityidregistry import CityIDRegistry
+from pyowm.commons import cityidregistry
+from pyowm.commons.citydb import CityDB
+from pyowm.commons.cityidregistry import CityIDRegistry, CityIndex, CompletionIndex, FuzzyIndex, fuzzy_similarity, \
+    CITY_ID_FILES_PATH, city_db_filename, city_id_files_digest
+from pyowm.utils.cachedir import user_cache_dir
 from pyowm.weatherapi25.location import Location
 from pyowm.utils.geo import Point
 
@@ -42,8 +48,24 @@ Pitcairn, Henderson, Ducie and Oeno Islands,4030699,-25.066669,-130.100006,PN"""
         'London,2643743,51.50853,-0.12574,GB\n',
         'London,4119617,35.328972,-93.25296,US\n']
 
+    _db_dir = None
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._db_dir is not None:
+            db_path = os.path.join(cls._db_dir, city_db_filename())
+            cityidregistry._city_dbs.pop(db_path).close()
+            os.remove(db_path)
+            os.rmdir(cls._db_dir)
+
     # mocked functions and helpers
 
+    def _db_instance(self):
+        # the city database is built upon first use from the city ID files, here into a temporary directory
+        if TestCityIDRegistry._db_dir is None:
+            TestCityIDRegistry._db_dir = tempfile.mkdtemp()
+        return CityIDRegistry(CITY_ID_FILES_PATH, db_path=os.path.join(self._db_dir, city_db_filename()))
+
     def _mock_get_lines(self, filename):
         return StringIO(self._test_file_contents).readlines()
 
@@ -56,6 +78,14 @@ Pitcairn, Henderson, Ducie and Oeno Islands,4030699,-25.066669,-130.100006,PN"""
     def _mock_test_file_contents_with_commas_in_names(self, filename):
         return StringIO(self._test_file_contents_with_commas_in_names).readlines()
 
+    def _clear_process_wide_indexes(self):
+        cityidregistry._city_indexes.clear()
+        cityidregistry._city_tables.clear()
+        cityidregistry._geo_indexes.clear()
+        cityidregistry._completion_indexes.clear()
+        cityidregistry._fuzzy_indexes.clear()
+        cityidregistry._id_indexes.clear()
+
     def _assertLocationsEqual(self, loc1, loc2):
         self.assertEqual(loc1.id, loc2.id)
         self.assertEqual(loc1.name, loc2.name)
@@ -71,6 +101,31 @@ Pitcairn, Henderson, Ducie and Oeno Islands,4030699,-25.066669,-130.100006,PN"""
     def test_get_instance(self):
         result = CityIDRegistry.get_instance()
         self.assertTrue(isinstance(result, CityIDRegistry))
+        self.assertEqual(os.path.join(user_cache_dir(), city_db_filename()),
+                         CityIDRegistry.get_instance(use_db=True)._db_path)
+
+    def test_city_id_files_digest(self):
+        digest = city_id_files_digest()
+        self.assertEqual(16, len(digest))
+        self.assertEqual(digest, city_id_files_digest(CITY_ID_FILES_PATH))
+        self.assertIn(digest, city_db_filename())
+        folder = tempfile.mkdtemp()
+        try:
+            filepath_regex = os.path.join(folder, '%03d-%03d.txt.bz2')
+            for i, (first, last) in enumerate(cityidregistry.CITY_ID_FILES_RANGES):
+                with open(filepath_regex % (first, last), 'wb') as fh:
+                    fh.write(b'file %d' % i)
+            other_digest = city_id_files_digest(filepath_regex)
+            self.assertNotEqual(digest, other_digest)
+            cityidregistry._city_id_files_digests.pop(filepath_regex)
+            with open(filepath_regex % cityidregistry.CITY_ID_FILES_RANGES[0], 'wb') as fh:
+                fh.write(b'updated file')
+            self.assertNotEqual(other_digest, city_id_files_digest(filepath_regex))
+        finally:
+            cityidregistry._city_id_files_digests.pop(filepath_regex, None)
+            for filename in os.listdir(folder):
+                os.remove(os.path.join(folder, filename))
+            os.rmdir(folder)
 
     # tests for helper functions
 
@@ -121,6 +176,12 @@ Pitcairn, Henderson, Ducie and Oeno Islands,4030699,-25.066669,-130.100006,PN"""
             'me', 'test me', 'startswith'))
         self.assertFalse(self._instance._city_name_matches(
             'foo', 'bar', 'startswith'))
+        self.assertTrue(self._instance._city_name_matches(
+            'Londn', 'London', 'fuzzy'))
+        self.assertTrue(self._instance._city_name_matches(
+            'Москва', 'Moskva', 'fuzzy'))
+        self.assertFalse(self._instance._city_name_matches(
+            'foo', 'bar', 'fuzzy'))
 
     # tests for IDs retrieval
 
@@ -250,6 +311,66 @@ Pitcairn, Henderson, Ducie and Oeno Islands,4030699,-25.066669,-130.100006,PN"""
         CityIDRegistry._get_lines = original_get_lines
         CityIDRegistry._get_all_lines = original_get_all_lines
 
+    def test_ids_for_many(self):
+        calls = []
+
+        def mock_get_lines(registry, filename):
+            calls.append(filename)
+            return self._mock_get_lines_with_homonymies(filename)
+
+        ref_to_original = CityIDRegistry._get_lines
+        CityIDRegistry._get_lines = mock_get_lines
+        try:
+            names = ['Abbeville', 'abbeville', 'Bologna', 'xyz', 'Abasolo', '', '1abc', 'Abbeville']
+            result = self._instance.ids_for_many(names)
+            self.assertEqual(['097-102.txt', '115-122.txt'], calls)  # each file is read once
+            self.assertEqual(7, len(result))
+            self.assertEqual(5, len(result['Abbeville']))
+            self.assertEqual(result['Abbeville'], result['abbeville'])
+            self.assertEqual([(2829449, 'Bologna', 'IT')], result['Bologna'])
+            self.assertEqual([], result['xyz'])
+            self.assertEqual([], result[''])
+            self.assertEqual([], result['1abc'])
+
+            result = self._instance.ids_for_many(['Abbeville', 'abbeville'], country='US', matching='exact')
+            self.assertEqual(4, len(result['Abbeville']))
+            self.assertEqual([], result['abbeville'])
+
+            result = self._instance.ids_for_many(['ABB', 'abbe', 'ville'], matching='startswith')
+            self.assertEqual(7, len(result['ABB']))
+            self.assertEqual(5, len(result['abbe']))
+            self.assertEqual([], result['ville'])
+
+            del calls[:]
+            result = self._instance.ids_for_many(['ville', 'DESSUS', 'o', 'xyz'], country='FR', matching='like')
+            self.assertEqual(['097-102.txt', '103-108.txt', '109-114.txt', '115-122.txt'], calls)
+            self.assertEqual([(3038789, 'Abbeville', 'FR')] * 4, result['ville'])  # one for each mocked file
+            self.assertEqual(8, len(result['DESSUS']))
+            self.assertEqual([], result['o'])
+        finally:
+            CityIDRegistry._get_lines = ref_to_original
+
+    def test_ids_for_many_matches_ids_for(self):
+        original_get_lines = CityIDRegistry._get_lines
+        CityIDRegistry._get_lines = self._mock_get_lines_with_homonymies
+        self._clear_process_wide_indexes()
+        try:
+            names = ['Abbeville', 'abbeville', 'abb', 'Bolgna', 'b', 'xyz']
+            for instance in [self._instance, CityIDRegistry('%03d-%03d.txt', use_index=True)]:
+                for matching in ['exact', 'nocase', 'startswith', 'fuzzy']:
+                    for country in [None, 'US']:
+                        result = instance.ids_for_many(names, country=country, matching=matching)
+                        for name in names:
+                            self.assertEqual(instance.ids_for(name, country=country, matching=matching),
+                                             result[name])
+        finally:
+            CityIDRegistry._get_lines = original_get_lines
+            self._clear_process_wide_indexes()
+
+    def test_ids_for_many_fails_with_wrong_parameters(self):
+        self.assertRaises(ValueError, self._instance.ids_for_many, ['bologna'], matching='xyz')
+        self.assertRaises(ValueError, self._instance.ids_for_many, ['bologna'], country='ITA')
+
     def test_ids_for_restricted_to_country(self):
         ref_to_original = CityIDRegistry._get_lines
         CityIDRegistry._get_lines = self._mock_get_lines_with_homonymies
@@ -537,5 +658,264 @@ Pitcairn, Henderson, Ducie and Oeno Islands,4030699,-25.066669,-130.100006,PN"""
 
         CityIDRegistry._get_lines = ref_to_original
 
+    # tests for the in-memory index
+
+    def test_city_index_lookup(self):
+        index = CityIndex(StringIO(self._test_file_contents_with_homonymies + '\n' +
+                                   self._test_file_contents_with_commas_in_names).readlines())
+        self.assertEqual(15, len(index))
+        self.assertEqual([], index.lookup('abbeville', 'exact'))
+        self.assertEqual(5, len(index.lookup('Abbeville', 'exact')))
+        self.assertEqual(['Bologna,2829449,30.57184,-83.250488,IT'], index.lookup('BOLOGNA', 'nocase'))
+        self.assertEqual(['Thale, Stadt,6550950,51.7528,11.058,DE'], index.lookup('thale, stadt', 'nocase'))
+        self.assertEqual(7, len(index.lookup('abb', 'startswith')))
+        self.assertEqual([], index.lookup('ville', 'startswith'))
+        self.assertEqual(['Abbans-Dessus,3038800,47.120548,5.88188,FR',
+                          'Abbans-Dessus,6452202,47.116669,5.88333,FR'], index.lookup('dessus', 'like'))
+        self.assertEqual(5, len(index.lookup('VILLE', 'like')))
+        self.assertRaises(ValueError, index.lookup, 'abb', 'xyz')
+
+    def test_city_index_lookup_preserves_file_order(self):
+        index = CityIndex(['Zeta,1,0,0,IT\n', 'Alpha,2,0,0,IT\n', 'zeta,3,0,0,FR\n', 'Alphaville,4,0,0,IT\n'])
+        self.assertEqual(['Zeta,1,0,0,IT', 'zeta,3,0,0,FR'], index.lookup('ZETA', 'nocase'))
+        self.assertEqual(['Alpha,2,0,0,IT', 'Alphaville,4,0,0,IT'], index.lookup('alpha', 'startswith'))
+        self.assertEqual(['Zeta,1,0,0,IT', 'Alpha,2,0,0,IT', 'zeta,3,0,0,FR', 'Alphaville,4,0,0,IT'],
+                         index.lookup('a', 'like'))
+
+    def test_indexed_lookups_match_file_scans(self):
+        ref_to_original = CityIDRegistry._get_lines
+        CityIDRegistry._get_lines = self._mock_get_lines_with_homonymies
+        self._clear_process_wide_indexes()
+        try:
+            indexed = CityIDRegistry('%03d-%03d.txt', use_index=True)
+            for name in ['Abbeville', 'abbeville', 'abb', 'dessus', 'Bologna', 'b', 'xyz']:
+                for matching in CityIDRegistry.MATCHINGS:
+                    for country in [None, 'US', 'IT']:
+                        self.assertEqual(self._instance.ids_for(name, country=country, matching=matching),
+                                         indexed.ids_for(name, country=country, matching=matching))
+            self.assertEqual([loc.to_dict() for loc in self._instance.locations_for('abbeville')],
+                             [loc.to_dict() for loc in indexed.locations_for('abbeville')])
+            self.assertRaises(ValueError, indexed.ids_for, '1bologna')
+        finally:
+            CityIDRegistry._get_lines = ref_to_original
+            self._clear_process_wide_indexes()
+
+    def test_indexes_are_built_once_per_process(self):
+        calls = []
+
+        def mock_get_lines(registry, filename):
+            calls.append(filename)
+            return self._mock_get_lines_with_homonymies(filename)
+
+        ref_to_original = CityIDRegistry._get_lines
+        CityIDRegistry._get_lines = mock_get_lines
+        self._clear_process_wide_indexes()
+        try:
+            for _ in range(3):
+                instance = CityIDRegistry('%03d-%03d.txt', use_index=True)
+                instance.ids_for('Abbeville')
+                instance.ids_for('Bologna', matching='startswith')
+            self.assertEqual(['097-102.txt'], calls)
+            instance.ids_for('Dessus', matching='like')
+            self.assertEqual(['097-102.txt', '103-108.txt', '109-114.txt', '115-122.txt'], calls)
+        finally:
+            CityIDRegistry._get_lines = ref_to_original
+            self._clear_process_wide_indexes()
+
+    # tests for the spatial lookups
+
+    def test_nearest(self):
+        original_get_all_lines = CityIDRegistry._get_all_lines
+        CityIDRegistry._get_all_lines = self._mock_get_all_lines
+        self._clear_process_wide_indexes()
+        try:
+            result = self._instance.nearest(47.1, 5.9)
+            self.assertEqual(1, len(result))
+            self._assertLocationsEqual(Location('Abbans-Dessus', 5.88333, 47.116669, 6452202, 'FR'), result[0])
+            result = self._instance.nearest(47.1, 5.9, k=3)
+            self.assertEqual([6452202, 3038800, 3038789], [loc.id for loc in result])
+            self.assertEqual(2, len(self._instance.nearest(47.1, 5.9, k=3, max_km=10)))
+            self.assertEqual(11, len(self._instance.nearest(0., 0., k=50)))
+        finally:
+            CityIDRegistry._get_all_lines = original_get_all_lines
+            self._clear_process_wide_indexes()
+
+    def test_nearest_fails_with_wrong_parameters(self):
+        self.assertRaises(ValueError, self._instance.nearest, 91., 5.9)
+        self.assertRaises(ValueError, self._instance.nearest, 47.1, -181.)
+        self.assertRaises(AssertionError, self._instance.nearest, '47.1', 5.9)
+        self.assertRaises(AssertionError, self._instance.nearest, 47.1, 5.9, k=0)
+        self.assertRaises(AssertionError, self._instance.nearest, 47.1, 5.9, max_km=-1)
+
+    def test_within_radius(self):
+        original_get_all_lines = CityIDRegistry._get_all_lines
+        CityIDRegistry._get_all_lines = self._mock_get_all_lines
+        self._clear_process_wide_indexes()
+        try:
+            result = self._instance.within_radius(Point(-83.3, 31.), 150)
+            self.assertEqual([2829449, 4178992], [loc.id for loc in result])
+            self.assertEqual([], self._instance.within_radius(Point(0., 0.), 200))
+            self.assertRaises(AssertionError, self._instance.within_radius, (31., -83.3), 200)
+            self.assertRaises(AssertionError, self._instance.within_radius, Point(-83.3, 31.), 0)
+        finally:
+            CityIDRegistry._get_all_lines = original_get_all_lines
+            self._clear_process_wide_indexes()
+
+    # tests for the lookups by ID
+
+    def test_location_for_id(self):
+        original_get_all_lines = CityIDRegistry._get_all_lines
+        CityIDRegistry._get_all_lines = self._mock_get_all_lines
+        self._clear_process_wide_indexes()
+        try:
+            self._assertLocationsEqual(Location('Abbeville', -83.306824, 31.992121, 4178992, 'US'),
+                                       self._instance.location_for_id(4178992))
+            self.assertIsNone(self._instance.location_for_id(1))
+            self.assertRaises(AssertionError, self._instance.location_for_id, '4178992')
+            self.assertRaises(ValueError, self._instance.location_for_id, -1)
+        finally:
+            CityIDRegistry._get_all_lines = original_get_all_lines
+            self._clear_process_wide_indexes()
+
+    def test_locations_for_ids(self):
+        original_get_all_lines = CityIDRegistry._get_all_lines
+        CityIDRegistry._get_all_lines = self._mock_get_all_lines
+        self._clear_process_wide_indexes()
+        try:
+            result = self._instance.locations_for_ids([2829449, 1, 3533505, 2829449])
+            self.assertEqual([2829449, 1, 3533505], list(result))
+            self._assertLocationsEqual(Location('Bologna', -83.250488, 30.57184, 2829449, 'IT'), result[2829449])
+            self._assertLocationsEqual(Location('Abasolo', -98.366669, 24.066669, 3533505, 'MX'), result[3533505])
+            self.assertIsNone(result[1])
+            self.assertEqual(dict(), self._instance.locations_for_ids([]))
+            self.assertRaises(ValueError, self._instance.locations_for_ids, [2829449, -1])
+        finally:
+            CityIDRegistry._get_all_lines = original_get_all_lines
+            self._clear_process_wide_indexes()
+
+    def test_lookups_by_id_with_db(self):
+        instance = self._db_instance()
+        result = instance.locations_for_ids([2643743, 524901, 1])
+        self.assertEqual('London', result[2643743].name)
+        self.assertEqual('GB', result[2643743].country)
+        self.assertEqual('Moscow', result[524901].name)
+        self.assertIsNone(result[1])
+
+    def test_spatial_lookups_with_db(self):
+        instance = self._db_instance()
+        result = instance.nearest(51.5, -0.12, k=3)
+        self.assertEqual(3, len(result))
+        self.assertTrue(2643743 in [loc.id for loc in result])  # London
+        result = instance.within_radius(Point(-0.12, 51.5), 5)
+        self.assertTrue(all(isinstance(loc, Location) for loc in result))
+        self.assertTrue(2643743 in [loc.id for loc in result])
+
+    # tests for completions
+
+    def test_completion_index(self):
+        index = CompletionIndex(['Zürich', 'Zurow', 'zurich', 'Zug', 'Bologna', 'Zürichberg', 'Zurich'])
+        self.assertEqual([1, 0, 2, 6, 5], index.complete('ZÜR', 10))
+        self.assertEqual([3, 1, 0], index.complete('zu', 3))
+        self.assertEqual([0, 2, 6], index.complete('zurich', 3))
+        self.assertEqual([5], index.complete('zurich', 10, accept=lambda position: position > 2 and position != 6))
+        self.assertEqual([], index.complete('xyz', 10))
+
+    def test_complete(self):
+        original_get_all_lines = CityIDRegistry._get_all_lines
+        CityIDRegistry._get_all_lines = self._mock_get_all_lines
+        self._clear_process_wide_indexes()
+        try:
+            result = self._instance.complete('abb')
+            self.assertEqual(['Abbeville'] * 5 + ['Abbans-Dessus'] * 2, [loc.name for loc in result])
+            self.assertTrue(all(isinstance(loc, Location) for loc in result))
+            self.assertEqual([4178992, 4314295], [loc.id for loc in self._instance.complete('ÁBBÈ', country='US',
+                                                                                           limit=2)])
+            self.assertEqual([2829449], [loc.id for loc in self._instance.complete('bo')])
+            self.assertEqual([], self._instance.complete('ville'))
+            self.assertEqual([], self._instance.complete(''))
+            self.assertRaises(ValueError, self._instance.complete, 'abb', country='USA')
+            self.assertRaises(AssertionError, self._instance.complete, 'abb', limit=0)
+        finally:
+            CityIDRegistry._get_all_lines = original_get_all_lines
+            self._clear_process_wide_indexes()
+
+    def test_complete_with_db(self):
+        instance = self._db_instance()
+        result = instance.complete('zuric', country='CH', limit=1)
+        self.assertEqual(1, len(result))
+        self.assertEqual('Zürich', result[0].name)
+
+    # tests for fuzzy matchings
+
+    def test_fuzzy_similarity(self):
+        self.assertEqual(1., fuzzy_similarity('Zürich', 'zurich'))
+        self.assertEqual(1., fuzzy_similarity('Москва', 'Moskva'))
+        self.assertEqual(0., fuzzy_similarity('foo', 'bar'))
+        self.assertTrue(fuzzy_similarity('London', 'Londn') > fuzzy_similarity('London', 'Lndn') > 0.)
+
+    def test_fuzzy_index(self):
+        index = FuzzyIndex(['London', 'Londa', 'Moskva', 'London', 'Bologna', 'Londonderry'])
+        self.assertEqual([1, 0, 3, 5], index.lookup('londn'))  # 'londa' shares as many trigrams, but is shorter
+        self.assertEqual([0, 3, 5], index.lookup('LONDON', min_similarity=0.5)[:3])
+        self.assertEqual([2], index.lookup('москва'))
+        self.assertEqual([4], index.lookup('Bolonga'))
+        self.assertEqual([], index.lookup('xyz'))
+
+    def test_ids_for_fuzzy(self):
+        original_get_all_lines = CityIDRegistry._get_all_lines
+        CityIDRegistry._get_all_lines = self._mock_get_all_lines
+        self._clear_process_wide_indexes()
+        try:
+            result = self._instance.ids_for('abeville', matching='fuzzy')
+            self.assertEqual(5, len(result))
+            self.assertTrue(all(name == 'Abbeville' for _, name, _ in result))
+            self.assertEqual([(3038789, 'Abbeville', 'FR')], self._instance.ids_for('Abbevile', country='FR',
+                                                                                    matching='fuzzy'))
+            # most similar names come first
+            result = self._instance.ids_for('Abbans', matching='fuzzy')
+            self.assertEqual('Abbans-Dessus', result[0][1])
+            self.assertEqual([(2829449, 'Bologna', 'IT')], self._instance.ids_for('Болонья', matching='fuzzy'))
+            result = self._instance.locations_for('bolgna', matching='fuzzy')
+            self.assertEqual(1, len(result))
+            self._assertLocationsEqual(Location('Bologna', -83.250488, 30.57184, 2829449, 'IT'), result[0])
+            self.assertEqual([], self._instance.ids_for('xyz', matching='fuzzy'))
+        finally:
+            CityIDRegistry._get_all_lines = original_get_all_lines
+            self._clear_process_wide_indexes()
+
+    # tests for the memory-mapped city database
+
+    def test_db_lookups_match_file_scans(self):
+        fd, path = tempfile.mkstemp(suffix='.bin')
+        os.close(fd)
+        CityDB.build(self._mock_get_lines_with_homonymies('any'), path)
+        original_get_lines = CityIDRegistry._get_lines
+        original_get_all_lines = CityIDRegistry._get_all_lines
+        CityIDRegistry._get_lines = self._mock_get_lines_with_homonymies
+        CityIDRegistry._get_all_lines = self._mock_get_all_lines
+        try:
+            db_backed = CityIDRegistry('%03d-%03d.txt', db_path=path)
+            for name in ['Abbeville', 'abbeville', 'abb', 'dessus', 'Bologna', 'b', 'xyz']:
+                for matching in CityIDRegistry.MATCHINGS:
+                    for country in [None, 'US', 'IT']:
+                        self.assertEqual(self._instance.ids_for(name, country=country, matching=matching),
+                                         db_backed.ids_for(name, country=country, matching=matching))
+            self.assertEqual([loc.to_dict() for loc in self._instance.locations_for('abbeville')],
+                             [loc.to_dict() for loc in db_backed.locations_for('abbeville')])
+            self.assertRaises(ValueError, db_backed.ids_for, '1bologna')
+        finally:
+            CityIDRegistry._get_lines = original_get_lines
+            CityIDRegistry._get_all_lines = original_get_all_lines
+            cityidregistry._city_dbs.pop(path).close()
+            os.remove(path)
+
+    def test_db_is_built_from_city_id_files(self):
+        instance = self._db_instance()
+        self.assertTrue(os.path.isfile(instance._db_path))
+        self.assertEqual(len(list(instance._get_all_lines())), len(instance._get_db()))
+        self.assertEqual(CityIDRegistry.get_instance().ids_for('London', country='GB'),
+                         instance.ids_for('London', country='GB'))
+
     def test_repr(self):
         print(self._instance)
+        print(CityIndex([]))
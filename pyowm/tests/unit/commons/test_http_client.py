@@ -1,13 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import json
+import threading
+import time
 import unittest
 import requests
-import json
 import pyowm.commons.exceptions
 from pyowm.config import DEFAULT_CONFIG
+from pyowm.commons.cache import ResponseCache
 from pyowm.commons.enums import SubscriptionTypeEnum
-from pyowm.commons.http_client import HttpClient, HttpRequestBuilder
+from pyowm.commons.ratelimiter import RateLimiter
+from pyowm.commons.retry import RetryPolicy
+from pyowm.commons.http_client import HttpClient, HttpRequestBuilder, HttpSession
 
 
 class MockResponse:
@@ -31,12 +36,20 @@ class MockCache:
         pass
 
 
-class TestHTTPClient(unittest.TestCase):
+class MockSession:
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    def request(self, method, url, **kwargs):
+        self.calls.append(method)
+        return MockResponse(200, '{}')
 
-    requests_original_get = requests.get
-    requests_original_post = requests.post
-    requests_original_put= requests.put
-    requests_original_delete = requests.delete
+    def close(self):
+        self.closed = True
+
+
+class TestHTTPClient(unittest.TestCase):
 
     def test_instantiation(self):
         self.assertRaises(AssertionError, HttpClient, None, DEFAULT_CONFIG, 'test.com', True)
@@ -51,20 +64,39 @@ class TestHTTPClient(unittest.TestCase):
         def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
             return MockResponse(200, expected_data)
 
-        requests.get = monkey_patched_get
-        status, data = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').get_json('/resource')
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance.session.get = monkey_patched_get
+        status, data = instance.get_json('/resource')
         self.assertEqual(json.loads(expected_data), data)
-        requests.get = self.requests_original_get
 
     def test_get_json_parse_error(self):
 
         def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
             return MockResponse(200, 123846237647236)
 
-        requests.get = monkey_patched_get
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance.session.get = monkey_patched_get
         self.assertRaises(pyowm.commons.exceptions.ParseAPIResponseError,
-                          HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').get_json, '/resource', params=dict(a=1, b=2))
-        requests.get = self.requests_original_get
+                          instance.get_json, '/resource', params=dict(a=1, b=2))
+
+    def test_get_json_decodes_bytes_with_the_configured_decoder(self):
+        decoded = []
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            return MockResponse(200, '{"name": "Città"}'.encode('utf-8'))
+
+        def decode(document):
+            decoded.append(document)
+            return json.loads(document)
+
+        instance = HttpClient('apikey', dict(DEFAULT_CONFIG, json_decoder='json'), 'anyurl.com')
+        instance.session.get = monkey_patched_get
+        self.assertEqual(dict(name='Città'), instance.get_json('/resource')[1])
+        instance.session.decode_json = decode
+        instance.get_json('/resource')
+        self.assertEqual(['{"name": "Città"}'.encode('utf-8')], decoded)
+        with self.assertRaises(ValueError):
+            HttpSession(dict(json_decoder='unknown'))
 
     def test_post(self):
         expected_data = '{"key": "value"}'
@@ -72,10 +104,10 @@ class TestHTTPClient(unittest.TestCase):
         def monkey_patched_post(uri, params=None, headers=None, proxies=None, json=None, timeout=None, verify=False):
             return MockResponse(201, expected_data)
 
-        requests.post = monkey_patched_post
-        status, data = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').post('/resource', data=dict(key='value'))
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance.session.post = monkey_patched_post
+        status, data = instance.post('/resource', data=dict(key='value'))
         self.assertEqual(json.loads(expected_data), data)
-        requests.post = self.requests_original_post
 
     def test_put(self):
         expected_data = '{"key": "value"}'
@@ -83,18 +115,19 @@ class TestHTTPClient(unittest.TestCase):
         def monkey_patched_put(uri, params=None, headers=None, proxies=None, json=None, timeout=None, verify=False):
             return MockResponse(200, expected_data)
 
-        requests.put = monkey_patched_put
-        status, data = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').put('/resource', data=dict(key=7))
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance.session.put = monkey_patched_put
+        status, data = instance.put('/resource', data=dict(key=7))
         self.assertEqual(json.loads(expected_data), data)
-        requests.put = self.requests_original_put
 
     def test_delete(self):
         # in case an empty payload is returned
         def monkey_patched_delete(uri, params=None, headers=None, proxies=None, json=None, timeout=None, verify=False):
             return MockResponse(204, None)
 
-        requests.delete = monkey_patched_delete
-        status, data = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').delete('/resource')
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance.session.delete = monkey_patched_delete
+        status, data = instance.delete('/resource')
         self.assertIsNone(data)
 
         # in case a non-empty payload is returned
@@ -103,12 +136,10 @@ class TestHTTPClient(unittest.TestCase):
         def monkey_patched_delete_returning_payload(uri, params=None, headers=None, proxies=None,  json=None, timeout=None, verify=False):
             return MockResponse(204, expected_data)
 
-        requests.delete = monkey_patched_delete_returning_payload
-        status, data = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').delete('/resource')
+        instance.session.delete = monkey_patched_delete_returning_payload
+        status, data = instance.delete('/resource')
         self.assertEqual(json.loads(expected_data), data)
 
-        requests.delete = self.requests_original_delete
-
     def test_check_status_code(self):
         msg = 'Generic error'
         HttpClient.check_status_code(200, msg)
@@ -118,6 +149,8 @@ class TestHTTPClient(unittest.TestCase):
             HttpClient.check_status_code(401, msg)
         with self.assertRaises(pyowm.commons.exceptions.NotFoundError):
             HttpClient.check_status_code(404, msg)
+        with self.assertRaises(pyowm.commons.exceptions.TooManyRequestsError):
+            HttpClient.check_status_code(429, msg)
         with self.assertRaises(pyowm.commons.exceptions.BadGatewayError):
             HttpClient.check_status_code(502, msg)
         with self.assertRaises(pyowm.commons.exceptions.APIRequestError):
@@ -129,14 +162,71 @@ class TestHTTPClient(unittest.TestCase):
         def monkey_patched_get_timeouting(uri, params=None, headers=None, proxies=None, timeout=timeout, verify=False):
             raise requests.exceptions.Timeout()
 
-        requests.get = monkey_patched_get_timeouting
         config = DEFAULT_CONFIG.copy()
         config['connection']['timeout_secs'] = timeout
+        instance = HttpClient('apikey', config, 'anyurl.com')
+        instance.session.get = monkey_patched_get_timeouting
         try:
-            status, data = HttpClient('apikey', config, 'anyurl.com').get_json('/resource')
+            status, data = instance.get_json('/resource')
             self.fail()
         except pyowm.commons.exceptions.TimeoutError:
-            requests.get = self.requests_original_get
+            pass
+
+    def test_connection_errors(self):
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            raise requests.exceptions.ConnectionError('connection refused')
+
+        def monkey_patched_get_connect_timeouting(uri, params=None, headers=None, proxies=None, timeout=None,
+                                                  verify=False):
+            raise requests.exceptions.ConnectTimeout()
+
+        def monkey_patched_get_ssl_error(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            raise requests.exceptions.SSLError('certificate verify failed')
+
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance.session.get = monkey_patched_get
+        self.assertRaises(pyowm.commons.exceptions.ConnectionError, instance.get_json, '/resource')
+        instance.session.get = monkey_patched_get_connect_timeouting
+        self.assertRaises(pyowm.commons.exceptions.TimeoutError, instance.get_json, '/resource')
+        instance.session.get = monkey_patched_get_ssl_error
+        self.assertRaises(pyowm.commons.exceptions.InvalidSSLCertificateError, instance.get_json, '/resource')
+
+    def test_circuit_breaker(self):
+        outcomes = []
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        config = dict(DEFAULT_CONFIG, circuit_breaker=dict(enabled=True, failure_threshold=2))
+        instance = HttpClient('apikey', config, 'anyurl.com')
+        other_instance = HttpClient('apikey', config, 'otherurl.com', session=instance.session)
+        instance.session.get = monkey_patched_get
+
+        # client errors do not open the breaker
+        outcomes.extend([MockResponse(404, 'not found'), MockResponse(404, 'not found')])
+        for _ in range(2):
+            self.assertRaises(pyowm.commons.exceptions.NotFoundError, instance.get_json, 'weather')
+
+        # timeouts and server errors do
+        outcomes.extend([requests.exceptions.ReadTimeout(), MockResponse(502, 'bad gateway')])
+        self.assertRaises(pyowm.commons.exceptions.TimeoutError, instance.get_json, 'weather')
+        self.assertRaises(pyowm.commons.exceptions.BadGatewayError, instance.get_json, 'weather')
+        self.assertRaises(pyowm.commons.exceptions.CircuitBreakerOpenError, instance.get_json, 'weather')
+        self.assertEqual({'anyurl.com': 'open'}, instance.session.circuit_breakers.states())
+
+        # breakers are per API root
+        outcomes.append(MockResponse(200, '{}'))
+        self.assertEqual((200, {}), other_instance.get_json('weather'))
+
+        # recovery via half-open probe
+        instance.session.circuit_breakers.get('anyurl.com')._opened_at -= 30
+        outcomes.append(MockResponse(200, '{}'))
+        self.assertEqual((200, {}), instance.get_json('weather'))
+        self.assertEqual('closed', instance.session.circuit_breakers.get('anyurl.com').state)
 
     def test_get_png(self):
         expected_data = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x01\x03\x00\x00\x00%\xdbV\xca\x00\x00\x00\x03PLTE\x00p\xff\xa5G\xab\xa1\x00\x00\x00\x01tRNS\xcc\xd24V\xfd\x00\x00\x00\nIDATx\x9ccb\x00\x00\x00\x06\x00\x0367|\xa8\x00\x00\x00\x00IEND\xaeB`\x82'
@@ -144,11 +234,11 @@ class TestHTTPClient(unittest.TestCase):
         def monkey_patched_get(uri, stream=True, params=None, headers=None, proxies=None, timeout=None, verify=False):
             return MockResponse(200, expected_data)
 
-        requests.get = monkey_patched_get
-        status, data = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').get_png('/resource')
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance.session.get = monkey_patched_get
+        status, data = instance.get_png('/resource')
         self.assertIsInstance(data, bytes)
         self.assertEqual(expected_data, data)
-        requests.get = self.requests_original_get
 
     def test_get_geotiff(self):
         expected_data = b'II*\x00\x08\x00\x04\x00k{\x84s\x84\x84\x8c\x84\x84\x84k\x84k\x84\x84k{s\x9c\x94k\x84'
@@ -156,16 +246,323 @@ class TestHTTPClient(unittest.TestCase):
         def monkey_patched_get(uri, stream=True, params=None, headers=None, proxies=None, timeout=None, verify=False):
             return MockResponse(200, expected_data)
 
-        requests.get = monkey_patched_get
-        status, data = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').get_geotiff('/resource')
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance.session.get = monkey_patched_get
+        status, data = instance.get_geotiff('/resource')
         self.assertIsInstance(data, bytes)
         self.assertEqual(expected_data, data)
-        requests.get = self.requests_original_get
+
+    def test_instantiation_with_shared_session(self):
+        session = HttpSession(DEFAULT_CONFIG)
+        instance_1 = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        instance_2 = HttpClient('apikey', DEFAULT_CONFIG, 'otherurl.com', session=session)
+        self.assertIs(session, instance_1.session)
+        self.assertIs(session, instance_2.session)
+        self.assertIsNot(HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').session,
+                         HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').session)
+        with self.assertRaises(AssertionError):
+            HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session='not-a-session')
+
+    def test_get_json_with_cache(self):
+        calls = []
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            calls.append(uri)
+            return MockResponse(200, '{"calls": %d}' % len(calls))
+
+        config = dict(DEFAULT_CONFIG, cache=dict(enabled=True, ttl_secs={'weather': 600}))
+        instance = HttpClient('apikey', config, 'anyurl.com', admits_subdomains=False)
+        other_instance = HttpClient('otherkey', config, 'anyurl.com', admits_subdomains=False,
+                                    session=instance.session)
+        instance.session.get = monkey_patched_get
+
+        # cacheable endpoint: the API key does not take part to the cache key
+        self.assertEqual((200, {'calls': 1}), instance.get_json('weather', params=dict(q='London')))
+        self.assertEqual((200, {'calls': 1}), instance.get_json('weather', params=dict(q='London')))
+        self.assertEqual((200, {'calls': 1}), other_instance.get_json('weather', params=dict(q='London')))
+        self.assertEqual((200, {'calls': 2}), instance.get_json('weather', params=dict(q='Rome')))
+
+        # non cacheable endpoint
+        self.assertEqual((200, {'calls': 3}), instance.get_json('polygons'))
+        self.assertEqual((200, {'calls': 4}), instance.get_json('polygons'))
+
+        # expired response
+        key = instance.session.cache.key_for('https://anyurl.com/weather', dict(q='London', lang='en'))
+        value, stored_at = instance.session.cache.backend._items[key]
+        instance.session.cache.backend._items[key] = (value, stored_at - 601)
+        self.assertEqual((200, {'calls': 5}), instance.get_json('weather', params=dict(q='London')))
+
+    def test_get_json_with_cache_does_not_store_errors(self):
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            return MockResponse(200, 'not json')
+
+        config = dict(DEFAULT_CONFIG, cache=dict(enabled=True))
+        instance = HttpClient('apikey', config, 'anyurl.com')
+        instance.session.get = monkey_patched_get
+        self.assertRaises(pyowm.commons.exceptions.ParseAPIResponseError, instance.get_json, 'weather')
+        self.assertEqual(0, len(instance.session.cache.backend))
+
+    def test_get_json_with_cache_stale_while_revalidate(self):
+        refreshed = threading.Event()
+        calls = []
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            calls.append(uri)
+            if len(calls) > 1:
+                refreshed.set()
+            return MockResponse(200, '{"calls": %d}' % len(calls))
+
+        config = dict(DEFAULT_CONFIG, cache=dict(enabled=True, ttl_secs={'weather': 600},
+                                                 stale_while_revalidate_secs=60))
+        instance = HttpClient('apikey', config, 'anyurl.com', admits_subdomains=False)
+        instance.session.get = monkey_patched_get
+        cache = instance.session.cache
+        self.assertEqual((200, {'calls': 1}), instance.get_json('weather'))
+        key = cache.key_for('https://anyurl.com/weather', dict(lang='en'))
+
+        # stale response is served and refreshed in the background
+        cache.backend._items[key] = (cache.backend._items[key][0], time.time() - 630)
+        self.assertEqual((200, {'calls': 1}), instance.get_json('weather'))
+        self.assertTrue(refreshed.wait(5))
+        for _ in range(100):
+            if cache.begin_refresh(key):
+                cache.end_refresh(key)
+                break
+            time.sleep(0.01)
+        self.assertEqual((200, {'calls': 2}), instance.get_json('weather'))
+
+        # too stale response is not served
+        cache.backend._items[key] = (cache.backend._items[key][0], time.time() - 661)
+        self.assertEqual((200, {'calls': 3}), instance.get_json('weather'))
+
+    def test_get_json_coalesces_concurrent_identical_calls(self):
+        release = threading.Event()
+        calls = []
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            calls.append(params['q'])
+            release.wait(5)
+            if params['q'] == 'nowhere':
+                return MockResponse(404, 'not found')
+            return MockResponse(200, '{"name": "%s"}' % params['q'])
+
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance.session.get = monkey_patched_get
+        results = []
+
+        def call(place):
+            try:
+                results.append(instance.get_json('weather', params=dict(q=place))[1])
+            except pyowm.commons.exceptions.NotFoundError as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=call, args=(place,)) for place in ['moscow'] * 4 + ['nowhere'] * 3]
+        for t in threads:
+            t.start()
+        time.sleep(0.2)  # let all threads reach the call
+        release.set()
+        for t in threads:
+            t.join(5)
+        self.assertEqual(['moscow', 'nowhere'], sorted(calls))
+        self.assertEqual(4, results.count({'name': 'moscow'}))
+        self.assertEqual(3, len([r for r in results if isinstance(r, pyowm.commons.exceptions.NotFoundError)]))
+        # each caller gets its own copy of the data
+        self.assertEqual(4, len(set(id(r) for r in results if isinstance(r, dict))))
+
+    def test_get_json_with_quota_exceeded_payload_feeds_rate_limiter(self):
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            return MockResponse(200, '{"cod": 429, "message": "quota exceeded"}')
+
+        config = dict(DEFAULT_CONFIG, rate_limit=dict(enabled=True), cache=dict(enabled=True))
+        instance = HttpClient('apikey', config, 'anyurl.com')
+        instance.session.get = monkey_patched_get
+        status, data = instance.get_json('weather')
+        self.assertEqual(429, data['cod'])
+        self.assertGreater(instance.session.rate_limiter.state()['blocked_for'], 0)
+        self.assertEqual(0, len(instance.session.cache.backend))
 
     def test_repr(self):
         print(HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com'))
 
 
+class TestHttpSession(unittest.TestCase):
+
+    def test_instantiation(self):
+        with self.assertRaises(AssertionError):
+            HttpSession(None)
+        instance = HttpSession(DEFAULT_CONFIG)
+        self.assertEqual(DEFAULT_CONFIG['connection']['pool_connections'], instance.pool_connections)
+        self.assertEqual(DEFAULT_CONFIG['connection']['pool_maxsize'], instance.pool_maxsize)
+        self.assertTrue(instance.keep_alive)
+        adapter = instance._session.get_adapter('https://anyurl.com')
+        self.assertEqual(instance.pool_maxsize, adapter._pool_maxsize)
+
+    def test_instantiation_fills_in_missing_connection_settings(self):
+        instance = HttpSession(dict())
+        self.assertEqual(DEFAULT_CONFIG['connection']['pool_connections'], instance.pool_connections)
+        self.assertEqual(DEFAULT_CONFIG['connection']['idle_timeout_secs'], instance.idle_timeout_secs)
+        config = {'connection': {'pool_maxsize': 3, 'keep_alive': False}}
+        instance = HttpSession(config)
+        self.assertEqual(3, instance.pool_maxsize)
+        self.assertFalse(instance.keep_alive)
+        self.assertEqual('close', instance._session.headers['Connection'])
+        with self.assertRaises(AssertionError):
+            HttpSession({'connection': {'pool_maxsize': 0}})
+
+    def test_request_delegates_to_pooled_session(self):
+        calls = []
+
+        def monkey_patched_request(method, url, **kwargs):
+            calls.append((method, url, kwargs))
+            return MockResponse(200, '{}')
+
+        instance = HttpSession(DEFAULT_CONFIG)
+        instance._session.request = monkey_patched_request
+        instance.get('http://anyurl.com', params=dict(a=1))
+        instance.post('http://anyurl.com', json=dict(b=2))
+        instance.put('http://anyurl.com')
+        instance.delete('http://anyurl.com')
+        self.assertEqual(['GET', 'POST', 'PUT', 'DELETE'], [c[0] for c in calls])
+        self.assertEqual(dict(params=dict(a=1)), calls[0][2])
+
+    def test_idle_connections_are_dropped(self):
+        sessions = []
+        instance = HttpSession({'connection': {'idle_timeout_secs': 10}})
+        instance._new_session = lambda: sessions.append(MockSession()) or sessions[-1]
+        instance.close()
+        instance.get('http://anyurl.com')
+        instance.get('http://anyurl.com')
+        self.assertEqual(1, len(sessions))
+        instance._last_used -= 11
+        instance.get('http://anyurl.com')
+        self.assertEqual(2, len(sessions))
+        self.assertTrue(sessions[0].closed)
+        self.assertFalse(sessions[1].closed)
+        self.assertEqual(['GET', 'GET'], sessions[0].calls)
+        self.assertEqual(['GET'], sessions[1].calls)
+
+    def test_sessions_in_use_are_closed_when_requests_are_over(self):
+        sessions = []
+        instance = HttpSession({'connection': {'idle_timeout_secs': 10}})
+        instance._new_session = lambda: sessions.append(MockSession()) or sessions[-1]
+        instance.close()
+        in_use = instance._acquire_session()  # a request in progress in another thread
+        instance._last_used -= 11
+        instance.get('http://anyurl.com')
+        self.assertFalse(in_use.closed)
+        instance._release_session(in_use)
+        self.assertTrue(in_use.closed)
+        self.assertIsNot(in_use, instance._session)
+        instance.close()
+        self.assertTrue(sessions[1].closed)
+        self.assertEqual(1, len(instance._users))
+
+    def test_instantiation_with_cache(self):
+        self.assertIsNone(HttpSession(DEFAULT_CONFIG).cache)
+        instance = HttpSession({'cache': {'enabled': True, 'max_size': 5}})
+        self.assertIsInstance(instance.cache, ResponseCache)
+        self.assertEqual(5, instance.cache.backend.max_size)
+
+    def test_instantiation_with_rate_limiter(self):
+        self.assertIsNone(HttpSession(DEFAULT_CONFIG).rate_limiter)
+        instance = HttpSession({'rate_limit': {'enabled': True}})
+        self.assertIsInstance(instance.rate_limiter, RateLimiter)
+        self.assertEqual(60, instance.rate_limiter.calls_per_minute)
+        rate_limiter = RateLimiter(60, 1)
+        self.assertIs(rate_limiter, HttpSession(DEFAULT_CONFIG, rate_limiter=rate_limiter).rate_limiter)
+
+    def test_requests_go_through_rate_limiter(self):
+        instance = HttpSession({'rate_limit': {'enabled': True, 'burst_size': 2, 'policy': 'fail'}})
+        instance._session.request = lambda method, url, **kwargs: MockResponse(200, '{}')
+        instance.get('http://anyurl.com')
+        instance.get('http://anyurl.com')
+        with self.assertRaises(pyowm.commons.exceptions.RateLimitExceededError):
+            instance.get('http://anyurl.com')
+
+    def test_too_many_requests_responses_feed_rate_limiter(self):
+        instance = HttpSession({'rate_limit': {'enabled': True, 'policy': 'fail'}})
+        resp = MockResponse(429, '{"cod": 429}')
+        resp.headers = {'Retry-After': '30'}
+        instance._session.request = lambda method, url, **kwargs: resp
+        self.assertIs(resp, instance.get('http://anyurl.com'))
+        state = instance.rate_limiter.state()
+        self.assertAlmostEqual(30, state['blocked_for'], delta=1)
+        self.assertLessEqual(state['tokens'], 0)
+        with self.assertRaises(pyowm.commons.exceptions.RateLimitExceededError):
+            instance.get('http://anyurl.com')
+
+    def test_instantiation_with_retry_policy(self):
+        self.assertIsNone(HttpSession(DEFAULT_CONFIG).retry_policy)
+        instance = HttpSession({'retry': {'max_retries': 3}})
+        self.assertIsInstance(instance.retry_policy, RetryPolicy)
+        self.assertEqual(3, instance.retry_policy.max_retries)
+
+    def test_get_requests_are_retried(self):
+        outcomes = [requests.exceptions.ConnectTimeout(), requests.exceptions.ReadTimeout(),
+                    requests.exceptions.ConnectionError(), MockResponse(502, 'bad gateway'),
+                    MockResponse(200, '{}')]
+        timeouts = []
+
+        def monkey_patched_request(method, url, timeout=None, **kwargs):
+            timeouts.append(timeout)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            outcome.headers = dict()
+            outcome.close = lambda: None
+            return outcome
+
+        instance = HttpSession({'retry': {'max_retries': 5, 'backoff_base_secs': 0.001, 'backoff_max_secs': 0.01,
+                                          'deadline_secs': 10}})
+        instance._session.request = monkey_patched_request
+        resp = instance.get('http://anyurl.com', timeout=20)
+        self.assertEqual(200, resp.status_code)
+        # the timeout of the attempts never exceeds the deadline
+        self.assertTrue(all(t <= 10 for t in timeouts))
+        metrics = instance.retry_policy.metrics()
+        self.assertEqual(4, metrics['retries'])
+        self.assertEqual(dict(connect_timeout=1, read_timeout=1, connection_error=1, status_502=1),
+                         metrics['retries_by_reason'])
+
+    def test_retries_give_up(self):
+        calls = []
+
+        def monkey_patched_request(method, url, **kwargs):
+            calls.append(method)
+            resp = MockResponse(503, 'unavailable')
+            resp.headers = dict()
+            resp.close = lambda: None
+            return resp
+
+        instance = HttpSession({'retry': {'max_retries': 2, 'backoff_base_secs': 0.001, 'backoff_max_secs': 0.01}})
+        instance._session.request = monkey_patched_request
+        self.assertEqual(503, instance.get('http://anyurl.com').status_code)
+        self.assertEqual(3, len(calls))
+        self.assertEqual(1, instance.retry_policy.metrics()['exhausted'])
+
+        # non idempotent calls are not retried
+        calls.clear()
+        self.assertEqual(503, instance.post('http://anyurl.com').status_code)
+        self.assertEqual(1, len(calls))
+
+    def test_ssl_errors_are_not_retried(self):
+        calls = []
+
+        def monkey_patched_request(method, url, **kwargs):
+            calls.append(method)
+            raise requests.exceptions.SSLError()
+
+        instance = HttpSession({'retry': {'max_retries': 2, 'backoff_base_secs': 0.001, 'backoff_max_secs': 0.01}})
+        instance._session.request = monkey_patched_request
+        self.assertRaises(requests.exceptions.SSLError, instance.get, 'http://anyurl.com')
+        self.assertEqual(1, len(calls))
+
+    def test_repr(self):
+        print(HttpSession(DEFAULT_CONFIG))
+
+
 class TestHttpRequestBuilder(unittest.TestCase):
 
     test_config = {
@@ -285,10 +682,14 @@ class TestHttpRequestBuilder(unittest.TestCase):
         hvalue = 'value'
         instance.with_header(hkey, hvalue)
         self.assertEqual({hkey: hvalue}, instance.headers)
+        instance.with_header('other', [1, 2])
+        self.assertEqual([1, 2], instance.headers['other'])
         with self.assertRaises(AssertionError):
             instance.with_header(123, 'value')
         with self.assertRaises(ValueError):
             instance.with_header('key', bytes()) # any non-serializable value is OK here
+        with self.assertRaises(ValueError):
+            instance.with_header('key', object())
 
     def test_build_with_subdomains(self):
         apikey = 'apikey'
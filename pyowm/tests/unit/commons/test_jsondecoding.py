@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import importlib
+import json
+import unittest
+from pyowm.commons.jsondecoding import DECODERS, decoder_for, decoder_from_config
+
+
+def installed(name):
+    try:
+        importlib.import_module(name)
+        return True
+    except ImportError:
+        return False
+
+
+class TestJSONDecoding(unittest.TestCase):
+
+    document = '{"name": "Città", "temp": [273.15, -1.5e3], "id": 12345678901, "ok": true, "none": null}'
+
+    def test_decoders_parse_bytes_and_str(self):
+        expected = json.loads(self.document)
+        for name in DECODERS:
+            if not installed(name):
+                continue
+            decode = decoder_for(name)
+            self.assertEqual(expected, decode(self.document.encode('utf-8')))
+            self.assertEqual(expected, decode(self.document))
+
+    def test_decoders_raise_value_errors(self):
+        for name in DECODERS:
+            if not installed(name):
+                continue
+            decode = decoder_for(name)
+            for document in (b'', b'{"a": ', 'not json'):
+                with self.assertRaises(ValueError):
+                    decode(document)
+
+    def test_auto_picks_the_fastest_installed_decoder(self):
+        fastest = next(name for name in DECODERS if installed(name))
+        self.assertIs(decoder_for(fastest), decoder_for('auto'))
+        self.assertIs(decoder_for('auto'), decoder_for())
+
+    def test_unsupported_decoders(self):
+        with self.assertRaises(ValueError):
+            decoder_for('simplejson')
+        for name in DECODERS:
+            if not installed(name):
+                with self.assertRaises(ImportError):
+                    decoder_for(name)
+
+    def test_decoder_from_config(self):
+        self.assertIs(decoder_for('auto'), decoder_from_config(dict()))
+        self.assertIs(decoder_for('json'), decoder_from_config(dict(json_decoder='json')))
+        with self.assertRaises(ValueError):
+            decoder_from_config(dict(json_decoder='unknown'))
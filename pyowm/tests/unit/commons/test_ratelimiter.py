@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import unittest
+from email.utils import formatdate
+from pyowm.commons.enums import SubscriptionTypeEnum
+from pyowm.commons.exceptions import RateLimitExceededError
+from pyowm.commons.ratelimiter import RateLimiter, parse_retry_after
+
+
+class TestParseRetryAfter(unittest.TestCase):
+
+    def test_parse_retry_after(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertEqual(30., parse_retry_after('30'))
+        self.assertEqual(0., parse_retry_after('-1'))
+        self.assertAlmostEqual(60., parse_retry_after(formatdate(time.time() + 60, usegmt=True)), delta=2)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, RateLimiter, 0, 10)
+        self.assertRaises(AssertionError, RateLimiter, 60, 0)
+        self.assertRaises(ValueError, RateLimiter, 60, 10, 'drop')
+
+    def test_from_config(self):
+        self.assertIsNone(RateLimiter.from_config(dict()))
+        instance = RateLimiter.from_config({'rate_limit': {'enabled': True}})
+        self.assertEqual(60, instance.calls_per_minute)
+        self.assertEqual('block', instance.policy)
+        instance = RateLimiter.from_config({'subscription_type': SubscriptionTypeEnum.DEVELOPER,
+                                            'rate_limit': {'enabled': True, 'policy': 'fail', 'burst_size': 5}})
+        self.assertEqual(3000, instance.calls_per_minute)
+        self.assertEqual(5, instance.burst_size)
+        self.assertEqual('fail', instance.policy)
+        self.assertRaises(ValueError, RateLimiter.from_config,
+                          {'rate_limit': {'enabled': True, 'calls_per_minute': {'startup': 600}}})
+
+    def test_fail_policy(self):
+        instance = RateLimiter(60, 3, 'fail')
+        for _ in range(3):
+            instance.acquire()
+        self.assertRaises(RateLimitExceededError, instance.acquire)
+        self.assertLess(instance.state()['tokens'], 1)
+
+    def test_block_policy(self):
+        instance = RateLimiter(600, 2)
+        start = time.monotonic()
+        for _ in range(4):
+            instance.acquire()
+        # two calls out of the burst, refilled at 10 calls per second
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_block_policy_is_thread_safe(self):
+        instance = RateLimiter(1200, 5)
+        start = time.monotonic()
+        threads = [threading.Thread(target=instance.acquire) for _ in range(15)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        # 10 calls out of the burst, refilled at 20 calls per second
+        self.assertGreaterEqual(time.monotonic() - start, 0.45)
+        self.assertLess(instance.state()['tokens'], 1)
+
+    def test_acquire_async(self):
+        instance = RateLimiter(600, 2)
+
+        async def acquire_all():
+            await asyncio.gather(*[instance.acquire_async() for _ in range(4)])
+
+        start = time.monotonic()
+        asyncio.run(acquire_all())
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+        instance = RateLimiter(60, 1, 'fail')
+        asyncio.run(instance.acquire_async())
+        self.assertRaises(RateLimitExceededError, asyncio.run, instance.acquire_async())
+
+    def test_penalize(self):
+        instance = RateLimiter(6000, 10, 'fail')
+        instance.penalize(retry_after=0.2)
+        state = instance.state()
+        self.assertLessEqual(state['tokens'], 0)
+        self.assertAlmostEqual(0.2, state['blocked_for'], delta=0.05)
+        self.assertRaises(RateLimitExceededError, instance.acquire)
+        time.sleep(0.25)
+        # no tokens are accrued while blocked
+        self.assertLess(instance.state()['tokens'], 10)
+        instance.acquire()
+        instance.penalize()
+        self.assertGreater(instance.state()['blocked_for'], 0)
+
+    def test_state(self):
+        state = RateLimiter(60, 10).state()
+        self.assertEqual(10, state['tokens'])
+        self.assertEqual(10, state['burst_size'])
+        self.assertEqual(60, state['calls_per_minute'])
+        self.assertEqual('block', state['policy'])
+        self.assertEqual(0, state['blocked_for'])
+
+    def test_repr(self):
+        print(RateLimiter(60, 10))
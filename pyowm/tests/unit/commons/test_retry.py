@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+from pyowm.commons.retry import RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, RetryPolicy, -1, 0.5, 8, 30, [502])
+        self.assertRaises(AssertionError, RetryPolicy, 3, 0, 8, 30, [502])
+        self.assertRaises(AssertionError, RetryPolicy, 3, 0.5, 0.1, 30, [502])
+        self.assertRaises(AssertionError, RetryPolicy, 3, 0.5, 8, 0, [502])
+
+    def test_from_config(self):
+        self.assertIsNone(RetryPolicy.from_config(dict()))
+        instance = RetryPolicy.from_config({'retry': {'max_retries': 2}})
+        self.assertEqual(2, instance.max_retries)
+        self.assertIn(502, instance.status_codes)
+        self.assertIn(429, instance.status_codes)
+
+    def test_next_delay_is_capped_exponential_backoff_with_jitter(self):
+        instance = RetryPolicy(10, 0.5, 4, 3600, [502])
+        deadline = instance.deadline()
+        for attempt in range(10):
+            for _ in range(20):
+                delay = instance.next_delay(attempt, deadline, 'status_502')
+                self.assertGreaterEqual(delay, 0.)
+                self.assertLessEqual(delay, min(4, 0.5 * 2 ** attempt))
+
+    def test_next_delay_honours_retry_after(self):
+        instance = RetryPolicy(3, 0.5, 4, 3600, [429])
+        self.assertGreaterEqual(instance.next_delay(0, instance.deadline(), 'status_429', retry_after=10), 10)
+
+    def test_next_delay_gives_up(self):
+        instance = RetryPolicy(2, 0.5, 4, 30, [502])
+        deadline = instance.deadline()
+        self.assertIsNone(instance.next_delay(2, deadline, 'status_502'))
+        self.assertIsNone(instance.next_delay(0, deadline, 'status_502', retry_after=60))
+        self.assertIsNone(instance.next_delay(0, time.monotonic(), 'status_502'))
+
+    def test_metrics(self):
+        instance = RetryPolicy(2, 0.5, 4, 30, [502])
+        self.assertEqual(dict(retries=0, retries_by_reason=dict(), exhausted=0), instance.metrics())
+        deadline = instance.deadline()
+        instance.next_delay(0, deadline, 'status_502')
+        instance.next_delay(1, deadline, 'status_502')
+        instance.next_delay(0, deadline, 'read_timeout')
+        instance.next_delay(2, deadline, 'status_502')
+        self.assertEqual(dict(retries=3, retries_by_reason=dict(status_502=2, read_timeout=1), exhausted=1),
+                         instance.metrics())
+
+    def test_repr(self):
+        print(RetryPolicy(2, 0.5, 4, 30, [502]))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+import unittest
+from pyowm.commons.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def _run_concurrently(self, instance, key, function, n_threads):
+        results = []
+        errors = []
+
+        def call():
+            try:
+                results.append(instance.do(key, function))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(n_threads)]
+        for t in threads:
+            t.start()
+        return threads, results, errors
+
+    def test_do(self):
+        instance = SingleFlight()
+        self.assertEqual(42, instance.do('key', lambda: 42))
+        self.assertEqual(43, instance.do('key', lambda: 43))
+        self.assertEqual(0, instance.in_flight())
+
+    def test_concurrent_calls_are_coalesced(self):
+        instance = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            release.wait(5)
+            return 'result'
+
+        threads, results, errors = self._run_concurrently(instance, 'key', function, 5)
+        time.sleep(0.2)  # let all threads reach the call
+        release.set()
+        for t in threads:
+            t.join(5)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(['result'] * 5, results)
+        self.assertEqual([], errors)
+        self.assertEqual(0, instance.in_flight())
+
+    def test_errors_are_propagated_to_all_callers(self):
+        instance = SingleFlight()
+        release = threading.Event()
+
+        def function():
+            release.wait(5)
+            raise ValueError('boom')
+
+        threads, results, errors = self._run_concurrently(instance, 'key', function, 5)
+        time.sleep(0.2)  # let all threads reach the call
+        release.set()
+        for t in threads:
+            t.join(5)
+        self.assertEqual([], results)
+        self.assertEqual(5, len(errors))
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+        self.assertEqual(0, instance.in_flight())
+
+    def test_calls_with_different_keys_are_not_coalesced(self):
+        instance = SingleFlight()
+        self.assertEqual(1, instance.do('a', lambda: instance.do('b', lambda: 1)))
+
+    def test_repr(self):
+        print(SingleFlight())
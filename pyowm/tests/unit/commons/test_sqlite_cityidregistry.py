@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sqlite3
+import stat
+import tempfile
+import unittest
+from unittest import mock
+from io import StringIO
+from pyowm.commons import cityidregistry
+from pyowm.commons.cityidregistry import CityIDRegistry
+from pyowm.commons.sqlite_cityidregistry import SQLiteCityIDRegistry
+
+
+class TestSQLiteCityIDRegistry(unittest.TestCase):
+
+    _test_file_contents = """Abasolo,3533505,24.066669,-98.366669,MX
+Abasolo,4019867,25.950001,-100.400002,MX
+Abbans-Dessus,3038800,47.120548,5.88188,FR
+Abbans-Dessus,6452202,47.116669,5.88333,FR
+Abbeville,3038789,50.099998,1.83333,FR
+abbeville,4178992,31.992121,-83.306824,US
+Abbeville,4314295,29.974649,-92.134293,US
+Bologna,2829449,30.57184,-83.250488,IT
+Thale, Stadt,6550950,51.7528,11.058,DE
+Pitcairn, Henderson, Ducie and Oeno Islands,4030699,-25.066669,-130.100006,PN"""
+
+    def _mock_get_lines(self, filename):
+        return StringIO(self._test_file_contents).readlines()
+
+    def _mock_get_all_lines(self):
+        return StringIO(self._test_file_contents).readlines()
+
+    def setUp(self):
+        self.original_get_lines = CityIDRegistry._get_lines
+        self.original_get_all_lines = CityIDRegistry._get_all_lines
+        CityIDRegistry._get_lines = self._mock_get_lines
+        CityIDRegistry._get_all_lines = self._mock_get_all_lines
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'cities.sqlite3')
+        self.instance = SQLiteCityIDRegistry(self.path)
+
+    def tearDown(self):
+        self.instance.close()
+        CityIDRegistry._get_lines = self.original_get_lines
+        CityIDRegistry._get_all_lines = self.original_get_all_lines
+        for filename in os.listdir(self.folder):
+            os.remove(os.path.join(self.folder, filename))
+        os.rmdir(self.folder)
+
+    def test_database_is_built_upon_first_lookup(self):
+        self.assertFalse(os.path.exists(self.path))
+        self.instance.ids_for('Bologna')
+        self.assertTrue(os.path.isfile(self.path))
+        self.assertEqual(['cities.sqlite3'], os.listdir(self.folder))
+        conn = sqlite3.connect(self.path)
+        self.assertEqual(10, conn.execute('SELECT COUNT(*) FROM cities').fetchone()[0])
+        conn.close()
+
+    @unittest.skipIf(os.name == 'nt', 'POSIX permissions only')
+    def test_database_file_is_private(self):
+        self.instance.ids_for('Bologna')
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(self.path).st_mode))
+
+    def test_database_defaults_to_user_cache_dir(self):
+        with mock.patch('pyowm.commons.sqlite_cityidregistry.user_cache_dir', return_value=self.folder):
+            instance = SQLiteCityIDRegistry()
+        self.assertEqual(self.folder, os.path.dirname(instance.path))
+
+    def test_database_is_reused(self):
+        self.instance.ids_for('Bologna')
+        self.instance.close()
+        CityIDRegistry._get_all_lines = lambda registry: self.fail('database must not be rebuilt')
+        other = SQLiteCityIDRegistry(self.path)
+        self.assertEqual([(2829449, 'Bologna', 'IT')], other.ids_for('Bologna'))
+        other.close()
+
+    def test_database_is_rebuilt_when_outdated_or_invalid(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute('CREATE TABLE cities (name TEXT)')
+        conn.execute('PRAGMA user_version = 0')
+        conn.commit()
+        conn.close()
+        self.assertEqual([(2829449, 'Bologna', 'IT')], self.instance.ids_for('Bologna'))
+        self.instance.close()
+
+        with open(self.path, 'wb') as f:
+            f.write(b'not a database' * 100)
+        self.assertEqual([(2829449, 'Bologna', 'IT')], SQLiteCityIDRegistry(self.path).ids_for('Bologna'))
+
+    def test_database_is_rebuilt_when_city_id_files_change(self):
+        self.instance.ids_for('Bologna')
+        self.instance.close()
+        with mock.patch('pyowm.commons.sqlite_cityidregistry.city_id_files_digest', return_value='0123456789abcdef'):
+            other = SQLiteCityIDRegistry(self.path)
+            CityIDRegistry._get_all_lines = lambda registry: StringIO('Bologna,1,30.57184,-83.250488,IT').readlines()
+            self.assertEqual([(1, 'Bologna', 'IT')], other.ids_for('Bologna'))
+            other.close()
+        conn = sqlite3.connect(self.path)
+        self.assertEqual(('0123456789abcdef',), conn.execute("SELECT value FROM meta WHERE key = 'digest'").fetchone())
+        conn.close()
+
+    def test_default_database_is_keyed_on_city_id_files(self):
+        with mock.patch('pyowm.commons.sqlite_cityidregistry.user_cache_dir', return_value=self.folder), \
+                mock.patch('pyowm.commons.sqlite_cityidregistry.city_id_files_digest', return_value='0123456789abcdef'):
+            instance = SQLiteCityIDRegistry()
+        self.assertEqual('cities-%d-0123456789abcdef.sqlite3' % SQLiteCityIDRegistry.SCHEMA_VERSION,
+                         os.path.basename(instance.path))
+
+    def test_lookups_match_file_scans(self):
+        scanning = CityIDRegistry('%03d-%03d.txt')
+        for name in ['Abbeville', 'abbeville', 'ABB', 'dessus', 'Bologna', 'b', 'xyz', 'thale, stadt', 'pitcairn',
+                     'ab', 'A"b', "a'", '%', 'a_b']:
+            for matching in ['exact', 'nocase', 'like', 'startswith']:
+                for country in [None, 'US', 'FR']:
+                    try:
+                        expected = scanning.ids_for(name, country=country, matching=matching)
+                    except ValueError:
+                        self.assertRaises(ValueError, self.instance.ids_for, name, country=country,
+                                          matching=matching)
+                        continue
+                    self.assertEqual(expected, self.instance.ids_for(name, country=country, matching=matching))
+        self.assertEqual([loc.to_dict() for loc in scanning.locations_for('abbeville')],
+                         [loc.to_dict() for loc in self.instance.locations_for('abbeville')])
+        self.assertEqual([p.to_dict() for p in scanning.geopoints_for('bologna')],
+                         [p.to_dict() for p in self.instance.geopoints_for('bologna')])
+
+    def test_ids_for_many(self):
+        result = self.instance.ids_for_many(['Abbeville', 'Bologna', 'xyz', '1abc'], country='US')
+        self.assertEqual([(4178992, 'abbeville', 'US'), (4314295, 'Abbeville', 'US')], result['Abbeville'])
+        self.assertEqual([], result['Bologna'])
+        self.assertEqual([], result['1abc'])
+
+    def test_locations_for_ids(self):
+        self.instance.MAX_QUERY_PARAMS = 2
+        result = self.instance.locations_for_ids([2829449, 1, 4030699, 3533505])
+        self.assertEqual([2829449, 1, 4030699, 3533505], list(result))
+        self.assertEqual('Bologna', result[2829449].name)
+        self.assertEqual('Pitcairn, Henderson, Ducie and Oeno Islands', result[4030699].name)
+        self.assertEqual(-25.066669, result[4030699].lat)
+        self.assertEqual('MX', result[3533505].country)
+        self.assertIsNone(result[1])
+        self.assertIsNone(self.instance.location_for_id(2))
+
+    def test_fuzzy_lookups(self):
+        try:
+            self.assertEqual([(2829449, 'Bologna', 'IT')], self.instance.ids_for('bolgna', matching='fuzzy'))
+        finally:
+            cityidregistry._city_tables.clear()
+            cityidregistry._fuzzy_indexes.clear()
+
+    def test_repr(self):
+        print(self.instance)
@@ -1,16 +1,25 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import subprocess
+import sys
 import unittest
-from pyowm.owm import OWM
+from pyowm.owm import OWM, AsyncOWM
 from pyowm.agroapi10.agro_manager import AgroManager
+from pyowm.agroapi10.aio_agro_manager import AsyncAgroManager
 from pyowm.airpollutionapi30.airpollution_manager import AirPollutionManager
+from pyowm.airpollutionapi30.aio_airpollution_manager import AsyncAirPollutionManager
 from pyowm.alertapi30.alert_manager import AlertManager
 from pyowm.commons.cityidregistry import CityIDRegistry
+from pyowm.commons.sqlite_cityidregistry import SQLiteCityIDRegistry
+from pyowm.config import DEFAULT_CONFIG
 from pyowm.stationsapi30.stations_manager import StationsManager
 from pyowm.tiles.tile_manager import TileManager
+from pyowm.tiles.aio_tile_manager import AsyncTileManager
 from pyowm.uvindexapi30.uvindex_manager import UVIndexManager
+from pyowm.uvindexapi30.aio_uvindex_manager import AsyncUVIndexManager
 from pyowm.weatherapi25.weather_manager import WeatherManager
+from pyowm.weatherapi25.aio_weather_manager import AsyncWeatherManager
 
 
 class TestOWM(unittest.TestCase):
@@ -45,6 +54,15 @@ class TestOWM(unittest.TestCase):
         result = self.__test_instance.city_id_registry()
         self.assertIsNotNone(result)
         self.assertIsInstance(result, CityIDRegistry)
+        self.assertFalse(result._is_indexed())
+        result = self.__test_instance.city_id_registry(backend='index')
+        self.assertTrue(result._use_index)
+        result = self.__test_instance.city_id_registry(backend='mmap')
+        self.assertIsNotNone(result._db_path)
+        result = self.__test_instance.city_id_registry(backend='sqlite', sqlite_path='/path/to/cities.sqlite3')
+        self.assertIsInstance(result, SQLiteCityIDRegistry)
+        self.assertEqual('/path/to/cities.sqlite3', result.path)
+        self.assertRaises(ValueError, self.__test_instance.city_id_registry, backend='xyz')
 
     def test_stations_manager(self):
         result = self.__test_instance.stations_manager()
@@ -80,3 +98,53 @@ class TestOWM(unittest.TestCase):
         result = self.__test_instance.tile_manager('test')
         self.assertIsNotNone(result)
         self.assertIsInstance(result, TileManager)
+
+    def test_managers_share_http_session(self):
+        session = self.__test_instance.http_session
+        self.assertIsNotNone(session)
+        self.assertIs(session, self.__test_instance.weather_manager().http_client.session)
+        self.assertIs(session, self.__test_instance.agro_manager().http_client.session)
+        self.assertIs(session, self.__test_instance.alert_manager().http_client.session)
+        self.assertIs(session, self.__test_instance.stations_manager().http_client.session)
+        self.assertIs(session, self.__test_instance.tile_manager('test').http_client.session)
+        self.assertIs(session, self.__test_instance.airpollution_manager().ap_client._client.session)
+        self.assertIs(session, self.__test_instance.uvindex_manager().uv_client._client.session)
+        self.assertIsNot(session, OWM('fake-api-key').http_session)
+
+    def test_aio(self):
+        aio = self.__test_instance.aio
+        self.assertIsInstance(aio, AsyncOWM)
+        self.assertIs(aio, self.__test_instance.aio)
+        session = aio.http_session
+        self.assertIsInstance(aio.weather_manager(), AsyncWeatherManager)
+        self.assertIs(session, aio.weather_manager().http_client.session)
+        self.assertIsInstance(aio.agro_manager(), AsyncAgroManager)
+        self.assertIs(session, aio.agro_manager().http_client.session)
+        self.assertIsInstance(aio.tile_manager('test'), AsyncTileManager)
+        self.assertIs(session, aio.tile_manager('test').http_client.session)
+        self.assertIsInstance(aio.airpollution_manager(), AsyncAirPollutionManager)
+        self.assertIs(session, aio.airpollution_manager().http_client.session)
+        self.assertIsInstance(aio.uvindex_manager(), AsyncUVIndexManager)
+        self.assertIs(session, aio.uvindex_manager().http_client.session)
+        print(aio)
+
+    def test_api_packages_are_imported_lazily(self):
+        code = ("import sys, pyowm; owm = pyowm.OWM('fake-api-key'); "
+                "print(' '.join(sorted(m for m in sys.modules if m.startswith('pyowm.'))))")
+        modules = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True).split()
+        for package in ['agroapi10', 'airpollutionapi30', 'alertapi30', 'stationsapi30', 'tiles', 'uvindexapi30',
+                        'weatherapi25']:
+            self.assertNotIn('pyowm.' + package, modules)
+        self.assertNotIn('pyowm.commons.aio_http_client', modules)
+        self.assertNotIn('pyowm.commons.cityidregistry', modules)
+
+    def test_response_cache_is_imported_only_when_enabled(self):
+        code = ("import sys, pyowm; pyowm.OWM('fake-api-key').http_session; "
+                "print('sqlite3' in sys.modules, 'pyowm.commons.cache' in sys.modules)")
+        self.assertEqual('False False', subprocess.check_output([sys.executable, '-c', code],
+                                                                universal_newlines=True).strip())
+
+    def test_aio_shares_rate_limiter(self):
+        instance = OWM('fake-api-key', dict(DEFAULT_CONFIG, rate_limit=dict(enabled=True)))
+        self.assertIsNotNone(instance.http_session.rate_limiter)
+        self.assertIs(instance.http_session.rate_limiter, instance.aio.http_session.rate_limiter)
@@ -0,0 +1,34 @@
+import asyncio
+import unittest
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.tiles.aio_tile_manager import AsyncTileManager
+from pyowm.commons.tile import Tile
+from pyowm.tiles.enums import MapLayerEnum
+
+
+class MockAsyncHttpClientReturningTile(AsyncHttpClient):
+
+    d = b'1234567890'
+
+    async def get_png(self, uri, params=None, headers=None):
+        return 200, self.d
+
+
+class TestAsyncTileManager(unittest.TestCase):
+
+    def test_instantiation_with_wrong_params(self):
+        self.assertRaises(AssertionError, AsyncTileManager, None, MapLayerEnum.PRESSURE, dict())
+        self.assertRaises(AssertionError, AsyncTileManager, 'apikey', None, dict())
+        self.assertRaises(AssertionError, AsyncTileManager, 'apikey', MapLayerEnum.PRESSURE, None)
+
+    def test_get_tile(self):
+        mocked = MockAsyncHttpClientReturningTile('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance = AsyncTileManager('apikey', 'a_layer', DEFAULT_CONFIG)
+        instance.http_client = mocked
+        result = asyncio.run(instance.get_tile(1, 2, 3))
+        self.assertIsInstance(result, Tile)
+        self.assertEqual(mocked.d, result.image.data)
+
+    def test_repr(self):
+        print(AsyncTileManager('apikey', 'a_layer', DEFAULT_CONFIG))
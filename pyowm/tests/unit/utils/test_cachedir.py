@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pyowm.utils.cachedir import user_cache_dir
+
+
+class TestCacheDir(unittest.TestCase):
+
+    @unittest.skipIf(sys.platform.startswith('win') or sys.platform == 'darwin', 'XDG layout only')
+    def test_user_cache_dir(self):
+        base = tempfile.mkdtemp()
+        try:
+            with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': base}):
+                result = user_cache_dir()
+                self.assertEqual(os.path.join(base, 'pyowm'), result)
+                self.assertTrue(os.path.isdir(result))
+                self.assertEqual(0o700, stat.S_IMODE(os.stat(result).st_mode))
+                self.assertEqual(result, user_cache_dir())  # already there
+        finally:
+            os.rmdir(os.path.join(base, 'pyowm'))
+            os.rmdir(base)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+import unittest
+from pyowm.utils.concurrency import fan_out
+
+
+class TestConcurrency(unittest.TestCase):
+
+    def test_fan_out(self):
+        result = dict(fan_out(lambda x: x * x, range(50), 4))
+        self.assertEqual({x: x * x for x in range(50)}, result)
+        self.assertEqual([], list(fan_out(lambda x: x, [], 4)))
+        self.assertRaises(AssertionError, fan_out, lambda x: x, [1], 0)
+        self.assertRaises(TypeError, fan_out, lambda x: x, 1, 2)
+
+    def test_fan_out_yields_exceptions(self):
+
+        def function(x):
+            if x % 2:
+                raise ValueError(x)
+            return x
+
+        result = dict(fan_out(function, range(10), 3))
+        self.assertEqual([0, 2, 4, 6, 8], sorted(k for k, v in result.items() if not isinstance(v, Exception)))
+        self.assertTrue(all(isinstance(result[k], ValueError) for k in (1, 3, 5, 7, 9)))
+
+    def test_fan_out_is_concurrent_and_bounded(self):
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def function(x):
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return x
+
+        start = time.monotonic()
+        self.assertEqual(20, len(list(fan_out(function, range(20), 4))))
+        self.assertLess(time.monotonic() - start, 0.3)
+        self.assertEqual(4, running[1])
+
+    def test_fan_out_consumes_items_lazily(self):
+        consumed = []
+
+        def items():
+            for i in range(1000):
+                consumed.append(i)
+                yield i
+
+        gen = fan_out(lambda x: x, items(), 2)
+        next(gen)
+        gen.close()
+        self.assertLess(len(consumed), 10)
+
+    def test_fan_out_cancellation(self):
+        cancel_event = threading.Event()
+        calls = []
+
+        def function(x):
+            calls.append(x)
+            time.sleep(0.01)
+            return x
+
+        result = []
+        for item, _ in fan_out(function, range(1000), 2, cancel_event=cancel_event):
+            result.append(item)
+            if len(result) == 5:
+                cancel_event.set()
+        self.assertLess(len(result), 10)
+        time.sleep(0.05)
+        self.assertLess(len(calls), 20)
@@ -3,6 +3,7 @@
 
 import unittest
 import json
+import math
 from pyowm.utils import geo
 
 
@@ -26,6 +27,15 @@ class TestGeo(unittest.TestCase):
 
     # -- Point --
 
+    def test_great_circle_distance(self):
+        self.assertEqual(0., geo.great_circle_distance(51.5, -0.12, 51.5, -0.12))
+        # London - Paris
+        self.assertAlmostEqual(344., geo.great_circle_distance(51.50853, -0.12574, 48.85341, 2.3488), delta=2.)
+        # antipodes
+        self.assertAlmostEqual(geo.EARTH_RADIUS_KM * math.pi, geo.great_circle_distance(0., 0., 0., 180.))
+        self.assertAlmostEqual(geo.great_circle_distance(10., 179.5, 10., -179.5),
+                               geo.great_circle_distance(10., -0.5, 10., 0.5))
+
     def test_point_geojson(self):
         expected = {
             "coordinates": [34, -56.3],
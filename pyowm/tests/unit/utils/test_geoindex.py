@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import random
+import unittest
+from pyowm.utils import geo
+from pyowm.utils.geoindex import GeoIndex
+
+
+class TestGeoIndex(unittest.TestCase):
+
+    _coordinates = [(51.50853, -0.12574),     # London
+                    (48.85341, 2.3488),       # Paris
+                    (41.89193, 12.51133),     # Rome
+                    (-33.86785, 151.20732),   # Sydney
+                    (64.8378, -147.71639),    # Fairbanks
+                    (-16.5, 179.9),           # close to the antimeridian, east
+                    (-16.5, -179.9),          # close to the antimeridian, west
+                    (89.9, 0.),               # close to the north pole
+                    (89.9, 180.)]
+
+    def test_nearest(self):
+        instance = GeoIndex(self._coordinates)
+        self.assertEqual(9, len(instance))
+        result = instance.nearest(51.4, 0.)
+        self.assertEqual(1, len(result))
+        self.assertEqual(0, result[0][1])
+        self.assertAlmostEqual(geo.great_circle_distance(51.4, 0., 51.50853, -0.12574), result[0][0])
+        self.assertEqual([1, 0, 2], [position for _, position in instance.nearest(50., 1., k=3)])
+
+    def test_nearest_with_max_distance(self):
+        instance = GeoIndex(self._coordinates)
+        self.assertEqual([], instance.nearest(0., 0., max_km=1000))
+        self.assertEqual([0], [position for _, position in instance.nearest(51.4, 0., k=5, max_km=100)])
+
+    def test_nearest_across_the_antimeridian_and_the_poles(self):
+        instance = GeoIndex(self._coordinates)
+        self.assertEqual([5, 6], sorted(position for _, position in instance.nearest(-16.5, 179.95, k=2)))
+        self.assertEqual([7, 8], sorted(position for _, position in instance.nearest(89.99, 90., k=2)))
+
+    def test_nearest_returns_all_points_at_most(self):
+        instance = GeoIndex(self._coordinates)
+        self.assertEqual(9, len(instance.nearest(0., 0., k=100)))
+        self.assertEqual([], GeoIndex([]).nearest(0., 0., k=3))
+
+    def test_nearest_matches_brute_force(self):
+        rnd = random.Random(42)
+        coordinates = [(rnd.uniform(-90, 90), rnd.uniform(-180, 180)) for _ in range(500)]
+        instance = GeoIndex(coordinates, cell_deg=5)
+        for _ in range(50):
+            lat, lon = rnd.uniform(-90, 90), rnd.uniform(-180, 180)
+            expected = sorted((geo.great_circle_distance(lat, lon, *c), i) for i, c in enumerate(coordinates))[:3]
+            self.assertEqual([i for _, i in expected], [i for _, i in instance.nearest(lat, lon, k=3)])
+
+    def test_within_radius(self):
+        instance = GeoIndex(self._coordinates)
+        result = instance.within_radius(50., 1., 1000)
+        self.assertEqual([1, 0], [position for _, position in result])
+        self.assertTrue(result[0][0] <= result[1][0] <= 1000)
+        self.assertEqual([], instance.within_radius(0., 0., 100))
+        self.assertEqual(9, len(instance.within_radius(0., 0., 20100)))
+
+    def test_repr(self):
+        print(GeoIndex(self._coordinates))
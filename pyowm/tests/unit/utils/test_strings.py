@@ -33,3 +33,21 @@ class TestStringUtils(unittest.TestCase):
         path = 'tests.unit.utils.test_strings.Placeholder'
         result = strings.class_from_dotted_path(path)
         assert result == Placeholder
+
+    def test_fold(self):
+        self.assertEqual('zurich', strings.fold('Zürich'))
+        self.assertEqual('sao paulo', strings.fold('SÃO PAULO'))
+        self.assertEqual('strasse', strings.fold('Straße'))
+        self.assertEqual('москва', strings.fold('Москва'))
+        self.assertEqual('', strings.fold(''))
+
+    def test_transliterate(self):
+        self.assertEqual('Moskva', strings.transliterate('Москва'))
+        self.assertEqual('Sankt-Peterburg', strings.transliterate('Санкт-Петербург'))
+        self.assertEqual('Kharkiv', strings.transliterate('Харків'))
+        self.assertEqual('Zürich', strings.transliterate('Zürich'))
+
+    def test_trigrams(self):
+        self.assertEqual({'  r', ' ro', 'rom', 'ome', 'me '}, strings.trigrams('rome'))
+        self.assertEqual({'  a', ' a '}, strings.trigrams('a'))
+        self.assertEqual({'   '}, strings.trigrams(''))
@@ -51,6 +51,8 @@ class TestWeatherUtils(unittest.TestCase):
                                                "rain", self.__test_registry))
         self.assertFalse(weather.status_is(self.__test_weather_sun,
                                                "rain", self.__test_registry))
+        unmapped = WeatherCodeRegistry({"rain": [{"start": 1, "end": 100}]})
+        self.assertFalse(weather.status_is(self.__test_weather_sun, "rain", unmapped))
 
     def test_any_status_is(self):
         self.assertTrue(weather.any_status_is(self.__test_weathers,
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import unittest
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.constants import UVINDEX_API_VERSION
+from pyowm.uvindexapi30 import uvindex
+from pyowm.uvindexapi30.aio_uvindex_manager import AsyncUVIndexManager
+from tests.unit.uvindexapi30.test_uvindex import UVINDEX_JSON, UVINDEX_LIST_JSON
+
+
+class MockAsyncHttpClient(AsyncHttpClient):
+
+    def __init__(self, payload):
+        super().__init__('fakeapikey', DEFAULT_CONFIG, 'anyurl.com')
+        self.payload = payload
+        self.calls = []
+
+    async def get_json(self, path, params=None, headers=None):
+        self.calls.append((path, params))
+        return 200, json.loads(self.payload)
+
+
+class TestAsyncUVIndexManager(unittest.TestCase):
+
+    def _instance_returning(self, payload):
+        instance = AsyncUVIndexManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client = MockAsyncHttpClient(payload)
+        return instance
+
+    def test_instantiation_with_wrong_params(self):
+        self.assertRaises(AssertionError, AsyncUVIndexManager, None, dict())
+        self.assertRaises(AssertionError, AsyncUVIndexManager, 'apikey', None)
+
+    def test_get_uvindex_api_version(self):
+        result = AsyncUVIndexManager('fakeapikey', DEFAULT_CONFIG).uvindex_api_version()
+        self.assertEqual(UVINDEX_API_VERSION, result)
+
+    def test_uvindex_around_coords(self):
+        instance = self._instance_returning(UVINDEX_JSON)
+        result = asyncio.run(instance.uvindex_around_coords(45, 9))
+        self.assertIsInstance(result, uvindex.UVIndex)
+        self.assertEqual(('uvi', dict(lat='45', lon='9')), instance.http_client.calls[0])
+
+    def test_uvindex_forecast_around_coords(self):
+        result = asyncio.run(self._instance_returning(UVINDEX_LIST_JSON).uvindex_forecast_around_coords(45, 9))
+        self.assertIsInstance(result, list)
+        self.assertTrue(all(isinstance(item, uvindex.UVIndex) for item in result))
+
+    def test_uvindex_history_around_coords(self):
+        instance = self._instance_returning(UVINDEX_LIST_JSON)
+        result = asyncio.run(instance.uvindex_history_around_coords(45, 9, 1498049953, end=1498481991))
+        self.assertTrue(all(isinstance(item, uvindex.UVIndex) for item in result))
+        path, params = instance.http_client.calls[0]
+        self.assertEqual('uvi/history', path)
+        self.assertEqual('1498049953', params['start'])
+        with self.assertRaises(AssertionError):
+            asyncio.run(instance.uvindex_history_around_coords(45, 9, None))
+
+    def test_repr(self):
+        print(AsyncUVIndexManager('fakeapikey', DEFAULT_CONFIG))
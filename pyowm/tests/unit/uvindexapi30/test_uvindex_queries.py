@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+from pyowm.uvindexapi30 import uvindex, uvindex_queries
+from tests.unit.uvindexapi30.test_uvindex import UVINDEX_LIST_JSON
+
+
+class TestUVIndexQueries(unittest.TestCase):
+
+    def test_uvi_queries(self):
+        params = uvindex_queries.coords_params(45, 9)
+        self.assertEqual(('uvi', dict(lat='45', lon='9')), uvindex_queries.get_uvi(params))
+        self.assertEqual(('uvi/forecast', dict(lat='45', lon='9')), uvindex_queries.get_uvi_forecast(params))
+        self.assertRaises(ValueError, uvindex_queries.coords_params, 200, 9)
+        self.assertRaises(ValueError, uvindex_queries.coords_params, 45, 200)
+
+    def test_uvi_history_queries(self):
+        params = uvindex_queries.history_params(45, 9, 1498049953, end='2017-06-26 12:59:51+00:00')
+        self.assertEqual(('uvi/history', dict(lat='45', lon='9', start='1498049953', end='1498481991')),
+                         uvindex_queries.get_uvi_history(params))
+        self.assertIsNotNone(uvindex_queries.history_params(45, 9, 1498049953)['end'])
+        self.assertRaises(AssertionError, uvindex_queries.history_params, 45, 9, None)
+        self.assertRaises(TypeError, uvindex_queries.history_params, 45, 9, dict(a=1))
+
+    def test_uvindex_list_from_list(self):
+        result = uvindex_queries.uvindex_list_from_list(json.loads(UVINDEX_LIST_JSON))
+        self.assertTrue(result)
+        self.assertTrue(all(isinstance(item, uvindex.UVIndex) for item in result))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import unittest
+from pyowm.commons.aio_http_client import AsyncHttpClient
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.constants import WEATHER_API_VERSION
+from pyowm.weatherapi25.aio_weather_manager import AsyncWeatherManager
+from pyowm.weatherapi25.forecaster import Forecaster
+from pyowm.weatherapi25.historian import Historian
+from pyowm.weatherapi25.observation import Observation
+from pyowm.weatherapi25.one_call import OneCall, LazyWeatherSequence
+from tests.unit.weatherapi25.json_test_responses import (
+    OBSERVATION_JSON, SEARCH_RESULTS_JSON, THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_NOT_FOUND_JSON,
+    STATION_TICK_WEATHER_HISTORY_JSON, ONE_CALL_JSON)
+
+
+class MockAsyncHttpClient(AsyncHttpClient):
+
+    def __init__(self, payload):
+        super().__init__('fakeapikey', DEFAULT_CONFIG, 'anyurl.com')
+        self.payload = payload
+        self.calls = []
+
+    async def get_json(self, path, params=None, headers=None):
+        self.calls.append((path, params))
+        return 200, json.loads(self.payload)
+
+
+class TestAsyncWeatherManager(unittest.TestCase):
+
+    def _instance_returning(self, payload):
+        instance = AsyncWeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client = MockAsyncHttpClient(payload)
+        return instance
+
+    def test_instantiation_with_wrong_params(self):
+        self.assertRaises(AssertionError, AsyncWeatherManager, None, dict())
+        self.assertRaises(AssertionError, AsyncWeatherManager, 'apikey', None)
+
+    def test_get_weather_api_version(self):
+        result = AsyncWeatherManager('fakeapikey', DEFAULT_CONFIG).weather_api_version()
+        self.assertEqual(WEATHER_API_VERSION, result)
+
+    def test_weather_at_place(self):
+        instance = self._instance_returning(OBSERVATION_JSON)
+        result = asyncio.run(instance.weather_at_place('London,uk'))
+        self.assertIsInstance(result, Observation)
+        self.assertEqual(('weather', {'q': 'London,uk'}), instance.http_client.calls[0])
+        with self.assertRaises(AssertionError):
+            asyncio.run(instance.weather_at_place(123))
+
+    def test_weather_at_coords_fails_with_wrong_params(self):
+        instance = self._instance_returning(OBSERVATION_JSON)
+        with self.assertRaises(ValueError):
+            asyncio.run(instance.weather_at_coords(100.0, 0.0))
+
+    def test_many_concurrent_calls(self):
+        instance = self._instance_returning(OBSERVATION_JSON)
+
+        async def gather():
+            return await asyncio.gather(*[instance.weather_at_id(i) for i in range(50)])
+
+        result = asyncio.run(gather())
+        self.assertEqual(50, len(result))
+        self.assertTrue(all(isinstance(item, Observation) for item in result))
+
+    def test_weather_at_places(self):
+        instance = self._instance_returning(SEARCH_RESULTS_JSON)
+        result = asyncio.run(instance.weather_at_places('London', 'accurate', limit=3))
+        self.assertIsInstance(result, list)
+        self.assertTrue(all(isinstance(item, Observation) for item in result))
+        self.assertEqual(2, instance.http_client.calls[0][1]['cnt'])
+        with self.assertRaises(ValueError):
+            asyncio.run(instance.weather_at_places('London', 'wrong'))
+
+    def test_forecast_at_place(self):
+        instance = self._instance_returning(THREE_HOURS_FORECAST_JSON)
+        result = asyncio.run(instance.forecast_at_place('London,uk', '3h', limit=5))
+        self.assertIsInstance(result, Forecaster)
+        self.assertEqual('3h', result.forecast.interval)
+        self.assertEqual(('forecast', {'q': 'London,uk', 'cnt': 5}), instance.http_client.calls[0])
+        with self.assertRaises(ValueError):
+            asyncio.run(instance.forecast_at_place('London,uk', 'monthly'))
+
+    def test_forecast_at_id_when_forecast_not_found(self):
+        instance = self._instance_returning(DAILY_FORECAST_NOT_FOUND_JSON)
+        self.assertIsNone(asyncio.run(instance.forecast_at_id(2643743, 'daily')))
+
+    def test_station_tick_history(self):
+        instance = self._instance_returning(STATION_TICK_WEATHER_HISTORY_JSON)
+        result = asyncio.run(instance.station_tick_history(1234, limit=4))
+        self.assertIsInstance(result, Historian)
+        self.assertEqual('tick', result.station_history.interval)
+        self.assertEqual(1234, result.station_history.station_id)
+
+    def test_one_call(self):
+        instance = self._instance_returning(ONE_CALL_JSON)
+        result = asyncio.run(instance.one_call(46.23, 12.7, exclude='minutely', units='metric'))
+        self.assertIsInstance(result, OneCall)
+        self.assertEqual('minutely', instance.http_client.calls[0][1]['exclude'])
+        self.assertNotIn('lazy', instance.http_client.calls[0][1])
+        result = asyncio.run(instance.one_call(46.23, 12.7, lazy=True))
+        self.assertIsInstance(result.forecast_hourly, LazyWeatherSequence)
+        with self.assertRaises(ValueError):
+            asyncio.run(instance.one_call_history(46.23, 12.7, dt=-1))
+
+    def test_repr(self):
+        print(AsyncWeatherManager('fakeapikey', DEFAULT_CONFIG))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+import pickle
+import unittest
+from pyowm.weatherapi25.columnar_forecast import ColumnarForecast, WeatherList
+from pyowm.weatherapi25.weather import Weather
+
+
+class TestColumnarForecast(unittest.TestCase):
+
+    __test_weathers = [
+        Weather(1378459200, 1378496400, 1378449600, 67, {"all": 20}, {}, {"deg": 252.002, "speed": 1.1}, 57,
+                {"press": 1030.119, "sea_level": None}, {"temp": 294.199, "temp_max": 296.098, "temp_min": 294.199},
+                "Clouds", "Overcast clouds", 804, "04d", 1000, 300.0, 298.0, 296.0),
+        Weather(1378470000, 1378496480, 1378449510, 23, {"1h": 0.5}, {"all": 2}, {"speed": 4.2}, 12,
+                {"press": 1070.119, "sea_level": 1078.589}, {"day": 297.199, "min": 295.6, "max": 299.0},
+                "Rain", "Light rain", 500, "10d", 1000, 300.0, 298.0, 296.0),
+        Weather(1378480800, 1378496480, 1378449510, 5, {"all": 20}, {}, {}, 57,
+                {"press": 1090.119, "sea_level": 1078.589}, {"temp": 299.199, "temp_max": 301.0, "temp_min": 297.6},
+                "Rain", "Heavy rain", 502, "10d", 1000, 300.0, 298.0, 296.0)]
+
+    def _assertColumnEqual(self, expected, column):
+        self.assertEqual(len(expected), len(column))
+        for e, c in zip(expected, column):
+            if e is None:
+                self.assertTrue(math.isnan(c))
+            else:
+                self.assertEqual(e, c)
+
+    def test_scalar_columns(self):
+        instance = ColumnarForecast(self.__test_weathers)
+        self.assertEqual(3, len(instance))
+        self.assertEqual([1378459200, 1378470000, 1378480800], list(instance.reference_times))
+        self.assertEqual([57., 12., 57.], list(instance.humidity))
+        self.assertEqual([67., 23., 5.], list(instance.clouds))
+        self.assertEqual([804, 500, 502], list(instance.weather_codes))
+
+    def test_nested_columns(self):
+        instance = ColumnarForecast(self.__test_weathers)
+        self._assertColumnEqual([294.199, None, 299.199], instance.temperature())
+        self._assertColumnEqual([296.098, None, 301.0], instance.temperature('temp_max'))
+        self._assertColumnEqual([None, 299.0, None], instance.temperature('max'))
+        self._assertColumnEqual([20., None, 20.], instance.rain())
+        self._assertColumnEqual([None, 0.5, None], instance.rain('1h'))
+        self._assertColumnEqual([None, 2., None], instance.snow())
+        self._assertColumnEqual([1.1, 4.2, None], instance.wind())
+        self._assertColumnEqual([252.002, None, None], instance.wind('deg'))
+        self._assertColumnEqual([None, 1078.589, 1078.589], instance.pressure('sea_level'))
+        self._assertColumnEqual([None, None, None], instance.pressure('unknown'))
+        self.assertIs(instance.temperature('temp_max'), instance.temperature('temp_max'))
+
+    def test_argmax_and_argmin(self):
+        instance = ColumnarForecast(self.__test_weathers)
+        self.assertEqual(0, instance.argmax(instance.humidity))  # the first greatest value wins
+        self.assertEqual(1, instance.argmin(instance.humidity))
+        self.assertEqual(2, instance.argmax(instance.temperature()))  # NaNs are skipped
+        self.assertEqual(0, instance.argmin(instance.temperature()))
+        self.assertIsNone(instance.argmax(instance.humidity, above=57.))
+        self.assertIsNone(instance.argmin(instance.humidity, below=12.))
+        self.assertIsNone(instance.argmax(instance.pressure('unknown')))
+        self.assertIsNone(instance.argmax(ColumnarForecast([]).humidity))
+
+    def test_codes(self):
+        instance = ColumnarForecast(self.__test_weathers)
+        self.assertTrue(instance.any_code_in({500, 501}))
+        self.assertFalse(instance.any_code_in({800}))
+        self.assertEqual(self.__test_weathers[1:], instance.filter_by_codes(frozenset(range(500, 532))))
+        self.assertEqual([], instance.filter_by_codes(frozenset()))
+
+    def test_weather_list_counts_changes(self):
+        weathers = WeatherList(self.__test_weathers)
+        self.assertEqual(self.__test_weathers, weathers)
+        self.assertEqual(0, weathers.changes)
+        weathers[0] = weathers[1]
+        weathers.append(weathers[0])
+        weathers += [weathers[0]]
+        del weathers[0]
+        weathers.sort(key=lambda w: w.ref_time)
+        self.assertEqual(5, weathers.changes)
+        restored = pickle.loads(pickle.dumps(weathers))
+        self.assertEqual([w.ref_time for w in weathers], [w.ref_time for w in restored])
+        self.assertEqual(5, restored.changes)
+
+    def test_is_view_of(self):
+        weathers = WeatherList(self.__test_weathers)
+        instance = ColumnarForecast(weathers)
+        self.assertTrue(instance.is_view_of(weathers))
+        self.assertFalse(instance.is_view_of(list(weathers)))
+        weathers[0] = weathers[1]
+        self.assertFalse(instance.is_view_of(weathers))
+        self.assertTrue(ColumnarForecast(self.__test_weathers).is_view_of(self.__test_weathers))
+
+    def test_pickling(self):
+        instance = ColumnarForecast(self.__test_weathers)
+        instance.temperature()
+        restored = pickle.loads(pickle.dumps(instance))
+        self.assertEqual(list(instance.reference_times), list(restored.reference_times))
+        self._assertColumnEqual([294.199, None, 299.199], restored.temperature())
+
+    def test_repr(self):
+        print(ColumnarForecast(self.__test_weathers))
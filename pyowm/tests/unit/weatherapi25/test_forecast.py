@@ -1,10 +1,10 @@
 import unittest
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pyowm.weatherapi25.location import Location
 from pyowm.weatherapi25.weather import Weather
 from pyowm.weatherapi25.forecast import Forecast
-from pyowm.commons.exceptions import APIResponseError, ParseAPIResponseError
+from pyowm.commons.exceptions import APIResponseError, ParseAPIResponseError, NotFoundError
 from tests.unit.weatherapi25.json_test_responses import (
     THREE_HOURS_FORECAST_JSON, FORECAST_NOT_FOUND_JSON,
     INTERNAL_SERVER_ERROR_JSON, FORECAST_MALFORMED_JSON)
@@ -183,5 +183,71 @@ class TestForecast(unittest.TestCase):
         result = self.__test_instance.to_dict()
         self.assertEqual(expected, result)
 
+    def test_to_columns(self):
+        instance = Forecast("daily", self.__test_reception_time, self.__test_location, list(self.__test_weathers))
+        columns = instance.to_columns()
+        self.assertEqual([1378459200, 1378459690], list(columns.reference_times))
+        self.assertIs(columns, instance.to_columns())
+        instance.weathers.pop()
+        self.assertEqual([1378459200], list(instance.to_columns().reference_times))
+        instance.weathers = list(self.__test_weathers)
+        self.assertEqual(2, len(instance.to_columns()))
+
+    def test_to_columns_reflects_items_replaced_in_place(self):
+        instance = Forecast("daily", self.__test_reception_time, self.__test_location, list(self.__test_weathers))
+        self.assertEqual([1378459200, 1378459690], list(instance.to_columns().reference_times))
+        instance.weathers[1] = instance.weathers[0]
+        self.assertEqual([1378459200, 1378459200], list(instance.to_columns().reference_times))
+
+    def test_weathers_are_sorted_by_reference_time(self):
+        instance = Forecast("daily", self.__test_reception_time, self.__test_location,
+                            list(reversed(self.__test_weathers)))
+        self.assertEqual(self.__test_weathers, instance.weathers)
+        instance.weathers = reversed(self.__test_weathers)
+        self.assertEqual(self.__test_weathers, instance.weathers)
+        instance.to_columns()
+        instance.weathers.insert(0, self.__test_weathers[1])
+        self.assertEqual([1378459200, 1378459690, 1378459690], list(instance.to_columns().reference_times))
+        self.assertEqual([1378459200, 1378459690, 1378459690], [w.ref_time for w in instance.weathers])
+
+    def test_is_in_coverage(self):
+        instance = self.__test_instance
+        self.assertTrue(instance.is_in_coverage(1378459200))
+        self.assertTrue(instance.is_in_coverage(1378459400))
+        self.assertTrue(instance.is_in_coverage("2013-09-06 09:28:10+00:00"))
+        self.assertFalse(instance.is_in_coverage(1378459199))
+        self.assertFalse(instance.is_in_coverage(1378459691))
+        empty = Forecast("daily", self.__test_reception_time, self.__test_location, [])
+        self.assertFalse(empty.is_in_coverage(1378459200))
+
+    def test_get_weather_at(self):
+        instance = self.__test_instance
+        self.assertIs(self.__test_weathers[0], instance.get_weather_at(1378459200))
+        self.assertIs(self.__test_weathers[0], instance.get_weather_at(1378459445))  # equally distant
+        self.assertIs(self.__test_weathers[1], instance.get_weather_at(1378459446))
+        self.assertIs(self.__test_weathers[1], instance.get_weather_at(datetime.fromtimestamp(1378459690, timezone.utc)))
+        with self.assertRaises(NotFoundError):
+            instance.get_weather_at(1378459691)
+        self.assertIsNone(Forecast("daily", self.__test_reception_time, self.__test_location, []).get_weather_at(0))
+
+    def test_get_weather_at_with_equal_reference_times(self):
+        instance = Forecast("daily", self.__test_reception_time, self.__test_location,
+                            [self.__test_weathers[1], self.__test_weathers[0], self.__test_weathers[1]])
+        self.assertIs(self.__test_weathers[0], instance.get_weather_at(1378459200))
+        self.assertIs(instance.weathers[1], instance.get_weather_at(1378459500))
+        self.assertIs(instance.weathers[1], instance.get_weather_at(1378459690))
+
+    def test_get_weathers_at(self):
+        instance = self.__test_instance
+        self.assertEqual([self.__test_weathers[1], self.__test_weathers[0], self.__test_weathers[0]],
+                         instance.get_weathers_at([1378459690, 1378459200, "2013-09-06 09:20:00+00:00"]))
+        self.assertEqual([], instance.get_weathers_at([]))
+        with self.assertRaises(NotFoundError):
+            instance.get_weathers_at([1378459200, 1378459691])
+        with self.assertRaises(TypeError):
+            instance.get_weathers_at([45.7])
+        self.assertEqual([], Forecast("daily", self.__test_reception_time, self.__test_location,
+                                      []).get_weathers_at([1378459200]))
+
     def test__repr(self):
         print(self.__test_instance)
@@ -7,6 +7,7 @@ from pyowm.weatherapi25.location import Location
 from pyowm.weatherapi25.weather import Weather
 from pyowm.weatherapi25.forecast import Forecast
 from pyowm.weatherapi25.forecaster import Forecaster
+from pyowm.commons.exceptions import NotFoundError
 
 
 class TestForecaster(unittest.TestCase):
@@ -271,6 +272,17 @@ class TestForecaster(unittest.TestCase):
         self.assertRaises(TypeError, Forecaster.get_weather_at,
                           self.__test_instance, 45.7)
 
+    def test_get_weathers_at(self):
+        time_1 = datetime(2013, 9, 13, 16, 47, 0, 0, timezone.utc)
+        time_2 = 1379226110
+        time_3 = "2013-09-16 19:56:50+00:00"
+        self.assertEqual([self.__test_weather_sun_1, self.__test_weather_rainsnow, self.__test_weather_clouds],
+                         self.__test_instance.get_weathers_at([time_3, time_1, time_2]))
+
+    def test_get_weathers_at_fails_with_times_out_of_coverage(self):
+        self.assertRaises(NotFoundError, Forecaster.get_weathers_at,
+                          self.__test_instance, [1379226110, 1])
+
     def test_most_hot(self):
         self.assertEqual(self.__test_weather_sun_2,
                          self.__test_instance.most_hot())
@@ -315,5 +327,22 @@ class TestForecaster(unittest.TestCase):
                                    [self.__test_none_values]))
         self.assertFalse(fcstr.most_windy())
 
+    def test_searches_see_changes_to_weathers(self):
+        weathers = [Weather(self.__test_time_1 + i * 3600, 0, 0, 10, {}, {}, {}, 50, {},
+                            {"temp": 290.0, "temp_max": 290.0 + i, "temp_min": 290.0 - i},
+                            "Clear", "Sky is clear", 800, "01d", 1000, 300.0, 298.0, 296.0) for i in range(3)]
+        fcstr = Forecaster(Forecast("3h", 1379089800, self.__test_location, weathers))
+        self.assertFalse(fcstr.will_have_rain())
+        self.assertIs(weathers[2], fcstr.most_hot())
+        self.assertIs(weathers[0], fcstr.most_humid())
+
+        weathers[0].weather_code = 500
+        weathers[0].temp['temp_max'] = 300.0
+        weathers[1].humidity = 90
+        self.assertTrue(fcstr.will_have_rain())
+        self.assertEqual([weathers[0]], fcstr.when_rain())
+        self.assertIs(weathers[0], fcstr.most_hot())
+        self.assertIs(weathers[1], fcstr.most_humid())
+
     def test__repr(self):
         print(self.__test_instance)
@@ -6,7 +6,7 @@ import unittest
 
 from pyowm.commons.exceptions import ParseAPIResponseError, APIResponseError
 from pyowm.utils import geo
-from pyowm.weatherapi25.one_call import OneCall
+from pyowm.weatherapi25.one_call import OneCall, LazyWeatherSequence
 from pyowm.weatherapi25.weather import Weather
 
 
@@ -95,6 +95,62 @@ class TestWeather(unittest.TestCase):
         }
         self.assertRaises(ParseAPIResponseError, lambda: OneCall.from_dict(data))
 
+    def test_to_columns(self):
+        result = OneCall.from_dict(self.__test_data_bozen)
+        hourly = result.to_columns()
+        self.assertEqual(48, len(hourly))
+        self.assertEqual([w.reference_time() for w in result.forecast_hourly], list(hourly.reference_times))
+        self.assertEqual([w.temperature()['temp'] for w in result.forecast_hourly], list(hourly.temperature()))
+        daily = result.to_columns('daily')
+        self.assertEqual([w.temperature()['max'] for w in result.forecast_daily], list(daily.temperature('max')))
+        self.assertEqual(len(result.forecast_minutely), len(result.to_columns('minutely')))
+        self.assertIsNone(OneCall(46.49, 11.33, "Europe/Rome", result.current).to_columns('daily'))
+        self.assertRaises(ValueError, result.to_columns, 'weekly')
+
+    def test_to_columns_are_cached(self):
+        result = OneCall.from_dict(self.__test_data_bozen)
+        hourly = result.to_columns()
+        self.assertIs(hourly, result.to_columns('hourly'))
+        self.assertIsNot(hourly, result.to_columns('daily'))
+        result.forecast_hourly[0] = result.forecast_hourly[1]
+        self.assertEqual(result.forecast_hourly[1].reference_time(), result.to_columns().reference_times[0])
+        result.forecast_hourly = result.forecast_hourly[:2]
+        self.assertEqual(2, len(result.to_columns()))
+        lazy = OneCall.from_dict(self.__test_data_bozen, lazy=True)
+        self.assertIs(lazy.to_columns('daily'), lazy.to_columns('daily'))
+
+    def test_one_call_from_dict_lazy(self):
+        eager = OneCall.from_dict(self.__test_data_bozen)
+        result = OneCall.from_dict(self.__test_data_bozen, lazy=True)
+        self.assertTrue(isinstance(result.current, Weather))
+        for name in ('forecast_minutely', 'forecast_hourly', 'forecast_daily'):
+            forecast = getattr(result, name)
+            self.assertIsInstance(forecast, LazyWeatherSequence)
+            self.assertEqual(0, forecast.parsed_count())
+            self.assertEqual(len(getattr(eager, name)), len(forecast))
+        hourly = result.forecast_hourly
+        self.assertEqual(eager.forecast_hourly[3].to_dict(), hourly[3].to_dict())
+        self.assertIs(hourly[3], hourly[3])
+        self.assertIs(hourly[-1], hourly[47])
+        self.assertEqual(2, hourly.parsed_count())
+        self.assertEqual([hourly[3], hourly[4]], hourly[3:5])
+        with self.assertRaises(IndexError):
+            hourly[48]
+        with self.assertRaises(IndexError):
+            hourly[-49]
+        self.assertEqual([w.to_dict() for w in eager.forecast_daily], [w.to_dict() for w in result.forecast_daily])
+        self.assertEqual(8, result.forecast_daily.parsed_count())
+        self.assertEqual(list(eager.to_columns().reference_times), list(result.to_columns().reference_times))
+        print(hourly)
+
+    def test_one_call_from_dict_lazy_fails_upon_access(self):
+        data = dict(self.__test_data_bozen, hourly=[{"temp": 280.0}])
+        result = OneCall.from_dict(data, lazy=True)
+        self.assertEqual(1, len(result.forecast_hourly))
+        with self.assertRaises(ParseAPIResponseError):
+            result.forecast_hourly[0]
+        self.assertRaises(ParseAPIResponseError, OneCall.from_dict, data)
+
     def test_to_geopoint(self):
         instance = OneCall.from_dict(self.__test_data_bozen)
         result_1 = instance.to_geopoint()
@@ -2,12 +2,14 @@
 # -*- coding: utf-8 -*-
 
 import json
+import pickle
 import unittest
 from datetime import datetime
 
 from pyowm.commons.exceptions import APIResponseError, ParseAPIResponseError
 from pyowm.weatherapi25.uris import ICONS_BASE_URI
 from pyowm.weatherapi25.weather import Weather
+from pyowm.weatherapi25.weathercoderegistry import WeatherCodeRegistry
 from tests.unit.weatherapi25.json_test_responses import (CITY_WEATHER_HISTORY_JSON,
                                                          CITY_WEATHER_HISTORY_NO_RESULTS_JSON,
                                                          CITY_WEATHER_HISTORY_NOT_FOUND_JSON,
@@ -448,6 +450,43 @@ class TestWeather(unittest.TestCase):
         result = self.__test_instance.to_dict()
         self.assertEqual(expected, result)
 
+    def test_values_are_stored_in_slots(self):
+        self.assertFalse(hasattr(self.__test_instance, '__dict__'))
+        self.assertEqual(self.__test_temperature, self.__test_instance.temp)
+        self.assertEqual(self.__test_pressure, self.__test_instance.pressure)
+        self.assertEqual(self.__test_wind, self.__test_instance.wnd)
+        self.assertEqual(self.__test_rain, self.__test_instance.rain)
+        self.assertEqual(self.__test_snow, self.__test_instance.snow)
+        restored = pickle.loads(pickle.dumps(self.__test_instance))
+        self.assertEqual(self.__test_instance.to_dict(), restored.to_dict())
+
+    def test_classified_status(self):
+        instance = pickle.loads(pickle.dumps(self.__test_instance))
+        self.assertEqual('clouds', instance.classified_status())
+        self.assertEqual('clouds', instance.classified_status(WeatherCodeRegistry.get_instance()))
+        registry = WeatherCodeRegistry({'Overcast': [{'start': 804, 'end': 804}]})
+        self.assertEqual('overcast', instance.classified_status(registry))
+        instance.weather_code = 500
+        self.assertIsNone(instance.classified_status(registry))
+        self.assertEqual('rain', instance.classified_status())
+        restored = pickle.loads(pickle.dumps(instance))  # the cached status is not pickled
+        self.assertFalse(hasattr(restored, '_classified_by'))
+        self.assertEqual('rain', restored.classified_status())
+
+    def test_nested_dicts_are_stored_as_they_are(self):
+        instance = pickle.loads(pickle.dumps(self.__test_instance))
+        instance.temp['temp'] = 0.
+        self.assertEqual(0., instance.temp['temp'])
+        self.assertEqual(0., instance.temperature()['temp'])
+        instance.rain['1h'] = 1.5
+        self.assertEqual(1.5, instance.rain['1h'])
+        self.assertIs(instance.wnd, instance.wind())
+        instance.temp = {'day': 280.0, 'unknown': 1.0}
+        self.assertEqual({'day': 280.0, 'unknown': 1.0}, instance.temp)
+        instance.rain = None
+        self.assertIsNone(instance.rain)
+        self.assertEqual(self.__test_snow, instance.snow)
+
     def test_from_dict_of_lists(self):
         result = Weather.from_dict_of_lists(json.loads(CITY_WEATHER_HISTORY_JSON))
         self.assertTrue(result)
@@ -811,3 +850,35 @@ class TestWeather(unittest.TestCase):
         self.assertEqual(276.84, result2.temperature()["feels_like_night"])
         self.assertEqual(278.55, result2.temperature()["feels_like_eve"])
         self.assertEqual(278.55, result2.temperature()["feels_like_morn"])
+
+    def test_from_dict_does_not_modify_the_dict(self):
+        the_dict = {'dt': 1378459200, 'precipitation': 0.5}
+        result = Weather.from_dict(the_dict)
+        self.assertEqual({'all': 0.5}, result.rain)
+        self.assertEqual({'dt': 1378459200, 'precipitation': 0.5}, the_dict)
+
+    def test_from_dict_with_unknown_feels_like_labels(self):
+        result = Weather.from_dict({'dt': 1378459200, 'feels_like': {'day': 278.55, 'noon': 280.1}})
+        self.assertEqual({'feels_like_day': 278.55, 'feels_like_noon': 280.1}, result.temperature())
+        self.assertEqual(result.temperature(), pickle.loads(pickle.dumps(result)).temperature())
+
+    def test_from_dict_with_station_data(self):
+        result = Weather.from_dict({'last': {'dt': 1378459200, 'main': {'temp': 288.4, 'humidity': 75,
+                                                                        'pressure': 1022},
+                                            'wind': {'speed': 1.5, 'deg': 120}, 'visibility': 9000,
+                                            'calc': {'dewpoint': 283.2, 'humidex': 290.1}}})
+        self.assertEqual(1378459200, result.reference_time())
+        self.assertEqual({'temp': 288.4}, result.temperature())
+        self.assertEqual(75, result.humidity)
+        self.assertEqual({'press': 1022, 'sea_level': None}, result.pressure)
+        self.assertEqual({'speed': 1.5, 'deg': 120}, result.wind())
+        self.assertEqual(9000, result.visibility_distance)
+        self.assertEqual(283.2, result.dewpoint)
+        self.assertEqual(290.1, result.humidex)
+        self.assertIsNone(result.heat_index)
+
+    def test_from_dict_fails_with_negative_values(self):
+        self.assertRaises(ValueError, Weather.from_dict, {'dt': -1})
+        self.assertRaises(ValueError, Weather.from_dict, {'dt': 1378459200, 'clouds': {'all': -1}})
+        self.assertRaises(ValueError, Weather.from_dict, {'dt': 1378459200, 'humidity': -1})
+        self.assertRaises(ValueError, Weather.from_dict, {'dt': 1378459200, 'visibility': -1})
@@ -2,7 +2,9 @@
 # -*- coding: utf-8 -*-
 
 import json
+import threading
 import unittest
+import pyowm.commons.exceptions
 from pyowm.weatherapi25.weather_manager import WeatherManager
 from pyowm.commons.http_client import HttpClient
 from pyowm.constants import WEATHER_API_VERSION
@@ -12,7 +14,7 @@ from pyowm.weatherapi25.forecast import Forecast
 from pyowm.weatherapi25.forecaster import Forecaster
 from pyowm.weatherapi25.location import Location
 from pyowm.weatherapi25.observation import Observation
-from pyowm.weatherapi25.one_call import OneCall
+from pyowm.weatherapi25.one_call import OneCall, LazyWeatherSequence
 from pyowm.weatherapi25.stationhistory import StationHistory
 from pyowm.weatherapi25.weather import Weather
 from tests.unit.weatherapi25.json_test_responses import (
@@ -198,6 +200,120 @@ class TestWeatherManager(unittest.TestCase):
         self.assertRaises(AssertionError, WeatherManager.weather_at_ids, self.__test_instance, "test")
         self.assertRaises(ValueError, WeatherManager.weather_at_ids, self.__test_instance, [-1, 2, 3])
 
+    def test_bulk_weather_at_ids(self):
+        calls = []
+
+        def mock_get_json(uri, params=None, headers=None):
+            calls.append(params['id'].split(','))
+            return 200, json.loads(SEARCH_RESULTS_JSON)
+
+        instance = WeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client.get_json = mock_get_json
+        result = list(instance.bulk_weather_at_ids(range(45), concurrency=3))
+        self.assertEqual(6, len(result))
+        self.assertTrue(all(isinstance(obs, Observation) for obs in result))
+        self.assertEqual([5, 20, 20], sorted(len(ids) for ids in calls))
+        self.assertEqual(set(map(str, range(45))), set(id for ids in calls for id in ids))
+
+    def test_bulk_weather_at_ids_reports_failures(self):
+
+        def mock_get_json(uri, params=None, headers=None):
+            if '0' in params['id'].split(','):
+                raise pyowm.commons.exceptions.TimeoutError('API call timeouted')
+            return 200, json.loads(SEARCH_RESULTS_JSON)
+
+        instance = WeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client.get_json = mock_get_json
+        failures = []
+        result = list(instance.bulk_weather_at_ids(range(30), chunk_size=10,
+                                                   on_failure=lambda ids, e: failures.append((ids, e))))
+        self.assertEqual(4, len(result))
+        self.assertEqual(1, len(failures))
+        self.assertEqual(list(range(10)), failures[0][0])
+        self.assertIsInstance(failures[0][1], pyowm.commons.exceptions.TimeoutError)
+
+        # without callback, failures are raised once all chunks are done
+        result = []
+        with self.assertRaises(pyowm.commons.exceptions.BulkAPIRequestError) as ctx:
+            for obs in instance.bulk_weather_at_ids(range(30), chunk_size=10):
+                result.append(obs)
+        self.assertEqual(4, len(result))
+        self.assertEqual(1, len(ctx.exception.failures))
+
+    def test_bulk_weather_at_ids_reports_chunks_without_data(self):
+
+        def mock_get_json(uri, params=None, headers=None):
+            if '0' in params['id'].split(','):
+                return 200, {'cod': '404', 'message': 'city not found'}
+            return 200, json.loads(SEARCH_RESULTS_JSON)
+
+        instance = WeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client.get_json = mock_get_json
+        failures = []
+        result = list(instance.bulk_weather_at_ids(range(30), chunk_size=10,
+                                                   on_failure=lambda ids, e: failures.append((ids, e))))
+        self.assertEqual(4, len(result))
+        self.assertEqual(1, len(failures))
+        self.assertEqual(list(range(10)), failures[0][0])
+        self.assertIsInstance(failures[0][1], pyowm.commons.exceptions.NotFoundError)
+
+    def test_bulk_weather_at_ids_fails_when_wrong_parameters(self):
+        self.assertRaises(ValueError, self.__test_instance.bulk_weather_at_ids, [1, 2], chunk_size=21)
+        self.assertRaises(ValueError, self.__test_instance.bulk_weather_at_ids, [1, 2], chunk_size=0)
+        self.assertRaises(AssertionError, self.__test_instance.bulk_weather_at_ids, ['1', '2'])
+        self.assertRaises(ValueError, self.__test_instance.bulk_weather_at_ids, [-1, 2])
+
+    def test_bulk_weather_at_ids_validates_ids_before_calling_the_api(self):
+        calls = []
+
+        def mock_get_json(uri, params=None, headers=None):
+            calls.append(params['id'])
+            return 200, json.loads(SEARCH_RESULTS_JSON)
+
+        instance = WeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client.get_json = mock_get_json
+        self.assertRaises(ValueError, instance.bulk_weather_at_ids, list(range(45)) + [-1], chunk_size=10)
+        self.assertEqual([], calls)
+
+    def test_bulk_methods_fail_upon_call_when_wrong_parameters(self):
+        def mock_get_json(uri, params=None, headers=None):
+            self.fail('no API call must be issued')
+
+        instance = WeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client.get_json = mock_get_json
+        self.assertRaises(AssertionError, instance.bulk_weather_at_ids, [1, 2], concurrency=0)
+        self.assertRaises(AssertionError, instance.bulk_forecast_at_ids, [1, 2], '3h', concurrency=0)
+        self.assertRaises(ValueError, instance.bulk_forecast_at_ids, [1, 2], 'weekly')
+        self.assertRaises(ValueError, instance.bulk_forecast_at_ids, [1, 2], '3h', limit=0)
+        self.assertRaises(AssertionError, instance.bulk_one_call, [(46.23, 12.7)], concurrency='2')
+
+    def test_bulk_forecast_at_ids(self):
+        calls = []
+
+        def mock_get_json(uri, params=None, headers=None):
+            calls.append((uri, params))
+            if params['id'] == 2:
+                return 200, json.loads(THREE_HOURS_FORECAST_NOT_FOUND_JSON)
+            return 200, json.loads(THREE_HOURS_FORECAST_AT_ID_JSON)
+
+        instance = WeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client.get_json = mock_get_json
+        result = dict(instance.bulk_forecast_at_ids([1, 2, 3, -4], '3h', limit=2, concurrency=2))
+        self.assertEqual({1, 2, 3, -4}, set(result))
+        for id in (1, 3):
+            self.assertIsInstance(result[id], Forecaster)
+        self.assertIsNone(result[2])
+        self.assertIsInstance(result[-4], ValueError)
+        self.assertEqual(3, len(calls))
+        self.assertTrue(all(params['cnt'] == 2 for _, params in calls))
+
+        # generator closing stops the retrieval
+        calls.clear()
+        results = instance.bulk_forecast_at_ids(range(1, 100), 'daily', concurrency=1)
+        next(results)
+        results.close()
+        self.assertTrue(len(calls) < 99)
+
     def test_weather_at_places_without_limits(self):
         original_func = HttpClient.get_json
         HttpClient.get_json= \
@@ -620,10 +736,51 @@ class TestWeatherManager(unittest.TestCase):
         if result.forecast_daily is not None:
             self.assertTrue(all(isinstance(v, Weather) for v in result.forecast_daily))
 
+    def test_one_call_lazy(self):
+        original_func = HttpClient.get_json
+        HttpClient.get_json = \
+            self.mock_api_call_returning_onecall_data
+        result = self.__test_instance.one_call(46.23, 12.7, lazy=True)
+        HttpClient.get_json = original_func
+        self.assertTrue(isinstance(result.forecast_hourly, LazyWeatherSequence))
+        self.assertTrue(all(isinstance(v, Weather) for v in result.forecast_hourly))
+
     def test_one_call_fails(self):
         self.assertRaises(AssertionError, WeatherManager.one_call, self.__test_instance, None, 12.7)
         self.assertRaises(AssertionError, WeatherManager.one_call, self.__test_instance, 46.23, 'test')
 
+    def test_bulk_one_call(self):
+        calls = []
+
+        def mock_get_json(uri, params=None, headers=None):
+            calls.append(params)
+            if params['lat'] == 0.0:
+                raise pyowm.commons.exceptions.TimeoutError('API call timeouted')
+            return 200, json.loads(ONE_CALL_JSON)
+
+        instance = WeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client.get_json = mock_get_json
+        coords = [(46.23, 12.7), (0.0, 0.0), (-33.9, 18.4)]
+        result = dict(instance.bulk_one_call(coords, concurrency=2, units='imperial'))
+        self.assertEqual(set(coords), set(result))
+        self.assertIsInstance(result[(46.23, 12.7)], OneCall)
+        self.assertIsInstance(result[(-33.9, 18.4)], OneCall)
+        self.assertIsInstance(result[(0.0, 0.0)], pyowm.commons.exceptions.TimeoutError)
+        self.assertTrue(all(params['units'] == 'imperial' for params in calls))
+
+    def test_bulk_one_call_can_be_cancelled(self):
+        cancel_event = threading.Event()
+
+        def mock_get_json(uri, params=None, headers=None):
+            cancel_event.set()
+            return 200, json.loads(ONE_CALL_JSON)
+
+        instance = WeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client.get_json = mock_get_json
+        coords = [(float(lat), 12.7) for lat in range(50)]
+        result = list(instance.bulk_one_call(coords, concurrency=1, cancel_event=cancel_event))
+        self.assertTrue(len(result) < len(coords))
+
     def test_one_call_history_without_time_range(self):
         original_func = HttpClient.get_json
         HttpClient.get_json = \
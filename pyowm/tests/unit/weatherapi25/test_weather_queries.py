@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+from pyowm.weatherapi25 import weather_queries
+from pyowm.weatherapi25.forecaster import Forecaster
+from pyowm.weatherapi25.stationhistory import StationHistory
+from tests.unit.weatherapi25.json_test_responses import THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_NOT_FOUND_JSON, \
+    STATION_TICK_WEATHER_HISTORY_JSON
+
+
+class TestWeatherQueries(unittest.TestCase):
+
+    def test_weather_queries(self):
+        self.assertEqual(('weather', {'q': 'London,uk'}), weather_queries.weather_at_place('London,uk'))
+        self.assertEqual(('weather', {'zip': '2000,AU'}), weather_queries.weather_at_zip_code('2000', 'AU'))
+        self.assertEqual(('group', {'id': '1,2'}), weather_queries.weather_at_ids([1, 2]))
+        self.assertEqual(('find', {'q': 'London', 'type': 'like', 'cnt': 2}),
+                         weather_queries.weather_at_places('London', 'like', limit=3))
+        self.assertEqual(('find', {'lon': 1.0, 'lat': 2.0, 'cnt': 3}),
+                         weather_queries.weather_around_coords(2.0, 1.0, limit=3))
+        self.assertEqual(('box/city', {'bbox': '1,2,3,4,5', 'cluster': 'no'}),
+                         weather_queries.weather_at_places_in_bbox(1, 2, 3, 4, zoom=5))
+
+    def test_weather_queries_fail_with_wrong_params(self):
+        self.assertRaises(AssertionError, weather_queries.weather_at_place, 123)
+        self.assertRaises(ValueError, weather_queries.weather_at_coords, 100.0, 0.0)
+        self.assertRaises(ValueError, weather_queries.weather_at_id, -1)
+        self.assertRaises(ValueError, weather_queries.weather_at_places, 'London', 'fuzzy')
+        self.assertRaises(ValueError, weather_queries.weather_around_coords, 2.0, 1.0, limit=0)
+
+    def test_forecast_queries(self):
+        self.assertEqual(('forecast', {'q': 'London', 'cnt': 5}),
+                         weather_queries.forecast_at_place('London', '3h', limit=5))
+        self.assertEqual(('forecast/daily', {'id': 123}), weather_queries.forecast_at_id(123, 'daily'))
+        self.assertRaises(ValueError, weather_queries.forecast_at_coords, 2.0, 1.0, 'weekly')
+        self.assertEqual('forecast/daily', weather_queries.forecast_uri('daily', limit=3))
+        self.assertRaises(ValueError, weather_queries.forecast_uri, '3h', limit=0)
+        result = weather_queries.forecaster_from_dict(json.loads(THREE_HOURS_FORECAST_JSON), '3h')
+        self.assertIsInstance(result, Forecaster)
+        self.assertEqual('3h', result.forecast.interval)
+        self.assertIsNone(weather_queries.forecaster_from_dict(json.loads(DAILY_FORECAST_NOT_FOUND_JSON), 'daily'))
+
+    def test_station_history_queries(self):
+        self.assertEqual(('history/station', {'id': 1234, 'type': 'tick', 'cnt': 4}),
+                         weather_queries.station_history(1234, 4, 'tick'))
+        self.assertRaises(ValueError, weather_queries.station_history, 1234, -3, 'tick')
+        result = weather_queries.station_history_from_dict(json.loads(STATION_TICK_WEATHER_HISTORY_JSON), 1234,
+                                                           'tick')
+        self.assertIsInstance(result, StationHistory)
+        self.assertEqual((1234, 'tick'), (result.station_id, result.interval))
+
+    def test_one_call_queries(self):
+        self.assertEqual(('onecall', {'lon': 1.0, 'lat': 2.0, 'units': 'metric'}),
+                         weather_queries.one_call(2.0, 1.0, units='metric', lazy=True))
+        self.assertEqual(('onecall/timemachine', {'lon': 1.0, 'lat': 2.0, 'dt': 1600000000}),
+                         weather_queries.one_call_history(2.0, 1.0, dt=1600000000))
+        self.assertRaises(ValueError, weather_queries.one_call_history, 2.0, 1.0, dt=-1)
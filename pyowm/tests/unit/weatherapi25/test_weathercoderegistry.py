@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 
 import unittest
-from pyowm.weatherapi25.weathercoderegistry import WeatherCodeRegistry
+from array import array
+from pyowm.weatherapi25.weathercoderegistry import WeatherCodeRegistry, WEATHER_CODES_INTERVALS
 
 
 class TestWeatherCodeRegistry(unittest.TestCase):
@@ -30,9 +31,64 @@ class TestWeatherCodeRegistry(unittest.TestCase):
         self.assertEqual("abc", self.__test_instance.status_for(150))
         self.assertEqual("xyz", self.__test_instance.status_for(345))
 
+    def test_status_for_lowercase(self):
+        instance = WeatherCodeRegistry({"Rain": [{"start": 500, "end": 531}]})
+        self.assertEqual("Rain", instance.status_for(500))
+        self.assertEqual("rain", instance.status_for(500, lowercase=True))
+        self.assertIsNone(instance.status_for(800, lowercase=True))
+
+    def test_status_for_matches_range_scans(self):
+        instance = WeatherCodeRegistry.get_instance()
+
+        def scan(code):
+            for status, ranges in WEATHER_CODES_INTERVALS.items():
+                for _range in ranges:
+                    if _range['start'] <= code <= _range['end']:
+                        return status
+            return None
+
+        for code in range(-10, 1100):
+            self.assertEqual(scan(code), instance.status_for(code))
+        self.assertEqual("rain", instance.status_for(500.0))
+
+    def test_status_for_with_overlapping_and_wide_ranges(self):
+        instance = WeatherCodeRegistry({
+            "first": [{"start": 10, "end": 20}],
+            "second": [{"start": 15, "end": 30}, {"start": -5, "end": -1}],
+            "wide": [{"start": 40, "end": 10 ** 9}]})
+        self.assertEqual("first", instance.status_for(15))
+        self.assertEqual("second", instance.status_for(21))
+        self.assertEqual("second", instance.status_for(-3))
+        self.assertEqual("wide", instance.status_for(WeatherCodeRegistry.MAX_TABLE_CODE))
+        self.assertEqual("wide", instance.status_for(10 ** 8))
+        self.assertIsNone(instance.status_for(10 ** 9 + 1))
+        self.assertEqual(frozenset(range(21, 31)) | frozenset(range(-5, 0)), instance.codes_for("second"))
+
+    def test_classify(self):
+        instance = WeatherCodeRegistry.get_instance()
+        codes = [500, 800, 200, 804, 962]
+        expected = ["rain", "sun", None, "clouds", "hurricane"]
+        self.assertEqual(expected, instance.classify(codes))
+        self.assertEqual(expected, instance.classify(array('l', codes)))
+        self.assertEqual(expected, instance.classify(iter(codes)))
+        self.assertEqual(["rain", None, None], instance.classify([500, -1, 10 ** 6]))
+        self.assertEqual(["rain", "rain"], instance.classify([500.0, 501]))
+        self.assertEqual([], instance.classify([]))
+        self.assertEqual(["Rain"], WeatherCodeRegistry({"Rain": [{"start": 1, "end": 2}]}).classify([1]))
+        self.assertEqual(["rain"], WeatherCodeRegistry({"Rain": [{"start": 1, "end": 2}]}).classify([1], lowercase=True))
+        self.assertEqual([None], WeatherCodeRegistry(dict()).classify([1]))
+
     def test_get_instance(self):
         result = WeatherCodeRegistry.get_instance()
         self.assertTrue(isinstance(result, WeatherCodeRegistry))
+        self.assertIs(result, WeatherCodeRegistry.get_instance())
+
+    def test_codes_for(self):
+        self.assertEqual(frozenset(range(1, 101)) | frozenset(range(120, 161)), self.__test_instance.codes_for('abc'))
+        self.assertEqual(frozenset([345]), self.__test_instance.codes_for('xyz'))
+        self.assertEqual(frozenset(), self.__test_instance.codes_for('XYZ'))
+        self.assertEqual(frozenset(), self.__test_instance.codes_for('unknown'))
+        self.assertEqual(frozenset(range(600, 623)), WeatherCodeRegistry.get_instance().codes_for('snow'))
 
     def test_repr(self):
         print(self.__test_instance)